@@ -3,14 +3,18 @@
 # Standard Library
 from typing import Optional, Tuple, Any, List
 
-# Numpy
-from numpy import roots
-
 # Utils
-from general_utils.numbers import are_close
+from general_utils.numbers import (
+    are_close,
+    to_number_like,
+    to_float_array,
+    sort_rows,
+)
+from conic_sections.utils.polynomials import get_roots
 
 # Math
 from decimal import Decimal
+import numpy as np
 
 
 class ConicSection:
@@ -20,6 +24,8 @@ class ConicSection:
         ax^2 + bxy + cy^2 + dx + ey + f = 0
     """
 
+    __slots__ = ("a", "b", "c", "d", "e", "f")
+
     a: Decimal
     b: Decimal
     c: Decimal
@@ -47,13 +53,40 @@ class ConicSection:
         b = self.b * x + self.e
         a = self.c
         c = (self.a * (x ** 2)) + (self.d * x) + (self.f)
-        xs = roots([a, b, c])
+        xs = get_roots([a, b, c])
         to_return = []
         for x in xs:
-            if are_close(Decimal(x.imag), Decimal("0"), Decimal("0.001")):
-                to_return.append(Decimal(x.real))
+            if are_close(x.imag, 0.0, 0.001):
+                to_return.append(to_number_like(x.real, self.a))
         return to_return
 
+    def y_formula_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Get ys from many xs in one vectorized pass.
+
+        The result has 2 rows, one for each solution of y_formula, sorted from the
+        highest to the lowest y. The values with no real solution are masked.
+        """
+        xs = to_float_array(xs)
+        a = float(self.c)
+        b = float(self.b) * xs + float(self.e)
+        c = (float(self.a) * (xs ** 2)) + (float(self.d) * xs) + float(self.f)
+        ys = np.full((2,) + xs.shape, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if a == 0:
+                # The formula is a line in y.
+                ys[0] = np.where(b != 0, -c / b, np.nan)
+                return np.ma.masked_invalid(ys)
+            discriminant = b ** 2 - 4 * a * c
+            # Same tolerance of the imaginary part used in y_formula.
+            is_real = np.sqrt(np.maximum(-discriminant, 0)) / abs(2 * a) <= 0.001
+            discriminant_root = np.sqrt(np.maximum(discriminant, 0))
+            # Avoid the cancellation of -b + sqrt(discriminant).
+            q = -(b + np.copysign(discriminant_root, b)) / 2
+            is_zero = q == 0
+            ys[0] = np.where(is_real, np.where(is_zero, 0, q / a), np.nan)
+            ys[1] = np.where(is_real, np.where(is_zero, 0, c / q), np.nan)
+        return np.ma.masked_invalid(sort_rows(ys))
+
     def x_formula(self, y: Decimal) -> List[Decimal]:
         """Get x from y.
 
@@ -64,11 +97,11 @@ class ConicSection:
         b = y1
         a = self.a
         c = self.c * (y ** 2) + self.e * y + self.f
-        xs = roots([a, b, c])
+        xs = get_roots([a, b, c])
         to_return = []
         for x in xs:
-            if are_close(Decimal(x.imag), Decimal("0"), Decimal("0.001")):
-                to_return.append(Decimal(x.real))
+            if are_close(x.imag, 0.0, 0.001):
+                to_return.append(to_number_like(x.real, self.a))
         return to_return
 
     def get_intersections(self, conic_section: Any) -> List[Tuple[Decimal, Decimal]]:
@@ -236,11 +269,12 @@ class ConicSection:
     ) -> List[Tuple[Decimal, Decimal]]:
         """Get intersections of a vertical line."""
         intersections = []
-        for x in roots(ps):
-            if are_close(Decimal(x.imag), Decimal("0"), Decimal("0.001")):
-                other_ys = conic_section.y_formula(Decimal(x))
+        for x in get_roots(ps):
+            if are_close(x.imag, 0.0, 0.001):
+                x = to_number_like(x.real, self.a)
+                other_ys = conic_section.y_formula(x)
                 for other_y in other_ys:
-                    intersections.append((Decimal(x), Decimal(other_y)))
+                    intersections.append((x, other_y))
         return intersections
 
     def _get_intersections(
@@ -248,10 +282,10 @@ class ConicSection:
     ) -> List[Tuple[Decimal, Decimal]]:
         """Get intersections using polinomial roots."""
         intersections: List[Tuple[Decimal, Decimal]] = []
-        for x in roots(ps):
-            if are_close(Decimal(x.imag), Decimal("0"), Decimal("0.001")):
+        for x in get_roots(ps):
+            if are_close(x.imag, 0.0, 0.001):
                 intersections += self._get_ys_of_intersections(
-                    Decimal(x.real), conic_section
+                    to_number_like(x.real, self.a), conic_section
                 )
         return intersections
 
@@ -265,7 +299,7 @@ class ConicSection:
         if len(ys) == 0 or len(other_ys) == 0:
             return []
 
-        epsilon = Decimal("0.0001")
+        epsilon = to_number_like("0.0001", x)
         for y in ys:
             for other_y in other_ys:
                 if are_close(y, other_y, epsilon):
@@ -274,11 +308,11 @@ class ConicSection:
 
     def get_vertical_tangents(self) -> List[Decimal]:
         """Get vertical tangents in the conic section."""
-        a = self.b ** Decimal(2) - Decimal(4) * self.c * self.a
-        b = Decimal(2) * self.b * self.e - Decimal(4) * self.c * self.d
-        c = self.e ** Decimal(2) - Decimal(4) * self.c * self.f
+        a = self.b ** 2 - 4 * self.c * self.a
+        b = 2 * self.b * self.e - 4 * self.c * self.d
+        c = self.e ** 2 - 4 * self.c * self.f
         xs = []
-        for x in roots([a, b, c]):
-            if are_close(Decimal(x.imag), Decimal("0"), Decimal("0.001")):
-                xs.append(Decimal(x.real))
+        for x in get_roots([a, b, c]):
+            if are_close(x.imag, 0.0, 0.001):
+                xs.append(to_number_like(x.real, self.a))
         return xs
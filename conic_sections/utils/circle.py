@@ -5,6 +5,9 @@ from typing import Optional, Tuple
 # Math
 from decimal import Decimal
 
+# Utils
+from general_utils.numbers import sqrt
+
 
 def get_circle_formula_y(
     h: Decimal, k: Decimal, r: Decimal, x: Decimal
@@ -13,8 +16,8 @@ def get_circle_formula_y(
     a = (r ** 2) - ((x - h) ** 2)
     if a < 0:
         return None
-    y1 = k + a.sqrt()
-    y2 = k - a.sqrt()
+    y1 = k + sqrt(a)
+    y2 = k - sqrt(a)
     return (y1, y2)
 
 
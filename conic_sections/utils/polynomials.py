@@ -0,0 +1,175 @@
+"""Polynomial utils.
+
+Closed form roots of polynomials up to degree 4. The roots are returned as complex
+numbers, like numpy.roots does, so the caller decides which ones are real enough.
+"""
+# Standard Library
+from typing import List, Optional, Sequence, Tuple
+from collections import Counter
+from contextvars import ContextVar
+
+# Math
+from decimal import Decimal
+from cmath import sqrt as complex_sqrt
+from math import sqrt, copysign
+
+# Newton iterations used to polish the cubic and quartic roots.
+NEWTON_ITERATIONS = 3
+
+# Cube roots of unity.
+OMEGA = complex(-0.5, sqrt(3) / 2)
+OMEGA_2 = complex(-0.5, -sqrt(3) / 2)
+
+# Counters where the calls to get_roots in the current context are counted as
+# "roots", None when they are not counted.
+roots_counters: ContextVar[Optional[Counter]] = ContextVar(
+    "roots_counters", default=None
+)
+
+
+def get_roots(coefficients: Sequence[Decimal]) -> List[complex]:
+    """Get roots of the polynomial with the given coefficients.
+
+    The coefficients are sorted from the highest degree to the lowest, as in
+    numpy.roots. Leading zeros are ignored and each trailing zero is a 0 root.
+    """
+    counters = roots_counters.get()
+    if counters is not None:
+        counters["roots"] += 1
+    ps = [float(coefficient) for coefficient in coefficients]
+    start = 0
+    while start < len(ps) and ps[start] == 0:
+        start += 1
+    end = len(ps)
+    while end > start and ps[end - 1] == 0:
+        end -= 1
+    ps_without_zeros = ps[start:end]
+    zero_roots = [complex(0)] * (len(ps) - end)
+
+    degree = len(ps_without_zeros) - 1
+    if degree <= 0:
+        return zero_roots
+    elif degree == 1:
+        roots = [complex(-ps_without_zeros[1] / ps_without_zeros[0])]
+    elif degree == 2:
+        roots = get_quadratic_roots(*ps_without_zeros)
+    elif degree == 3:
+        roots = get_cubic_roots(*ps_without_zeros)
+    elif degree == 4:
+        roots = get_quartic_roots(*ps_without_zeros)
+    else:
+        raise ValueError(f"Polynomials of degree {degree} are not supported.")
+    return roots + zero_roots
+
+
+def get_quadratic_roots(a: float, b: float, c: float) -> List[complex]:
+    """Get roots of ax^2 + bx + c with the numerically stable quadratic formula."""
+    discriminant = b ** 2 - 4 * a * c
+    if discriminant < 0:
+        real = -b / (2 * a)
+        imag = sqrt(-discriminant) / (2 * a)
+        return [complex(real, imag), complex(real, -imag)]
+    # Avoid the cancellation of -b + sqrt(discriminant).
+    q = -(b + copysign(sqrt(discriminant), b)) / 2
+    if q == 0:
+        return [complex(0), complex(0)]
+    return [complex(q / a), complex(c / q)]
+
+
+def get_cubic_roots(a: float, b: float, c: float, d: float) -> List[complex]:
+    """Get roots of ax^3 + bx^2 + cx + d with Cardano's formula."""
+    b, c, d = b / a, c / a, d / a
+    roots = _get_monic_cubic_roots(b, c, d)
+    return [_polish_root([1, b, c, d], root) for root in roots]
+
+
+def _get_monic_cubic_roots(b: float, c: float, d: float) -> List[complex]:
+    """Get roots of x^3 + bx^2 + cx + d."""
+    return [t - b / 3 for t in _get_depressed_cubic_roots(b, c, d)]
+
+
+def _get_depressed_cubic_roots(b: float, c: float, d: float) -> List[complex]:
+    """Get roots of t^3 + pt + q where x = t - b / 3 in x^3 + bx^2 + cx + d."""
+    p = c - (b ** 2) / 3
+    q = (2 * (b ** 3)) / 27 - (b * c) / 3 + d
+    if p == 0 and q == 0:
+        return [complex(0), complex(0), complex(0)]
+    discriminant_root = complex_sqrt((q / 2) ** 2 + (p / 3) ** 3)
+    # Take the sign that avoids cancellation so u is not 0.
+    w = -q / 2 + discriminant_root
+    if abs(w) < abs(-q / 2 - discriminant_root):
+        w = -q / 2 - discriminant_root
+    u = _get_complex_cube_root(w)
+    if u == 0:
+        return [complex(0), complex(0), complex(0)]
+    v = -p / (3 * u)
+    return [u + v, OMEGA * u + OMEGA_2 * v, OMEGA_2 * u + OMEGA * v]
+
+
+def get_quartic_roots(
+    a: float, b: float, c: float, d: float, e: float
+) -> List[complex]:
+    """Get roots of ax^4 + bx^3 + cx^2 + dx + e with Ferrari's method."""
+    b, c, d, e = b / a, c / a, d / a, e / a
+    # Depressed quartic y^4 + py^2 + qy + r where x = y - b / 4.
+    p = c - 3 * (b ** 2) / 8
+    q = d - (b * c) / 2 + (b ** 3) / 8
+    r = e - (b * d) / 4 + ((b ** 2) * c) / 16 - 3 * (b ** 4) / 256
+
+    if q == 0:
+        # Biquadratic.
+        ys = []
+        for z in _get_complex_quadratic_roots(p, r):
+            y = complex_sqrt(z)
+            ys += [y, -y]
+    else:
+        # Any non 0 root of the resolvent cubic m^3 + pm^2 + (p^2/4 - r)m - q^2/8.
+        m = max(_get_monic_cubic_roots(p, (p ** 2) / 4 - r, -(q ** 2) / 8), key=abs,)
+        sqrt_2m = complex_sqrt(2 * m)
+        ys = []
+        for sign in (1, -1):
+            root = complex_sqrt(-(2 * p + 2 * m + sign * 2 * q / sqrt_2m))
+            ys += [(sign * sqrt_2m + root) / 2, (sign * sqrt_2m - root) / 2]
+    return [_polish_root([1, b, c, d, e], y - b / 4) for y in ys]
+
+
+def _get_complex_quadratic_roots(b: complex, c: complex) -> List[complex]:
+    """Get roots of x^2 + bx + c."""
+    discriminant_root = complex_sqrt(b ** 2 - 4 * c)
+    return [(-b + discriminant_root) / 2, (-b - discriminant_root) / 2]
+
+
+def _get_complex_cube_root(value: complex) -> complex:
+    """Get the principal cube root of a complex number."""
+    if value == 0:
+        return complex(0)
+    return value ** (1 / 3)
+
+
+def _evaluate(ps: Sequence[float], x: complex) -> Tuple[complex, complex]:
+    """Evaluate polynomial and its derivative with Horner's method."""
+    value = complex(0)
+    derivative = complex(0)
+    for p in ps:
+        derivative = derivative * x + value
+        value = value * x + p
+    return value, derivative
+
+
+def _polish_root(ps: Sequence[float], root: complex) -> complex:
+    """Polish root with Newton's method.
+
+    The polishing stops as soon as a step does not give a better root.
+    """
+    value, derivative = _evaluate(ps, root)
+    best_value = abs(value)
+    for _ in range(NEWTON_ITERATIONS):
+        if best_value == 0 or derivative == 0:
+            break
+        new_root = root - value / derivative
+        value, derivative = _evaluate(ps, new_root)
+        if abs(value) >= best_value:
+            break
+        root = new_root
+        best_value = abs(value)
+    return root
@@ -1,3 +1,14 @@
 """Numbers utils."""
 
-from .numbers import are_close
+from .numbers import (
+    are_close,
+    to_number,
+    to_number_like,
+    to_numeric,
+    sqrt,
+    DECIMAL_NUMERIC,
+    FLOAT_NUMERIC,
+    FLOAT_RELATIVE_ERROR,
+    NUMERICS,
+)
+from .arrays import to_float_array, sort_rows
@@ -0,0 +1,23 @@
+"""Array utils."""
+
+# Standard Library
+from typing import Iterable
+
+# Math
+import numpy as np
+
+
+def to_float_array(values: Iterable) -> np.ndarray:
+    """Get values as a float array.
+
+    Decimals and arrays of Decimals are converted to float.
+    """
+    return np.asarray(values, dtype=float)
+
+
+def sort_rows(ys: np.ndarray) -> np.ndarray:
+    """Sort each column from the highest to the lowest value.
+
+    NaN values are moved to the last rows.
+    """
+    return -np.sort(-ys, axis=0)
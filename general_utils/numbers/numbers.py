@@ -1,6 +1,55 @@
 """Numbers utils."""
 
+# Math
+from decimal import Decimal
+from math import sqrt as float_sqrt
+
+# Numeric backends.
+DECIMAL_NUMERIC = "decimal"
+FLOAT_NUMERIC = "float"
+NUMERICS = (DECIMAL_NUMERIC, FLOAT_NUMERIC)
+
+# Bound of the relative error of the float formulas. It is a multiple of the machine
+# epsilon that also covers the cancellations when their coefficients are computed.
+FLOAT_RELATIVE_ERROR = 2 ** -40
+
 
 def are_close(a, b, epsilon):
     """Check if a and b are relative (to epsilon) close."""
+    if isinstance(a, float) or isinstance(b, float):
+        a, b, epsilon = float(a), float(b), float(epsilon)
     return (a - epsilon) <= b and (a + epsilon) >= b
+
+
+def to_number(value):
+    """Get value as one of the supported numbers.
+
+    Floats are kept as floats, any other value is converted to Decimal.
+    """
+    if isinstance(value, (float, Decimal)):
+        return value
+    return Decimal(value)
+
+
+def to_number_like(value, reference):
+    """Get value in the same numeric type as reference.
+
+    Strings are allowed in value to create exact Decimal constants.
+    """
+    if isinstance(reference, float):
+        return float(value)
+    return Decimal(value)
+
+
+def to_numeric(value, numeric: str):
+    """Get value in the numeric backend given."""
+    if numeric == FLOAT_NUMERIC:
+        return float(value)
+    return to_number(value)
+
+
+def sqrt(value):
+    """Get square root of a Decimal or a float."""
+    if isinstance(value, float):
+        return float_sqrt(value)
+    return Decimal(value).sqrt()
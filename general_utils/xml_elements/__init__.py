@@ -0,0 +1,3 @@
+"""XML elements utils."""
+
+from .elements import element_to_string
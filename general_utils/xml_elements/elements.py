@@ -0,0 +1,38 @@
+"""XML elements utils."""
+
+# Standard Library
+from typing import List
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
+
+# Characters escaped in attributes as ElementTree does.
+ATTRIBUTE_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+
+
+def element_to_string(element: ET.Element) -> str:
+    """Get xml of an element as ElementTree.tostring with encoding="unicode".
+
+    Only elements without namespaces are supported, so they are written without
+    looking for them.
+    """
+    parts: List[str] = []
+    _write_element(element, parts)
+    return "".join(parts)
+
+
+def _write_element(element: ET.Element, parts: List[str]) -> None:
+    """Write xml of an element and its tail in parts."""
+    parts.append("<" + element.tag)
+    for key, value in element.items():
+        parts.append(f' {key}="{escape(value, ATTRIBUTE_ENTITIES)}"')
+    if element.text or len(element):
+        parts.append(">")
+        if element.text:
+            parts.append(escape(element.text))
+        for child in element:
+            _write_element(child, parts)
+        parts.append(f"</{element.tag}>")
+    else:
+        parts.append(" />")
+    if element.tail:
+        parts.append(escape(element.tail))
@@ -0,0 +1,57 @@
+"""Get throughput of the batch computation with different number of workers."""
+
+# Standard Library
+import os
+import time
+
+# Batch
+from voronoi_diagrams.batch import compute_many, compute_one
+from voronoi_diagrams.partitioned import compute_partitioned
+
+# Utils
+from general_utils.numbers import FLOAT_NUMERIC
+
+# Math
+import numpy as np
+
+
+def get_site_sets(n_sets: int, n: int):
+    """Get n_sets random site sets of n sites."""
+    rng = np.random.default_rng()
+    return [rng.uniform(-100, 100, (n, 2)) for _ in range(n_sets)]
+
+
+def execute_with_workers(site_sets, workers: int) -> float:
+    """Print the diagrams per second computed with the given workers."""
+    start_time = time.time()
+    for _ in compute_many(site_sets, workers=workers, numeric=FLOAT_NUMERIC):
+        pass
+    total_time = time.time() - start_time
+    print("|", workers, "workers:", len(site_sets) / total_time, "diagrams per second")
+    return total_time
+
+
+def execute_partitioned(sites, workers: int) -> float:
+    """Print the time to compute one diagram split in strips."""
+    start_time = time.time()
+    compute_partitioned(sites, workers=workers, numeric=FLOAT_NUMERIC)
+    total_time = time.time() - start_time
+    print("|", workers, "workers partitioned:", total_time, "seconds")
+    return total_time
+
+
+if __name__ == "__main__":
+    site_sets = get_site_sets(200, 100)
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        execute_with_workers(site_sets, workers)
+        workers *= 2
+
+    sites = get_site_sets(1, 10000)[0]
+    start_time = time.time()
+    compute_one(sites, numeric=FLOAT_NUMERIC)
+    print("| Single process:", time.time() - start_time, "seconds")
+    workers = 2
+    while workers <= (os.cpu_count() or 1):
+        execute_partitioned(sites, workers)
+        workers *= 2
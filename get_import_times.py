@@ -0,0 +1,48 @@
+"""Get cold-start import times."""
+
+# Standard Library
+from typing import Tuple
+from decimal import Decimal
+import subprocess
+import sys
+
+
+ALGORITHM_MODULE = "voronoi_diagrams.fortunes_algorithm"
+PLOT_MODULE = "plots.plot_utils.steps"
+
+IMPORT_TIME_SCRIPT = """
+import sys
+import time
+start_time = time.perf_counter()
+import {module}
+print(time.perf_counter() - start_time, "plotly" in sys.modules)
+"""
+
+
+def get_import_time(module: str) -> Tuple[Decimal, bool]:
+    """Get import time of module in a new interpreter and if plotly was imported."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_TIME_SCRIPT.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return (Decimal(output[0]), output[1] == "True")
+
+
+def execute_x_times(times: int, module: str) -> Decimal:
+    print("Importing", module)
+    total_time = Decimal(0)
+    for _ in range(times):
+        import_time, plotly_imported = get_import_time(module)
+        total_time += import_time
+        print("|", import_time, "plotly imported:", plotly_imported)
+    average_time = total_time / Decimal(times)
+    print("Average import time:", average_time)
+    return average_time
+
+
+if __name__ == "__main__":
+    times = 10
+    execute_x_times(times, ALGORITHM_MODULE)
+    execute_x_times(times, PLOT_MODULE)
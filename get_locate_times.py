@@ -0,0 +1,52 @@
+"""Get queries per second of the point location in Voronoi Diagrams."""
+
+# Standard Library
+import time
+
+# Voronoi Diagrams
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+from voronoi_diagrams.point_location import PointLocator
+from voronoi_diagrams.models import Point
+
+# Utils
+from general_utils.numbers import FLOAT_NUMERIC
+
+# Math
+import numpy as np
+
+
+def execute_locate(voronoi_diagram: FortunesAlgorithm, n_queries: int) -> float:
+    """Print the queries per second located in the diagram."""
+    start_time = time.time()
+    locator = PointLocator(voronoi_diagram)
+    print("|", locator, "built in", time.time() - start_time, "seconds")
+
+    rng = np.random.default_rng()
+    xs, ys = rng.uniform(-100, 100, (2, n_queries))
+    start_time = time.time()
+    locator.locate(xs, ys)
+    total_time = time.time() - start_time
+    print("|", n_queries / total_time, "queries per second")
+    return total_time
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng()
+    for n in [100, 1000, 10000]:
+        print("Voronoi Diagram of", n, "sites")
+        points = [Point(x, y) for x, y in rng.uniform(-100, 100, (n, 2))]
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, numeric=FLOAT_NUMERIC
+        )
+        execute_locate(voronoi_diagram, 1000000)
+
+    n = 100
+    print("AW Voronoi Diagram of", n, "sites")
+    points_and_weights = [
+        (Point(x, y), w)
+        for x, y, w in zip(*rng.uniform(-100, 100, (2, n)), rng.uniform(0, 5, n))
+    ]
+    voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+        points_and_weights, numeric=FLOAT_NUMERIC
+    )
+    execute_locate(voronoi_diagram, 1000000)
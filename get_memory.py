@@ -0,0 +1,83 @@
+"""Get memory used per site.
+
+With 1000 random sites the allocation peak is about 2.5 KB per site for point
+diagrams and 1.8 KB for AW diagrams with Decimal numeric, and 2.3 KB and 1.6 KB
+with float numeric. Before the models were slotted it was about 5.6 KB and 5.3 KB
+with Decimal. The edges keep one half-edge and their ranges in flat tuples, their
+boundaries and vertices are known from the bisector and the half-edges, and the
+conic sections of the AW bisectors are freed when their edges are complete.
+"""
+
+# Standard Library
+from typing import Tuple
+from decimal import Decimal
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+# Voronoi Diagrams
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+
+# Utils
+from general_utils.numbers import DECIMAL_NUMERIC, FLOAT_NUMERIC
+
+# Sites
+from get_times import (
+    get_sites_to_use,
+    VORONOI_DIAGRAM_TYPE,
+    AW_VORONOI_DIAGRAM_TYPE,
+)
+
+
+def get_diagram_memory(n: int, type_vd: int, numeric: str) -> Tuple[int, int]:
+    """Get peak of allocated bytes and peak RSS bytes calculating a diagram."""
+    sites = get_sites_to_use(n, type_vd)
+    tracemalloc.start()
+    if type_vd == VORONOI_DIAGRAM_TYPE:
+        FortunesAlgorithm.calculate_voronoi_diagram(sites, numeric=numeric)
+    elif type_vd == AW_VORONOI_DIAGRAM_TYPE:
+        FortunesAlgorithm.calculate_aw_voronoi_diagram(sites, numeric=numeric)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # ru_maxrss is given in kilobytes.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return (peak, max_rss)
+
+
+def get_diagram_memory_in_new_process(
+    n: int, type_vd: int, numeric: str
+) -> Tuple[int, int]:
+    """Get diagram memory in a new interpreter so the peak RSS is not shared."""
+    output = subprocess.run(
+        [sys.executable, __file__, str(n), str(type_vd), numeric],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return (int(output[0]), int(output[1]))
+
+
+def print_bytes_per_site(n: int, numeric: str) -> None:
+    print("Executing", n, " sites with", numeric, "numeric")
+    for name, type_vd in (
+        ("VD", VORONOI_DIAGRAM_TYPE),
+        ("AW VD", AW_VORONOI_DIAGRAM_TYPE),
+    ):
+        peak, max_rss = get_diagram_memory_in_new_process(n, type_vd, numeric)
+        print(
+            f"| {name} allocated bytes per site:",
+            Decimal(peak) / Decimal(n),
+            "peak RSS:",
+            max_rss,
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        print(*get_diagram_memory(int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]))
+    else:
+        for i in range(1, 5):
+            print("New Iteration -------------------------------------")
+            for numeric in (DECIMAL_NUMERIC, FLOAT_NUMERIC):
+                print_bytes_per_site(10 ** i, numeric)
@@ -0,0 +1,36 @@
+"""Get times of the polynomial solver against numpy.roots."""
+
+# Standard Library
+from random import uniform
+from decimal import Decimal
+import timeit
+
+# Conic Sections
+from conic_sections.utils.polynomials import get_roots
+
+# Math
+from numpy import roots
+
+
+def get_random_polynomials(n: int, degree: int):
+    """Get n random polynomials of the given degree."""
+    return [[Decimal(uniform(-100, 100)) for _ in range(degree + 1)] for _ in range(n)]
+
+
+def execute_x_times(times: int, n: int, degree: int) -> None:
+    """Print the average time to solve n polynomials with each solver."""
+    polynomials = get_random_polynomials(n, degree)
+    print("Degree:", degree)
+    for name, solver in (("get_roots", get_roots), ("numpy.roots", roots)):
+        total_time = timeit.timeit(
+            lambda: [solver(polynomial) for polynomial in polynomials], number=times,
+        )
+        average_time = Decimal(total_time) / Decimal(times * n)
+        print("|", name, "average time per polynomial:", average_time)
+
+
+if __name__ == "__main__":
+    times = 10
+    n = 1000
+    for degree in (2, 3, 4):
+        execute_x_times(times, n, degree)
@@ -12,7 +12,10 @@ from voronoi_diagrams.fortunes_algorithm import (
     FortunesAlgorithm,
     AUTOMATIC_MODE,
 )
-from voronoi_diagrams.models import Point
+from voronoi_diagrams.models import Point, WeightedPointBisector
+
+# Utils
+from general_utils.numbers import DECIMAL_NUMERIC, FLOAT_NUMERIC
 
 # Plot
 from plots.plot_utils.voronoi_diagram import SiteToUse
@@ -22,19 +25,21 @@ VORONOI_DIAGRAM_TYPE = 1
 AW_VORONOI_DIAGRAM_TYPE = 2
 
 
-def get_diagram_and_time(sites: List[SiteToUse], type_vd: int,) -> float:
+def get_diagram_and_time(
+    sites: List[SiteToUse], type_vd: int, numeric: str = DECIMAL_NUMERIC
+) -> float:
     """Get and plot Voronoi Diagram depending on the requested type."""
     start_time = time.time()
     if type_vd == VORONOI_DIAGRAM_TYPE:
-        FortunesAlgorithm.calculate_voronoi_diagram(sites)
+        FortunesAlgorithm.calculate_voronoi_diagram(sites, numeric=numeric)
     elif type_vd == AW_VORONOI_DIAGRAM_TYPE:
-        FortunesAlgorithm.calculate_aw_voronoi_diagram(sites)
+        FortunesAlgorithm.calculate_aw_voronoi_diagram(sites, numeric=numeric)
 
     return time.time() - start_time
 
 
 def get_sites_to_use(n: int, type_vd: int) -> Optional[List[SiteToUse]]:
-    """Get sites to use and limit_sites."""
+    """Get sites to use."""
     sites = []
     if type_vd not in [1, 2]:
         return None
@@ -61,30 +66,42 @@ def get_sites_to_use(n: int, type_vd: int) -> Optional[List[SiteToUse]]:
     return sites
 
 
-def execute_x_times(times: int, n: int) -> Decimal:
-    print("Executing", n, " sites in Voronoi Diagrams")
+def execute_x_times(times: int, n: int, numeric: str = DECIMAL_NUMERIC) -> Decimal:
+    print("Executing", n, " sites in Voronoi Diagrams with", numeric, "numeric")
     total_vd_time = Decimal(0)
     for _ in range(times):
         sites = get_sites_to_use(n, VORONOI_DIAGRAM_TYPE)
-        vd_time = Decimal(get_diagram_and_time(sites, VORONOI_DIAGRAM_TYPE))
+        vd_time = Decimal(get_diagram_and_time(sites, VORONOI_DIAGRAM_TYPE, numeric))
         total_vd_time += vd_time
         print("|", vd_time)
     average_vd_time = total_vd_time / Decimal(times)
     print("Average VD time:", average_vd_time)
 
-    print("Executing", n, " weighted sites in AW Voronoi Diagrams")
+    print(
+        "Executing",
+        n,
+        " weighted sites in AW Voronoi Diagrams with",
+        numeric,
+        "numeric",
+    )
     total_aw_vd_time = Decimal(0)
     for _ in range(times):
         sites = get_sites_to_use(n, AW_VORONOI_DIAGRAM_TYPE)
-        aw_vd_time = Decimal(get_diagram_and_time(sites, AW_VORONOI_DIAGRAM_TYPE))
+        aw_vd_time = Decimal(
+            get_diagram_and_time(sites, AW_VORONOI_DIAGRAM_TYPE, numeric)
+        )
         total_aw_vd_time += aw_vd_time
         print("|", aw_vd_time)
     average_aw_vd_time = total_aw_vd_time / Decimal(times)
     print("Average AW VD time:", average_aw_vd_time)
+    for name, counter in WeightedPointBisector.cache_counters.items():
+        print("Cached", name, counter)
+        counter.reset()
 
 
 if __name__ == "__main__":
     times = 10
     for i in range(1, 5):
         print("New Iteration -------------------------------------")
-        execute_x_times(times, 10 ** i)
+        for numeric in (DECIMAL_NUMERIC, FLOAT_NUMERIC):
+            execute_x_times(times, 10 ** i, numeric)
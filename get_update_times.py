@@ -0,0 +1,57 @@
+"""Get times of changing sites of AW Voronoi Diagrams against recalculating them."""
+
+# Standard Library
+import sys
+import time
+
+# Voronoi Diagrams
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+from voronoi_diagrams.models import Point
+
+# Utils
+from general_utils.numbers import FLOAT_NUMERIC
+
+# Math
+import numpy as np
+
+
+def calculate_diagram(points_and_weights) -> FortunesAlgorithm:
+    """Calculate AW Voronoi Diagram with floats."""
+    return FortunesAlgorithm.calculate_aw_voronoi_diagram(
+        points_and_weights, numeric=FLOAT_NUMERIC
+    )
+
+
+def execute_changes(n: int, n_changes: int, rng: np.random.Generator) -> None:
+    """Print times of updating and removing sites against recalculating."""
+    # Sites start with the same weight and the changed ones get weights near it.
+    points_and_weights = [(Point(x, y), 0.5) for x, y in rng.uniform(-100, 100, (n, 2))]
+    voronoi_diagram = calculate_diagram(points_and_weights)
+    indices = rng.choice(n, n_changes, replace=False)
+
+    sites = [voronoi_diagram.sites[i] for i in indices]
+    start_time = time.time()
+    voronoi_diagram.update_weights(zip(sites, rng.uniform(0.3, 0.7, n_changes)))
+    update_time = time.time() - start_time
+
+    start_time = time.time()
+    voronoi_diagram.remove_sites(sites)
+    remove_time = time.time() - start_time
+
+    start_time = time.time()
+    calculate_diagram([(site.point, site.weight) for site in voronoi_diagram.sites])
+    total_time = time.time() - start_time
+    print(
+        f"| {n_changes} sites changed: update_weights {update_time:.3f} s "
+        f"({total_time / update_time:.1f}x), remove_sites {remove_time:.3f} s "
+        f"({total_time / remove_time:.1f}x), recalculation {total_time:.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng()
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+    for n in sizes:
+        print("AW Voronoi Diagram of", n, "sites")
+        for n_changes in [1, 10, 100]:
+            execute_changes(n, n_changes, rng)
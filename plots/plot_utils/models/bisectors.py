@@ -11,7 +11,8 @@ from voronoi_diagrams.models import (
 )
 
 # Utils.
-from .events import create_weighted_site, is_equal_limit_site, SiteToUse
+from general_utils.numbers import to_float_array
+from .events import create_weighted_site
 from .vertices import plot_vertex
 from .points import plot_point
 
@@ -20,6 +21,7 @@ from plotly import graph_objects as go
 
 # Math
 from decimal import Decimal
+import numpy as np
 
 Limit = Tuple[Decimal, Decimal]
 
@@ -89,21 +91,15 @@ def plot_bisector(
         return []
 
     if y_range is None:
-        y_lists = [[] for _ in range(num_lists)]
-        for x in x_range:
-            if x < xlim[0] or x > xlim[1]:
-                for i in range(num_lists):
-                    y_lists[i].append(None)
-                continue
-            ys = bisector.formula_y(x)
-            num_y = len(ys)
-            for i in range(num_y):
-                if ys[i] >= ylim[0] and ys[i] <= ylim[1]:
-                    y_lists[i].append(ys[i])
-                else:
-                    y_lists[i].append(None)
-            for i in range(num_y, num_lists):
-                y_lists[i].append(None)
+        xs = to_float_array(x_range)
+        ys = bisector.formula_y_many(xs)[:num_lists]
+        is_outside = (
+            (xs < float(xlim[0]))
+            | (xs > float(xlim[1]))
+            | np.ma.filled(ys < float(ylim[0]), True)
+            | np.ma.filled(ys > float(ylim[1]), True)
+        )
+        y_lists = np.ma.masked_where(is_outside, ys).tolist()
 
         for i in range(num_lists):
             traces.append(
@@ -173,38 +169,20 @@ def plot_intersections(
         figure.add_trace(trace)
 
 
-def is_a_limit_bisector(
-    vd_bisector: Edge, limit_sites: List[SiteToUse], bisector_class: Type[Bisector],
-) -> bool:
-    """Check if current bisector is a bisector with a limit site."""
-    for site in vd_bisector.bisector.get_sites_tuple():
-        for limit_site in limit_sites:
-            if is_equal_limit_site(site, limit_site, bisector_class=bisector_class):
-                return True
-    return False
-
-
 def plot_vertices_and_edges(
-    bisectors: List[Edge],
-    limit_sites: List[SiteToUse],
-    xlim: Limit,
-    ylim: Limit,
-    bisector_class: Type[Bisector],
+    bisectors: List[Edge], xlim: Limit, ylim: Limit, bisector_class: Type[Bisector],
 ) -> List[go.Scatter]:
     """Plot bisectors in diagram."""
     vertices_passed = set()
     traces = []
     for vd_bisector in bisectors:
-        if not is_a_limit_bisector(
-            vd_bisector, limit_sites, bisector_class=bisector_class
-        ):
-            for bisector_vertex in vd_bisector.vertices:
-                if id(bisector_vertex) in vertices_passed:
-                    continue
-                vertices_passed.add(id(bisector_vertex))
-                traces.append(plot_vertex(bisector_vertex))
-            traces += plot_edge(
-                vd_bisector, xlim=xlim, ylim=ylim, bisector_class=bisector_class,
-            )
+        for bisector_vertex in vd_bisector.vertices:
+            if id(bisector_vertex) in vertices_passed:
+                continue
+            vertices_passed.add(id(bisector_vertex))
+            traces.append(plot_vertex(bisector_vertex))
+        traces += plot_edge(
+            vd_bisector, xlim=xlim, ylim=ylim, bisector_class=bisector_class,
+        )
 
     return traces
@@ -1,6 +1,6 @@
 """Boundaries representations in plots."""
 # Standard Library.
-from typing import Tuple, Type
+from typing import Tuple, Type, Iterable, List, Optional, Any
 
 # Models.
 from voronoi_diagrams.models import (
@@ -18,6 +18,38 @@ import numpy as np
 # Math
 from decimal import Decimal
 
+# Utils.
+from general_utils.numbers import to_float_array
+
+
+def get_ys_to_plot(
+    boundary: Boundary,
+    x_list: Iterable,
+    ys: np.ma.MaskedArray,
+    xlim: Tuple[Decimal, Decimal],
+    ylim: Tuple[Decimal, Decimal],
+    highest_index: int,
+) -> List[Optional[Any]]:
+    """Get the ys to plot of a boundary given its ys in x_list.
+
+    The y in highest_index is the highest point of the site and just the first y out
+    of ylim is kept, so the boundary reaches the limit.
+    """
+    if len(x_list) == 0:
+        return []
+    xs = to_float_array(x_list)
+    is_outside_x = (xs < float(xlim[0])) | (xs > float(xlim[1]))
+    is_outside_y = np.ma.filled((ys < float(ylim[0])) | (ys > float(ylim[1])), False)
+    is_outside_y[highest_index] = False
+    is_outside_y &= ~is_outside_x
+    outside_indices = np.flatnonzero(is_outside_y)
+    if len(outside_indices) > 0:
+        is_outside_y[outside_indices[0]] = False
+    y_list = np.ma.masked_where(is_outside_x | is_outside_y, ys).tolist()
+    if not is_outside_x[highest_index]:
+        y_list[highest_index] = boundary.get_site().get_highest_site_point().y
+    return y_list
+
 
 def get_plot_scatter_boundary(
     boundary: Boundary,
@@ -54,28 +86,15 @@ def get_plot_scatter_boundary(
                     Decimal(xlim[0]), boundary.get_site().point.x - step, step
                 )
 
-        if y_list == []:
-            pass_limit = False
-            last = len(x_list) - 1
-            for i in range(len(x_list)):
-                x = x_list[i]
-                if x < xlim[0] or x > xlim[1]:
-                    y_list.append(None)
-                    continue
-                if (boundary.sign and i == 0) or (not boundary.sign and i == last):
-                    y_list.append(boundary.get_site().get_highest_site_point().y)
-                    continue
-                ys = boundary.formula_y(Decimal(x))
-                if len(ys) == 0:
-                    y_list.append(None)
-                elif ys[0] >= ylim[0] and ys[0] <= ylim[1]:
-                    y_list.append(ys[0])
-                else:
-                    if pass_limit:
-                        y_list.append(None)
-                    else:
-                        y_list.append(ys[0])
-                        pass_limit = True
+        if len(y_list) == 0:
+            y_list = get_ys_to_plot(
+                boundary,
+                x_list,
+                boundary.formula_y_many(x_list)[0],
+                xlim,
+                ylim,
+                0 if boundary.sign else len(x_list) - 1,
+            )
     elif bisector_class == WeightedPointBisector:
         x_list = []
         y_list = []
@@ -102,31 +121,14 @@ def get_plot_scatter_boundary(
                     if step > 0:
                         x_lists[1] = np.arange(change_of_x, Decimal(xlim[1]), step)
 
-            func_map = {0: min, 1: max}
-            pass_limit = False
-            for i, _ in enumerate(x_lists):
-                for j in range(len(x_lists[i])):
-                    x = x_lists[i][j]
-                    if x < xlim[0] or x > xlim[1]:
-                        y_list.append(None)
-                        continue
-                    if i == 0 and j == 0:
-                        y_list.append(boundary.get_site().get_highest_site_point().y)
-                        continue
-                    ys = boundary.formula_y(Decimal(x))
-                    if len(ys) == 0:
-                        y_list.append(None)
-                    else:
-                        y = func_map[i](ys)
-                        if y >= ylim[0] and y <= ylim[1]:
-                            y_list.append(y)
-                        else:
-                            if pass_limit:
-                                y_list.append(None)
-                            else:
-                                y_list.append(y)
-                                pass_limit = True
             x_list = np.concatenate(x_lists)
+            ys = np.ma.concatenate(
+                [
+                    boundary.formula_y_many(x_lists[0]).min(axis=0),
+                    boundary.formula_y_many(x_lists[1]).max(axis=0),
+                ]
+            )
+            y_list = get_ys_to_plot(boundary, x_list, ys, xlim, ylim, 0)
         elif boundary.bisector.is_vertical():
             if not boundary.sign:
                 return None
@@ -149,28 +151,15 @@ def get_plot_scatter_boundary(
             if step > 0:
                 x_list = np.arange(Decimal(xlim[0]), boundary.get_site().point.x, step)
 
-        if y_list == []:
-            pass_limit = False
-            last = len(x_list) - 1
-            for i in range(len(x_list)):
-                x = x_list[i]
-                if x < xlim[0] or x > xlim[1]:
-                    y_list.append(None)
-                    continue
-                if (boundary.sign and i == 0) or (not boundary.sign and i == last):
-                    y_list.append(boundary.get_site().get_highest_site_point().y)
-                    continue
-                ys = boundary.formula_y(Decimal(x))
-                if len(ys) == 0:
-                    y_list.append(None)
-                elif ys[0] >= ylim[0] and ys[0] <= ylim[1]:
-                    y_list.append(ys[0])
-                else:
-                    if pass_limit:
-                        y_list.append(None)
-                    else:
-                        y_list.append(ys[0])
-                        pass_limit = True
+        if len(y_list) == 0:
+            y_list = get_ys_to_plot(
+                boundary,
+                x_list,
+                boundary.formula_y_many(x_list)[0],
+                xlim,
+                ylim,
+                0 if boundary.sign else len(x_list) - 1,
+            )
 
     return go.Scatter(
         x=x_list,
@@ -1,6 +1,6 @@
 """Sites representations in plot."""
 
-from typing import Iterable, Union, Tuple, Type
+from typing import Iterable, Optional, Union, Tuple
 from random import randint
 
 # Models.
@@ -76,53 +76,43 @@ def plot_sites(figure: go.Figure, sites: Iterable[Site], site_class=Site):
         plot_site(figure, site, site_class)
 
 
-def plot_sweep_line(figure: go.Figure, xlim, ylim, event: Event):
-    """Plot event sweep line."""
-    y = event.get_event_point().y
+def get_sweep_line_trace(xlim, ylim, y: Decimal) -> Optional[go.Scatter]:
+    """Get trace of the sweep line at y, None if it is out of the limits."""
     if y < ylim[0] or y > ylim[1]:
-        return
+        return None
     step = Decimal("1")
     x_range = np.arange(xlim[0], xlim[1], step)
     y_range = [y for _ in x_range]
     line_properties = {"width": 3.5, "dash": "dash"}
-    figure.add_trace(
-        go.Scatter(
-            x=x_range,
-            y=y_range,
-            mode="lines",
-            name="Sweep line",
-            line=line_properties,
-            legendgroup="sweepline",
-        )
+    return go.Scatter(
+        x=x_range,
+        y=y_range,
+        mode="lines",
+        name="Sweep line",
+        line=line_properties,
+        legendgroup="sweepline",
     )
 
 
-def is_equal_limit_site(
-    site: SiteToUse, limit_site: SiteToUse, site_class: Type[Site]
-) -> None:
-    """Check if site is a limit site."""
-    if site_class == Site:
-        return site.point.x == limit_site.x and site.point.y == limit_site.y
-    elif site_class == WeightedSite:
-        return (
-            site.point.x == limit_site[0].x
-            and site.point.y == limit_site[0].y
-            and site.weight == limit_site[1]
-        )
+def plot_sweep_line(figure: go.Figure, xlim, ylim, event: Event):
+    """Plot event sweep line."""
+    trace = get_sweep_line_trace(xlim, ylim, event.get_event_point().y)
+    if trace is not None:
+        figure.add_trace(trace)
+
+
+def get_event_trace(x: Decimal, y: Decimal, name: str) -> go.Scatter:
+    """Get trace of an event in its event point."""
+    color = f"rgb({randint(0, 255)}, {randint(0, 255)}, {randint(0, 255)})"
+    return get_point_trace(
+        x, y, name=name, color=color, symbol="diamond", size=8, group="events",
+    )
 
 
 def plot_events_traces(figure: go.Figure, q_queue: QStructure):
     """Get events traces."""
     for event in q_queue.get_all_events():
-        color = f"rgb({randint(0, 255)}, {randint(0, 255)}, {randint(0, 255)})"
+        event_point = event.get_event_point()
         figure.add_trace(
-            get_point_trace(
-                event.get_event_point().x,
-                event.get_event_point().y,
-                name=f"{event.get_event_str()}",
-                color=color,
-                symbol="diamond",
-                size=8,
-                group="events",
-            )
+            get_event_trace(event_point.x, event_point.y, event.get_event_str())
         )
@@ -0,0 +1,256 @@
+"""Fortune's Algorithm steps plot."""
+
+# Standard Library
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from decimal import Decimal
+
+# Voronoi Diagrams
+from voronoi_diagrams.observers import FortunesAlgorithmObserver
+from voronoi_diagrams.models import Bisector, Boundary, Site, Vertex
+
+# Plot
+from plotly import graph_objects as go
+
+# Plot Models
+from .models.events import (
+    get_event_trace,
+    get_site_traces,
+    get_sweep_line_trace,
+)
+from .models.boundaries import get_plot_scatter_boundary
+from .models.bisectors import plot_edge
+from .models.vertices import plot_vertex
+
+Limit = Tuple[Any, Any]
+
+
+def get_empty_step_figure(xlim: Limit, ylim: Limit) -> go.Figure:
+    """Get figure of the steps with its layout and without traces."""
+    figure = go.Figure()
+    layout = go.Layout(
+        height=745,
+        width=815,
+        hovermode="closest",
+        legend={"itemclick": "toggleothers", "itemdoubleclick": "toggle"},
+    )
+    template = dict(layout=layout)
+    figure.update_layout(title="VD", template=template)
+    figure.update_xaxes(range=list(xlim))
+    figure.update_yaxes(range=list(ylim), scaleanchor="x", scaleratio=1)
+    return figure
+
+
+def get_step_overlay_traces(
+    xlim: Limit,
+    ylim: Limit,
+    sweep_line_y: Decimal,
+    events: Iterable[Tuple[Decimal, Decimal, str]],
+) -> List[go.Scatter]:
+    """Get traces of the sweep line and the events of a step.
+
+    events are the event point and the name of every event in Q.
+    """
+    traces = []
+    sweep_line_trace = get_sweep_line_trace(xlim, ylim, sweep_line_y)
+    if sweep_line_trace is not None:
+        traces.append(sweep_line_trace)
+    traces += [get_event_trace(x, y, name) for x, y, name in events]
+    return traces
+
+
+def get_step_figure(
+    xlim: Limit,
+    ylim: Limit,
+    traces: Iterable[go.Scatter],
+    sweep_line_y: Decimal,
+    events: Iterable[Tuple[Decimal, Decimal, str]],
+) -> go.Figure:
+    """Get figure of a step.
+
+    traces are the traces of the diagram in the step and events the event point and
+    the name of every event in Q.
+    """
+    figure = get_empty_step_figure(xlim, ylim)
+    traces = list(traces)
+    traces += get_step_overlay_traces(xlim, ylim, sweep_line_y, events)
+    figure.add_traces(traces)
+    return figure
+
+
+class PlotStepsObserver(FortunesAlgorithmObserver):
+    """Plot every step of Fortune's Algorithm in a plotly figure.
+
+    The figure of a step is only plotted when it is requested with get_figure.
+    """
+
+    figure: Optional[go.Figure]
+    _is_plotted: bool
+    _figure_traces: int
+    _traces: List[Optional[go.Scatter]]
+    _boundary_plot_dict: Dict[str, int]
+    _bisector_plot_dict: Dict[Tuple[str, bool], List[int]]
+
+    def __init__(self) -> None:
+        """Construct observer without figure."""
+        self.figure = None
+        self._is_plotted = False
+
+    def start(self, voronoi_diagram) -> None:
+        """Start with the figure to be plotted."""
+        super(PlotStepsObserver, self).start(voronoi_diagram)
+        self.figure = None
+        self._is_plotted = False
+        self._figure_traces = 0
+        self._traces = []
+        self._boundary_plot_dict = {}
+        self._bisector_plot_dict = {}
+
+    def add_site(self, site: Site) -> None:
+        """Set site trace in traces."""
+        site_traces = get_site_traces(site, self.voronoi_diagram.SITE_CLASS)
+        self._traces += site_traces
+        self._figure_traces += len(site_traces)
+
+    def step(self) -> None:
+        """Mark step to be plotted when the figure is requested."""
+        self._is_plotted = False
+
+    def get_figure(self) -> go.Figure:
+        """Get figure of the current step, plotting it if needed."""
+        if self._is_plotted:
+            return self.figure
+        events = []
+        for event in self.voronoi_diagram.q_structure.get_all_events():
+            event_point = event.get_event_point()
+            events.append((event_point.x, event_point.y, event.get_event_str()))
+        self.figure = get_step_figure(
+            self.voronoi_diagram._xlim,
+            self.voronoi_diagram._ylim,
+            [trace for trace in self._traces if trace is not None],
+            self.voronoi_diagram.event.get_event_point().y,
+            events,
+        )
+        self._is_plotted = True
+        return self.figure
+
+    def get_traces(self) -> List[Optional[go.Scatter]]:
+        """Get traces of the diagram, None where they were removed."""
+        return self._traces
+
+    def site_event(self, boundary_minus: Boundary, boundary_plus: Boundary) -> None:
+        """Add the new boundaries and its bisector to plot."""
+        self._add_boundaries_to_plot([boundary_plus, boundary_minus])
+        self._add_bisector_to_plot(boundary_minus.bisector, None)
+
+    def intersection_event(
+        self, boundary_q_s: Boundary, boundary_q_r: Boundary, boundary_r_s: Boundary,
+    ) -> None:
+        """Replace the old boundaries with the new one in plot."""
+        self._remove_boundaries_from_figure_traces(
+            boundary_q_r, boundary_r_s,
+        )
+        self._update_boundaries_bisectors_figure_traces([boundary_q_r, boundary_r_s])
+        self._add_boundary_to_plot(boundary_q_s)
+        self._add_bisector_to_plot(boundary_q_s.bisector, boundary_q_s.sign)
+
+    def add_vertex(self, vertex: Vertex) -> None:
+        """Add vertex to vd trace."""
+        trace = plot_vertex(vertex)
+        self._traces.append(trace)
+        self._figure_traces += 1
+
+    def _add_boundaries_to_plot(self, boundaries: List[Boundary]):
+        """Add boundaries to plot."""
+        for boundary in boundaries:
+            self._add_boundary_to_plot(boundary)
+
+    def _add_boundary_to_plot(self, boundary: Boundary):
+        """Add boundary to plot."""
+        trace = get_plot_scatter_boundary(
+            boundary,
+            self.voronoi_diagram._xlim,
+            self.voronoi_diagram._ylim,
+            self.voronoi_diagram.BISECTOR_CLASS,
+        )
+        self._traces.append(trace)
+        self._figure_traces += 1
+        # TODO: Change to use complete_string()
+        self._boundary_plot_dict[str(boundary)] = self._figure_traces - 1
+
+    def _add_bisector_to_plot(self, bisector: Bisector, sign: Optional[bool]):
+        """Add boundary to plot."""
+        if sign is None:
+            vd_bisector = self.voronoi_diagram.get_edges([(bisector, True)])[0]
+        else:
+            vd_bisector = self.voronoi_diagram.get_edges([(bisector, sign)])[0]
+        traces = plot_edge(
+            vd_bisector,
+            self.voronoi_diagram._xlim,
+            self.voronoi_diagram._ylim,
+            self.voronoi_diagram.BISECTOR_CLASS,
+        )
+        self._traces += traces
+        traces_numbers = list(
+            range(self._figure_traces, self._figure_traces + len(traces))
+        )
+        if sign is None:
+            self._bisector_plot_dict[
+                (str(bisector.get_object_to_hash()), True)
+            ] = traces_numbers
+            self._bisector_plot_dict[
+                (str(bisector.get_object_to_hash()), False)
+            ] = traces_numbers
+        else:
+            self._bisector_plot_dict[
+                (str(bisector.get_object_to_hash()), sign)
+            ] = traces_numbers
+        self._figure_traces += len(traces)
+
+    def _update_boundaries_bisectors_figure_traces(
+        self, boundaries: List[Optional[Boundary]]
+    ):
+        """Update boundaries bisectors' figure traces."""
+        for boundary in boundaries:
+            if boundary is None:
+                continue
+            self._update_bisector_figure_traces(boundary.bisector, boundary.sign)
+
+    def _update_bisector_figure_traces(self, bisector: Bisector, sign: bool):
+        """Update bisector's figure traces."""
+        bisector_traces = self._bisector_plot_dict[
+            (str(bisector.get_object_to_hash()), sign)
+        ]
+        bisector_other_sign_traces = self._bisector_plot_dict.get(
+            (str(bisector.get_object_to_hash()), not sign), []
+        )
+        if bisector_traces == bisector_other_sign_traces:
+            sign = None
+        for bisector_trace_i in bisector_traces:
+            self._traces[bisector_trace_i] = None
+        self._add_bisector_to_plot(bisector, sign)
+
+    def _remove_boundaries_from_figure_traces(
+        self, boundary1: Optional[Boundary], boundary2: Optional[Boundary]
+    ):
+        """Remove boundary from figure traces."""
+        if boundary1 is None and boundary2 is None:
+            return
+        if boundary1 is None:
+            self._remove_boundary_from_figure_traces(boundary2)
+        elif boundary2 is None:
+            self._remove_boundary_from_figure_traces(boundary1)
+        else:
+            position1 = self._boundary_plot_dict[str(boundary1)]
+            position2 = self._boundary_plot_dict[str(boundary2)]
+            if position1 > position2:
+                self._remove_boundary_from_figure_traces(boundary1)
+                self._remove_boundary_from_figure_traces(boundary2)
+            else:
+                self._remove_boundary_from_figure_traces(boundary2)
+                self._remove_boundary_from_figure_traces(boundary1)
+
+    def _remove_boundary_from_figure_traces(self, boundary: Optional[Boundary]):
+        """Remove boundary from figure traces."""
+        if boundary is None:
+            return
+        self._traces[self._boundary_plot_dict[str(boundary)]] = None
@@ -18,16 +18,46 @@ from voronoi_diagrams.models import (
 # from matplotlib import pyplot as plt
 from plotly import graph_objects as go
 from plots.plot_utils.models.bisectors import plot_vertices_and_edges
-from plots.plot_utils.models.events import plot_site, is_equal_limit_site
+from plots.plot_utils.models.events import plot_site
 
 
 SiteToUse = Union[Point, Tuple[Point, Decimal]]
 Limit = Tuple[Decimal, Decimal]
 
+# Plotly config of the plots.
+PLOT_CONFIG = {
+    "modeBarButtonsToRemove": ["toggleSpikelines", "hoverCompareCartesian"],
+    "modeBarButtonsToAdd": ["drawopenpath", "drawclosedpath", "eraseshape"],
+}
+
+
+def get_cell_traces(
+    voronoi_diagram: FortunesAlgorithm, xlim: Limit, ylim: Limit
+) -> List[go.Scatter]:
+    """Get traces of the cells clipped to the limits."""
+    traces = []
+    polygons = voronoi_diagram.get_cell_polygons(xlim, ylim)
+    for site, polygon in zip(voronoi_diagram.sites, polygons):
+        if not polygon:
+            continue
+        traces.append(
+            go.Scatter(
+                x=[point.x for point in polygon + polygon[:1]],
+                y=[point.y for point in polygon + polygon[:1]],
+                mode="lines",
+                fill="toself",
+                opacity=0.15,
+                line={"width": 0},
+                name=f"Cell {site.name}",
+                legendgroup="cells",
+                hoverinfo="name",
+            )
+        )
+    return traces
+
 
 def get_vd_figure(
     voronoi_diagram: FortunesAlgorithm,
-    limit_sites: List[SiteToUse],
     xlim: Limit,
     ylim: Limit,
     site_class: Type[Site] = Site,
@@ -49,17 +79,18 @@ def get_vd_figure(
     if site_class == WeightedSite:
         bisector_class = WeightedPointBisector
 
+    # Cells, only when the sweep has ended.
+    if not voronoi_diagram.has_next_step():
+        for trace in get_cell_traces(voronoi_diagram, xlim, ylim):
+            figure.add_trace(trace)
+
     # Sites.
     for site in voronoi_diagram.sites:
-        for limit_site in limit_sites:
-            if is_equal_limit_site(site, limit_site, site_class=site_class):
-                break
-        else:
-            plot_site(figure, site, site_class)
+        plot_site(figure, site, site_class)
 
     # Diagram.
     traces = plot_vertices_and_edges(
-        voronoi_diagram.edges, limit_sites, xlim, ylim, bisector_class=bisector_class,
+        voronoi_diagram.edges, xlim, ylim, bisector_class=bisector_class,
     )
     for trace in traces:
         figure.add_trace(trace)
@@ -69,34 +100,22 @@ def get_vd_figure(
 
 def get_html(figure: go.Figure):
     """Get html of the Figure."""
-    config = {
-        "modeBarButtonsToRemove": ["toggleSpikelines", "hoverCompareCartesian"],
-        "modeBarButtonsToAdd": ["drawopenpath", "drawclosedpath", "eraseshape"],
-    }
-    return figure.to_html(config=config)
+    return figure.to_html(config=PLOT_CONFIG)
 
 
-def get_vd_html(
-    voronoi_diagram: FortunesAlgorithm,
-    limit_sites: List[SiteToUse],
-    xlim: Limit,
-    ylim: Limit,
-) -> None:
+def get_vd_html(voronoi_diagram: FortunesAlgorithm, xlim: Limit, ylim: Limit) -> None:
     """Plot voronoi diagram."""
-    figure = get_vd_figure(
-        voronoi_diagram, limit_sites, xlim, ylim, voronoi_diagram.SITE_CLASS
-    )
+    figure = get_vd_figure(voronoi_diagram, xlim, ylim, voronoi_diagram.SITE_CLASS)
     html = get_html(figure)
     return html
 
 
 def plot_voronoi_diagram(
     voronoi_diagram: FortunesAlgorithm,
-    limit_sites: List[SiteToUse],
     xlim: Limit,
     ylim: Limit,
     site_class: Type[Site] = Site,
 ) -> None:
     """Plot voronoi diagram."""
-    figure = get_vd_figure(voronoi_diagram, limit_sites, xlim, ylim, site_class)
+    figure = get_vd_figure(voronoi_diagram, xlim, ylim, site_class)
     figure.show()
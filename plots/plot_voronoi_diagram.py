@@ -23,93 +23,6 @@ VORONOI_DIAGRAM_TYPE = 1
 AW_VORONOI_DIAGRAM_TYPE = 2
 
 
-def get_limit_sites(
-    xlim: Limit, ylim: Limit, sites: List[SiteToUse], type_vd: int
-) -> List[SiteToUse]:
-    """Get limit sites."""
-    to_return = []
-    x0, x1 = xlim
-    y0, y1 = ylim
-    min_x_site = sites[0]
-    max_x_site = sites[0]
-    min_y_site = sites[0]
-    max_y_site = sites[0]
-
-    if type_vd == VORONOI_DIAGRAM_TYPE:
-        for point in sites:
-            if point.x < min_x_site.x:
-                min_x_site = point
-            if point.x > max_x_site.x:
-                max_x_site = point
-            if point.y < min_y_site.y:
-                min_y_site = point
-            if point.y > max_y_site.y:
-                max_y_site = point
-        # X
-        if x0 >= min_x_site.x:
-            x0_site = Point(min_x_site.x - 1, min_x_site.y)
-        else:
-            x0_site = Point(x0 - (min_x_site.x - x0), min_x_site.y)
-        if x1 <= min_x_site.x:
-            x1_site = Point(max_x_site.x + 1, max_x_site.y)
-        else:
-            x1_site = Point(x1 + (x1 - max_x_site.x), max_x_site.y)
-        # Y
-        if y0 >= min_y_site.y:
-            y0_site = Point(min_y_site.x, min_y_site.y - 1)
-        else:
-            y0_site = Point(min_y_site.x, y0 - (min_y_site.y - y0))
-        if y1 <= min_y_site.x:
-            y1_site = Point(max_y_site.x, max_y_site.y + 1)
-        else:
-            y1_site = Point(max_y_site.x, y1 + (y1 - max_y_site.y))
-        to_return = [x0_site, x1_site, y0_site, y1_site]
-
-    elif type_vd == AW_VORONOI_DIAGRAM_TYPE:
-        for point, weight in sites:
-            if point.x + weight < min_x_site[0].x + min_x_site[1]:
-                min_x_site = (point, weight)
-            if point.x - weight > max_x_site[0].x - max_x_site[1]:
-                max_x_site = (point, weight)
-            if point.y + weight < min_y_site[0].y + min_y_site[1]:
-                min_y_site = (point, weight)
-            if point.y - weight > max_y_site[0].y - min_y_site[1]:
-                max_y_site = (point, weight)
-        # X
-        if x0 >= min_x_site[0].x:
-            x0_site = (Point(min_x_site[0].x - 1, min_x_site[0].y), min_x_site[1])
-        else:
-            x0_site = (
-                Point(x0 - (min_x_site[0].x - x0), min_x_site[0].y),
-                min_x_site[1],
-            )
-        if x1 <= min_x_site[0].x:
-            x1_site = (Point(max_x_site[0].x + 1, max_x_site[0].y), max_x_site[1])
-        else:
-            x1_site = (
-                Point(x1 + (x1 - max_x_site[0].x), max_x_site[0].y),
-                max_x_site[1],
-            )
-        # Y
-        if y0 >= min_y_site[0].y:
-            y0_site = (Point(min_y_site[0].x, min_y_site[0].y - 1), min_y_site[1])
-        else:
-            y0_site = (
-                Point(min_y_site[0].x, y0 - (min_y_site[0].y - y0)),
-                min_y_site[1],
-            )
-        if y1 <= min_y_site[0].x:
-            y1_site = (Point(max_y_site[0].x, max_y_site[0].y + 1), max_y_site[1])
-        else:
-            y1_site = (
-                Point(max_y_site[0].x, y1 + (y1 - max_y_site[0].y)),
-                max_y_site[1],
-            )
-        to_return = [x0_site, x1_site, y0_site, y1_site]
-
-    return to_return
-
-
 def get_limits() -> Tuple[Limit, Limit]:
     """Get Limits to used in the plot."""
     print(
@@ -126,7 +39,6 @@ def get_limits() -> Tuple[Limit, Limit]:
 
 def get_diagram_and_plot(
     sites: List[SiteToUse],
-    limit_sites: List[SiteToUse],
     xlim: Limit,
     ylim: Limit,
     type_vd: int,
@@ -135,8 +47,6 @@ def get_diagram_and_plot(
     mode: int = AUTOMATIC_MODE,
 ) -> None:
     """Get and plot Voronoi Diagram depending on the requested type."""
-    sites += limit_sites
-    # print(limit_sites)  # Debugging
     start_time = time.time()
     if type_vd == VORONOI_DIAGRAM_TYPE:
         voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
@@ -145,7 +55,7 @@ def get_diagram_and_plot(
         print("--- %s seconds to calculate diagram. ---" % (time.time() - start_time))
         site_class = Site
         if plot_diagram:
-            plot_voronoi_diagram(voronoi_diagram, limit_sites, xlim, ylim)
+            plot_voronoi_diagram(voronoi_diagram, xlim, ylim)
     elif type_vd == AW_VORONOI_DIAGRAM_TYPE:
         voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
             sites, plot_steps=plot_steps, xlim=xlim, ylim=ylim, mode=mode
@@ -163,12 +73,12 @@ def get_diagram_and_plot(
     # Plot
     if plot_diagram:
         plot_voronoi_diagram(
-            voronoi_diagram, limit_sites, xlim, ylim, site_class=site_class,
+            voronoi_diagram, xlim, ylim, site_class=site_class,
         )
 
 
 def get_sites_to_use(type_vd: int, random_sites: bool) -> Optional[List[SiteToUse]]:
-    """Get sites to use and limit_sites."""
+    """Get sites to use."""
     n = int(input("Insert number of sites: "))
     sites = []
     if type_vd not in [1, 2]:
@@ -253,10 +163,8 @@ if __name__ == "__main__":
     if sites is None:
         print("Bye bye")
     else:
-        limit_sites = []
         get_diagram_and_plot(
             sites,
-            limit_sites,
             xlim,
             ylim,
             type_vd,
@@ -0,0 +1,4 @@
+"""Fixtures of the tests of batch computation."""
+
+# Fixtures
+from tests.fortunes_algorithm.conftest import points, weights  # noqa: F401
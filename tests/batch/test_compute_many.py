@@ -0,0 +1,57 @@
+"""Test batch computation of Voronoi Diagrams."""
+
+# Batch
+from voronoi_diagrams.batch import compute_many, compute_one, to_site_array
+
+# Models
+from voronoi_diagrams.models import NO_VERTEX
+
+# Testing
+from pytest import raises
+
+# Math
+import numpy as np
+
+
+class TestComputeMany:
+    """Test compute_many against computing every diagram alone."""
+
+    def get_site_sets(self, points, weights):
+        """Get point and weighted site sets of float coordinates."""
+        points = [(float(point.x), float(point.y)) for point in points]
+        weighted_points = [
+            (x, y, float(weight)) for (x, y), weight in zip(points, weights)
+        ]
+        return [points, weighted_points, points[:4], points[2:]]
+
+    def test_same_diagrams_as_compute_one(self, points, weights):
+        """Test every result is the diagram of the site set with its index."""
+        site_sets = self.get_site_sets(points, weights)
+        results = list(compute_many(site_sets, workers=2, chunksize=1))
+        assert sorted(result.index for result in results) == [0, 1, 2, 3]
+        for result in results:
+            expected = compute_one(to_site_array(site_sets[result.index]))
+            assert np.array_equal(result.vertices, expected.vertices)
+            assert np.array_equal(result.edges, expected.edges)
+
+    def test_edges_table(self, points, weights):
+        """Test the edges table references sites and vertices."""
+        result = compute_one(to_site_array(self.get_site_sets(points, weights)[0]))
+        assert result.edges.dtype == np.int32
+        assert result.edges.shape[1] == 4
+        assert result.edges[:, :2].min() >= 0
+        assert result.edges[:, :2].max() < len(points)
+        vertex_indices = result.edges[:, 2:]
+        assert vertex_indices[vertex_indices != NO_VERTEX].max() < len(result.vertices)
+        # Every vertex is the endpoint of 3 edges.
+        assert (vertex_indices != NO_VERTEX).sum() == 3 * len(result.vertices)
+
+    def test_in_process(self, points, weights):
+        """Test one worker computes the diagrams in order."""
+        results = list(compute_many(self.get_site_sets(points, weights), workers=1))
+        assert [result.index for result in results] == [0, 1, 2, 3]
+
+    def test_invalid_sites(self):
+        """Test site sets must have 2 or 3 columns."""
+        with raises(ValueError):
+            list(compute_many([[(1, 2, 3, 4)]], workers=1))
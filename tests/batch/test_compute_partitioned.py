@@ -0,0 +1,68 @@
+"""Test divide and conquer computation of a Voronoi Diagram."""
+
+# Batch
+from voronoi_diagrams.batch import compute_one
+from voronoi_diagrams.partitioned import compute_partitioned
+
+# Models
+from voronoi_diagrams.models import NO_VERTEX
+
+# Testing
+from pytest import raises
+
+# Math
+import numpy as np
+
+# Utils
+from general_utils.numbers import FLOAT_NUMERIC
+
+
+def get_edges_with_vertices(diagram):
+    """Get the vertices of each edge by its sites, independent of the order."""
+    return {
+        (site_a, site_b): frozenset(
+            tuple(np.round(diagram.vertices[vertex], 6))
+            for vertex in (v0, v1)
+            if vertex != NO_VERTEX
+        )
+        for site_a, site_b, v0, v1 in diagram.edges.tolist()
+    }
+
+
+class TestComputePartitioned:
+    """Test partitioned diagrams against calculating all the sites at once."""
+
+    def assert_same_diagram(self, sites, strips, workers=1, numeric=FLOAT_NUMERIC):
+        """Assert the partitioned diagram is the diagram of all the sites."""
+        expected = compute_one(np.asarray(sites, dtype=float), numeric=numeric)
+        result = compute_partitioned(
+            sites, workers=workers, strips=strips, numeric=numeric
+        )
+        assert get_edges_with_vertices(result) == get_edges_with_vertices(expected)
+        assert len(result.vertices) == len(expected.vertices)
+
+    def test_random_sites(self):
+        """Test random site sets with different number of strips."""
+        rng = np.random.default_rng(0)
+        for strips in (2, 3, 5):
+            self.assert_same_diagram(rng.uniform(-100, 100, (150, 2)), strips)
+            self.assert_same_diagram(rng.normal(0, 30, (150, 2)), strips)
+
+    def test_grid(self):
+        """Test sites with many cocircular sites."""
+        sites = [(x, y) for x in range(8) for y in range(7)]
+        self.assert_same_diagram(sites, 3)
+
+    def test_collinear_sites(self):
+        """Test sites in a line, where no edge has vertices."""
+        self.assert_same_diagram([(x, 0.5 * x) for x in range(12)], 3)
+
+    def test_worker_processes(self):
+        """Test strips calculated in worker processes."""
+        rng = np.random.default_rng(1)
+        self.assert_same_diagram(rng.uniform(-100, 100, (100, 2)), 4, workers=2)
+
+    def test_weighted_sites(self):
+        """Test weighted sites can not be partitioned."""
+        with raises(ValueError):
+            compute_partitioned([(0, 0, 1), (1, 1, 2)], workers=1, strips=2)
@@ -0,0 +1,97 @@
+"""Test get roots."""
+# Standard Library
+from random import randint, uniform
+
+# Testing
+import pytest
+
+# Conic Sections
+from conic_sections.utils.polynomials import get_roots
+
+# Math
+from decimal import Decimal
+from numpy import roots
+
+# Utils
+from general_utils.numbers import are_close
+
+
+def _get_sorted_roots(xs):
+    """Sort roots to compare them."""
+    return sorted(xs, key=lambda x: (round(x.real, 6), round(x.imag, 6)))
+
+
+def _are_same_roots(xs, expected_xs, tolerance=0.000001):
+    """Check that both lists have the same roots."""
+    if len(xs) != len(expected_xs):
+        return False
+    for x, expected_x in zip(_get_sorted_roots(xs), _get_sorted_roots(expected_xs)):
+        if abs(x - expected_x) > tolerance * max(1, abs(expected_x)):
+            return False
+    return True
+
+
+class TestGetRoots:
+    """Test get roots of polynomials."""
+
+    def test_linear(self):
+        """Test with a polynomial of degree 1."""
+        xs = get_roots([Decimal(2), Decimal(-4)])
+        assert len(xs) == 1
+        assert xs[0] == complex(2)
+
+    def test_leading_and_trailing_zeros(self):
+        """Test that leading zeros are ignored and trailing zeros are roots."""
+        xs = get_roots([Decimal(0), Decimal(1), Decimal(-3), Decimal(2), Decimal(0)])
+        assert _are_same_roots(xs, [complex(0), complex(1), complex(2)])
+        assert get_roots([Decimal(0), Decimal(0), Decimal(5)]) == []
+
+    def test_quadratic(self):
+        """Test with a polynomial of degree 2."""
+        xs = get_roots([Decimal(1), Decimal(-3), Decimal(2)])
+        assert _are_same_roots(xs, [complex(1), complex(2)])
+        xs = get_roots([Decimal(1), Decimal(0), Decimal(1)])
+        assert _are_same_roots(xs, [complex(0, 1), complex(0, -1)])
+        # Cancellation of -b + sqrt(b^2 - 4ac).
+        xs = get_roots([Decimal(1), Decimal(100000000), Decimal(1)])
+        assert _get_sorted_roots(xs)[1] == complex(-0.00000001)
+
+    def test_cubic(self):
+        """Test with a polynomial of degree 3."""
+        # (x - 1)(x - 2)(x - 3)
+        xs = get_roots([Decimal(1), Decimal(-6), Decimal(11), Decimal(-6)])
+        assert _are_same_roots(xs, [complex(1), complex(2), complex(3)])
+        # (x - 2)^3
+        xs = get_roots([Decimal(1), Decimal(-6), Decimal(12), Decimal(-8)])
+        assert _are_same_roots(xs, [complex(2)] * 3, tolerance=0.0001)
+
+    def test_quartic(self):
+        """Test with a polynomial of degree 4."""
+        # (x - 1)(x + 1)(x - 2)(x + 3)
+        xs = get_roots([Decimal(1), Decimal(1), Decimal(-7), Decimal(-1), Decimal(6)])
+        assert _are_same_roots(xs, [complex(1), complex(-1), complex(2), complex(-3)])
+        # Biquadratic x^4 - 5x^2 + 4.
+        xs = get_roots([Decimal(1), Decimal(0), Decimal(-5), Decimal(0), Decimal(4)])
+        assert _are_same_roots(xs, [complex(1), complex(-1), complex(2), complex(-2)])
+        # (x^2 + 1)(x - 3)^2
+        xs = get_roots([Decimal(1), Decimal(-6), Decimal(10), Decimal(-6), Decimal(9)])
+        assert _are_same_roots(
+            xs, [complex(0, 1), complex(0, -1), complex(3), complex(3)], 0.0001
+        )
+
+    def test_random_polynomials(self):
+        """Test that the roots are the same as the ones of numpy."""
+        for _ in range(200):
+            degree = randint(1, 4)
+            ps = [Decimal(uniform(-100, 100)) for _ in range(degree + 1)]
+            xs = get_roots(ps)
+            expected_xs = roots([float(p) for p in ps])
+            assert len(xs) == len(expected_xs)
+            for x in expected_xs:
+                if are_close(x.imag, 0.0, 0.001):
+                    assert any(abs(x - y) < 0.0001 * max(1, abs(x)) for y in xs)
+
+    def test_degree_not_supported(self):
+        """Test that polynomials of degree greater than 4 raise an error."""
+        with pytest.raises(ValueError):
+            get_roots([Decimal(1)] * 6)
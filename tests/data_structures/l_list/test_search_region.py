@@ -0,0 +1,74 @@
+"""Test search region."""
+# Standard Library
+from random import randint
+
+# Data structures
+from voronoi_diagrams.data_structures import LStructure
+
+# Models
+from voronoi_diagrams.models import Region, Site, PointBisector, PointBoundary
+
+# Math
+from decimal import Decimal
+
+
+def create_l_list_with_5_regions():
+    """Create an L List with the regions of p, q and r."""
+    p = Site(Decimal(0), Decimal(0))
+    q = Site(Decimal(2), Decimal(2))
+    r = Site(Decimal(2), Decimal(3))
+
+    bisector_pq = PointBisector((p, q))
+    bisector_qr = PointBisector((q, r))
+
+    boundary_pq_minus = PointBoundary(bisector_pq, False)
+    boundary_pq_plus = PointBoundary(bisector_pq, True)
+    boundary_qr_minus = PointBoundary(bisector_qr, False)
+    boundary_qr_plus = PointBoundary(bisector_qr, True)
+
+    l_list = LStructure(Region(p, None, None))
+    r_p_left = Region(p, None, boundary_pq_minus)
+    r_q = Region(q, boundary_pq_minus, boundary_pq_plus)
+    r_p_right = Region(p, boundary_pq_plus, None)
+    l_list.update_regions(r_p_left, r_q, r_p_right)
+
+    r_q_left = Region(q, boundary_pq_minus, boundary_qr_minus)
+    r_r = Region(r, boundary_qr_minus, boundary_qr_plus)
+    r_q_right = Region(q, boundary_qr_plus, boundary_pq_plus)
+    l_list.update_regions(r_q_left, r_r, r_q_right)
+    return l_list
+
+
+class TestSearchRegion:
+    """Test search region in the L structure."""
+
+    def test_same_regions_as_avl_search(self):
+        """Test that the region found is the same found by the AVL search."""
+        l_list = create_l_list_with_5_regions()
+        for _ in range(50):
+            site = Site(Decimal(randint(-20, 20)), Decimal(randint(4, 20)))
+            assert l_list.search_region_node(site) is l_list.t.search(site)
+
+    def test_boundaries_are_compared_once(self):
+        """Test that each boundary is compared once with the same site."""
+        l_list = create_l_list_with_5_regions()
+        counter = l_list.comparisons.counter
+        site = Site(Decimal(3), Decimal(5))
+        node = l_list.search_region_node(site)
+        misses = counter.misses
+        # Each boundary is compared at most once.
+        assert misses <= 4
+        hits = counter.hits
+        assert l_list.search_region_node(site) is node
+        assert counter.misses == misses
+        assert counter.hits > hits
+
+    def test_comparisons_are_cleared_when_sweep_advances(self):
+        """Test that comparisons of other y coordinates are not used."""
+        l_list = create_l_list_with_5_regions()
+        l_list.search_region_node(Site(Decimal(3), Decimal(5)))
+        assert l_list.comparisons.y == Decimal(5)
+        l_list.search_region_node(Site(Decimal(3), Decimal(6)))
+        assert l_list.comparisons.y == Decimal(6)
+        for key in l_list.comparisons.comparisons:
+            assert key[1] == Decimal(3)
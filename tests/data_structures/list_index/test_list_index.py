@@ -0,0 +1,36 @@
+"""Test List Index."""
+# Standard Library
+from random import Random
+
+# Data structures
+from voronoi_diagrams.data_structures import ListIndex
+
+
+class TestListIndex:
+    """Test List Index."""
+
+    def test_remove(self) -> None:
+        """Test removed items leave the other items in their positions."""
+        rnd = Random(0)
+        names = [f"item {i}" for i in range(100)]
+        lengths = [len(name) for name in names]
+        index = ListIndex([names, lengths], get_key=lambda name: name)
+        removed = rnd.sample(names, 60)
+        for name in removed:
+            index.remove(name)
+            assert name not in index
+        index.remove(removed[0])
+        assert sorted(names) == sorted(set(names) - set(removed))
+        for i, name in enumerate(names):
+            assert index.get_position(name) == i
+            assert lengths[i] == len(name)
+
+    def test_append(self) -> None:
+        """Test appended items are indexed."""
+        items = [3, 1]
+        index = ListIndex([items], get_key=lambda item: item)
+        index.append(2)
+        index.remove(3)
+        assert items == [2, 1]
+        assert index.get_position(2) == 0
+        assert index.get_position(3) is None
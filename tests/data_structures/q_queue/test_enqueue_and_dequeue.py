@@ -46,3 +46,36 @@ class TestEnqueueDequeueRegions:
             for event in random_list:
                 q_queue.enqueue(event)
             validate_q_queue_with_expected_list(q_queue, expected_list)
+
+    def test_enqueue_sites(self) -> None:
+        """Test bulk enqueued sites are merged with the enqueued events."""
+        sites: List[Event] = [Site(0, i) for i in range(0, 1000, 2)]
+        events: List[Event] = [Site(0, i) for i in range(1, 1000, 2)]
+        expected_list: List[Event] = [Site(0, i) for i in range(1000)]
+        q_queue = QStructure()
+        random_list = sites.copy()
+        shuffle(random_list)
+        q_queue.enqueue_sites(random_list)
+        for event in events:
+            q_queue.enqueue(event)
+        assert [event.point for event in q_queue.get_all_events()] == [
+            event.point for event in expected_list
+        ]
+        validate_q_queue_with_expected_list(q_queue, expected_list)
+        assert q_queue.is_empty()
+
+    def test_len(self) -> None:
+        """Test number of events with sites and events enqueued and deleted."""
+        sites: List[Event] = [Site(0, i) for i in range(0, 100, 2)]
+        events: List[Event] = [Site(0, i) for i in range(1, 100, 2)]
+        q_queue = QStructure()
+        q_queue.enqueue_sites(sites)
+        for event in events:
+            q_queue.enqueue(event)
+        assert len(q_queue) == 100
+        for event in events[::2]:
+            q_queue.delete(event)
+        assert len(q_queue) == 75
+        for i in range(75):
+            q_queue.dequeue()
+            assert len(q_queue) == 74 - i
@@ -0,0 +1,76 @@
+"""Test Heap Q Structure."""
+# Standard Library
+from typing import List
+from random import shuffle
+
+# Data structures
+from voronoi_diagrams.data_structures import HeapQStructure, QStructure
+
+# Models
+from voronoi_diagrams.models import Event, Site, WeightedSite
+
+# Tests
+from tests.data_structures.q_queue.test_enqueue_and_dequeue import (
+    validate_q_queue_with_expected_list,
+)
+
+
+class TestHeapQStructure:
+    """Test Heap Q Structure."""
+
+    def test_enqueue_dequeue(self) -> None:
+        """Test events are dequeued sorted."""
+        expected_list: List[Event] = [Site(0, i) for i in range(1000)]
+        q_queue = HeapQStructure()
+        for _ in range(100):
+            random_list = expected_list.copy()
+            shuffle(random_list)
+            for event in random_list:
+                q_queue.enqueue(event)
+            validate_q_queue_with_expected_list(q_queue, expected_list)
+            assert q_queue.is_empty()
+
+    def test_same_y(self) -> None:
+        """Test events with the same y are sorted as in the AVL Q Structure."""
+        sites = [WeightedSite(0, 0, 2), WeightedSite(1, 2, 0), WeightedSite(2, 2, 0)]
+        q_queue = HeapQStructure()
+        avl_q_queue = QStructure()
+        for site in sites:
+            q_queue.enqueue(site)
+            avl_q_queue.enqueue(site)
+        expected_list = [sites[2], sites[1], sites[0]]
+        assert avl_q_queue.get_all_events() == expected_list
+        assert [q_queue.dequeue() for _ in sites] == expected_list
+
+    def test_delete(self) -> None:
+        """Test deleted events are skipped."""
+        events: List[Event] = [Site(0, i) for i in range(100)]
+        q_queue = HeapQStructure()
+        for event in events:
+            q_queue.enqueue(event)
+        for event in events[::2]:
+            q_queue.delete(event)
+        # Deleting an event that is not in the queue does nothing.
+        q_queue.delete(events[0])
+        q_queue.delete(Site(0, 1000))
+        assert len(q_queue) == 50
+        assert q_queue.get_all_events() == events[1::2]
+        validate_q_queue_with_expected_list(q_queue, events[1::2])
+        assert q_queue.is_empty()
+        assert q_queue.dequeue() is None
+
+    def test_enqueue_sites(self) -> None:
+        """Test bulk enqueued sites are merged with the enqueued events."""
+        sites: List[Event] = [Site(0, i) for i in range(0, 100, 2)]
+        events: List[Event] = [Site(0, i) for i in range(1, 100, 2)]
+        q_queue = HeapQStructure()
+        random_list = sites.copy()
+        shuffle(random_list)
+        q_queue.enqueue_sites(random_list)
+        for event in events:
+            q_queue.enqueue(event)
+        q_queue.delete(sites[1])
+        q_queue.delete(events[1])
+        expected_list = [Site(0, i) for i in range(100) if i not in (2, 3)]
+        validate_q_queue_with_expected_list(q_queue, expected_list)
+        assert q_queue.is_empty()
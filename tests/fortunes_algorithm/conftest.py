@@ -0,0 +1,41 @@
+"""Fixtures of the tests of Fortune's Algorithm."""
+
+# Standard
+from typing import List
+
+# Models
+from voronoi_diagrams.models import Point
+
+# Math
+from decimal import Decimal
+
+# Testing
+import pytest
+
+
+@pytest.fixture
+def points() -> List[Point]:
+    """Get points in general position with 3 bounded cells."""
+    return [
+        Point(Decimal("-8.25"), Decimal("4.5")),
+        Point(Decimal("3.75"), Decimal("9.125")),
+        Point(Decimal("0.5"), Decimal("-2.25")),
+        Point(Decimal("7.5"), Decimal("-6.75")),
+        Point(Decimal("-3.5"), Decimal("-9.5")),
+        Point(Decimal("-1.25"), Decimal("1.5")),
+        Point(Decimal("5"), Decimal("1.5")),
+    ]
+
+
+@pytest.fixture
+def weights() -> List[Decimal]:
+    """Get weights of the points."""
+    return [
+        Decimal("1.5"),
+        Decimal("0.5"),
+        Decimal("2.25"),
+        Decimal("1"),
+        Decimal("0.75"),
+        Decimal("0.25"),
+        Decimal("0.25"),
+    ]
@@ -0,0 +1,88 @@
+"""Test cells of the Voronoi Diagram clipped to a box."""
+
+# Models
+from voronoi_diagrams.models import Point
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+from voronoi_diagrams.clipping import get_polygon_area
+
+# Math
+from decimal import Decimal
+import numpy as np
+
+
+class TestCellPolygons:
+    """Test get_cell_polygons against the nearest site of points in the box."""
+
+    xlim = (Decimal(-12), Decimal(10))
+    ylim = (Decimal(-11), Decimal(12))
+
+    def _check_polygons(self, voronoi_diagram, polygons, area_tolerance):
+        """Check polygons cover the box and contain their nearest points."""
+        box_area = (self.xlim[1] - self.xlim[0]) * (self.ylim[1] - self.ylim[0])
+        areas = [get_polygon_area(polygon) for polygon in polygons]
+        assert all(area > 0 for area in areas)
+        assert abs(sum(areas) - box_area) <= area_tolerance * box_area
+
+        # The middle of each polygon edge is nearest to its site or on a bisector.
+        sites = voronoi_diagram.sites
+        for site, polygon in zip(sites, polygons):
+            for i in range(len(polygon)):
+                x = float(polygon[i - 1].x + polygon[i].x) / 2
+                y = float(polygon[i - 1].y + polygon[i].y) / 2
+                distances = [
+                    float(other.get_weighted_distance(Decimal(x), Decimal(y)))
+                    for other in sites
+                ]
+                assert distances[sites.index(site)] <= min(distances) + 1e-3
+
+    def test_point_sites(self, points):
+        """Test cells of point sites are exact polygons."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        polygons = voronoi_diagram.get_cell_polygons(self.xlim, self.ylim)
+        assert all(len(polygon) > 2 for polygon in polygons)
+        self._check_polygons(voronoi_diagram, polygons, Decimal("1e-20"))
+        bounded = voronoi_diagram.sites[5]
+        assert voronoi_diagram.get_cell_area(bounded) == get_polygon_area(polygons[5])
+
+    def test_weighted_sites(self, points, weights):
+        """Test cells of weighted sites sample their hyperbolas."""
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            list(zip(points, weights))
+        )
+        polygons = voronoi_diagram.get_cell_polygons(self.xlim, self.ylim, samples=64)
+        self._check_polygons(voronoi_diagram, polygons, Decimal("1e-3"))
+
+    def test_float_numeric(self, points):
+        """Test float cells have the same areas than Decimal cells."""
+        decimal_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        float_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, numeric="float"
+        )
+        decimal_areas = [
+            float(get_polygon_area(polygon))
+            for polygon in decimal_diagram.get_cell_polygons(self.xlim, self.ylim)
+        ]
+        float_areas = [
+            get_polygon_area(polygon)
+            for polygon in float_diagram.get_cell_polygons(self.xlim, self.ylim)
+        ]
+        assert np.allclose(decimal_areas, float_areas)
+
+    def test_box_in_one_cell(self):
+        """Test the box is the cell of the nearest site when no edge crosses it."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            [Point(Decimal(0), Decimal(0)), Point(Decimal(50), Decimal(0))]
+        )
+        polygons = voronoi_diagram.get_cell_polygons(self.xlim, self.ylim)
+        assert polygons[1] == []
+        assert get_polygon_area(polygons[0]) == 22 * 23
+
+    def test_strips(self):
+        """Test cells of collinear sites are closed by the box."""
+        points = [Point(Decimal(i), Decimal(0)) for i in range(-4, 5, 2)]
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        polygons = voronoi_diagram.get_cell_polygons(self.xlim, self.ylim)
+        areas = [get_polygon_area(polygon) for polygon in polygons]
+        assert areas == [9 * 23, 2 * 23, 2 * 23, 2 * 23, 7 * 23]
@@ -0,0 +1,101 @@
+"""Test doubly connected edge list of the Voronoi Diagram."""
+
+# Models
+from voronoi_diagrams.models import Point, Site
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+
+# Math
+from decimal import Decimal
+
+
+class TestDCEL:
+    """Test half-edges built in the sweep."""
+
+    def _check_cells(self, voronoi_diagram):
+        """Check every half-edge is in exactly one cell and links are consistent."""
+        seen = set()
+        for site in voronoi_diagram.sites:
+            for half_edge in voronoi_diagram.get_cell_half_edges(site):
+                assert id(half_edge) not in seen
+                seen.add(id(half_edge))
+                assert half_edge.site is site
+                assert half_edge.twin.twin is half_edge
+                assert half_edge.next.prev is half_edge
+                assert half_edge.next.origin is half_edge.get_destination()
+        assert len(seen) == 2 * len(voronoi_diagram.edges)
+
+    def test_point_cells(self, points):
+        """Test cells of a point diagram."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        self._check_cells(voronoi_diagram)
+        arrays = voronoi_diagram.to_arrays()
+        for i, site in enumerate(voronoi_diagram.sites):
+            neighbors = [
+                voronoi_diagram.sites.index(neighbor)
+                for neighbor in voronoi_diagram.get_cell_neighbors(site)
+            ]
+            assert sorted(neighbors) == sorted(arrays.get_cell_neighbors(i).tolist())
+
+    def test_counterclockwise(self, points):
+        """Test bounded cells are counterclockwise."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        areas = [voronoi_diagram.get_cell_area(site) for site in voronoi_diagram.sites]
+        bounded_areas = [area for area in areas if area is not None]
+        assert len(bounded_areas) == 3
+        assert all(area > 0 for area in bounded_areas)
+
+    def test_square_cell(self):
+        """Test the cell in the middle of a cross of sites."""
+        points = [
+            Point(Decimal(0), Decimal(0)),
+            Point(Decimal(2), Decimal(0)),
+            Point(Decimal(-2), Decimal(0)),
+            Point(Decimal(0), Decimal(2)),
+            Point(Decimal(0), Decimal(-2)),
+        ]
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        self._check_cells(voronoi_diagram)
+        center = voronoi_diagram.sites[0]
+        assert voronoi_diagram.get_cell_area(center) == 4
+        assert len(voronoi_diagram.get_cell_vertices(center)) == 4
+        assert voronoi_diagram.get_cell_area(voronoi_diagram.sites[1]) is None
+
+    def test_two_sites(self):
+        """Test each cell of two sites is closed by its only half-edge."""
+        points = [Point(Decimal(0), Decimal(0)), Point(Decimal(1), Decimal(3))]
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        self._check_cells(voronoi_diagram)
+        for site in voronoi_diagram.sites:
+            half_edge = voronoi_diagram.get_outer_half_edge(site)
+            assert half_edge.next is half_edge
+            assert half_edge.origin is None
+
+    def test_collinear_sites(self):
+        """Test the cells between collinear sites are strips."""
+        points = [Point(Decimal(i), Decimal(2 * i)) for i in range(4)]
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        self._check_cells(voronoi_diagram)
+        for site in voronoi_diagram.sites[1:-1]:
+            assert len(voronoi_diagram.get_cell_neighbors(site)) == 2
+
+    def test_weighted_cells(self, points, weights):
+        """Test cells of an AW diagram."""
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            list(zip(points, weights))
+        )
+        self._check_cells(voronoi_diagram)
+
+    def test_shared_sites(self, points):
+        """Test diagrams of the same sites walk the cells of their own edges."""
+        sites = [Site(point.x, point.y) for point in points]
+        first_diagram = FortunesAlgorithm(sites[:4])
+        second_diagram = FortunesAlgorithm(sites)
+        third_diagram = FortunesAlgorithm(sites)
+        for voronoi_diagram in (first_diagram, second_diagram, third_diagram):
+            self._check_cells(voronoi_diagram)
+            edge_ids = {id(edge) for edge in voronoi_diagram.edges}
+            for site in voronoi_diagram.sites:
+                for half_edge in voronoi_diagram.get_cell_half_edges(site):
+                    assert id(half_edge.edge) in edge_ids
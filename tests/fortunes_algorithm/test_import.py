@@ -0,0 +1,23 @@
+"""Test Algorithm imports."""
+
+# Standard
+import subprocess
+import sys
+
+
+class TestImport:
+    """Test algorithm import."""
+
+    def test_plotly_is_not_imported(self):
+        """Test the algorithm can be imported and used without importing plotly."""
+        script = (
+            "import sys\n"
+            "from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm\n"
+            "from voronoi_diagrams.models import Point\n"
+            "FortunesAlgorithm.calculate_voronoi_diagram([Point(0, 0), Point(1, 2)])\n"
+            "print('plotly' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], check=True, capture_output=True, text=True,
+        ).stdout.strip()
+        assert output == "False"
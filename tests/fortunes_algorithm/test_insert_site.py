@@ -0,0 +1,174 @@
+"""Test insertion of sites in a finished Voronoi Diagram."""
+
+# Models
+from voronoi_diagrams.models import Point
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm, MANUAL_MODE
+
+# Math
+from decimal import Decimal
+import random
+import pytest
+
+
+class TestInsertSite:
+    """Test inserted sites against the diagram calculated with all the sites."""
+
+    def _check_cells(self, voronoi_diagram):
+        """Check every half-edge is in exactly one cell and links are consistent."""
+        seen = set()
+        for site in voronoi_diagram.sites:
+            for half_edge in voronoi_diagram.get_cell_half_edges(site):
+                assert id(half_edge) not in seen
+                seen.add(id(half_edge))
+                assert half_edge.site is site
+                assert half_edge.twin.twin is half_edge
+                assert half_edge.next.prev is half_edge
+                assert half_edge.next.origin is half_edge.get_destination()
+        assert len(seen) == 2 * len(voronoi_diagram.edges)
+        vertex_ids = {id(vertex) for vertex in voronoi_diagram.vertices}
+        vertex_points = {
+            vertex.point.get_tuple() for vertex in voronoi_diagram.vertices
+        }
+        assert len(vertex_points) == len(voronoi_diagram.vertices)
+        for edge in voronoi_diagram.edges:
+            assert all(id(vertex) in vertex_ids for vertex in edge.vertices)
+        assert len(voronoi_diagram.vertices_list) == len(voronoi_diagram.vertices)
+        for vertex, point in zip(
+            voronoi_diagram.vertices, voronoi_diagram.vertices_list
+        ):
+            assert vertex.point is point
+        bisector_ids = {id(bisector) for bisector in voronoi_diagram.bisectors_list}
+        assert len(bisector_ids) == len(voronoi_diagram.bisectors_list)
+
+    def _get_signature(self, voronoi_diagram):
+        """Get sites of the edges and rounded vertices of the diagram."""
+        edges = sorted(
+            tuple(sorted(half_edge.site.name for half_edge in edge.half_edges))
+            for edge in voronoi_diagram.edges
+        )
+        vertices = sorted(
+            (round(float(vertex.point.x), 6), round(float(vertex.point.y), 6))
+            for vertex in voronoi_diagram.vertices
+        )
+        return edges, vertices
+
+    def _check_insertions(self, points, n_inserted, numeric="decimal"):
+        """Check inserting the last points gives the diagram of all the points."""
+        n_sites = len(points) - n_inserted
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            points[:n_sites], numeric=numeric
+        )
+        for i, point in enumerate(points[n_sites:]):
+            site = voronoi_diagram.insert_site(point, name=str(n_sites + i + 1))
+            assert voronoi_diagram.sites[-1] is site
+            self._check_cells(voronoi_diagram)
+        expected = FortunesAlgorithm.calculate_voronoi_diagram(points, numeric=numeric)
+        assert self._get_signature(voronoi_diagram) == self._get_signature(expected)
+        return voronoi_diagram
+
+    def test_insert_sites(self, points):
+        """Test inserting sites inside and outside the convex hull."""
+        points = points + [
+            Point(Decimal("1.5"), Decimal("2.5")),
+            Point(Decimal("20"), Decimal("-3")),
+        ]
+        voronoi_diagram = self._check_insertions(points, 2)
+        arrays = voronoi_diagram.to_arrays()
+        assert len(arrays.edges) == len(voronoi_diagram.edges)
+        polygons = voronoi_diagram.get_cell_polygons((-30, 30), (-30, 30))
+        assert all(polygons)
+        xlim = (Decimal(-30), Decimal(30))
+        for edge in voronoi_diagram.edges:
+            edge.get_ranges(xlim, xlim)
+        assert voronoi_diagram.get_xml()
+
+    def test_random_sites(self):
+        """Test inserting random sites one by one."""
+        rnd = random.Random(0)
+        for _ in range(10):
+            points = [
+                Point(
+                    Decimal(rnd.randint(-1000, 1000)) / 100,
+                    Decimal(rnd.randint(-1000, 1000)) / 100,
+                )
+                for _ in range(12)
+            ]
+            self._check_insertions(points, 6)
+
+    def test_float_numeric(self, points):
+        """Test inserting sites in a float diagram."""
+        self._check_insertions(points, 3, numeric="float")
+
+    def test_one_site(self):
+        """Test inserting sites in a diagram with only one site."""
+        points = [
+            Point(Decimal(0), Decimal(0)),
+            Point(Decimal(1), Decimal(1)),
+            Point(Decimal(2), Decimal(2)),
+            Point(Decimal(-1), Decimal(1)),
+        ]
+        self._check_insertions(points, 3)
+
+    def test_collinear_sites(self):
+        """Test inserting sites between sites in a line."""
+        points = [
+            Point(Decimal(0), Decimal(0)),
+            Point(Decimal(4), Decimal(0)),
+            Point(Decimal(8), Decimal(0)),
+            Point(Decimal(2), Decimal(0)),
+            Point(Decimal(7), Decimal(0)),
+            Point(Decimal(-3), Decimal(0)),
+        ]
+        self._check_insertions(points, 3)
+
+    def test_cocircular_sites(self):
+        """Test sites in the circle of a vertex are rejected in a grid of sites."""
+        points = [
+            Point(Decimal(0), Decimal(0)),
+            Point(Decimal(2), Decimal(0)),
+            Point(Decimal(0), Decimal(2)),
+        ]
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        with pytest.raises(ValueError):
+            voronoi_diagram.insert_site(Point(Decimal(2), Decimal(2)))
+        assert len(voronoi_diagram.sites) == 3
+        self._check_cells(voronoi_diagram)
+
+        grid = [
+            Point(Decimal(x), Decimal(y)) for x in range(-3, 4) for y in range(-3, 4)
+        ]
+        rnd = random.Random(0)
+        n_rejected = 0
+        for _ in range(30):
+            points = rnd.sample(grid, 12)
+            voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points[:8])
+            n_sites = 8
+            for point in points[8:]:
+                try:
+                    voronoi_diagram.insert_site(point, name=str(n_sites + 1))
+                except ValueError:
+                    n_rejected += 1
+                    break
+                n_sites += 1
+                self._check_cells(voronoi_diagram)
+            expected = FortunesAlgorithm.calculate_voronoi_diagram(points[:n_sites])
+            assert self._get_signature(voronoi_diagram) == self._get_signature(expected)
+        assert 0 < n_rejected < 30
+
+    def test_invalid_insertions(self, points):
+        """Test sites that can not be inserted."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        with pytest.raises(ValueError):
+            voronoi_diagram.insert_site(points[0])
+        weighted_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            [(point, Decimal(1)) for point in points]
+        )
+        with pytest.raises(ValueError):
+            weighted_diagram.insert_site(Point(Decimal(0), Decimal(0)))
+        unfinished_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, mode=MANUAL_MODE
+        )
+        with pytest.raises(ValueError):
+            unfinished_diagram.insert_site(Point(Decimal(0), Decimal(0)))
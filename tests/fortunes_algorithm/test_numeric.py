@@ -0,0 +1,102 @@
+"""Test Algorithm using the different numeric backends."""
+
+# Standard
+from typing import List, Tuple
+from random import Random
+
+# Models
+from voronoi_diagrams.models import Point
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+
+# Utils
+from general_utils.numbers import are_close, DECIMAL_NUMERIC, FLOAT_NUMERIC
+
+# Math
+from decimal import Decimal
+
+# Testing
+import pytest
+
+# Seeds of the random sites compared.
+SEEDS = range(10)
+N_SITES = 60
+
+
+def get_random_decimal(random: Random, start: int, end: int) -> Decimal:
+    """Get random Decimal with 4 decimals between start and end."""
+    return Decimal(random.randint(start * 10 ** 4, end * 10 ** 4)) / 10 ** 4
+
+
+def get_random_points(random: Random) -> List[Point]:
+    """Get random points with different coordinates in [-100, 100]."""
+    points = {}
+    while len(points) < N_SITES:
+        x = get_random_decimal(random, -100, 100)
+        y = get_random_decimal(random, -100, 100)
+        points[(x, y)] = Point(x, y)
+    return list(points.values())
+
+
+def get_random_weighted_points(random: Random) -> List[Tuple[Point, Decimal]]:
+    """Get random points with weights in [0, 10]."""
+    return [
+        (point, get_random_decimal(random, 0, 10))
+        for point in get_random_points(random)
+    ]
+
+
+class TestNumeric:
+    """Test float numeric against Decimal numeric."""
+
+    def _check_same_diagram(
+        self, decimal_vd: FortunesAlgorithm, float_vd: FortunesAlgorithm
+    ):
+        assert len(decimal_vd.bisectors_list) == len(float_vd.bisectors_list)
+        expected_vertices = decimal_vd.vertices_list
+        vertices = float_vd.vertices_list
+        assert len(expected_vertices) == len(vertices)
+        for vertex in vertices:
+            assert isinstance(vertex.x, float) and isinstance(vertex.y, float)
+            assert any(
+                are_close(vertex.x, expected.x, Decimal("0.0001"))
+                and are_close(vertex.y, expected.y, Decimal("0.0001"))
+                for expected in expected_vertices
+            )
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_random_point_sites(self, seed):
+        """Test float Voronoi Diagram of random sites against the Decimal one."""
+        points = get_random_points(Random(seed))
+        decimal_vd = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, numeric=DECIMAL_NUMERIC
+        )
+        float_vd = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, numeric=FLOAT_NUMERIC
+        )
+        self._check_same_diagram(decimal_vd, float_vd)
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_random_weighted_sites(self, seed):
+        """Test float AW Voronoi Diagram of random sites against the Decimal one."""
+        points_and_weights = get_random_weighted_points(Random(seed))
+        decimal_vd = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights, numeric=DECIMAL_NUMERIC
+        )
+        float_vd = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights, numeric=FLOAT_NUMERIC
+        )
+        self._check_same_diagram(decimal_vd, float_vd)
+
+    def test_invalid_numeric(self, points):
+        """Test unknown numeric is rejected."""
+        with pytest.raises(ValueError):
+            FortunesAlgorithm.calculate_voronoi_diagram(points, numeric="int")
+
+    def test_float_numeric_with_plot_steps(self, points):
+        """Test steps cannot be plotted with float numeric."""
+        with pytest.raises(ValueError):
+            FortunesAlgorithm.calculate_voronoi_diagram(
+                points, plot_steps=True, numeric=FLOAT_NUMERIC
+            )
@@ -0,0 +1,57 @@
+"""Test point location in the Voronoi Diagram."""
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm, MANUAL_MODE
+from voronoi_diagrams.point_location import PointLocator
+
+# Math
+from decimal import Decimal
+import numpy as np
+import pytest
+
+
+class TestPointLocator:
+    """Test locate against the nearest site of each point."""
+
+    def _check_locate(self, voronoi_diagram, locator):
+        """Check located sites are the nearest in and out of the box."""
+        rng = np.random.default_rng(0)
+        xs, ys = rng.uniform(-30, 30, (2, 5000))
+        distances = np.array(
+            [site.get_site_distance_many(xs, ys) for site in voronoi_diagram.sites]
+        )
+        located = locator.locate(xs, ys)
+        assert located.shape == (5000,)
+        assert np.allclose(distances[located, np.arange(5000)], distances.min(axis=0))
+
+    def test_point_sites(self, points):
+        """Test location in a point diagram."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, xlim=(-20, 20), ylim=(-20, 20)
+        )
+        locator = voronoi_diagram.get_point_locator()
+        self._check_locate(voronoi_diagram, locator)
+        assert locator.locate([Decimal("-1.25")], [Decimal("1.5")]).tolist() == [5]
+
+    def test_weighted_sites(self, points, weights):
+        """Test location respects the weights."""
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            list(zip(points, weights)), xlim=(-20, 20), ylim=(-20, 20)
+        )
+        self._check_locate(voronoi_diagram, voronoi_diagram.get_point_locator())
+
+    def test_float_numeric(self, points):
+        """Test location with a float diagram and a small grid."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, numeric="float"
+        )
+        locator = PointLocator(voronoi_diagram, (-15, 15), (-15, 15), 0.5)
+        self._check_locate(voronoi_diagram, locator)
+
+    def test_unfinished_diagram(self, points):
+        """Test a diagram in the middle of the sweep can not be indexed."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            points, mode=MANUAL_MODE
+        )
+        with pytest.raises(ValueError):
+            voronoi_diagram.get_point_locator()
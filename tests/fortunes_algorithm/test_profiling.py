@@ -0,0 +1,94 @@
+"""Test profiling of Fortune's Algorithm."""
+
+# Standard
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+# Voronoi Diagrams
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm, MANUAL_MODE
+from voronoi_diagrams.models import Point
+from voronoi_diagrams.profiling import Profile
+
+
+class TestProfiling:
+    """Test profiling of the diagrams."""
+
+    def setup_method(self):
+        """Set up points."""
+        self.points = [
+            Point(Decimal(0), Decimal(0)),
+            Point(Decimal(10), Decimal(2)),
+            Point(Decimal(-5), Decimal(8)),
+            Point(Decimal(3), Decimal(-7)),
+            Point(Decimal(6), Decimal(12)),
+        ]
+        self.weighted_points = [
+            (point, Decimal(i + 1)) for i, point in enumerate(self.points)
+        ]
+
+    def test_counters(self):
+        """Test counters and timers of a diagram of points."""
+        stats = Profile()
+        FortunesAlgorithm.calculate_voronoi_diagram(self.points, profile=stats)
+        result = stats.get_stats()
+        counters = result["counters"]
+        # The first site is handled when the structures are initialized.
+        assert counters["site_events"] == len(self.points) - 1
+        assert counters["intersection_events"] > 0
+        assert counters["bisectors"] > 0
+        assert counters["point_comparisons"] > 0
+        assert counters["avl_rotations"] > 0
+        assert counters["region_searches"] >= len(self.points) - 1
+        assert result["maxima"]["region_search_depth"] >= 1
+        assert set(result["seconds"]) == {
+            "init",
+            "site_events",
+            "intersection_events",
+            "close_cells",
+        }
+        assert all(seconds >= 0 for seconds in result["seconds"].values())
+
+    def test_weighted_roots(self):
+        """Test the roots calculated in a diagram of weighted points are counted."""
+        stats = Profile()
+        FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            self.weighted_points, profile=stats
+        )
+        assert stats.get_stats()["counters"]["roots"] > 0
+
+    def test_only_profiled_diagram(self):
+        """Test diagrams without the profile are not counted, also in other threads."""
+        stats = Profile()
+        FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            self.weighted_points, profile=stats
+        )
+        expected = stats.get_stats()["counters"]
+
+        def calculate(profile):
+            FortunesAlgorithm.calculate_aw_voronoi_diagram(
+                self.weighted_points, profile=profile
+            )
+            return profile
+
+        profiles = [Profile() if i % 2 == 0 else None for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(calculate, profiles))
+        for profile in profiles:
+            if profile is not None:
+                assert profile.get_stats()["counters"] == expected
+
+    def test_nested_diagram(self):
+        """Test a diagram calculated while another one is profiled is not counted."""
+        stats = Profile()
+        diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            self.weighted_points, profile=stats, mode=MANUAL_MODE
+        )
+        diagram.next_step()
+        FortunesAlgorithm.calculate_aw_voronoi_diagram(self.weighted_points)
+        while diagram.has_next_step():
+            diagram.next_step()
+        other_stats = Profile()
+        FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            self.weighted_points, profile=other_stats
+        )
+        assert stats.get_stats()["counters"] == other_stats.get_stats()["counters"]
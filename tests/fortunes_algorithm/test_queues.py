@@ -0,0 +1,52 @@
+"""Test Algorithm using the different Q structures."""
+
+# Models
+from voronoi_diagrams.models import Point
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import (
+    FortunesAlgorithm,
+    AVL_QUEUE,
+    HEAP_QUEUE,
+)
+
+# Math
+from decimal import Decimal
+
+
+class TestQueues:
+    """Test heap queue against AVL queue."""
+
+    def test_point_sites(self, points):
+        """Test Voronoi Diagram is the same with both queues."""
+        avl_vd = FortunesAlgorithm.calculate_voronoi_diagram(points, queue=AVL_QUEUE)
+        heap_vd = FortunesAlgorithm.calculate_voronoi_diagram(points, queue=HEAP_QUEUE)
+        assert avl_vd.vertices_list == heap_vd.vertices_list
+        assert avl_vd.bisectors_list == heap_vd.bisectors_list
+
+    def test_weighted_sites(self, points, weights):
+        """Test AW Voronoi Diagram is the same with both queues."""
+        points_and_weights = list(zip(points, weights))
+        avl_vd = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights, queue=AVL_QUEUE
+        )
+        heap_vd = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights, queue=HEAP_QUEUE
+        )
+        assert avl_vd.vertices_list == heap_vd.vertices_list
+        assert avl_vd.bisectors_list == heap_vd.bisectors_list
+
+    def test_site_and_intersection_with_same_point(self):
+        """Test intersection is handled before a site at the same point."""
+        points = [
+            Point(Decimal(0), Decimal(-1)),
+            Point(Decimal(1), Decimal(0)),
+            Point(Decimal(-1), Decimal(0)),
+            Point(Decimal(0), Decimal(1)),
+        ]
+        for queue in (AVL_QUEUE, HEAP_QUEUE):
+            voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+                points, queue=queue
+            )
+            assert voronoi_diagram.vertices_list == [Point(Decimal(0), Decimal(0))]
+            assert len(voronoi_diagram.bisectors_list) == 5
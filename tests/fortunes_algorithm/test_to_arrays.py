@@ -0,0 +1,55 @@
+"""Test arrays representation of the Voronoi Diagram."""
+
+# Models
+from voronoi_diagrams.models import Point, NO_VERTEX
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+
+# Math
+from decimal import Decimal
+import numpy as np
+
+
+class TestToArrays:
+    """Test to_arrays against the object graph of the diagram."""
+
+    def test_vertices_and_edges(self, points):
+        """Test vertices and edges tables."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        arrays = voronoi_diagram.to_arrays(exact=True)
+        assert arrays.vertices.dtype == np.float64
+        assert arrays.edges.dtype == np.int32
+        assert arrays.vertices.shape == (len(voronoi_diagram.vertices), 2)
+        assert arrays.edges.shape == (len(voronoi_diagram.edges), 4)
+        for vertex, (x, y) in zip(voronoi_diagram.vertices, arrays.exact_vertices):
+            assert Point(Decimal(x), Decimal(y)) == vertex.point
+        for edge, (site_a, site_b, v0, v1) in zip(voronoi_diagram.edges, arrays.edges):
+            assert edge.bisector.sites == (
+                voronoi_diagram.sites[site_a],
+                voronoi_diagram.sites[site_b],
+            )
+            vertices = [voronoi_diagram.vertices[v] for v in (v0, v1) if v != NO_VERTEX]
+            assert vertices == edge.vertices
+
+    def test_cells_adjacency(self, points, weights):
+        """Test the CSR adjacency has every edge in the cells of both sites."""
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            list(zip(points, weights))
+        )
+        arrays = voronoi_diagram.to_arrays()
+        assert arrays.exact_vertices is None
+        assert arrays.get_n_sites() == len(points)
+        assert arrays.cell_offsets[-1] == 2 * len(arrays.edges)
+        for site in range(arrays.get_n_sites()):
+            for neighbor, edge in zip(
+                arrays.get_cell_neighbors(site), arrays.get_cell_edges(site)
+            ):
+                assert sorted(arrays.edges[edge, :2]) == sorted((site, neighbor))
+
+    def test_without_sites(self):
+        """Test arrays of an empty diagram."""
+        arrays = FortunesAlgorithm.calculate_voronoi_diagram([]).to_arrays()
+        assert arrays.vertices.shape == (0, 2)
+        assert arrays.edges.shape == (0, 4)
+        assert list(arrays.cell_offsets) == [0]
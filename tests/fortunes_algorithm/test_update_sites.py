@@ -0,0 +1,198 @@
+"""Test removal and weight update of sites in a finished Voronoi Diagram."""
+
+# Models
+from voronoi_diagrams.models import Point, WeightedSite
+
+# Algorithm
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm, MANUAL_MODE
+
+# Math
+from decimal import Decimal
+import random
+import pytest
+
+
+class TestUpdateSites:
+    """Test changed sites against the diagram calculated with the final sites."""
+
+    def _check_cells(self, voronoi_diagram):
+        """Check every half-edge is in exactly one cell and links are consistent."""
+        seen = set()
+        for site in voronoi_diagram.sites:
+            for half_edge in voronoi_diagram.get_cell_half_edges(site):
+                assert id(half_edge) not in seen
+                seen.add(id(half_edge))
+                assert half_edge.site is site
+                assert half_edge.twin.twin is half_edge
+                assert half_edge.next.prev is half_edge
+                assert half_edge.next.origin is half_edge.get_destination()
+        assert len(seen) == 2 * len(voronoi_diagram.edges)
+        vertex_ids = {id(vertex) for vertex in voronoi_diagram.vertices}
+        for edge in voronoi_diagram.edges:
+            assert all(id(vertex) in vertex_ids for vertex in edge.vertices)
+        assert len(voronoi_diagram.vertices_list) == len(voronoi_diagram.vertices)
+        for vertex, point in zip(
+            voronoi_diagram.vertices, voronoi_diagram.vertices_list
+        ):
+            assert vertex.point is point
+        bisector_ids = {id(bisector) for bisector in voronoi_diagram.bisectors_list}
+        assert len(bisector_ids) == len(voronoi_diagram.bisectors_list)
+
+    def _get_signature(self, voronoi_diagram):
+        """Get sites of the edges and rounded vertices of the diagram."""
+        edges = sorted(
+            tuple(sorted(half_edge.site.name for half_edge in edge.half_edges))
+            for edge in voronoi_diagram.edges
+        )
+        vertices = sorted(
+            (round(float(vertex.point.x), 6), round(float(vertex.point.y), 6))
+            for vertex in voronoi_diagram.vertices
+        )
+        return edges, vertices
+
+    def _check_diagram(self, voronoi_diagram):
+        """Check the diagram is the one calculated with its sites."""
+        self._check_cells(voronoi_diagram)
+        names = [site.name for site in voronoi_diagram.sites]
+        if voronoi_diagram.SITE_CLASS == WeightedSite:
+            expected = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+                [(site.point, site.weight) for site in voronoi_diagram.sites],
+                names=names,
+            )
+        else:
+            expected = FortunesAlgorithm.calculate_voronoi_diagram(
+                [site.point for site in voronoi_diagram.sites], names=names
+            )
+        assert self._get_signature(voronoi_diagram) == self._get_signature(expected)
+
+    def test_remove_weighted_sites(self, points, weights):
+        """Test removing each site of an AW diagram."""
+        for i in range(len(points)):
+            voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+                list(zip(points, weights))
+            )
+            voronoi_diagram.remove_site(voronoi_diagram.sites[i])
+            assert len(voronoi_diagram.sites) == len(points) - 1
+            self._check_diagram(voronoi_diagram)
+
+    def test_update_weights(self, points, weights):
+        """Test updating weights that grow and shrink the cells."""
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            list(zip(points, weights))
+        )
+        for i, weight in [(5, "2"), (2, "0.5"), (0, "3.5"), (5, "0"), (3, "1.75")]:
+            voronoi_diagram.update_weight(voronoi_diagram.sites[i], Decimal(weight))
+            assert voronoi_diagram.sites[i].weight == Decimal(weight)
+            self._check_diagram(voronoi_diagram)
+        assert voronoi_diagram.get_cell_polygons((-30, 30), (-30, 30))
+
+    def test_update_and_remove_many_sites(self):
+        """Test updating the weights and removing many random sites at once."""
+        rnd = random.Random(1)
+        points_and_weights = [
+            (
+                Point(
+                    Decimal(rnd.randint(-5000, 5000)) / 100,
+                    Decimal(rnd.randint(-5000, 5000)) / 100,
+                ),
+                Decimal(rnd.randint(0, 600)) / 100,
+            )
+            for _ in range(40)
+        ]
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights
+        )
+        for _ in range(3):
+            sites = rnd.sample(voronoi_diagram.sites, 8)
+            weights = [Decimal(rnd.randint(0, 600)) / 100 for _ in sites]
+            voronoi_diagram.update_weights(zip(sites, weights))
+            assert [site.weight for site in sites] == weights
+            self._check_diagram(voronoi_diagram)
+            sites = rnd.sample(voronoi_diagram.sites, 4)
+            voronoi_diagram.remove_sites(sites)
+            assert all(site not in voronoi_diagram.sites for site in sites)
+            self._check_diagram(voronoi_diagram)
+
+    def test_hidden_site(self):
+        """Test a site with an empty cell appears when the site hiding it changes."""
+        points_and_weights = [
+            (Point(Decimal(0), Decimal(0)), Decimal("0.5")),
+            (Point(Decimal("0.5"), Decimal(0)), Decimal(2)),
+            (Point(Decimal(6), Decimal(1)), Decimal(1)),
+            (Point(Decimal(-5), Decimal(4)), Decimal(1)),
+            (Point(Decimal(-2), Decimal(-6)), Decimal(1)),
+        ]
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights
+        )
+        hidden_site = voronoi_diagram.sites[1]
+        assert voronoi_diagram.get_cell_half_edges(hidden_site) == []
+        voronoi_diagram.update_weight(voronoi_diagram.sites[0], Decimal(2))
+        self._check_diagram(voronoi_diagram)
+        assert voronoi_diagram.get_cell_half_edges(hidden_site)
+        voronoi_diagram.update_weight(voronoi_diagram.sites[0], Decimal("0.5"))
+        self._check_diagram(voronoi_diagram)
+        assert voronoi_diagram.get_cell_half_edges(hidden_site) == []
+        voronoi_diagram.remove_site(voronoi_diagram.sites[0])
+        self._check_diagram(voronoi_diagram)
+        assert voronoi_diagram.get_cell_half_edges(hidden_site)
+
+    def test_hidden_site_after_changes(self):
+        """Test a site with an empty cell is found after changes of other cells."""
+        points_and_weights = [
+            (Point(Decimal(0), Decimal(0)), Decimal("0.5")),
+            (Point(Decimal("0.5"), Decimal(0)), Decimal(2)),
+            (Point(Decimal(6), Decimal(1)), Decimal(1)),
+            (Point(Decimal(-5), Decimal(4)), Decimal(1)),
+            (Point(Decimal(-2), Decimal(-6)), Decimal(1)),
+            (Point(Decimal(12), Decimal(8)), Decimal(1)),
+            (Point(Decimal(-12), Decimal(-9)), Decimal("1.5")),
+        ]
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights
+        )
+        site, hidden_site = voronoi_diagram.sites[:2]
+        voronoi_diagram.update_weight(voronoi_diagram.sites[5], Decimal("0.5"))
+        self._check_diagram(voronoi_diagram)
+        voronoi_diagram.remove_site(voronoi_diagram.sites[6])
+        self._check_diagram(voronoi_diagram)
+        assert voronoi_diagram.get_cell_half_edges(hidden_site) == []
+        voronoi_diagram.update_weight(site, Decimal(2))
+        self._check_diagram(voronoi_diagram)
+        assert voronoi_diagram.get_cell_half_edges(hidden_site)
+        voronoi_diagram.remove_site(hidden_site)
+        self._check_diagram(voronoi_diagram)
+        assert all(
+            diagram_site is not hidden_site for diagram_site in voronoi_diagram.sites
+        )
+
+    def test_remove_point_sites(self):
+        """Test removing random sites of point diagrams until one is left."""
+        rnd = random.Random(0)
+        points = [
+            Point(
+                Decimal(rnd.randint(-1000, 1000)) / 100,
+                Decimal(rnd.randint(-1000, 1000)) / 100,
+            )
+            for _ in range(15)
+        ]
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        while len(voronoi_diagram.sites) > 1:
+            voronoi_diagram.remove_site(rnd.choice(voronoi_diagram.sites))
+            self._check_diagram(voronoi_diagram)
+        assert voronoi_diagram.edges == []
+        assert voronoi_diagram.vertices == []
+
+    def test_invalid_changes(self, points, weights):
+        """Test sites that can not be changed."""
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        with pytest.raises(ValueError):
+            voronoi_diagram.update_weight(voronoi_diagram.sites[0], Decimal(1))
+        other_diagram = FortunesAlgorithm.calculate_voronoi_diagram(points)
+        with pytest.raises(ValueError):
+            voronoi_diagram.remove_site(other_diagram.sites[0])
+        unfinished_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            list(zip(points, weights)), mode=MANUAL_MODE
+        )
+        with pytest.raises(ValueError):
+            unfinished_diagram.remove_site(unfinished_diagram.sites[0])
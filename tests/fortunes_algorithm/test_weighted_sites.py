@@ -91,8 +91,8 @@ class TestWeightedSites:
         expected_bisectors = [bisector_p1_p2, bisector_p1_p3, bisector_p2_p3]
         expected_vertices = [
             Point(
-                Decimal("23.7599947570548692965530790388584136962890625"),
-                Decimal("19.77888156319230716917445533908903598785400390625"),
+                Decimal("23.75999475673692605701290187"),
+                Decimal("19.77888155887522298822269355"),
             )
         ]
         self._check_bisectors_and_vertex(
@@ -118,12 +118,12 @@ class TestWeightedSites:
         expected_bisectors = [bisector_p1_p2, bisector_p1_p3, bisector_p2_p3]
         expected_vertices = [
             Point(
-                Decimal("23.195022965036205420119586051441729068756103515625"),
-                Decimal("-21.511647174809116478400028427131474018096923828125"),
+                Decimal("23.19502296503623971544591176"),
+                Decimal("-21.5116471748086747945056978"),
             ),
             Point(
-                Decimal("26.469144622760826024432390113361179828643798828125"),
-                Decimal("20.870038727961539137822910561226308345794677734375"),
+                Decimal("26.46914462276100522174393494"),
+                Decimal("20.8700387279619009259076023"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -154,14 +154,8 @@ class TestWeightedSites:
             bisector_p2_p3,
         ]
         expected_vertices = [
-            Point(
-                Decimal("6"),
-                Decimal("6.99999999999999911182158029987476766109466552734375"),
-            ),
-            Point(
-                Decimal("6"),
-                Decimal("13.0000000000000017763568394002504646778106689453125"),
-            ),
+            Point(Decimal("6"), Decimal("7"),),
+            Point(Decimal("6"), Decimal("13"),),
         ]
         self._check_bisectors_and_vertex(
             voronoi_diagram, expected_bisectors, expected_vertices
@@ -194,8 +188,8 @@ class TestWeightedSites:
                 Decimal("7.10536595577264762368940864689648151397705078125"),
             ),
             Point(
-                Decimal("6.0000001581526287708356903749518096446990966796875"),
-                Decimal("12.894634297774786091395071707665920257568359375"),
+                Decimal("6"),
+                Decimal("12.89463404422735237631059135310351848602294921875"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -273,8 +267,8 @@ class TestWeightedSites:
         expected_bisectors = [bisector_p1_p2, bisector_p1_p3, bisector_p2_p3]
         expected_vertices = [
             Point(
-                Decimal("26.81366459627329135173567919991910457611083984375"),
-                Decimal("20.67701863354037783437888720072805881500244140625"),
+                Decimal("26.81366459627329192546583851"),
+                Decimal("20.67701863354037267080745342"),
             )
         ]
         self._check_bisectors_and_vertex(
@@ -367,12 +361,12 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("30.522802422504742736464322661049664020538330078125"),
-                Decimal("2.581536125410982318584274253225885331630706787109375"),
+                Decimal("30.52280242253129730883080867"),
+                Decimal("2.581536125490331784088490465"),
             ),
             Point(
-                Decimal("27.786748740244686217693015350960195064544677734375"),
-                Decimal("13.3062948690129889683930741739459335803985595703125"),
+                Decimal("27.78674874028235808468912901"),
+                Decimal("13.30629486901748082173098213"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -411,16 +405,16 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("30.522802422504742736464322661049664020538330078125"),
-                Decimal("2.581536125410982318584274253225885331630706787109375"),
+                Decimal("30.52280242253129730883080867"),
+                Decimal("2.581536125490331784088490465"),
             ),
             Point(
-                Decimal("21.83673459217973089607767178677022457122802734375"),
-                Decimal("-18.2628496544823377689681365154683589935302734375"),
+                Decimal("21.83673459217972426280249039"),
+                Decimal("-18.26284965448237168060385102"),
             ),
             Point(
-                Decimal("26.51369782967488930580657324753701686859130859375"),
-                Decimal("17.1438564285112278184897149913012981414794921875"),
+                Decimal("26.51369782967280220708748425"),
+                Decimal("17.14385642850714261572540958"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -457,16 +451,16 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("23.195022965036205420119586051441729068756103515625"),
-                Decimal("-21.511647174809116478400028427131474018096923828125"),
+                Decimal("23.19502296503623971544591176"),
+                Decimal("-21.5116471748086747945056978"),
             ),
             Point(
-                Decimal("26.469144622760826024432390113361179828643798828125"),
-                Decimal("20.870038727961539137822910561226308345794677734375"),
+                Decimal("26.46914462276100522174393494"),
+                Decimal("20.8700387279619009259076023"),
             ),
             Point(
-                Decimal("26.977832844500397868614527396857738494873046875"),
-                Decimal("27.45472515381070621742765069939196109771728515625"),
+                Decimal("26.97783284449987442959881855"),
+                Decimal("27.45472515380393011647359562"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -505,20 +499,20 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("23.195022965036205420119586051441729068756103515625"),
-                Decimal("-21.511647174809116478400028427131474018096923828125"),
+                Decimal("23.19502296503623971544591176"),
+                Decimal("-21.5116471748086747945056978"),
             ),
             Point(
-                Decimal("26.7498329695602734545900602824985980987548828125"),
-                Decimal("24.50339343927415569623917690478265285491943359375"),
+                Decimal("26.74983296955542615811028122"),
+                Decimal("24.5033934392452386022053068"),
             ),
             Point(
-                Decimal("25.930130575231569167726775049231946468353271484375"),
-                Decimal("19.569718372035143971743309521116316318511962890625"),
+                Decimal("25.93013057523105919213326025"),
+                Decimal("19.56971837203390381343069907"),
             ),
             Point(
-                Decimal("25.913143883533347633374432916752994060516357421875"),
-                Decimal("-11.7365557052741333876610951847396790981292724609375"),
+                Decimal("25.91314388353290255063169302"),
+                Decimal("-11.73655570527578155454367990"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -574,24 +568,24 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("23.195022965036205420119586051441729068756103515625"),
-                Decimal("-21.511647174809116478400028427131474018096923828125"),
+                Decimal("23.19502296503623971544591176"),
+                Decimal("-21.5116471748086747945056978"),
             ),
             Point(
-                Decimal("25.913143883533347633374432916752994060516357421875"),
-                Decimal("-11.7365557052741333876610951847396790981292724609375"),
+                Decimal("25.91314388353290255063169302"),
+                Decimal("-11.73655570527578155454367990"),
             ),
             Point(
-                Decimal("27.37706884756726566365614417009055614471435546875"),
-                Decimal("2.395486209641373154255461486172862350940704345703125"),
+                Decimal("27.37706884501716853079700166"),
+                Decimal("2.395485872313015294311819025"),
             ),
             Point(
-                Decimal("32.8412086290852442971299751661717891693115234375"),
-                Decimal("5.588553097025879878856358118355274200439453125"),
+                Decimal("32.84120862906411158664724027"),
+                Decimal("5.588553097019427108702653396"),
             ),
             Point(
-                Decimal("20.6432720530798832214713911525905132293701171875"),
-                Decimal("5.6026444142095694900262969895265996456146240234375"),
+                Decimal("20.64327205308569786090591142"),
+                Decimal("5.602644414231070285895168704"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -645,24 +639,24 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("30.34729940447785878632203093729913234710693359375"),
-                Decimal("-4.37406323830063126223421932081691920757293701171875"),
+                Decimal("30.34729940449568086116740251"),
+                Decimal("-4.374063238312404206140741756"),
             ),
             Point(
-                Decimal("20.354186410998604372935005812905728816986083984375"),
-                Decimal("-4.28314108153177297566571724019013345241546630859375"),
+                Decimal("20.35418641099851103443077692"),
+                Decimal("-4.283141081531844948676292389"),
             ),
             Point(
-                Decimal("26.9768707113081092074935440905392169952392578125"),
-                Decimal("-3.181920552671356983154282715986482799053192138671875"),
+                Decimal("26.97687071130758623212711356"),
+                Decimal("-3.181920552671501659424012317"),
             ),
             Point(
-                Decimal("25.930130575231569167726775049231946468353271484375"),
-                Decimal("19.569718372035143971743309521116316318511962890625"),
+                Decimal("25.93013057523105919213326025"),
+                Decimal("19.56971837203390381343069907"),
             ),
             Point(
-                Decimal("26.7498329695602734545900602824985980987548828125"),
-                Decimal("24.50339343927415569623917690478265285491943359375"),
+                Decimal("26.74983296955542615811028122"),
+                Decimal("24.5033934392452386022053068"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -712,24 +706,24 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("31.13272934807425684766712947748601436614990234375"),
-                Decimal("-8.7569999351260232600679955794475972652435302734375"),
+                Decimal("31.13272934807380336073738265"),
+                Decimal("-8.75699993512159979867068496"),
             ),
             Point(
-                Decimal("27.95864696372947122426921851001679897308349609375"),
-                Decimal("-0.395718931677663920964960198034532368183135986328125"),
+                Decimal("27.95864696367852084392779943"),
+                Decimal("-0.39571893165687630300908495"),
             ),
             Point(
-                Decimal("26.7100260252399692717517609708011150360107421875"),
-                Decimal("5.7235016993763085935142953530885279178619384765625"),
+                Decimal("26.71002602513187391821247729"),
+                Decimal("5.72350169928844035382553557"),
             ),
             Point(
-                Decimal("28.497320292656983298229533829726278781890869140625"),
-                Decimal("63.47058450654454730965881026349961757659912109375"),
+                Decimal("28.49732029266095697227152206"),
+                Decimal("63.47058450663267374895410970"),
             ),
             Point(
-                Decimal("28.149999999995035437905244180001318454742431640625"),
-                Decimal("80.70465905304178022561245597898960113525390625"),
+                Decimal("28.15000000000000000000000000"),
+                Decimal("80.70465905307901614813748350"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -781,16 +775,16 @@ class TestWeightedSites:
         ]
         expected_vertices = [
             Point(
-                Decimal("21.343778547920823740469131735153496265411376953125"),
-                Decimal("24.265201667101234050960556487552821636199951171875"),
+                Decimal("21.34377854783906471559530779"),
+                Decimal("24.26520166710228189273193483"),
             ),
             Point(
-                Decimal("-2.455770410233987011139333844766952097415924072265625"),
-                Decimal("25.049067098689359767149653634987771511077880859375"),
+                Decimal("-2.455770410234078468588478411"),
+                Decimal("25.04906709868857277090185765"),
             ),
             Point(
-                Decimal("-6.39719423990470570373645387007854878902435302734375"),
-                Decimal("29.160222207705533747912340913899242877960205078125"),
+                Decimal("-6.397194239904678688709601695"),
+                Decimal("29.16022220770556306068076968"),
             ),
         ]
         self._check_bisectors_and_vertex(
@@ -984,5 +978,53 @@ class TestWeightedSites:
             voronoi_diagram, expected_bisectors, expected_vertices
         )
 
+    def test_vertex_in_max_y_of_bisector(self):
+        """Test a vertex in the max y of a bisector to the right of its site.
+
+        The max y of the bisector is in its boundary that is not x monotone, so the
+        vertex is not in the boundary of the side of the site.
+        """
+        p1 = Point(Decimal("15.1593"), Decimal("28.8723"))
+        p1_w = Decimal("0.563")
+        p2 = Point(Decimal("36.7781"), Decimal("47.3775"))
+        p2_w = Decimal("4.224")
+        p3 = Point(Decimal("17.4455"), Decimal("33.7701"))
+        p3_w = Decimal("5.822")
+        p4 = Point(Decimal("10.0209"), Decimal("34.1132"))
+        p4_w = Decimal("0.49")
+        site_p1 = WeightedSite(p1.x, p1.y, p1_w)
+        site_p2 = WeightedSite(p2.x, p2.y, p2_w)
+        site_p3 = WeightedSite(p3.x, p3.y, p3_w)
+        site_p4 = WeightedSite(p4.x, p4.y, p4_w)
+        points_and_weights = ((p1, p1_w), (p2, p2_w), (p3, p3_w), (p4, p4_w))
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            points_and_weights
+        )
+        expected_bisectors = [
+            WeightedPointBisector((site_p1, site_p2)),
+            WeightedPointBisector((site_p1, site_p3)),
+            WeightedPointBisector((site_p1, site_p4)),
+            WeightedPointBisector((site_p2, site_p3)),
+            WeightedPointBisector((site_p2, site_p4)),
+            WeightedPointBisector((site_p3, site_p4)),
+        ]
+        expected_vertices = [
+            Point(
+                Decimal("17.48740447843460320686614596"),
+                Decimal("36.18684621246560857915885265"),
+            ),
+            Point(
+                Decimal("24.90696331745874611675678048"),
+                Decimal("42.28308509541666895606153732"),
+            ),
+            Point(
+                Decimal("24.36605760421125773583678149"),
+                Decimal("43.02393632767979258504785445"),
+            ),
+        ]
+        self._check_bisectors_and_vertex(
+            voronoi_diagram, expected_bisectors, expected_vertices
+        )
+
 
 TestWeightedSites().test_sites_in_same_y()
@@ -0,0 +1,48 @@
+"""Test GeoGebra xml of the diagrams."""
+
+# Standard
+from decimal import Decimal
+from xml.etree import ElementTree as ET
+
+# Voronoi Diagrams
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
+from voronoi_diagrams.models import Point
+
+# Utils
+from general_utils.xml_elements import element_to_string
+
+
+class TestXml:
+    """Test xml of the diagrams."""
+
+    def test_element_to_string(self):
+        """Test elements are written as ElementTree writes them."""
+        element = ET.Element("element")
+        element.set("label", 'a&<>"\n\t\r')
+        child = ET.SubElement(element, "value")
+        child.set("val", "1")
+        child.tail = "<tail>"
+        ET.SubElement(element, "command").text = "a & b"
+        assert element_to_string(element) == ET.tostring(element, encoding="unicode")
+        assert element_to_string(child) == ET.tostring(child, encoding="unicode")
+
+    def test_iter_xml(self):
+        """Test xml in parts is the whole xml of an AW diagram."""
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            [
+                (Point(Decimal(0), Decimal(0)), Decimal(1)),
+                (Point(Decimal(10), Decimal(2)), Decimal(2)),
+                (Point(Decimal(-5), Decimal(8)), Decimal(0)),
+            ],
+            names=["a", "b&", "c"],
+        )
+        parts = list(voronoi_diagram.iter_xml())
+        assert len(parts) == (
+            2
+            + len(voronoi_diagram.sites)
+            + len(voronoi_diagram.edges)
+            + len(voronoi_diagram.vertices)
+        )
+        xml = voronoi_diagram.get_xml()
+        assert xml == "".join(parts)
+        assert "b&amp;" in xml
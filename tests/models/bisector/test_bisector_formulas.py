@@ -5,6 +5,7 @@ from random import randint
 
 # Math
 from decimal import Decimal
+import numpy as np
 
 # Models
 from voronoi_diagrams.models import (
@@ -183,3 +184,49 @@ class TestWeightedPointBisectorFormulas:
         assert len(values_y) == 0
         values_x = bisector.formula_x(y)
         assert len(values_x) == 0
+
+
+class TestFormulaYMany:
+    """Test formula_y_many in bisectors."""
+
+    def _check_formula_y_many(self, bisector: Any, xs: List[Decimal]) -> None:
+        """Check that formula_y_many has the same ys of formula_y."""
+        ys_many = bisector.formula_y_many(np.array([float(x) for x in xs]))
+        for i, x in enumerate(xs):
+            ys = sorted(bisector.formula_y(x), reverse=True)
+            ys_column = ys_many[:, i].compressed()
+            assert len(ys) == len(ys_column)
+            for y, y_column in zip(ys, ys_column):
+                assert are_close(float(y), y_column, 0.000001 * max(1, abs(float(y))))
+
+    def test_point_bisector(self):
+        """Test formula_y_many in point bisectors."""
+        xs = [Decimal(x) for x in range(-100, 101, 5)]
+        p = Site(Decimal(0), Decimal(0))
+        q = Site(Decimal(2), Decimal(2))
+        self._check_formula_y_many(PointBisector(sites=(p, q)), xs)
+        # Horizontal bisector.
+        q = Site(Decimal(0), Decimal(10))
+        self._check_formula_y_many(PointBisector(sites=(p, q)), xs)
+        # Vertical bisector.
+        q = Site(Decimal(10), Decimal(0))
+        ys = PointBisector(sites=(p, q)).formula_y_many(np.array([0.0, 5.0]))
+        assert ys.mask.all()
+
+    def test_weighted_point_bisector_random_values(self):
+        """Test formula_y_many in weighted point bisectors with random sites."""
+        xs = [Decimal(x) for x in range(-100, 101, 5)]
+        for _ in range(20):
+            p = WeightedSite(
+                Decimal(randint(-50, 50)),
+                Decimal(randint(-50, 50)),
+                Decimal(randint(0, 10)),
+            )
+            q = WeightedSite(
+                Decimal(randint(-50, 50)),
+                Decimal(randint(-50, 50)),
+                Decimal(randint(0, 10)),
+            )
+            if p.point == q.point:
+                continue
+            self._check_formula_y_many(WeightedPointBisector(sites=(p, q)), xs)
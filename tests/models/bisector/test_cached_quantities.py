@@ -0,0 +1,104 @@
+"""Test cached quantities of weighted point bisectors."""
+# Standard
+from random import randint
+
+# Models
+from voronoi_diagrams.models import (
+    WeightedPointBisector,
+    WeightedPointBoundary,
+    WeightedSite,
+)
+
+# Math
+from decimal import Decimal
+
+
+class TestCachedQuantities:
+    """Test the quantities that are computed once in weighted point bisectors."""
+
+    def test_vertical_tangents_are_computed_once(self):
+        """Test that the vertical tangents are computed once."""
+        p = WeightedSite(Decimal(15), Decimal(-5), Decimal(7))
+        q = WeightedSite(Decimal(-7.6), Decimal(-2.27), Decimal(2))
+        bisector = WeightedPointBisector(sites=(p, q))
+        counter = WeightedPointBisector.cache_counters["vertical_tangents"]
+        counter.reset()
+        vertical_tangents = bisector.get_vertical_tangents()
+        assert vertical_tangents == bisector._get_vertical_tangents()
+        assert counter.misses == 1
+        assert counter.hits == 0
+        # Changing the list given does not change the cached one.
+        vertical_tangents.append(Decimal(0))
+        assert bisector.get_vertical_tangents() == bisector._get_vertical_tangents()
+        assert counter.misses == 1
+        assert counter.hits == 1
+
+    def test_conic_section_is_computed_again_when_freed(self):
+        """Test that the conic section is computed again after it is freed."""
+        p = WeightedSite(Decimal(15), Decimal(-5), Decimal(7))
+        q = WeightedSite(Decimal(-7.6), Decimal(-2.27), Decimal(2))
+        bisector = WeightedPointBisector(sites=(p, q))
+        counter = WeightedPointBisector.cache_counters["conic_section"]
+        counter.reset()
+        conic_section = bisector.conic_section
+        assert bisector.conic_section is conic_section
+        assert counter.misses == 1
+        assert counter.hits == 1
+        vertical_tangents = bisector.get_vertical_tangents()
+        bisector.free_cached_quantities()
+        assert bisector.get_vertical_tangents() == vertical_tangents
+        assert counter.misses == 1
+        new_conic_section = bisector.conic_section
+        assert new_conic_section is not conic_section
+        assert counter.misses == 2
+        for name in ("a", "b", "c", "d", "e", "f"):
+            assert getattr(new_conic_section, name) == getattr(conic_section, name)
+
+    def test_boundaries_share_bisector_quantities(self):
+        """Test that both boundaries use the quantities cached in the bisector."""
+        p = WeightedSite(Decimal(16), Decimal(10), Decimal(2))
+        q = WeightedSite(Decimal(40), Decimal(10), Decimal(6))
+        bisector = WeightedPointBisector(sites=(p, q))
+        boundary_plus = WeightedPointBoundary(bisector=bisector, sign=True)
+        boundary_minus = WeightedPointBoundary(bisector=bisector, sign=False)
+        counter = WeightedPointBisector.cache_counters["not_x_monotone_sign"]
+        counter.reset()
+        assert not boundary_plus.is_boundary_not_x_monotone()
+        assert boundary_minus.is_boundary_not_x_monotone()
+        assert counter.misses == 1
+        assert counter.hits == 1
+        assert counter.get_hit_rate() == 0.5
+
+    def test_random_values(self):
+        """Test that the cached quantities are the same for both boundaries."""
+        for _ in range(20):
+            p = WeightedSite(
+                Decimal(randint(-50, 50)),
+                Decimal(randint(-50, 50)),
+                Decimal(randint(0, 10)),
+            )
+            q = WeightedSite(
+                Decimal(randint(-50, 50)),
+                Decimal(randint(-50, 50)),
+                Decimal(randint(0, 10)),
+            )
+            if p.point == q.point:
+                continue
+            bisector = WeightedPointBisector(sites=(p, q))
+            boundary_plus = WeightedPointBoundary(bisector=bisector, sign=True)
+            boundary_minus = WeightedPointBoundary(bisector=bisector, sign=False)
+            # At most one of the boundaries is not x monotone.
+            assert not (
+                boundary_plus.is_boundary_not_x_monotone()
+                and boundary_minus.is_boundary_not_x_monotone()
+            )
+            # At most one of the boundaries has a vertical asymptote.
+            assert not (
+                boundary_plus.has_vertical_asymptote()
+                and boundary_minus.has_vertical_asymptote()
+            )
+            for _ in range(2):
+                assert (
+                    bisector.get_vertical_tangents()
+                    == bisector._get_vertical_tangents()
+                )
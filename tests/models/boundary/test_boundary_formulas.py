@@ -15,6 +15,7 @@ from voronoi_diagrams.models import (
 
 # Math
 from decimal import Decimal
+import numpy as np
 
 # General Utils
 from general_utils.numbers import are_close
@@ -236,3 +237,49 @@ class TestWeightedPointBoundaryFormulas:
         assert are_close(
             ys_in_boundary[0], Decimal("21.52380952380952402392614375"), Decimal(0)
         )
+
+
+class TestFormulaYMany:
+    """Test formula_y_many in boundaries."""
+
+    def _check_formula_y_many(self, boundary: Any, xs: List[Decimal]) -> None:
+        """Check that formula_y_many has the same ys of formula_y."""
+        ys_many = boundary.formula_y_many(np.array([float(x) for x in xs]))
+        for i, x in enumerate(xs):
+            ys = sorted(boundary.formula_y(x), reverse=True)
+            ys_column = ys_many[:, i].compressed()
+            assert len(ys) == len(ys_column)
+            for y, y_column in zip(ys, ys_column):
+                assert are_close(float(y), y_column, 0.000001 * max(1, abs(float(y))))
+
+    def test_point_boundary_random_values(self):
+        """Test formula_y_many in point boundaries with random sites."""
+        xs = [Decimal(x) for x in range(-100, 101, 5)]
+        for _ in range(20):
+            p = Site(Decimal(randint(-50, 50)), Decimal(randint(-50, 50)))
+            q = Site(Decimal(randint(-50, 50)), Decimal(randint(-50, 50)))
+            if p.point.y == q.point.y:
+                continue
+            bisector = PointBisector(sites=(p, q))
+            self._check_formula_y_many(PointBoundary(bisector, True), xs)
+            self._check_formula_y_many(PointBoundary(bisector, False), xs)
+
+    def test_weighted_point_boundary_random_values(self):
+        """Test formula_y_many in weighted point boundaries with random sites."""
+        xs = [Decimal(x) for x in range(-100, 101, 5)]
+        for _ in range(20):
+            p = WeightedSite(
+                Decimal(randint(-50, 50)),
+                Decimal(randint(-50, 50)),
+                Decimal(randint(0, 10)),
+            )
+            q = WeightedSite(
+                Decimal(randint(-50, 50)),
+                Decimal(randint(-50, 50)),
+                Decimal(randint(0, 10)),
+            )
+            if p.point == q.point:
+                continue
+            bisector = WeightedPointBisector(sites=(p, q))
+            self._check_formula_y_many(WeightedPointBoundary(bisector, True), xs)
+            self._check_formula_y_many(WeightedPointBoundary(bisector, False), xs)
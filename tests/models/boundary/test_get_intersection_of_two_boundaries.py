@@ -5,6 +5,7 @@ from random import randint
 
 # Models
 from voronoi_diagrams.models import (
+    Boundary,
     PointBisector,
     Point,
     Site,
@@ -111,16 +112,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "26.071357865127087194423438631929457187652587890625"
-        )
-        assert intersection.y == Decimal(
-            "56.97399440432361217290235799737274646759033203125"
-        )
-        assert intersection_star.x == Decimal(
-            "26.071357865127087194423438631929457187652587890625"
-        )
-        assert intersection_star.y == Decimal("107.0155222687127964860201311")
+        assert intersection.x == Decimal("26.07135786512708296140288516")
+        assert intersection.y == Decimal("56.97399440432358180097988689")
+        assert intersection_star.x == Decimal("26.07135786512708296140288516")
+        assert intersection_star.y == Decimal("107.0155222687127414753541280")
 
         intersections = boundary_qr_plus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -147,31 +142,19 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "142.2824956122580033479607664048671722412109375"
-        )
-        assert intersection.y == Decimal(
-            "237.595493857161244477538275532424449920654296875"
-        )
-        assert intersection_star.x == Decimal(
-            "142.2824956122580033479607664048671722412109375"
-        )
-        assert intersection_star.y == Decimal("499.8779894694192013325998825")
+        assert intersection.x == Decimal("142.2824956122581170347984880")
+        assert intersection.y == Decimal("237.5954938571613638487178832")
+        assert intersection_star.x == Decimal("142.2824956122581170347984880")
+        assert intersection_star.y == Decimal("499.8779894694194808835163712")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_minus)
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "-46.1192303061356625448752311058342456817626953125"
-        )
-        assert intersection.y == Decimal(
-            "-26.1669224285899275628253235481679439544677734375"
-        )
-        assert intersection_star.x == Decimal(
-            "-46.1192303061356625448752311058342456817626953125"
-        )
-        assert intersection_star.y == Decimal("47.71384726527440049937736671")
+        assert intersection.x == Decimal("-46.11923030613566254487523111")
+        assert intersection.y == Decimal("-26.16692242858992756282532355")
+        assert intersection_star.x == Decimal("-46.11923030613566254487523111")
+        assert intersection_star.y == Decimal("47.71384726527440989229944534")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -192,16 +175,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "-195.64751728601504510152153670787811279296875"
-        )
-        assert intersection.y == Decimal(
-            "737.2008338612932902833563275635242462158203125"
-        )
-        assert intersection_star.x == Decimal(
-            "-195.64751728601504510152153670787811279296875"
-        )
-        assert intersection_star.y == Decimal("1496.575063910015190799840426")
+        assert intersection.x == Decimal("-195.6475172860151794586933895")
+        assert intersection.y == Decimal("737.2008338612936933548718859")
+        assert intersection_star.x == Decimal("-195.6475172860151794586933895")
+        assert intersection_star.y == Decimal("1496.575063910016018036747647")
 
         intersections = boundary_qr_plus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -247,31 +224,19 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "11.4773547011539189810491734533570706844329833984375"
-        )
-        assert intersection.y == Decimal(
-            "9.522707454740849897234511445276439189910888671875"
-        )
-        assert intersection_star.x == Decimal(
-            "11.4773547011539189810491734533570706844329833984375"
-        )
-        assert intersection_star.y == Decimal("16.07046829640067737307526993")
+        assert intersection.x == Decimal("11.47735470115383193242901979")
+        assert intersection.y == Decimal("9.522707454740944904203995798")
+        assert intersection_star.x == Decimal("11.47735470115383193242901979")
+        assert intersection_star.y == Decimal("16.07046829640085047715744423")
 
         intersections = boundary_qr_plus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "1.0997085109018398529912019512266851961612701416015625"
-        )
-        assert intersection.y == Decimal(
-            "16.7276506075346560464822687208652496337890625"
-        )
-        assert intersection_star.x == Decimal(
-            "1.0997085109018398529912019512266851961612701416015625"
-        )
-        assert intersection_star.y == Decimal("35.07634991840194240564230971")
+        assert intersection.x == Decimal("1.09970851090184124132297390")
+        assert intersection.y == Decimal("16.72765060753465626730325257")
+        assert intersection_star.x == Decimal("1.09970851090184124132297390")
+        assert intersection_star.y == Decimal("35.07634991840194182854724149")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_minus)
         assert len(intersections) == 0
@@ -293,16 +258,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "38.110951833897416918262024410068988800048828125"
-        )
-        assert intersection.y == Decimal(
-            "68.6352892425572207457662443630397319793701171875"
-        )
-        assert intersection_star.x == Decimal(
-            "38.110951833897416918262024410068988800048828125"
-        )
-        assert intersection_star.y == Decimal("133.3010002459383107400476452")
+        assert intersection.x == Decimal("38.11095183389652045017707376")
+        assert intersection.y == Decimal("68.63528924255545478390390430")
+        assert intersection_star.x == Decimal("38.11095183389652045017707376")
+        assert intersection_star.y == Decimal("133.3010002459345774849663468")
 
         intersections = boundary_qr_plus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -333,16 +292,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "10.17385250288240428062636055983603000640869140625"
-        )
-        assert intersection.y == Decimal(
-            "23.5941894450834155350094079039990901947021484375"
-        )
-        assert intersection_star.x == Decimal(
-            "10.17385250288240428062636055983603000640869140625"
-        )
-        assert intersection_star.y == Decimal("40.38425304626468173189701465")
+        assert intersection.x == Decimal("10.17385250288244347508049442")
+        assert intersection.y == Decimal("23.59418944508498743890677654")
+        assert intersection_star.x == Decimal("10.17385250288244347508049442")
+        assert intersection_star.y == Decimal("40.38425304626768213585174019")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_minus)
         assert len(intersections) == 0
@@ -357,22 +310,22 @@ class TestGetIntersectionInWeightedPointBoundary:
         intersection, intersection_star = intersection
         assert are_close(
             intersection.x,
-            Decimal("10.17385250288240428062636055983603000640869140625"),
+            Decimal("10.173852502882464676758900168351829051971435546875"),
             Decimal("0.00000001"),
         )
         assert are_close(
             intersection.y,
-            Decimal("23.5941894450834155350094079039990901947021484375"),
+            Decimal("23.594189445085856249306743848137557506561279296875"),
             Decimal("0.00000001"),
         )
         assert are_close(
             intersection_star.x,
-            Decimal("10.17385250288240428062636055983603000640869140625"),
+            Decimal("10.173852502882464676758900168351829051971435546875"),
             Decimal("0.00000001"),
         )
         assert are_close(
             intersection_star.y,
-            Decimal("40.38425304626468173189701465"),
+            Decimal("40.38425304626934210091497346"),
             Decimal("0.00000001"),
         )
 
@@ -495,16 +448,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "28.102044708167113640229217708110809326171875"
-        )
-        assert intersection.y == Decimal(
-            "19.979552926265565560015602386556565761566162109375"
-        )
-        assert intersection_star.x == Decimal(
-            "28.102044708167113640229217708110809326171875"
-        )
-        assert intersection_star.y == Decimal("41.53936887136552600734798861")
+        assert intersection.x == Decimal("28.10204470733382898471033378")
+        assert intersection.y == Decimal("19.97955292666171015289666222")
+        assert intersection_star.x == Decimal("28.10204470733382898471033378")
+        assert intersection_star.y == Decimal("41.53936887181561768775583452")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -528,16 +475,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "28.160220994475139377755112946033477783203125"
-        )
-        assert intersection.y == Decimal(
-            "19.397790055248616880589906941168010234832763671875"
-        )
-        assert intersection_star.x == Decimal(
-            "28.160220994475139377755112946033477783203125"
-        )
-        assert intersection_star.y == Decimal("40.44211151511457928961840373")
+        assert intersection.x == Decimal("28.16022099447513812154696133")
+        assert intersection.y == Decimal("19.39779005524861878453038674")
+        assert intersection_star.x == Decimal("28.16022099447513812154696133")
+        assert intersection_star.y == Decimal("40.44211151511458103837385000")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -561,16 +502,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "29.237523029892987125322179053910076618194580078125"
-        )
-        assert intersection.y == Decimal(
-            "18.887489091103322635945005458779633045196533203125"
-        )
-        assert intersection_star.x == Decimal(
-            "29.237523029892987125322179053910076618194580078125"
-        )
-        assert intersection_star.y == Decimal("39.91292787117044096096486319")
+        assert intersection.x == Decimal("29.23752302989302542985667728")
+        assert intersection.y == Decimal("18.88748909110330374375210024")
+        assert intersection_star.x == Decimal("29.23752302989302542985667728")
+        assert intersection_star.y == Decimal("39.91292787117041982838984634")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -594,16 +529,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "28.218323696394005395404747105203568935394287109375"
-        )
-        assert intersection.y == Decimal(
-            "18.81676302800800471004549763165414333343505859375"
-        )
-        assert intersection_star.x == Decimal(
-            "28.218323696394005395404747105203568935394287109375"
-        )
-        assert intersection_star.y == Decimal("40.34994142860942754088607165")
+        assert intersection.x == Decimal("28.21832369723915314093059080")
+        assert intersection.y == Decimal("18.81676302760846859069409205")
+        assert intersection_star.x == Decimal("28.21832369723915314093059080")
+        assert intersection_star.y == Decimal("40.34994142818190560756795988")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -629,16 +558,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "25.705669523894808747854767716489732265472412109375"
-        )
-        assert intersection.y == Decimal(
-            "20.000000000000046185277824406512081623077392578125"
-        )
-        assert intersection_star.x == Decimal(
-            "25.705669523894808747854767716489732265472412109375"
-        )
-        assert intersection_star.y == Decimal("41.79794856989274689184053680")
+        assert intersection.x == Decimal("25.70566952389484901194312746")
+        assert intersection.y == Decimal("20.00000000000000000000000000")
+        assert intersection_star.x == Decimal("25.70566952389484901194312746")
+        assert intersection_star.y == Decimal("41.79794856989271778502370580")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -662,14 +585,10 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert len(intersections) == 1
         intersection = intersections[0]
         intersection, intersection_star = intersection
-        assert intersection.x == Decimal(
-            "26.888888888888889283634853200055658817291259765625"
-        )
+        assert intersection.x == Decimal("26.88888888888888888888888889")
         assert intersection.y == Decimal("20")
-        assert intersection_star.x == Decimal(
-            "26.888888888888889283634853200055658817291259765625"
-        )
-        assert intersection_star.y == Decimal("41.15317446917735752620224829")
+        assert intersection_star.x == Decimal("26.88888888888888888888888889")
+        assert intersection_star.y == Decimal("41.15317446917735821898531867")
 
         intersections = boundary_qr_minus.get_intersections(boundary_pq_plus)
         assert len(intersections) == 0
@@ -692,7 +611,7 @@ class TestGetIntersectionInWeightedPointBoundary:
         assert intersection.x == Decimal("29")
         assert intersection.y == Decimal("1")
         assert intersection_star.x == Decimal("29")
-        assert intersection_star.y == Decimal("10.05538513813741662657380817")
+        assert intersection_star.y == Decimal("10.05538513813741730018591625")
 
         intersections = boundary_qr_plus.get_intersections(boundary_pq_minus)
         assert len(intersections) == 0
@@ -714,3 +633,50 @@ class TestGetIntersectionInWeightedPointBoundary:
         boundary_qr_minus = WeightedPointBoundary(bisector_qr, False)
         intersections = boundary_qr_minus.get_intersections(boundary_pq_minus)
         assert len(intersections) == 1
+
+
+class TestCircumcenterIntersectionPoint:
+    """Test closed form intersections of PointBoundary against bisectors ones."""
+
+    def test_random_sites(self):
+        """Test with random sites sharing one site and every combination of signs."""
+        for _ in range(200):
+            p, q, r = [
+                Site(Decimal(randint(-5, 5)), Decimal(randint(-5, 5))) for _ in range(3)
+            ]
+            if p == q or q == r or p == r:
+                continue
+            # Bisectors of collinear sites are parallel.
+            if (q.point.x - p.point.x) * (r.point.y - p.point.y) == (
+                q.point.y - p.point.y
+            ) * (r.point.x - p.point.x):
+                continue
+            for sign_pq, sign_qr in [
+                (True, True),
+                (True, False),
+                (False, True),
+                (False, False),
+            ]:
+                boundary_pq = PointBoundary(PointBisector(sites=(p, q)), sign_pq)
+                boundary_qr = PointBoundary(PointBisector(sites=(q, r)), sign_qr)
+                intersections = boundary_pq.get_intersections(boundary_qr)
+                expected_intersections = Boundary.get_intersections(
+                    boundary_pq, boundary_qr
+                )
+                # When the intersection is a site, the boundary it belongs to depends
+                # on the rounding of the bisectors intersection.
+                if any(
+                    are_close(intersection_star.x, site.point.x, Decimal("0.0001"))
+                    for _, intersection_star in intersections + expected_intersections
+                    for site in (p, q, r)
+                ):
+                    continue
+                assert len(intersections) == len(expected_intersections)
+                for intersection, expected_intersection in zip(
+                    intersections, expected_intersections
+                ):
+                    for point, expected_point in zip(
+                        intersection, expected_intersection
+                    ):
+                        assert are_close(point.x, expected_point.x, Decimal("0.0001"))
+                        assert are_close(point.y, expected_point.y, Decimal("0.0001"))
@@ -36,7 +36,7 @@ class TestWeightedPointBoundaryIsPointInAllRegion:
         point = Point(Decimal("36"), Decimal("16.17424305044159994757531098"))
         assert boundary_minus.get_point_comparison(point) == 0
         assert boundary_plus.get_point_comparison(point) < 0
-        point = Point(Decimal("36"), Decimal("107.8257569495584071586485307"))
+        point = Point(Decimal("36"), Decimal("107.8257569495583929747084098"))
         assert boundary_minus.get_point_comparison(point) == 0
         assert boundary_plus.get_point_comparison(point) < 0
         point = Point(Decimal("45"), Decimal("215.8749217771908888306107530"))
@@ -108,7 +108,7 @@ class TestWeightedPointBoundaryIsPointInAllRegion:
         assert boundary_minus.get_point_comparison(point) > 0
         assert boundary_plus.get_point_comparison(point) == 0
         # Point in Boundary-
-        point = Point(Decimal("24"), Decimal("50.49390153191919183928135506"))
+        point = Point(Decimal("24"), Decimal("50.49390153191919504191087900"))
         assert boundary_minus.get_point_comparison(point) == 0
         assert boundary_plus.get_point_comparison(point) < 0
 
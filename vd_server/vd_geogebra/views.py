@@ -1,18 +1,68 @@
 """Geogebra views."""
-import json
-import tempfile
-from django.http.response import HttpResponse
+from typing import Iterable, Iterator, List
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from django.views import View
 
 from django import http
 
-from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
-from voronoi_diagrams.models import Point
 from vd_steps import db
+from vd_steps.results import results
 
-from decimal import Decimal
-from zipfile import ZipFile
+# Bytes of the compressed file sent at once.
+GGB_CHUNK_SIZE = 64 * 1024
+
+
+class ZipStream:
+    """Write-only stream keeping the bytes written until they are popped.
+
+    It cannot seek, so ZipFile writes the sizes of the files after them.
+    """
+
+    chunks: List[bytes]
+    size: int
+
+    def __init__(self) -> None:
+        """Construct empty stream."""
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """Keep bytes written."""
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """Do nothing, the bytes are kept until they are popped."""
+
+    def pop(self) -> bytes:
+        """Get bytes written since the last pop."""
+        data = b"".join(self.chunks)
+        self.chunks = []
+        self.size = 0
+        return data
+
+
+def iter_ggb(xml_parts: Iterable[str]) -> Iterator[bytes]:
+    """Get GeoGebra file of the xml of a construction in chunks.
+
+    The xml is compressed while it is generated, without keeping it whole.
+    """
+    stream = ZipStream()
+    with ZipFile(stream, "w", compression=ZIP_DEFLATED) as ggb:
+        with ggb.open("geogebra.xml", "w") as xml_file:
+            for xml_part in xml_parts:
+                xml_file.write(xml_part.encode("utf-8"))
+                if stream.size >= GGB_CHUNK_SIZE:
+                    yield stream.pop()
+    yield stream.pop()
+
+
+def iter_chunks(data: bytes) -> Iterator[bytes]:
+    """Get bytes in chunks."""
+    for start in range(0, len(data), GGB_CHUNK_SIZE):
+        yield data[start : start + GGB_CHUNK_SIZE]
 
 
 class GetGeogebraGGP(View):
@@ -28,15 +78,16 @@ class GetGeogebraGGP(View):
         if not db.is_vd_finished(session):
             return http.HttpResponseBadRequest()
 
-        vd = db.get_vd(session)
-        all_xml = vd.get_xml()
-        temp_dir = tempfile.TemporaryDirectory()
-        with open(temp_dir.name + "/" + "geogebra.xml", "wb") as t_file:
-            t_file.write(bytes(all_xml, "utf-8"))
-            with ZipFile(temp_dir.name + "/" + "voronoi_diagram.ggb", "w") as zip:
-                zip.write(t_file.name, "geogebra.xml")
-        with open(temp_dir.name + "/" + "voronoi_diagram.ggb", "rb") as z_file:
-            res = http.HttpResponse(z_file.read(), content_type="application/zip")
-            res["Content-Disposition"] = "inline;filename=voronoi_diagram.ggb"
-            temp_dir.cleanup()
-            return res
+        vd_input = db.get_vd_input(session)
+        if vd_input is not None:
+            ggb = results.get_artifact(
+                vd_input,
+                "voronoi_diagram.ggb",
+                lambda: b"".join(iter_ggb(results.get_vd(vd_input).iter_xml())),
+            )
+            ggb_chunks = iter_chunks(ggb)
+        else:
+            ggb_chunks = iter_ggb(db.get_vd(session).iter_xml())
+        res = http.StreamingHttpResponse(ggb_chunks, content_type="application/zip")
+        res["Content-Disposition"] = "inline;filename=voronoi_diagram.ggb"
+        return res
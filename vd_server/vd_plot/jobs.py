@@ -0,0 +1,191 @@
+"""Background calculation of Voronoi Diagrams."""
+
+# Standard Library
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import threading
+import uuid
+
+# VD
+from vd_steps.results import VDInput
+from vd_steps.store import SessionStore
+
+# Threads calculating jobs.
+MAX_JOB_WORKERS = 2
+# Jobs queued or running, more are rejected.
+MAX_PENDING_JOBS = 16
+# Jobs kept to get their progress and seconds they are kept after their last use.
+MAX_JOBS = 256
+JOB_TTL = 30 * 60
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+# Stages of a running job.
+CALCULATING = "calculating"
+RENDERING = "rendering"
+
+
+class JobCancelled(Exception):
+    """Raised in the job when it is cancelled."""
+
+
+class Job:
+    """Calculation running in the background.
+
+    The progress is the stage of the job, the events processed and the estimated
+    total of events, the events processed plus the events in Q. The result is kept
+    by the job until it is taken, so it is not lost if the cache evicts it.
+    """
+
+    __slots__ = (
+        "id",
+        "vd_input",
+        "status",
+        "stage",
+        "n_events",
+        "n_total_events",
+        "error",
+        "result",
+        "_cancel_event",
+        "_future",
+    )
+
+    id: str
+    vd_input: VDInput
+    status: str
+    stage: str
+    n_events: int
+    n_total_events: int
+    error: Optional[str]
+    result: Optional[bytes]
+    _cancel_event: threading.Event
+    _future: Optional[Future]
+
+    def __init__(self, vd_input: VDInput) -> None:
+        """Construct queued job of the input."""
+        self.id = uuid.uuid4().hex
+        self.vd_input = vd_input
+        self.status = QUEUED
+        self.stage = CALCULATING
+        self.n_events = 0
+        self.n_total_events = 0
+        self.error = None
+        self.result = None
+        self._cancel_event = threading.Event()
+        self._future = None
+
+    def is_pending(self) -> bool:
+        """Check if the job is queued or running."""
+        return self.status in (QUEUED, RUNNING)
+
+    def update_progress(self, n_events: int, n_pending_events: int) -> None:
+        """Update progress of the job, raising JobCancelled if it was cancelled."""
+        self.check_cancelled()
+        self.n_events = n_events
+        self.n_total_events = n_events + n_pending_events
+
+    def start_stage(self, stage: str) -> None:
+        """Start stage of the job, raising JobCancelled if it was cancelled."""
+        self.check_cancelled()
+        self.stage = stage
+
+    def check_cancelled(self) -> None:
+        """Raise JobCancelled if the job was cancelled."""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def cancel(self) -> None:
+        """Cancel job, it is stopped in its next update of the progress or stage."""
+        self._cancel_event.set()
+        if self._future is not None and self._future.cancel():
+            self.status = CANCELLED
+
+    def take_result(self) -> Optional[bytes]:
+        """Get result of the job and stop keeping it, None if it was taken."""
+        result, self.result = self.result, None
+        return result
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Get status and progress of the job in a dict."""
+        return {
+            "job": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "n_events": self.n_events,
+            "n_total_events": self.n_total_events,
+            "error": self.error,
+        }
+
+
+class JobPool:
+    """Bounded pool of threads running jobs."""
+
+    jobs: SessionStore
+    max_pending_jobs: int
+    _executor: ThreadPoolExecutor
+    _pending_jobs: int
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        max_workers: int = MAX_JOB_WORKERS,
+        max_pending_jobs: int = MAX_PENDING_JOBS,
+        max_jobs: int = MAX_JOBS,
+        ttl: float = JOB_TTL,
+    ) -> None:
+        """Construct pool without jobs."""
+        self.jobs = SessionStore(max_entries=max_jobs, ttl=ttl)
+        self.max_pending_jobs = max_pending_jobs
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="vd_job"
+        )
+        self._pending_jobs = 0
+        self._lock = threading.Lock()
+
+    def submit(self, vd_input: VDInput, work: Callable[[Job], None]) -> Optional[Job]:
+        """Run work of the input in the background.
+
+        work gets its job to update its progress. None is returned if there are
+        too many pending jobs.
+        """
+        with self._lock:
+            if self._pending_jobs >= self.max_pending_jobs:
+                return None
+            self._pending_jobs += 1
+        job = Job(vd_input)
+        self.jobs.put(job.id, job)
+        job._future = self._executor.submit(self._run, job, work)
+        job._future.add_done_callback(self._finish)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get job, None if it does not exist or it expired."""
+        return self.jobs.get(job_id)
+
+    def _run(self, job: Job, work: Callable[[Job], None]) -> None:
+        """Run work of the job and set its status."""
+        if job._cancel_event.is_set():
+            job.status = CANCELLED
+            return
+        job.status = RUNNING
+        try:
+            work(job)
+        except JobCancelled:
+            job.status = CANCELLED
+        except Exception as error:
+            job.error = str(error)
+            job.status = FAILED
+        else:
+            job.status = DONE
+
+    def _finish(self, future: Future) -> None:
+        """Count job as finished, also called when it is cancelled before running."""
+        with self._lock:
+            self._pending_jobs -= 1
+
+
+jobs = JobPool()
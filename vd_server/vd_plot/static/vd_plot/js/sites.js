@@ -146,13 +146,150 @@ vd_form.submit(function (event) {
     event.preventDefault();
 });
 
+// Step shown in the plot and its traces by id, null when the plot is not a step.
+var plot_step = null;
+var plot_traces = {};
+var plot_layout = {};
+var plot_config = {};
+
 async function write_plot(resp) {
+    plot_step = null;
     $('#plot').html(resp);
 }
 
+async function write_plot_delta(resp) {
+    if (resp.reset) {
+        plot_traces = {};
+        plot_layout = resp.layout;
+        plot_config = resp.config;
+        $('#plot').html('<div id="step_plot"></div>');
+    }
+    for (let i = 0; i < resp.removed.length; i++) {
+        delete plot_traces[resp.removed[i]];
+    }
+    for (let i = 0; i < resp.added.length; i++) {
+        plot_traces[resp.added[i].id] = resp.added[i].trace;
+    }
+    plot_step = resp.step;
+    // Integer keys are iterated in ascending order, the order of the traces.
+    var data = Object.values(plot_traces).concat(resp.overlay);
+    await Plotly.react('step_plot', data, plot_layout, plot_config);
+}
+
+function get_step_delta(direction) {
+    $('#loading').html(loading_content());
+    $.ajax({
+        type: 'GET',
+        url: '/steps/delta/',
+        dataType: 'json',
+        data: { session: session, direction: direction, from_step: plot_step },
+        success: function (resp) {
+            write_plot_delta(resp).then(() => {
+                $('#loading').html("")
+                get_info()
+            });
+        },
+        error: function (resp) {
+            $('#loading').html("")
+            console.log(resp);
+        }
+    });
+}
+
+// Job calculating the diagram, null when there is none running.
+var plot_job = null;
+var job_poll_interval = 250;
+
+function cancel_plot_job() {
+    if (plot_job == null) {
+        return;
+    }
+    $.ajax({
+        type: 'POST',
+        url: '/plot-vd/jobs/' + plot_job + '/cancel/',
+        dataType: 'json',
+        headers: { 'X-CSRFToken': csrftoken }
+    });
+    plot_job = null;
+}
+
+function write_job_progress(resp) {
+    var progress = "";
+    if (resp.stage == "rendering") {
+        progress = "Rendering";
+    } else if (resp.n_total_events > 0) {
+        progress = resp.n_events + " / " + resp.n_total_events + " events";
+    }
+    $('#loading').html(loading_content() + "<span>" + progress + "</span>");
+}
+
+function get_job_result(job) {
+    $.ajax({
+        type: 'GET',
+        url: '/plot-vd/jobs/' + job + '/result/',
+        dataType: 'html',
+        data: { session: session },
+        success: function (resp) {
+            write_plot(resp).then(() => {
+                $('#loading').html("")
+                // Step buttons.
+                $('#next-step').attr('disabled', 'disabled');
+                $('#next-step-responsive').attr('disabled', 'disabled');
+                $('#prev-step').attr('disabled', 'disabled');
+                $('#prev-step-responsive').attr('disabled', 'disabled');
+                $('#download-ggb').removeAttr('disabled');
+                $('#download-ggb-responsive').removeAttr('disabled');
+                // Actual Event
+                $('#actual_event').html("");
+                // Queue
+                $('#qqueue').html("");
+                // LList
+                $('#llist').html("");
+            });
+        },
+        error: function (resp) {
+            console.log(resp);
+            $('#loading').html("")
+        }
+    });
+}
+
+function poll_job(job) {
+    if (job != plot_job) {
+        return;
+    }
+    $.ajax({
+        type: 'GET',
+        url: '/plot-vd/jobs/' + job + '/',
+        dataType: 'json',
+        success: function (resp) {
+            if (job != plot_job) {
+                return;
+            }
+            if (resp.status == "done") {
+                plot_job = null;
+                get_job_result(job);
+            } else if (resp.status == "queued" || resp.status == "running") {
+                write_job_progress(resp);
+                setTimeout(function () { poll_job(job); }, job_poll_interval);
+            } else {
+                console.log(resp);
+                plot_job = null;
+                $('#loading').html("")
+            }
+        },
+        error: function (resp) {
+            console.log(resp);
+            plot_job = null;
+            $('#loading').html("")
+        }
+    });
+}
+
 $('#plot-vd').click(function () {
     data = getFormData(vd_form);
     data["sites"] = get_sites();
+    cancel_plot_job();
     $('#loading').html(loading_content());
     $.ajax({
         type: 'POST',
@@ -162,27 +299,14 @@ $('#plot-vd').click(function () {
         headers: { 'X-CSRFToken': csrftoken },
         success: function (r) {
             $.ajax({
-                type: 'GET',
-                url: '/plot-vd/',
-                dataType: 'html',
-                data: { body: JSON.stringify(data), session: session },
+                type: 'POST',
+                url: '/plot-vd/jobs/',
+                dataType: 'json',
+                data: { body: JSON.stringify(data) },
+                headers: { 'X-CSRFToken': csrftoken },
                 success: function (resp) {
-                    write_plot(resp).then(() => {
-                        $('#loading').html("")
-                        // Step buttons.
-                        $('#next-step').attr('disabled', 'disabled');
-                        $('#next-step-responsive').attr('disabled', 'disabled');
-                        $('#prev-step').attr('disabled', 'disabled');
-                        $('#prev-step-responsive').attr('disabled', 'disabled');
-                        $('#download-ggb').removeAttr('disabled');
-                        $('#download-ggb-responsive').removeAttr('disabled');
-                        // Actual Event
-                        $('#actual_event').html("");
-                        // Queue
-                        $('#qqueue').html("");
-                        // LList
-                        $('#llist').html("");
-                    });
+                    plot_job = resp.job;
+                    poll_job(resp.job);
                 },
                 error: function (resp) {
                     console.log(resp);
@@ -200,14 +324,15 @@ $('#plot-vd').click(function () {
 $('#first-step').click(function () {
     data = getFormData(vd_form);
     data["sites"] = get_sites();
+    cancel_plot_job();
     $('#loading').html(loading_content());
     $.ajax({
         type: 'GET',
         url: '/steps/first/',
-        dataType: 'html',
-        data: { body: JSON.stringify(data), session: session },
+        dataType: 'json',
+        data: { body: JSON.stringify(data), session: session, format: 'json' },
         success: function (resp) {
-            write_plot(resp).then(() => {
+            write_plot_delta(resp).then(() => {
                 $('#loading').html("")
                 get_info()
             });
@@ -220,23 +345,7 @@ $('#first-step').click(function () {
 })
 
 function next_step() {
-    $('#loading').html(loading_content());
-    $.ajax({
-        type: 'GET',
-        url: '/steps/next/',
-        dataType: 'html',
-        data: { session: session },
-        success: function (resp) {
-            write_plot(resp).then(() => {
-                $('#loading').html("")
-                get_info()
-            });
-        },
-        error: function (resp) {
-            $('#loading').html("")
-            console.log(resp);
-        }
-    });
+    get_step_delta('next');
 }
 
 $('#next-step').click(next_step)
@@ -244,23 +353,7 @@ $('#next-step').click(next_step)
 $('#next-step-responsive').click(next_step)
 
 function prev_step() {
-    $('#loading').html(loading_content());
-    $.ajax({
-        type: 'GET',
-        url: '/steps/prev/',
-        dataType: 'html',
-        data: { session: session },
-        success: function (resp) {
-            write_plot(resp).then(() => {
-                $('#loading').html("")
-                get_info()
-            });
-        },
-        error: function (resp) {
-            $('#loading').html("")
-            console.log(resp);
-        }
-    });
+    get_step_delta('prev');
 }
 
 $('#prev-step').click(prev_step)
@@ -1,3 +1,114 @@
-from django.test import TestCase
+"""VD plot tests."""
 
-# Create your tests here.
+# Standard Library
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+import json
+import threading
+
+# Django
+from django.test import Client, SimpleTestCase
+
+# VD
+from voronoi_diagrams.models import Point
+from vd_steps.results import VDInput, results
+
+from .jobs import CANCELLED, DONE, FAILED, JobPool, jobs
+
+
+def get_input(n):
+    """Get input of a diagram of n point sites in a diagonal."""
+    return VDInput(
+        "vd",
+        [Point(Decimal(i), Decimal(i * i % 7)) for i in range(n)],
+        [str(i) for i in range(n)],
+        (Decimal("-100"), Decimal("100")),
+        (Decimal("-100"), Decimal("100")),
+    )
+
+
+class JobPoolTest(SimpleTestCase):
+    """Test pool of jobs in the background."""
+
+    def test_progress(self):
+        """Test progress of a job calculating a diagram."""
+        pool = JobPool(max_workers=1)
+        job = pool.submit(
+            get_input(10), lambda job: job.vd_input.calculate(job.update_progress)
+        )
+        job._future.result()
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(job.n_events, job.n_total_events)
+        self.assertGreaterEqual(job.n_events, 10)
+        self.assertIs(pool.get(job.id), job)
+
+    def test_cancel(self):
+        """Test jobs are cancelled while running and while queued."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def work(job):
+            started.set()
+            release.wait()
+            job.vd_input.calculate(job.update_progress)
+
+        pool = JobPool(max_workers=1)
+        running_job = pool.submit(get_input(10), work)
+        queued_job = pool.submit(get_input(10), work)
+        started.wait()
+        running_job.cancel()
+        queued_job.cancel()
+        release.set()
+        running_job._future.result()
+        self.assertEqual(running_job.status, CANCELLED)
+        self.assertEqual(queued_job.status, CANCELLED)
+
+    def test_max_pending_jobs(self):
+        """Test jobs over max_pending_jobs are rejected and errors are kept."""
+        release = threading.Event()
+
+        def work(job):
+            release.wait()
+            raise ValueError("Invalid sites.")
+
+        pool = JobPool(max_workers=1, max_pending_jobs=2)
+        jobs = [pool.submit(get_input(1), work) for _ in range(3)]
+        self.assertIsNone(jobs[2])
+        release.set()
+        for job in jobs[:2]:
+            job._future.result()
+            self.assertEqual((job.status, job.error), (FAILED, "Invalid sites."))
+
+
+class JobViewsTest(SimpleTestCase):
+    """Test views of the jobs."""
+
+    def test_job_and_request(self):
+        """Test a job and a request of the same diagram at the same time."""
+        body = json.dumps(
+            {
+                "vd_type": "vd",
+                "sites": [[str(i), str(i * i % 7), str(i)] for i in range(40)],
+            }
+        )
+        client = Client(HTTP_HOST="localhost")
+        request_client = Client(HTTP_HOST="localhost")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            job_response = client.post("/plot-vd/jobs/", {"body": body})
+            request = executor.submit(
+                request_client.get, "/plot-vd/", {"session": "request", "body": body}
+            )
+            job = jobs.get(job_response.json()["job"])
+            job._future.result(60)
+            html = request.result(60).content
+        self.assertEqual(job.status, DONE)
+
+        # The result is kept by the job even if the cache evicts it.
+        results.memory.clear()
+        url = f"/plot-vd/jobs/{job.id}/result/"
+        response = client.get(url, {"session": "job"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, html)
+        # It is not calculated again when it is got a second time.
+        response = client.get(url, {"session": "job"})
+        self.assertEqual(response.status_code, 410)
@@ -7,4 +7,16 @@ from . import views
 urlpatterns = [
     path("", views.MainView.as_view(), name="main"),
     path("plot-vd/", views.PlotVDView.as_view(), name="plot_vd"),
+    path("plot-vd/jobs/", views.PlotVDJobView.as_view(), name="plot_vd_job"),
+    path("plot-vd/jobs/<str:job_id>/", views.JobView.as_view(), name="job"),
+    path(
+        "plot-vd/jobs/<str:job_id>/result/",
+        views.JobResultView.as_view(),
+        name="job_result",
+    ),
+    path(
+        "plot-vd/jobs/<str:job_id>/cancel/",
+        views.CancelJobView.as_view(),
+        name="cancel_job",
+    ),
 ]
@@ -1,6 +1,6 @@
 """VD Plot views."""
 
-from typing import Dict
+from typing import Any, Dict
 import json
 
 from django.shortcuts import render
@@ -12,6 +12,9 @@ from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm
 from voronoi_diagrams.models import Point
 from plots.plot_utils.voronoi_diagram import get_vd_html
 from vd_steps import db
+from vd_steps.results import VDInput, results
+
+from .jobs import DONE, RENDERING, Job, jobs
 
 from decimal import Decimal
 
@@ -28,6 +31,52 @@ class MainView(View):
         return render(request, self.template)
 
 
+def get_vd_input(body_data: Dict[str, Any]) -> VDInput:
+    """Get input of the diagram in the body of a request."""
+    sites = []
+    names = []
+
+    vd_type = body_data.get("vd_type", "vd")
+    xlim = (
+        Decimal(body_data.get("limit_x0", "-100")),
+        Decimal(body_data.get("limit_x1", "100")),
+    )
+    ylim = (
+        Decimal(body_data.get("limit_y0", "-100")),
+        Decimal(body_data.get("limit_y1", "100")),
+    )
+    if vd_type == "vd":
+        for x, y, name in body_data["sites"]:
+            sites.append(Point(Decimal(x), Decimal(y)))
+            names.append(name)
+    elif vd_type == "aw_vd":
+        for x, y, w, name in body_data["sites"]:
+            sites.append((Point(Decimal(x), Decimal(y)), Decimal(w)))
+            names.append(name)
+    return VDInput(vd_type, sites, names, xlim, ylim)
+
+
+def get_vd_html_result(vd_input: VDInput) -> bytes:
+    """Get html of the diagram of the input from the cache, calculating it if needed.
+
+    The same sites are served from the cache without calculating them again.
+    """
+    return results.get_artifact(
+        vd_input,
+        "vd.html",
+        lambda: get_vd_html(
+            results.get_vd(vd_input), vd_input.xlim, vd_input.ylim
+        ).encode("utf-8"),
+    )
+
+
+def calculate_vd_job(job: Job) -> None:
+    """Calculate diagram of the job and render its html, kept by the job."""
+    results.get_vd(job.vd_input, job.update_progress)
+    job.start_stage(RENDERING)
+    job.result = get_vd_html_result(job.vd_input)
+
+
 class PlotVDView(View):
     """Plot Voronoi Diagram View."""
 
@@ -46,36 +95,77 @@ class PlotVDView(View):
         if not body_data.get("sites", False):
             return http.HttpResponseNotFound()
 
-        sites = []
-        names = []
-
-        vd_type = body_data.get("vd_type", "vd")
-        xlim = (
-            Decimal(body_data.get("limit_x0", "-100")),
-            Decimal(body_data.get("limit_x1", "100")),
-        )
-        ylim = (
-            Decimal(body_data.get("limit_y0", "-100")),
-            Decimal(body_data.get("limit_y1", "100")),
-        )
-        if vd_type == "vd":
-            for x, y, name in body_data["sites"]:
-                sites.append(Point(Decimal(x), Decimal(y)))
-                names.append(name)
-            voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
-                sites, False, xlim=xlim, ylim=ylim, names=names
-            )
-        elif vd_type == "aw_vd":
-            for x, y, w, name in body_data["sites"]:
-                sites.append((Point(Decimal(x), Decimal(y)), Decimal(w)))
-                names.append(name)
-            voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
-                sites, False, xlim=xlim, ylim=ylim, names=names
-            )
-
-        db.save_vd_completed(session, voronoi_diagram, xlim, ylim)
-        step, ok = db.get_current_step(session)
-        if not ok:
+        vd_input = get_vd_input(body_data)
+        html = get_vd_html_result(vd_input)
+        db.save_vd_input(session, vd_input)
+        return http.HttpResponse(html)
+
+
+class PlotVDJobView(View):
+    """Calculate Voronoi Diagram in the background."""
+
+    def post(self, request):
+        """Submit job of the voronoi diagram."""
+        body = request.POST.get("body")
+        if not body:
+            return http.HttpResponseNotFound()
+
+        body_data = json.loads(body)
+        if not body_data.get("sites", False):
+            return http.HttpResponseNotFound()
+
+        job = jobs.submit(get_vd_input(body_data), calculate_vd_job)
+        if job is None:
+            return http.JsonResponse({"error": "Too many jobs."}, status=503)
+
+        return http.JsonResponse(job.get_progress())
+
+
+class JobView(View):
+    """Job progress view."""
+
+    def get(self, request, job_id):
+        """Get progress of the job."""
+        job = jobs.get(job_id)
+        if job is None:
+            return http.HttpResponseNotFound()
+
+        return http.JsonResponse(job.get_progress())
+
+
+class JobResultView(View):
+    """Job result view."""
+
+    def get(self, request, job_id):
+        """Get voronoi diagram of a job done and save it in the session.
+
+        The diagram can be got once, after that the job must be submitted again.
+        """
+        session = request.GET.get("session")
+        if not session:
+            return http.HttpResponseBadRequest()
+
+        job = jobs.get(job_id)
+        if job is None:
+            return http.HttpResponseNotFound()
+        if job.status != DONE:
+            return http.JsonResponse(job.get_progress(), status=409)
+
+        html = job.take_result()
+        if html is None:
+            return http.JsonResponse(job.get_progress(), status=410)
+        db.save_vd_input(session, job.vd_input)
+        return http.HttpResponse(html)
+
+
+class CancelJobView(View):
+    """Cancel job view."""
+
+    def post(self, request, job_id):
+        """Cancel job."""
+        job = jobs.get(job_id)
+        if job is None:
             return http.HttpResponseNotFound()
 
-        return http.HttpResponse(step)
+        job.cancel()
+        return http.JsonResponse(job.get_progress())
@@ -115,3 +115,10 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/3.1/howto/static-files/
 
 STATIC_URL = "/static/"
+
+
+# Cache of the results of the diagrams.
+# Directory of the disk tier, it is only used if it is set.
+VD_RESULTS_CACHE_DIR = os.environ.get("VD_RESULTS_CACHE_DIR") or None
+# Bytes of all the files in the disk tier.
+VD_RESULTS_CACHE_MAX_DISK = 1024 * 1024 * 1024
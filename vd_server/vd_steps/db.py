@@ -6,18 +6,56 @@ from datetime import datetime
 import threading
 
 # Voronoi Diagrams
-from plots.plot_utils.voronoi_diagram import get_vd_html, get_html
+from plots.plot_utils.steps import (
+    get_empty_step_figure,
+    get_step_figure,
+    get_step_overlay_traces,
+)
+from plots.plot_utils.voronoi_diagram import (
+    PLOT_CONFIG,
+    get_html,
+    get_vd_figure,
+    get_vd_html,
+)
 from voronoi_diagrams.fortunes_algorithm import (
     FortunesAlgorithm,
     MANUAL_MODE,
 )
 
-from .utils import get_event_dict, get_region_dict
+# Plot
+from plotly import graph_objects as go
+
+from .results import VDInput, results
+from .store import SessionStore
+from .utils import (
+    Changes,
+    apply_changes,
+    get_changes,
+    get_event_dict,
+    get_item_key,
+    get_region_dict,
+)
 
 Session = str
 Step = str
+StepDelta = Dict[str, Any]
 Finished = bool
 
+# Steps between snapshots, at least the number of sites so the snapshots take
+# memory proportional to the number of events.
+SNAPSHOT_INTERVAL = 64
+
+# Limits of the sessions saved, the least recently used are removed first.
+MAX_SESSIONS = 64
+# Estimated memory of all the sessions in bytes.
+MAX_SESSIONS_MEMORY = 512 * 1024 * 1024
+# Seconds a session is kept without being used.
+SESSION_TTL = 30 * 60
+# Estimated memory in bytes of each trace and of each event, region, vertex or
+# edge logged, measured in sessions of random sites.
+TRACE_MEMORY_SIZE = 16 * 1024
+LOGGED_ITEM_MEMORY_SIZE = 1024
+
 
 class VDStepInfo:
     """VD step info."""
@@ -47,17 +85,119 @@ class VDStepInfo:
         self.actual_event = actual_event
 
 
+class VDStep:
+    """Log of the changes made in a step.
+
+    The Q and L structures are logged as changes of their dicts and the diagram as
+    the indices of the traces of the steps observer added and removed.
+    """
+
+    __slots__ = (
+        "actual_event",
+        "has_next_step",
+        "is_diagram",
+        "q_changes",
+        "l_changes",
+        "added_traces",
+        "removed_traces",
+        "new_vertices",
+        "new_edges",
+    )
+
+    actual_event: Optional[Dict[str, Any]]
+    has_next_step: bool
+    is_diagram: bool
+    q_changes: Changes
+    l_changes: Changes
+    added_traces: List[int]
+    removed_traces: List[int]
+    new_vertices: List[Dict[str, Any]]
+    new_edges: List[List[str]]
+
+    def __init__(
+        self,
+        actual_event: Optional[Dict[str, Any]],
+        has_next_step: bool,
+        is_diagram: bool,
+        q_changes: Changes,
+        l_changes: Changes,
+        added_traces: List[int],
+        removed_traces: List[int],
+        new_vertices: List[Dict[str, Any]],
+        new_edges: List[List[str]],
+    ):
+        """Step log constructor."""
+        self.actual_event = actual_event
+        self.has_next_step = has_next_step
+        self.is_diagram = is_diagram
+        self.q_changes = q_changes
+        self.l_changes = l_changes
+        self.added_traces = added_traces
+        self.removed_traces = removed_traces
+        self.new_vertices = new_vertices
+        self.new_edges = new_edges
+
+
+class VDSnapshot:
+    """Q and L structures and traces of the diagram in a step."""
+
+    __slots__ = ("q_structure", "l_structure", "traces")
+
+    q_structure: List[Dict[str, Any]]
+    l_structure: List[Dict[str, Any]]
+    traces: List[int]
+
+    def __init__(
+        self,
+        q_structure: List[Dict[str, Any]],
+        l_structure: List[Dict[str, Any]],
+        traces: List[int],
+    ):
+        """Snapshot constructor."""
+        self.q_structure = q_structure
+        self.l_structure = l_structure
+        self.traces = traces
+
+    def copy(self) -> "VDSnapshot":
+        """Get copy of the snapshot to apply changes."""
+        return VDSnapshot(
+            list(self.q_structure), list(self.l_structure), list(self.traces)
+        )
+
+
 class VDEntry:
-    """Entry in db."""
+    """Entry in db.
+
+    Only the log of the steps is saved. The frames of the steps are materialized
+    when they are requested, applying the log to the last snapshot before them.
+    """
 
     session: Session
     created_at: datetime
     vd: FortunesAlgorithm
-    steps: List[Step]
-    step_infos: List[VDStepInfo]
+    xlim: Any
+    ylim: Any
+    steps: List[VDStep]
+    snapshots: List[VDSnapshot]
+    snapshot_interval: int
     finished: bool
     is_diagram: bool
     current_step: int
+    # Traces of the steps observer in all the steps.
+    _traces: List[Optional[go.Scatter]]
+    # Snapshot of the last step and the keys of its structures.
+    _last_snapshot: VDSnapshot
+    _q_keys: List[str]
+    _l_keys: List[str]
+    # Vertices and edges of the diagram in the last step.
+    _n_vertices: int
+    _n_edges: int
+    # Last frame materialized.
+    _frame: Optional[Tuple[int, Step]]
+    # Estimated memory of the log of the steps.
+    _memory_size: int
+    # Lock to use the entry from many requests.
+    lock: threading.Lock
 
     def __init__(
         self,
@@ -69,57 +209,261 @@ class VDEntry:
         """Create entry."""
         self.vd = vd
         self.created_at = datetime.now()
+        self.xlim = vd._xlim if xlim is None else xlim
+        self.ylim = vd._ylim if ylim is None else ylim
+        self.steps = []
+        self.snapshots = []
+        self.snapshot_interval = max(SNAPSHOT_INTERVAL, len(vd.sites))
+        self.current_step = 0
+        self._traces = []
+        self._last_snapshot = VDSnapshot([], [], [])
+        self._q_keys = []
+        self._l_keys = []
+        self._n_vertices = 0
+        self._n_edges = 0
+        self._frame = None
+        self._memory_size = 0
+        self.lock = threading.Lock()
         if steps:
-            self.steps = [get_html(self.vd._figure)]
             self.is_diagram = False
             self.finished = not vd.has_next_step()
         else:
-            self.steps = [get_vd_html(vd, [], xlim, ylim)]
             self.is_diagram = True
             self.finished = True
-        self.step_infos = []
-        self.current_step = 0
-        self.save_step_info()
+        self.save_step()
 
-    def save_step_info(self) -> None:
-        """Save snapshot info of the current step."""
-        # Q structure
-        q_queue_dict = []
+    def save_step(self) -> None:
+        """Save log of the changes made in the last step."""
+        q_structure = []
         for event in self.vd.q_structure.get_all_events():
-            q_queue_dict.append(get_event_dict(event))
+            q_structure.append(get_event_dict(event))
 
-        l_structure_dict = []
+        l_structure = []
         if self.finished and self.is_diagram:
             actual_event = None
         else:
             actual_event = get_event_dict(self.vd.event)
-            # L structure
             for region in self.vd.l_structure.get_all_regions():
-                l_structure_dict.append(get_region_dict(region))
-
-        self.step_infos.append(
-            VDStepInfo(
-                q_structure=q_queue_dict,
-                l_structure=l_structure_dict,
-                has_next_step=self.vd.has_next_step(),
-                is_prev_step=self.current_step != 0,
-                is_diagram=self.is_diagram,
-                actual_event=actual_event,
+                l_structure.append(get_region_dict(region))
+        q_keys = [get_item_key(event) for event in q_structure]
+        l_keys = [get_item_key(region) for region in l_structure]
+
+        snapshot = self._last_snapshot
+        added_traces = []
+        removed_traces = []
+        if self.vd.observer is not None and not self.is_diagram:
+            traces = self.vd.observer.get_traces()
+            added_traces = [
+                i
+                for i in range(len(self._traces), len(traces))
+                if traces[i] is not None
+            ]
+            removed_traces = [i for i in snapshot.traces if traces[i] is None]
+            self._traces += traces[len(self._traces) :]
+            snapshot.traces = [
+                i for i in snapshot.traces if traces[i] is not None
+            ] + added_traces
+
+        vd_step = VDStep(
+            actual_event=actual_event,
+            has_next_step=self.vd.has_next_step(),
+            is_diagram=self.is_diagram,
+            q_changes=get_changes(self._q_keys, q_keys, q_structure),
+            l_changes=get_changes(self._l_keys, l_keys, l_structure),
+            added_traces=added_traces,
+            removed_traces=removed_traces,
+            new_vertices=[
+                {"x": point.x, "y": point.y}
+                for point in self.vd.vertices_list[self._n_vertices :]
+            ],
+            new_edges=[
+                [site.name for site in edge.bisector.sites]
+                for edge in self.vd.edges[self._n_edges :]
+            ],
+        )
+        self.steps.append(vd_step)
+        n_logged_items = (
+            sum(len(items) for _, _, items in vd_step.q_changes)
+            + sum(len(items) for _, _, items in vd_step.l_changes)
+            + len(vd_step.new_vertices)
+            + len(vd_step.new_edges)
+        )
+        self._memory_size += (
+            TRACE_MEMORY_SIZE * len(added_traces)
+            + LOGGED_ITEM_MEMORY_SIZE * n_logged_items
+        )
+        snapshot.q_structure = q_structure
+        snapshot.l_structure = l_structure
+        self._q_keys = q_keys
+        self._l_keys = l_keys
+        self._n_vertices = len(self.vd.vertices_list)
+        self._n_edges = len(self.vd.edges)
+        if (len(self.steps) - 1) % self.snapshot_interval == 0:
+            self.snapshots.append(snapshot.copy())
+            self._memory_size += LOGGED_ITEM_MEMORY_SIZE * (
+                len(q_structure) + len(l_structure)
+            )
+
+    def get_memory_size(self) -> int:
+        """Get estimated memory of the entry in bytes."""
+        memory_size = self._memory_size
+        if self._frame is not None:
+            memory_size += len(self._frame[1])
+        return memory_size
+
+    def get_snapshot(self, step: int) -> VDSnapshot:
+        """Get Q and L structures and traces of a step applying the log."""
+        if step == len(self.steps) - 1:
+            return self._last_snapshot
+        first_step = step - step % self.snapshot_interval
+        snapshot = self.snapshots[first_step // self.snapshot_interval].copy()
+        traces = set(snapshot.traces)
+        for vd_step in self.steps[first_step + 1 : step + 1]:
+            apply_changes(snapshot.q_structure, vd_step.q_changes)
+            apply_changes(snapshot.l_structure, vd_step.l_changes)
+            traces.difference_update(vd_step.removed_traces)
+            traces.update(vd_step.added_traces)
+        snapshot.traces = sorted(traces)
+        return snapshot
+
+    def get_frame(self, step: int) -> Step:
+        """Get frame of a step, materializing it if needed."""
+        if self._frame is not None and self._frame[0] == step:
+            return self._frame[1]
+        vd_step = self.steps[step]
+        if vd_step.is_diagram:
+            frame = get_vd_html(self.vd, self.xlim, self.ylim)
+        else:
+            snapshot = self.get_snapshot(step)
+            events = []
+            for event in snapshot.q_structure:
+                event_point = event["event_point"]
+                events.append((event_point["x"], event_point["y"], event["event_str"]))
+            figure = get_step_figure(
+                self.xlim,
+                self.ylim,
+                [self._traces[i] for i in snapshot.traces],
+                vd_step.actual_event["event_point"]["y"],
+                events,
             )
+            frame = get_html(figure)
+        self._frame = (step, frame)
+        return frame
+
+    def get_delta(self, from_step: Optional[int], step: int) -> StepDelta:
+        """Get traces of a step added and removed from the traces of from_step.
+
+        The traces of the diagram are identified by their index in the steps
+        observer. The sweep line and the events are sent in every step as the
+        overlay. The whole plot is sent, with its layout and reset in True, when
+        from_step is None or one of the steps is the diagram.
+        """
+        vd_step = self.steps[step]
+        if vd_step.is_diagram:
+            figure = get_vd_figure(self.vd, self.xlim, self.ylim, self.vd.SITE_CLASS)
+            return {
+                "step": step,
+                "reset": True,
+                "layout": figure.layout.to_plotly_json(),
+                "config": PLOT_CONFIG,
+                "removed": [],
+                "added": [],
+                "overlay": [trace.to_plotly_json() for trace in figure.data],
+            }
+
+        snapshot = self.get_snapshot(step)
+        reset = (
+            from_step is None
+            or not 0 <= from_step < len(self.steps)
+            or self.steps[from_step].is_diagram
+        )
+        if reset:
+            removed_traces = []
+            added_traces = snapshot.traces
+        else:
+            old_traces = set(self.get_snapshot(from_step).traces)
+            new_traces = set(snapshot.traces)
+            removed_traces = sorted(old_traces - new_traces)
+            added_traces = sorted(new_traces - old_traces)
+
+        events = []
+        for event in snapshot.q_structure:
+            event_point = event["event_point"]
+            events.append((event_point["x"], event_point["y"], event["event_str"]))
+        overlay = get_step_overlay_traces(
+            self.xlim, self.ylim, vd_step.actual_event["event_point"]["y"], events
         )
+        delta = {
+            "step": step,
+            "reset": reset,
+            "removed": removed_traces,
+            "added": [
+                {"id": i, "trace": self._traces[i].to_plotly_json()}
+                for i in added_traces
+            ],
+            "overlay": [trace.to_plotly_json() for trace in overlay],
+        }
+        if reset:
+            delta["layout"] = get_empty_step_figure(
+                self.xlim, self.ylim
+            ).layout.to_plotly_json()
+            delta["config"] = PLOT_CONFIG
+        return delta
 
     def get_step_info(self) -> Dict[str, Any]:
         """Get current step info in a dict."""
-        step_info = self.step_infos[self.current_step].__dict__.copy()
-        return step_info
+        vd_step = self.steps[self.current_step]
+        snapshot = self.get_snapshot(self.current_step)
+        step_info = VDStepInfo(
+            q_structure=snapshot.q_structure,
+            l_structure=snapshot.l_structure,
+            has_next_step=vd_step.has_next_step,
+            is_prev_step=self.current_step != 0,
+            is_diagram=vd_step.is_diagram,
+            actual_event=vd_step.actual_event,
+        )
+        step_info_dict = step_info.__dict__.copy()
+        step_info_dict["new_vertices"] = vd_step.new_vertices
+        step_info_dict["new_edges"] = vd_step.new_edges
+        return step_info_dict
 
 
-db: Dict[Session, VDEntry] = {}
+class VDResultEntry:
+    """Entry in db of a diagram calculated completely, kept in the results cache."""
+
+    __slots__ = ("vd_input", "finished", "is_diagram")
+
+    vd_input: VDInput
+    finished: bool
+    is_diagram: bool
+
+    def __init__(self, vd_input: VDInput):
+        """Create entry."""
+        self.vd_input = vd_input
+        self.finished = True
+        self.is_diagram = True
+
+    @property
+    def vd(self) -> FortunesAlgorithm:
+        """Get Voronoi Diagram from the results cache."""
+        return results.get_vd(self.vd_input)
+
+    def get_memory_size(self) -> int:
+        """Get estimated memory of the entry, its results are in the cache."""
+        return 0
+
+
+sessions = SessionStore(
+    max_entries=MAX_SESSIONS,
+    max_memory=MAX_SESSIONS_MEMORY,
+    ttl=SESSION_TTL,
+    get_size=lambda entry: entry.get_memory_size(),
+)
 
 
 def get_vd(session: Session) -> Optional[FortunesAlgorithm]:
     """Get VD with a given session."""
-    entry = db.get(session, None)
+    entry = sessions.get(session)
     if entry is None:
         return None
     return entry.vd
@@ -127,7 +471,7 @@ def get_vd(session: Session) -> Optional[FortunesAlgorithm]:
 
 def is_vd_finished(session: Session) -> bool:
     """Get if the voronoi diagram has been calculated completely."""
-    entry = db.get(session, None)
+    entry = sessions.get(session)
     if entry is None:
         return False
     return entry.finished and entry.is_diagram
@@ -143,91 +487,143 @@ def save_vd(session: Session, sites, names, xlim, ylim, vd_type):
         vd = FortunesAlgorithm.calculate_aw_voronoi_diagram(
             sites, True, xlim=xlim, ylim=ylim, mode=MANUAL_MODE, names=names,
         )
-    db[session] = VDEntry(vd)
+    sessions.put(session, VDEntry(vd))
 
 
 def save_vd_completed(session: Session, vd: FortunesAlgorithm, xlim, ylim):
     """Save completed VD to the DB in the given session."""
-    db[session] = VDEntry(vd, steps=False, xlim=xlim, ylim=ylim)
+    sessions.put(session, VDEntry(vd, steps=False, xlim=xlim, ylim=ylim))
 
 
-def add_step(session: Session) -> bool:
-    """Add Step in entry."""
-    entry = db.get(session, None)
-    if entry is None or (entry.finished and entry.is_diagram):
+def save_vd_input(session: Session, vd_input: VDInput) -> None:
+    """Save input of a VD calculated completely in the results cache."""
+    sessions.put(session, VDResultEntry(vd_input))
+
+
+def get_vd_input(session: Session) -> Optional[VDInput]:
+    """Get input of the VD in the results cache of a given session."""
+    entry = sessions.get(session)
+    if not isinstance(entry, VDResultEntry):
+        return None
+    return entry.vd_input
+
+
+def _get_steps_entry(session: Session) -> Optional[VDEntry]:
+    """Get entry with steps of a given session."""
+    entry = sessions.get(session)
+    if not isinstance(entry, VDEntry):
+        return None
+    return entry
+
+
+def _add_step(entry: VDEntry) -> bool:
+    """Add Step in entry, its lock must be held."""
+    if entry.finished and entry.is_diagram:
         return False
     if entry.finished and not entry.is_diagram:
-        diagram_html = get_vd_html(entry.vd, [], entry.vd._xlim, entry.vd._ylim)
-        entry.steps.append(diagram_html)
         entry.is_diagram = True
-        entry.save_step_info()
+        entry.save_step()
         return True
     entry.vd.next_step()
-    step = get_html(entry.vd._figure)
-    entry.steps.append(step)
     entry.finished = not entry.vd.has_next_step()
-    entry.save_step_info()
+    entry.save_step()
     return True
 
 
+def add_step(session: Session) -> bool:
+    """Add Step in entry."""
+    entry = _get_steps_entry(session)
+    if entry is None:
+        return False
+    with entry.lock:
+        return _add_step(entry)
+
+
 def get_last_step(session: Session) -> Tuple[Step, bool]:
     """Get last step."""
-    entry = db.get(session, None)
-    if entry is None or entry.steps == []:
+    entry = _get_steps_entry(session)
+    if entry is None:
         return ("", False)
-    return (entry.steps[-1], True)
+    with entry.lock:
+        if entry.steps == []:
+            return ("", False)
+        return (entry.get_frame(len(entry.steps) - 1), True)
+
+
+def _move_step(entry: VDEntry, direction: int) -> bool:
+    """Move current step of entry forward (1), back (-1) or not (0).
+
+    Its lock must be held.
+    """
+    if direction > 0 and entry.current_step == len(entry.steps) - 1:
+        ok = _add_step(entry)
+        if not ok:
+            return False
+    elif direction < 0 and entry.current_step == 0:
+        return False
+
+    entry.current_step += direction
+    return True
 
 
 def get_next_step(session: Session) -> Tuple[Step, bool]:
     """Get next step."""
-    entry = db.get(session, None)
+    entry = _get_steps_entry(session)
     if entry is None:
         return ("", False)
-    entry.current_step += 1
-    if entry.current_step - 1 == len(entry.steps) - 1:
-        ok = add_step(session)
-        if not ok:
+    with entry.lock:
+        if not _move_step(entry, 1):
             return ("", False)
-
-    return (entry.steps[entry.current_step], True)
+        return (entry.get_frame(entry.current_step), True)
 
 
 def get_prev_step(session: Session) -> Tuple[Step, bool]:
     """Get prev step."""
-    entry = db.get(session, None)
+    entry = _get_steps_entry(session)
     if entry is None:
         return ("", False)
-    if entry.current_step == 0:
-        return ("", False)
+    with entry.lock:
+        if not _move_step(entry, -1):
+            return ("", False)
+        return (entry.get_frame(entry.current_step), True)
 
-    entry.current_step -= 1
-    return (entry.steps[entry.current_step], True)
+
+def get_step_delta(
+    session: Session, direction: int, from_step: Optional[int]
+) -> Tuple[StepDelta, bool]:
+    """Move current step and get its delta from the step the client has."""
+    entry = _get_steps_entry(session)
+    if entry is None:
+        return ({}, False)
+    with entry.lock:
+        if not _move_step(entry, direction):
+            return ({}, False)
+        return (entry.get_delta(from_step, entry.current_step), True)
 
 
 def get_current_step(session: Session) -> Tuple[Step, bool]:
     """Get current step."""
-    entry = db.get(session, None)
+    entry = _get_steps_entry(session)
     if entry is None:
         return ("", False)
-
-    return (entry.steps[entry.current_step], True)
+    with entry.lock:
+        return (entry.get_frame(entry.current_step), True)
 
 
 def get_current_step_info(session: Session) -> Tuple[Dict[str, Any], bool]:
     """Get current step info."""
-    entry = db.get(session, None)
+    entry = _get_steps_entry(session)
     if entry is None:
         return ({}, False)
-
-    return (entry.get_step_info(), True)
-
-
-lock = threading.Lock()
+    with entry.lock:
+        return (entry.get_step_info(), True)
 
 
 def remove_session(session: Session) -> None:
     """Remove session VD."""
-    with lock:
-        if session in db:
-            # Debuging.
-            del db[session]
+    sessions.remove(session)
+
+
+def get_stats() -> Dict[str, Any]:
+    """Get use of the limits and counters of the sessions and the results cache."""
+    return {"sessions": sessions.get_stats(), "results": results.get_stats()}
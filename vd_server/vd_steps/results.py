@@ -0,0 +1,340 @@
+"""Cache of the results of the Voronoi Diagrams by their input."""
+
+# Standard Library
+from concurrent.futures import Future
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+# Django
+from django.conf import settings
+
+# Voronoi Diagrams
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm, MANUAL_MODE
+
+from .store import SessionStore
+
+# Function called with the events processed and the events in Q after every event.
+OnEvent = Callable[[int, int], None]
+
+# Estimated memory in bytes of the diagram calculated for each site.
+VD_MEMORY_SIZE_PER_SITE = 32 * 1024
+# Estimated memory of all the results in memory.
+MAX_RESULTS_MEMORY = 256 * 1024 * 1024
+# Prefix of the files being written in the disk tier.
+TEMPORARY_PREFIX = ".tmp"
+
+
+def get_decimal_key(number: Any) -> str:
+    """Get canonical string of a number, equal for equal numbers."""
+    number = Decimal(number)
+    if number == 0:
+        return "0"
+    return str(number.normalize())
+
+
+class VDInput:
+    """Input of a Voronoi Diagram calculated completely."""
+
+    __slots__ = ("vd_type", "sites", "names", "xlim", "ylim", "key")
+
+    vd_type: str
+    sites: List[Any]
+    names: List[Any]
+    xlim: Tuple[Decimal, Decimal]
+    ylim: Tuple[Decimal, Decimal]
+    # Hash of the canonical input, equal for the same sites in any order.
+    key: str
+
+    def __init__(
+        self,
+        vd_type: str,
+        sites: List[Any],
+        names: List[Any],
+        xlim: Tuple[Decimal, Decimal],
+        ylim: Tuple[Decimal, Decimal],
+    ):
+        """Input constructor."""
+        self.vd_type = vd_type
+        self.sites = sites
+        self.names = names
+        self.xlim = xlim
+        self.ylim = ylim
+        self.key = self.get_key()
+
+    def get_key(self) -> str:
+        """Get hash of the type, sorted sites with their weights and limits."""
+        canonical_sites = []
+        for site, name in zip(self.sites, self.names):
+            if self.vd_type == "aw_vd":
+                point, weight = site
+                weight_key = get_decimal_key(weight)
+            else:
+                point = site
+                weight_key = None
+            canonical_sites.append(
+                (get_decimal_key(point.x), get_decimal_key(point.y), weight_key, name)
+            )
+        canonical_sites.sort(key=str)
+        canonical_input = {
+            "vd_type": self.vd_type,
+            "sites": canonical_sites,
+            "xlim": [get_decimal_key(limit) for limit in self.xlim],
+            "ylim": [get_decimal_key(limit) for limit in self.ylim],
+        }
+        canonical_json = json.dumps(canonical_input, separators=(",", ":"))
+        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+    def calculate(self, on_event: Optional[OnEvent] = None) -> FortunesAlgorithm:
+        """Calculate Voronoi Diagram of the input.
+
+        on_event is called after every event, it can raise to stop the calculation.
+        """
+        if self.vd_type == "aw_vd":
+            calculate_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram
+        else:
+            calculate_diagram = FortunesAlgorithm.calculate_voronoi_diagram
+        vd = calculate_diagram(
+            self.sites,
+            False,
+            xlim=self.xlim,
+            ylim=self.ylim,
+            mode=MANUAL_MODE,
+            names=self.names,
+        )
+        if len(vd.sites) == 0:
+            return vd
+        # The first event is processed when the diagram is constructed.
+        n_events = 1
+        while not vd.q_structure.is_empty():
+            if on_event is not None:
+                on_event(n_events, len(vd.q_structure))
+            vd.calculate_next_event()
+            n_events += 1
+        if on_event is not None:
+            on_event(n_events, 0)
+        return vd
+
+
+class VDResult:
+    """Voronoi Diagram calculated and its artifacts rendered."""
+
+    __slots__ = ("vd", "artifacts")
+
+    vd: Optional[FortunesAlgorithm]
+    artifacts: Dict[str, bytes]
+
+    def __init__(self) -> None:
+        """Construct empty result."""
+        self.vd = None
+        self.artifacts = {}
+
+    def get_memory_size(self) -> int:
+        """Get estimated memory of the result in bytes."""
+        memory_size = sum(len(artifact) for artifact in self.artifacts.values())
+        if self.vd is not None:
+            memory_size += VD_MEMORY_SIZE_PER_SITE * len(self.vd.sites)
+        return memory_size
+
+
+class ResultCache:
+    """Cache of the results by the key of their input.
+
+    The diagrams and artifacts are kept in a memory tier bounded by max_memory,
+    and the artifacts are also written in directory, if it is given, bounded by
+    max_disk. The diagrams are only kept in memory, they are calculated again
+    when an artifact is not cached in any tier.
+    A diagram or artifact is calculated once at a time, the ones asking for it
+    while it is calculated wait for the same calculation.
+    """
+
+    memory: SessionStore
+    directory: Optional[str]
+    max_disk: Optional[int]
+    disk_hits: int
+    disk_misses: int
+    disk_evictions: int
+    # Calculations in progress by the key and name of what they calculate, the name
+    # is None for the diagram.
+    _calculations: Dict[Tuple[str, Optional[str]], Future]
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        max_memory: Optional[int] = None,
+        directory: Optional[str] = None,
+        max_disk: Optional[int] = None,
+    ):
+        """Construct empty cache, the disk tier is only used with a directory."""
+        self.memory = SessionStore(
+            max_memory=max_memory, get_size=lambda result: result.get_memory_size()
+        )
+        self.directory = directory
+        self.max_disk = max_disk
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.disk_evictions = 0
+        self._calculations = {}
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get_vd(
+        self, vd_input: VDInput, on_event: Optional[OnEvent] = None
+    ) -> FortunesAlgorithm:
+        """Get Voronoi Diagram of the input, calculating it if it is not cached.
+
+        on_event is given to the calculation, it is not called if the diagram is
+        already being calculated for another caller.
+        """
+        return self._get_or_calculate(
+            vd_input.key, None, lambda: vd_input.calculate(on_event)
+        )
+
+    def get_artifact(
+        self, vd_input: VDInput, name: str, render: Callable[[], bytes]
+    ) -> bytes:
+        """Get artifact of the input, rendering it if it is not cached."""
+
+        def calculate() -> bytes:
+            artifact = self._read_artifact(vd_input.key, name)
+            if artifact is None:
+                artifact = render()
+                self._write_artifact(vd_input.key, name, artifact)
+            return artifact
+
+        return self._get_or_calculate(vd_input.key, name, calculate)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get use of the limits and counters of the tiers."""
+        stats = {"memory": self.memory.get_stats()}
+        if self.directory is not None:
+            stats["disk"] = {
+                "size": sum(size for _, _, size in self._get_disk_files()),
+                "max_size": self.max_disk,
+                "hits": self.disk_hits,
+                "misses": self.disk_misses,
+                "evictions": self.disk_evictions,
+            }
+        return stats
+
+    def _get_or_calculate(
+        self, key: str, name: Optional[str], calculate: Callable[[], Any]
+    ) -> Any:
+        """Get diagram, if name is None, or artifact of the key, calculating it once.
+
+        The lock is only held to look for the value or its calculation, so the
+        calculations of other keys and names are not blocked. If the calculation
+        that is waited for fails, it is tried again.
+        """
+        while True:
+            with self._lock:
+                value = self._get_cached(key, name)
+                if value is not None:
+                    return value
+                calculation = self._calculations.get((key, name))
+                is_calculating = calculation is None
+                if is_calculating:
+                    calculation = Future()
+                    self._calculations[(key, name)] = calculation
+            if not is_calculating:
+                try:
+                    return calculation.result()
+                except Exception:
+                    continue
+            try:
+                value = calculate()
+            except BaseException as error:
+                with self._lock:
+                    del self._calculations[(key, name)]
+                calculation.set_exception(error)
+                raise
+            with self._lock:
+                self._put_cached(key, name, value)
+                del self._calculations[(key, name)]
+            calculation.set_result(value)
+            return value
+
+    def _get_cached(self, key: str, name: Optional[str]) -> Any:
+        """Get diagram, if name is None, or artifact of the key in memory."""
+        result = self.memory.get(key)
+        if result is None:
+            return None
+        if name is None:
+            return result.vd
+        return result.artifacts.get(name)
+
+    def _put_cached(self, key: str, name: Optional[str], value: Any) -> None:
+        """Save diagram, if name is None, or artifact of the key in memory."""
+        result = self.memory.get(key)
+        if result is None:
+            result = VDResult()
+        if name is None:
+            result.vd = value
+        else:
+            result.artifacts[name] = value
+        self.memory.put(key, result)
+
+    def _get_path(self, key: str, name: str) -> str:
+        """Get path of an artifact in the disk tier."""
+        return os.path.join(self.directory, f"{key}-{name}")
+
+    def _read_artifact(self, key: str, name: str) -> Optional[bytes]:
+        """Read artifact from the disk tier, None if it is not there."""
+        if self.directory is None:
+            return None
+        path = self._get_path(key, name)
+        try:
+            with open(path, "rb") as artifact_file:
+                artifact = artifact_file.read()
+            # Modification times order the artifacts to evict.
+            os.utime(path)
+        except FileNotFoundError:
+            self.disk_misses += 1
+            return None
+        self.disk_hits += 1
+        return artifact
+
+    def _write_artifact(self, key: str, name: str, artifact: bytes) -> None:
+        """Write artifact in the disk tier and evict the oldest over max_disk."""
+        if self.directory is None:
+            return
+        # Written to a temporary file first so it is never read incomplete.
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, prefix=TEMPORARY_PREFIX, delete=False
+        ) as temporary_file:
+            temporary_file.write(artifact)
+        os.replace(temporary_file.name, self._get_path(key, name))
+        if self.max_disk is None:
+            return
+        files = sorted(self._get_disk_files())
+        disk_size = sum(size for _, _, size in files)
+        for _, path, size in files:
+            if disk_size <= self.max_disk:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            disk_size -= size
+            self.disk_evictions += 1
+
+    def _get_disk_files(self) -> List[Tuple[float, str, int]]:
+        """Get modification time, path and size of the artifacts in disk."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith(TEMPORARY_PREFIX):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+        return files
+
+
+results = ResultCache(
+    max_memory=MAX_RESULTS_MEMORY,
+    directory=getattr(settings, "VD_RESULTS_CACHE_DIR", None),
+    max_disk=getattr(settings, "VD_RESULTS_CACHE_MAX_DISK", None),
+)
@@ -0,0 +1,148 @@
+"""Bounded store of the sessions."""
+
+# Standard Library
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+Value = Any
+
+
+class SessionStore:
+    """Thread-safe store of values by session.
+
+    Sessions not accessed in ttl seconds expire, and the least recently used ones
+    are evicted when there are more than max_entries or their sizes add up to more
+    than max_memory. The size of a value is measured with get_size every time it
+    is saved or got, so values can grow after they are saved. The last session
+    accessed is never evicted.
+    """
+
+    max_entries: Optional[int]
+    max_memory: Optional[int]
+    ttl: Optional[float]
+    get_size: Callable[[Value], int]
+    clock: Callable[[], float]
+    memory: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    # Sessions from the least to the most recently used with their value, size and
+    # time of the last access.
+    _entries: "OrderedDict[Hashable, Tuple[Value, int, float]]"
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        ttl: Optional[float] = None,
+        get_size: Optional[Callable[[Value], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Construct empty store, a limit of None is no limit."""
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.ttl = ttl
+        self.get_size = get_size if get_size is not None else lambda value: 0
+        self.clock = clock
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get number of sessions saved."""
+        return len(self._entries)
+
+    def __contains__(self, session: Hashable) -> bool:
+        """Check if the session is saved without accessing it."""
+        with self._lock:
+            self._remove_expired()
+            return session in self._entries
+
+    def get(self, session: Hashable) -> Optional[Value]:
+        """Get value of the session, None if it is not saved or it expired."""
+        with self._lock:
+            self._remove_expired()
+            if session not in self._entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            value = self._entries[session][0]
+            self._save(session, value)
+            return value
+
+    def put(self, session: Hashable, value: Value) -> None:
+        """Save value of the session, replacing the old one."""
+        with self._lock:
+            self._remove_expired()
+            self._save(session, value)
+
+    def remove(self, session: Hashable) -> None:
+        """Remove the session if it is saved."""
+        with self._lock:
+            if session in self._entries:
+                self._pop(session)
+
+    def clear(self) -> None:
+        """Remove all the sessions."""
+        with self._lock:
+            self._entries.clear()
+            self.memory = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get use of the limits and counters of the store."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "memory": self.memory,
+                "max_memory": self.max_memory,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _save(self, session: Hashable, value: Value) -> None:
+        """Save value as the most recently used and evict sessions over the limits."""
+        if session in self._entries:
+            self._pop(session)
+        size = self.get_size(value)
+        self._entries[session] = (value, size, self.clock())
+        self.memory += size
+        while len(self._entries) > 1 and self._is_over_limits():
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _is_over_limits(self) -> bool:
+        """Check if the sessions saved are more or bigger than allowed."""
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_memory is not None and self.memory > self.max_memory
+
+    def _remove_expired(self) -> None:
+        """Remove sessions not accessed in ttl seconds."""
+        if self.ttl is None:
+            return
+        oldest_access = self.clock() - self.ttl
+        # Sessions are in order of access, so the expired ones are the first ones.
+        while self._entries:
+            session, (_, _, last_access) = next(iter(self._entries.items()))
+            if last_access > oldest_access:
+                break
+            self._pop(session)
+            self.expirations += 1
+
+    def _pop(self, session: Hashable) -> Value:
+        """Remove session and get its value."""
+        value, size, _ = self._entries.pop(session)
+        self.memory -= size
+        return value
@@ -1,3 +1,335 @@
-from django.test import TestCase
+"""VD steps tests."""
 
-# Create your tests here.
+# Standard Library
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest import mock
+import json
+import os
+import random
+import tempfile
+import threading
+
+# Django
+from django.test import Client, SimpleTestCase
+
+# VD
+from voronoi_diagrams.fortunes_algorithm import FortunesAlgorithm, MANUAL_MODE
+from voronoi_diagrams.models import Point
+from . import db
+from .results import ResultCache, VDInput
+from .store import SessionStore
+from .utils import get_event_dict, get_region_dict
+
+
+class FakeClock:
+    """Clock moved by hand."""
+
+    def __init__(self):
+        """Start at 0."""
+        self.time = 0.0
+
+    def __call__(self):
+        """Get time."""
+        return self.time
+
+
+class SessionStoreTest(SimpleTestCase):
+    """Test bounded store of the sessions."""
+
+    def test_evict_least_recently_used(self):
+        """Test sessions over max_entries are evicted from the least recent."""
+        store = SessionStore(max_entries=2)
+        store.put("a", 1)
+        store.put("b", 2)
+        self.assertEqual(store.get("a"), 1)
+        store.put("c", 3)
+        self.assertEqual(store.get("b"), None)
+        self.assertEqual(store.get("a"), 1)
+        self.assertEqual(store.get("c"), 3)
+        self.assertEqual(store.get_stats()["evictions"], 1)
+
+    def test_evict_over_max_memory(self):
+        """Test sessions are evicted until their sizes fit and sizes are updated."""
+        values = {"a": [0] * 4, "b": [0] * 4}
+        store = SessionStore(max_memory=10, get_size=len)
+        store.put("a", values["a"])
+        store.put("b", values["b"])
+        self.assertEqual(store.get_stats()["memory"], 8)
+        values["b"].extend([0] * 4)
+        store.get("b")
+        self.assertNotIn("a", store)
+        self.assertEqual(store.get_stats()["memory"], 8)
+        # The last session is kept even if it is bigger than the limit.
+        store.put("c", [0] * 20)
+        self.assertEqual(len(store), 1)
+        self.assertIn("c", store)
+
+    def test_expire_after_ttl(self):
+        """Test sessions not accessed in ttl seconds expire."""
+        clock = FakeClock()
+        store = SessionStore(ttl=10, clock=clock)
+        store.put("a", 1)
+        store.put("b", 2)
+        clock.time = 6
+        store.get("a")
+        clock.time = 12
+        self.assertEqual(store.get("b"), None)
+        self.assertEqual(store.get("a"), 1)
+        clock.time = 30
+        self.assertEqual(len(store), 1)
+        self.assertNotIn("a", store)
+        self.assertEqual(store.get_stats()["expirations"], 2)
+
+    def test_stats(self):
+        """Test hits and misses are counted."""
+        store = SessionStore()
+        store.put("a", 1)
+        store.get("a")
+        store.get("b")
+        store.remove("a")
+        stats = store.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["entries"], 0)
+
+
+class ResultCacheTest(SimpleTestCase):
+    """Test cache of the results by their input."""
+
+    def get_input(self, sites, xlim=("-10", "10")):
+        """Get input of a diagram of point sites named by their position."""
+        return VDInput(
+            "vd",
+            [Point(Decimal(x), Decimal(y)) for x, y in sites],
+            [f"{x},{y}" for x, y in sites],
+            (Decimal(xlim[0]), Decimal(xlim[1])),
+            (Decimal("-10"), Decimal("10")),
+        )
+
+    def test_key(self):
+        """Test equal inputs have the same key in any order."""
+        key = self.get_input([("1", "2"), ("3", "4")]).key
+        self.assertEqual(self.get_input([("3", "4"), ("1", "2")]).key, key)
+        self.assertEqual(
+            self.get_input([("1", "2"), ("3", "4")], ("-10.0", "1E1")).key, key
+        )
+        self.assertNotEqual(self.get_input([("1", "2"), ("3", "5")]).key, key)
+
+    def test_artifacts(self):
+        """Test artifacts are rendered once and kept in the disk tier."""
+        vd_input = self.get_input([("1", "2"), ("3", "4"), ("-5", "0")])
+        renders = []
+
+        def render():
+            renders.append(True)
+            return str(len(results.get_vd(vd_input).sites)).encode("utf-8")
+
+        with tempfile.TemporaryDirectory() as directory:
+            results = ResultCache(directory=directory)
+            self.assertEqual(results.get_artifact(vd_input, "sites", render), b"3")
+            self.assertEqual(results.get_artifact(vd_input, "sites", render), b"3")
+            self.assertEqual(len(renders), 1)
+            # A new cache reads the artifacts from the disk.
+            results = ResultCache(directory=directory)
+            self.assertEqual(results.get_artifact(vd_input, "sites", render), b"3")
+            self.assertEqual(len(renders), 1)
+            self.assertEqual(os.listdir(directory), [f"{vd_input.key}-sites"])
+
+    def test_concurrent_artifacts(self):
+        """Test an artifact is rendered once at a time without blocking other keys."""
+        vd_input = self.get_input([("1", "2"), ("3", "4")])
+        other_input = self.get_input([("1", "2"), ("3", "5")])
+        results = ResultCache()
+        rendering = threading.Event()
+        rendered = threading.Event()
+        renders = []
+
+        def render():
+            renders.append(True)
+            rendering.set()
+            rendered.wait(10)
+            return b"slow"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(results.get_artifact, vd_input, "a", render)
+            self.assertTrue(rendering.wait(10))
+            second = executor.submit(results.get_artifact, vd_input, "a", render)
+            # Other keys and names are not blocked by the rendering.
+            self.assertEqual(
+                results.get_artifact(other_input, "a", lambda: b"other"), b"other"
+            )
+            self.assertEqual(
+                results.get_artifact(vd_input, "b", lambda: b"fast"), b"fast"
+            )
+            rendered.set()
+            self.assertEqual(first.result(10), b"slow")
+            self.assertEqual(second.result(10), b"slow")
+        self.assertEqual(len(renders), 1)
+
+    def test_failed_calculation(self):
+        """Test a failed calculation is not cached and is tried again."""
+        vd_input = self.get_input([("1", "2"), ("3", "4")])
+        results = ResultCache()
+
+        def render():
+            raise ValueError("Render failed.")
+
+        with self.assertRaises(ValueError):
+            results.get_artifact(vd_input, "a", render)
+        self.assertEqual(results.get_artifact(vd_input, "a", lambda: b"a"), b"a")
+
+
+def get_random_sites(n_sites, seed=0):
+    """Get random sites with their names in a box of 20 x 20."""
+    rnd = random.Random(seed)
+    sites = [
+        (Decimal(rnd.randint(-900, 900)) / 100, Decimal(rnd.randint(-900, 900)) / 100)
+        for _ in range(n_sites)
+    ]
+    return sites, [str(i + 1) for i in range(n_sites)]
+
+
+class VDEntryTest(SimpleTestCase):
+    """Test the steps replayed from the log against the live steps."""
+
+    def get_live_state(self, entry):
+        """Get Q and L structures and traces of the diagram in the last step."""
+        q_structure = [
+            get_event_dict(event) for event in entry.vd.q_structure.get_all_events()
+        ]
+        l_structure = []
+        if not entry.is_diagram:
+            l_structure = [
+                get_region_dict(region)
+                for region in entry.vd.l_structure.get_all_regions()
+            ]
+        traces = [
+            i
+            for i, trace in enumerate(entry.vd.observer.get_traces())
+            if trace is not None
+        ]
+        return q_structure, l_structure, traces
+
+    def get_frame(self, entry, step):
+        """Get frame of the step with the same random colors of the events."""
+        random.seed(step)
+        return entry.get_frame(step)
+
+    def test_replay_steps(self):
+        """Test snapshots and frames of every step are the ones of the live step."""
+        sites, names = get_random_sites(24)
+        limit = (Decimal(-10), Decimal(10))
+        vd = FortunesAlgorithm.calculate_voronoi_diagram(
+            [Point(x, y) for x, y in sites],
+            True,
+            xlim=limit,
+            ylim=limit,
+            mode=MANUAL_MODE,
+            names=names,
+        )
+        # The figures of the frames are compared instead of their html.
+        with mock.patch.object(
+            db, "get_html", lambda figure: figure.to_json()
+        ), mock.patch.object(db, "SNAPSHOT_INTERVAL", 8):
+            entry = db.VDEntry(vd)
+            live_states = [self.get_live_state(entry)]
+            live_frames = [self.get_frame(entry, 0)]
+            while db._add_step(entry):
+                live_states.append(self.get_live_state(entry))
+                live_frames.append(self.get_frame(entry, len(entry.steps) - 1))
+            self.assertGreater(len(entry.steps), 4 * entry.snapshot_interval)
+            for step in range(len(entry.steps)):
+                snapshot = entry.get_snapshot(step)
+                self.assertEqual(
+                    (snapshot.q_structure, snapshot.l_structure, snapshot.traces),
+                    live_states[step],
+                )
+                if not entry.steps[step].is_diagram:
+                    self.assertEqual(self.get_frame(entry, step), live_frames[step])
+
+
+class StepDeltaViewTest(SimpleTestCase):
+    """Test the deltas of the steps applied by the client."""
+
+    session = "delta-test"
+
+    def setUp(self):
+        """Start a session with the first step."""
+        sites, names = get_random_sites(12)
+        body = {
+            "sites": [[str(x), str(y), name] for (x, y), name in zip(sites, names)],
+            "vd_type": "vd",
+            "limit_x0": "-10",
+            "limit_x1": "10",
+            "limit_y0": "-10",
+            "limit_y1": "10",
+        }
+        self.client = Client(HTTP_HOST="localhost")
+        response = self.client.get(
+            "/steps/first/",
+            {"session": self.session, "body": json.dumps(body), "format": "json"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.delta = response.json()
+        self.entry = db._get_steps_entry(self.session)
+
+    def tearDown(self):
+        """Remove the session."""
+        db.remove_session(self.session)
+
+    def get_delta(self, direction, from_step):
+        """Get delta of the step in the direction from the step of the client."""
+        return self.client.get(
+            "/steps/delta/",
+            {"session": self.session, "direction": direction, "from_step": from_step},
+        )
+
+    def apply_delta(self, traces, delta):
+        """Apply delta to the traces of the client and check they are the step's."""
+        if delta["reset"]:
+            traces = set()
+            self.assertIn("layout", delta)
+        traces.difference_update(delta["removed"])
+        traces.update(trace["id"] for trace in delta["added"])
+        if not self.entry.steps[delta["step"]].is_diagram:
+            self.assertEqual(
+                sorted(traces), self.entry.get_snapshot(delta["step"]).traces
+            )
+        return traces
+
+    def test_next_and_prev_deltas(self):
+        """Test traces of the client are the ones of each step going and back."""
+        self.assertTrue(self.delta["reset"])
+        traces = self.apply_delta(set(), self.delta)
+        step = self.delta["step"]
+        for direction in ["next"] * 200 + ["prev"] * 40 + ["next"] * 10:
+            response = self.get_delta(direction, step)
+            if response.status_code == 404:
+                # There are no steps after the diagram.
+                self.assertEqual(direction, "next")
+                self.assertTrue(self.entry.steps[step].is_diagram)
+                continue
+            delta = response.json()
+            self.assertEqual(delta["step"], step + (1 if direction == "next" else -1))
+            # The diagram and the step after it reset the plot of the client.
+            is_reset = (
+                self.entry.steps[delta["step"]].is_diagram
+                or self.entry.steps[step].is_diagram
+            )
+            self.assertEqual(delta["reset"], is_reset)
+            traces = self.apply_delta(traces, delta)
+            step = delta["step"]
+        self.assertTrue(self.entry.finished)
+
+    def test_reset_without_from_step(self):
+        """Test a client without a valid step gets all the traces of the step."""
+        self.get_delta("next", 0)
+        self.get_delta("next", 1)
+        for from_step in ["", "-1", "1000"]:
+            delta = self.get_delta("current", from_step).json()
+            self.assertTrue(delta["reset"])
+            self.apply_delta(set(), delta)
+
+    def test_invalid_direction(self):
+        """Test unknown directions are rejected."""
+        self.assertEqual(self.get_delta("up", 0).status_code, 400)
@@ -8,6 +8,8 @@ urlpatterns = [
     path("next/", views.PlotNextStepView.as_view(), name="next_step"),
     path("first/", views.FirstStepView.as_view(), name="first_step"),
     path("prev/", views.PlotPrevStepView.as_view(), name="prev_step"),
+    path("delta/", views.StepDeltaView.as_view(), name="step_delta"),
     path("info/", views.StepInfoView.as_view(), name="step_info"),
     path("delete/", views.DeleteSession.as_view(), name="delete_session"),
+    path("stats/", views.SessionStatsView.as_view(), name="session_stats"),
 ]
@@ -1,22 +1,27 @@
 """VD steps utils."""
 
 # Standard Library
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+from difflib import SequenceMatcher
+import json
 
 # Voronoi Diagrams
-from voronoi_diagrams.models import Event, Region, Boundary
+from voronoi_diagrams.models import Event, Region, Boundary, WeightedSite
+
+Changes = List[Tuple[int, int, List[Any]]]
 
 
 def get_event_dict(event: Event) -> Dict[str, Any]:
     """Get event dict."""
     final_event_dict = {}
-    event_dict = event.__dict__.copy()
-    final_event_dict["point"] = event.point.__dict__.copy()
+    final_event_dict["point"] = {"x": event.point.x, "y": event.point.y}
+    event_point = event.get_event_point()
+    final_event_dict["event_point"] = {"x": event_point.x, "y": event_point.y}
     final_event_dict["is_site"] = event.is_site
     final_event_dict["name"] = event.name
     final_event_dict["event_str"] = event.get_event_str()
-    if event.is_site and "weight" in event_dict:
-        final_event_dict["weight"] = event_dict["weight"]
+    if isinstance(event, WeightedSite):
+        final_event_dict["weight"] = event.weight
     return final_event_dict
 
 
@@ -51,3 +56,30 @@ def get_region_dict(region: Region) -> Dict[str, Any]:
         final_region_dict["right"] = get_boundary_dict(region.right)
 
     return final_region_dict
+
+
+def get_item_key(item: Dict[str, Any]) -> str:
+    """Get key to compare dicts of events and regions between steps."""
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def get_changes(
+    old_keys: List[str], new_keys: List[str], new_items: List[Any]
+) -> Changes:
+    """Get changes to get the new items from the old ones.
+
+    Changes are (start, end, items) replacing the old items in start:end by items,
+    applied from the last one.
+    """
+    matcher = SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    return [
+        (i1, i2, new_items[j1:j2])
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_changes(items: List[Any], changes: Changes) -> None:
+    """Apply changes to items in place."""
+    for start, end, new_items in reversed(changes):
+        items[start:end] = new_items
@@ -10,11 +10,25 @@ from django.shortcuts import render, redirect, reverse
 from django.views import View
 from django import http
 
+# Plot
+from plotly.utils import PlotlyJSONEncoder
+
 # VD
 from . import db
 from voronoi_diagrams.models import Point
 
 
+# Directions of the steps in the deltas.
+STEP_DIRECTIONS = {"current": 0, "next": 1, "prev": -1}
+
+
+def get_delta_response(delta):
+    """Get compact JSON response of a step delta, with float arrays."""
+    return http.JsonResponse(
+        delta, encoder=PlotlyJSONEncoder, json_dumps_params={"separators": (",", ":")},
+    )
+
+
 class StepView(View):
     """Step View that will have the visitor's ip."""
 
@@ -100,6 +114,12 @@ class FirstStepView(StepView):
         db.save_vd(
             self.session, self.sites, self.names, self.xlim, self.ylim, self.vd_type
         )
+        if request.GET.get("format") == "json":
+            delta, ok = db.get_step_delta(self.session, 0, None)
+            if not ok:
+                return http.HttpResponseNotFound()
+            return get_delta_response(delta)
+
         step, ok = db.get_current_step(self.session)
         if not ok:
             return http.HttpResponseNotFound()
@@ -131,6 +151,27 @@ class PlotPrevStepView(StepView):
         return http.HttpResponse(step)
 
 
+class StepDeltaView(StepView):
+    """Move step and get the traces changed from the step of the client."""
+
+    def handle_get(self, request):
+        """GET method."""
+        direction = STEP_DIRECTIONS.get(request.GET.get("direction", "current"))
+        if direction is None:
+            return http.HttpResponseBadRequest()
+        from_step = request.GET.get("from_step", "")
+        try:
+            from_step = int(from_step)
+        except ValueError:
+            from_step = None
+
+        delta, ok = db.get_step_delta(self.session, direction, from_step)
+        if not ok:
+            return http.HttpResponseNotFound()
+
+        return get_delta_response(delta)
+
+
 class StepInfoView(StepView):
     """Step info view."""
 
@@ -143,6 +184,14 @@ class StepInfoView(StepView):
         return http.JsonResponse(step_info)
 
 
+class SessionStatsView(View):
+    """Stats of the sessions saved."""
+
+    def get(self, request):
+        """GET method."""
+        return http.JsonResponse(db.get_stats())
+
+
 class DeleteSession(StepView):
     """Delete Session VD."""
 
@@ -0,0 +1,133 @@
+"""Batch computation of many independent Voronoi Diagrams.
+
+The site sets are sent to the worker processes as float arrays and every diagram
+is sent back as arrays too, so no object graph is pickled between processes.
+"""
+# Standard Library
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from itertools import islice
+import os
+
+# Voronoi Diagrams
+from .fortunes_algorithm import FortunesAlgorithm
+
+# Models
+from .models import Point, DiagramArrays
+
+# Math
+from decimal import Decimal
+import numpy as np
+
+# Utils
+from general_utils.numbers import DECIMAL_NUMERIC, NUMERICS
+
+# Site sets per task sent to a worker.
+DEFAULT_CHUNKSIZE = 8
+# Tasks waiting in the pool per worker.
+TASKS_PER_WORKER = 2
+
+
+def to_site_array(sites: Sequence) -> np.ndarray:
+    """Get sites as a float array.
+
+    Each row is (x, y) for point sites or (x, y, weight) for weighted sites.
+    """
+    site_array = np.asarray(sites, dtype=float)
+    if site_array.size == 0:
+        return site_array.reshape(0, 2)
+    if site_array.ndim != 2 or site_array.shape[1] not in (2, 3):
+        raise ValueError(
+            f"Sites must have shape (n, 2) or (n, 3), not {site_array.shape}."
+        )
+    return site_array
+
+
+def compute_one(
+    site_array: np.ndarray, index: int = 0, numeric: str = DECIMAL_NUMERIC
+) -> DiagramArrays:
+    """Calculate the Voronoi Diagram of a site array and get it as arrays."""
+    rows = site_array.tolist()
+    if numeric == DECIMAL_NUMERIC:
+        rows = [[Decimal(value) for value in row] for row in rows]
+    if site_array.shape[1] == 3:
+        voronoi_diagram = FortunesAlgorithm.calculate_aw_voronoi_diagram(
+            [(Point(x, y), weight) for x, y, weight in rows], numeric=numeric
+        )
+    else:
+        voronoi_diagram = FortunesAlgorithm.calculate_voronoi_diagram(
+            [Point(x, y) for x, y in rows], numeric=numeric
+        )
+    diagram_arrays = voronoi_diagram.to_arrays()
+    diagram_arrays.index = index
+    return diagram_arrays
+
+
+def _compute_chunk(
+    chunk: List[Tuple[int, np.ndarray]], numeric: str
+) -> List[DiagramArrays]:
+    """Calculate the Voronoi Diagrams of a chunk of indexed site arrays."""
+    return [compute_one(site_array, index, numeric) for index, site_array in chunk]
+
+
+def _get_chunks(
+    site_sets: Iterable[Sequence], chunksize: int
+) -> Iterator[List[Tuple[int, np.ndarray]]]:
+    """Get chunks of indexed site arrays."""
+    indexed_site_arrays = (
+        (index, to_site_array(sites)) for index, sites in enumerate(site_sets)
+    )
+    while True:
+        chunk = list(islice(indexed_site_arrays, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def compute_many(
+    site_sets: Iterable[Sequence],
+    workers: Optional[int] = None,
+    numeric: str = DECIMAL_NUMERIC,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[DiagramArrays]:
+    """Calculate the Voronoi Diagrams of many site sets in worker processes.
+
+    Each site set is an (n, 2) array-like of points or an (n, 3) array-like of
+    weighted points, which are calculated as AW Voronoi Diagrams.
+    The results are yielded as soon as they are completed, so they may not be in
+    the order of site_sets; DiagramArrays.index is the position of its site set.
+    workers defaults to the number of CPUs. With 1 worker the diagrams are
+    calculated in this process.
+    """
+    if numeric not in NUMERICS:
+        raise ValueError(f"Numeric must be one of {NUMERICS}, not {numeric!r}.")
+    if chunksize < 1:
+        raise ValueError(f"Chunksize must be positive, not {chunksize!r}.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Workers must be positive, not {workers!r}.")
+
+    chunks = _get_chunks(site_sets, chunksize)
+    if workers == 1:
+        for chunk in chunks:
+            yield from _compute_chunk(chunk, numeric)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # The site sets are submitted lazily to keep the pending tasks bounded.
+        pending: Set[Future] = set()
+        for chunk in islice(chunks, workers * TASKS_PER_WORKER):
+            pending.add(executor.submit(_compute_chunk, chunk, numeric))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.add(executor.submit(_compute_chunk, chunk, numeric))
+                yield from future.result()
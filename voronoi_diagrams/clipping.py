@@ -0,0 +1,325 @@
+"""Clipping of the cells of the Voronoi Diagram to a box.
+
+Every cell is closed into a polygon inside the box walking the half-edges of the
+cell, so no limit sites are needed to bound the unbounded cells.
+"""
+# Standard Library
+from typing import Any, List, Tuple
+
+# Models
+from .models import Point, Site, HalfEdge
+
+# Utils
+from general_utils.numbers import sqrt, to_number_like
+
+Limit = Tuple[Any, Any]
+
+# Points sampled inside each piece of hyperbola in the polygons.
+DEFAULT_SAMPLES = 16
+# Tolerance relative to the box size to accept points in the box sides.
+CLIP_TOLERANCE = "1e-9"
+
+
+class BisectorCurve:
+    """Bisector between the site of a half-edge and its twin site.
+
+    The points of the bisector are center + k * sqrt(beta2 + v^2) * e1 + v * e2,
+    where e1 is the unit vector from the site to the twin site and e2 is e1
+    rotated counterclockwise, so v grows in the direction of the half-edge.
+    k is 0 when the bisector is a line, otherwise it is the branch of hyperbola
+    where |p - site| - |p - twin site| is the difference of their weights.
+    """
+
+    __slots__ = ("cx", "cy", "e1x", "e1y", "e2x", "e2y", "k", "beta2")
+
+    cx: Any
+    cy: Any
+    e1x: Any
+    e1y: Any
+    e2x: Any
+    e2y: Any
+    k: Any
+    beta2: Any
+
+    def __init__(self, site: Site, twin_site: Site) -> None:
+        """Construct curve of the bisector of the sites."""
+        dx = twin_site.point.x - site.point.x
+        dy = twin_site.point.y - site.point.y
+        distance = sqrt(dx ** 2 + dy ** 2)
+        self.cx = site.point.x + dx / 2
+        self.cy = site.point.y + dy / 2
+        self.e1x = dx / distance
+        self.e1y = dy / distance
+        self.e2x = -self.e1y
+        self.e2y = self.e1x
+        # The weighted distance from a site to its own point is its weight.
+        alpha = (
+            twin_site.get_weighted_distance(twin_site.point.x, twin_site.point.y)
+            - site.get_weighted_distance(site.point.x, site.point.y)
+        ) / 2
+        self.beta2 = (distance / 2) ** 2 - alpha ** 2
+        self.k = alpha / sqrt(self.beta2)
+
+    def get_point(self, v: Any) -> Point:
+        """Get point of the bisector in the parameter v."""
+        u = self.k * sqrt(self.beta2 + v ** 2)
+        return Point(
+            self.cx + u * self.e1x + v * self.e2x,
+            self.cy + u * self.e1y + v * self.e2y,
+        )
+
+    def get_v(self, point: Point) -> Any:
+        """Get parameter of a point of the bisector."""
+        return (point.x - self.cx) * self.e2x + (point.y - self.cy) * self.e2y
+
+    def get_extreme_vs(self) -> List[Any]:
+        """Get parameters where the bisector has vertical or horizontal tangents.
+
+        x and y have their extreme values in the hyperbola at these parameters.
+        """
+        extreme_vs = []
+        if self.k == 0:
+            return extreme_vs
+        for e1, e2 in ((self.e1x, self.e2x), (self.e1y, self.e2y)):
+            if e1 == 0:
+                continue
+            # v / sqrt(beta2 + v^2) = ratio makes the derivative 0.
+            ratio = -e2 / (self.k * e1)
+            if abs(ratio) < 1:
+                extreme_vs.append(ratio * sqrt(self.beta2) / sqrt(1 - ratio ** 2))
+        return extreme_vs
+
+    def get_line_crossings(self, c: Any, e1: Any, e2: Any, value: Any) -> List[Any]:
+        """Get parameters where one coordinate of the bisector is value.
+
+        c, e1 and e2 are the center and the unit vectors in that coordinate.
+        The equation k * sqrt(beta2 + v^2) * e1 = value - c - v * e2 is squared,
+        so the roots have to be checked after.
+        """
+        d = value - c
+        if self.k == 0:
+            if e2 == 0:
+                return []
+            return [d / e2]
+        ke1 = self.k * e1
+        a = ke1 ** 2 - e2 ** 2
+        b = 2 * d * e2
+        c = ke1 ** 2 * self.beta2 - d ** 2
+        if a == 0:
+            if b == 0:
+                return []
+            return [-c / b]
+        discriminant = b ** 2 - 4 * a * c
+        if discriminant < 0:
+            return []
+        # Stable form of the quadratic formula.
+        if b >= 0:
+            q = -(b + sqrt(discriminant)) / 2
+        else:
+            q = -(b - sqrt(discriminant)) / 2
+        if q == 0:
+            return [q]
+        return [q / a, c / q]
+
+    def get_box_crossings(self, xlim: Limit, ylim: Limit, tolerance: Any) -> List[Any]:
+        """Get sorted parameters where the bisector crosses the sides of the box."""
+        crossings = []
+        for value in xlim:
+            for v in self.get_line_crossings(self.cx, self.e1x, self.e2x, value):
+                point = self.get_point(v)
+                if abs(point.x - value) <= tolerance and is_in_limit(
+                    point.y, ylim, tolerance
+                ):
+                    crossings.append(v)
+        for value in ylim:
+            for v in self.get_line_crossings(self.cy, self.e1y, self.e2y, value):
+                point = self.get_point(v)
+                if abs(point.y - value) <= tolerance and is_in_limit(
+                    point.x, xlim, tolerance
+                ):
+                    crossings.append(v)
+        crossings.sort()
+        # Crossings in corners are found in two sides.
+        return [
+            v
+            for i, v in enumerate(crossings)
+            if i == 0 or v - crossings[i - 1] > tolerance
+        ]
+
+
+def is_in_limit(value: Any, limit: Limit, tolerance: Any) -> bool:
+    """Check if value is between the limits."""
+    return limit[0] - tolerance <= value <= limit[1] + tolerance
+
+
+def get_tolerance(xlim: Limit, ylim: Limit) -> Any:
+    """Get tolerance to accept points in the box sides."""
+    size = (xlim[1] - xlim[0]) + (ylim[1] - ylim[0])
+    return to_number_like(CLIP_TOLERANCE, size) * size
+
+
+def clamp_to_box(point: Point, xlim: Limit, ylim: Limit) -> Point:
+    """Get point moved inside the box, used for crossings with its sides."""
+    return Point(
+        min(max(point.x, xlim[0]), xlim[1]), min(max(point.y, ylim[0]), ylim[1])
+    )
+
+
+def get_half_edge_pieces(
+    half_edge: HalfEdge, xlim: Limit, ylim: Limit, samples: int = DEFAULT_SAMPLES
+) -> List[List[Point]]:
+    """Get pieces of the half-edge inside the box.
+
+    Each piece is a list of points in the direction of the half-edge. Pieces of
+    hyperbola have samples points between their ends, plus the points where x or y
+    are extreme, so the bounds of the points are the bounds of the piece.
+    """
+    tolerance = get_tolerance(xlim, ylim)
+    curve = BisectorCurve(half_edge.site, half_edge.twin.site)
+    destination = half_edge.get_destination()
+    start = None if half_edge.origin is None else curve.get_v(half_edge.origin.point)
+    end = None if destination is None else curve.get_v(destination.point)
+    crossings = [
+        v
+        for v in curve.get_box_crossings(xlim, ylim, tolerance)
+        if (start is None or v > start) and (end is None or v < end)
+    ]
+    limits = [start] + crossings + [end]
+
+    pieces = []
+    for i in range(len(limits) - 1):
+        v0, v1 = limits[i], limits[i + 1]
+        # The parts that go to the infinity are out of the box.
+        if v0 is None or v1 is None or v1 <= v0:
+            continue
+        middle = curve.get_point((v0 + v1) / 2)
+        if not (
+            is_in_limit(middle.x, xlim, tolerance)
+            and is_in_limit(middle.y, ylim, tolerance)
+        ):
+            continue
+        if i == 0:
+            piece = [half_edge.origin.point]
+        else:
+            piece = [clamp_to_box(curve.get_point(v0), xlim, ylim)]
+        if curve.k != 0:
+            step = (v1 - v0) / (samples + 1)
+            vs = [v0 + step * j for j in range(1, samples + 1)]
+            vs += [v for v in curve.get_extreme_vs() if v0 < v < v1]
+            piece += [curve.get_point(v) for v in sorted(vs)]
+        if i == len(limits) - 2:
+            piece.append(destination.point)
+        else:
+            piece.append(clamp_to_box(curve.get_point(v1), xlim, ylim))
+        pieces.append(piece)
+    return pieces
+
+
+def get_perimeter_position(point: Point, xlim: Limit, ylim: Limit) -> Any:
+    """Get position of a point in the perimeter of the box.
+
+    The perimeter goes counterclockwise from the lower left corner.
+    """
+    width = xlim[1] - xlim[0]
+    height = ylim[1] - ylim[0]
+    distances = [
+        abs(point.y - ylim[0]),
+        abs(point.x - xlim[1]),
+        abs(point.y - ylim[1]),
+        abs(point.x - xlim[0]),
+    ]
+    side = distances.index(min(distances))
+    if side == 0:
+        return point.x - xlim[0]
+    if side == 1:
+        return width + point.y - ylim[0]
+    if side == 2:
+        return width + height + xlim[1] - point.x
+    return 2 * width + height + ylim[1] - point.y
+
+
+def get_box_corners(xlim: Limit, ylim: Limit) -> List[Point]:
+    """Get corners of the box counterclockwise from the lower right one."""
+    return [
+        Point(xlim[1], ylim[0]),
+        Point(xlim[1], ylim[1]),
+        Point(xlim[0], ylim[1]),
+        Point(xlim[0], ylim[0]),
+    ]
+
+
+def get_box_path(start: Point, end: Point, xlim: Limit, ylim: Limit) -> List[Point]:
+    """Get corners of the box passed going counterclockwise from start to end."""
+    width = xlim[1] - xlim[0]
+    height = ylim[1] - ylim[0]
+    perimeter = 2 * (width + height)
+    start_position = get_perimeter_position(start, xlim, ylim)
+    end_position = get_perimeter_position(end, xlim, ylim)
+    if end_position < start_position:
+        end_position += perimeter
+    corners = get_box_corners(xlim, ylim)
+    positions = [width, width + height, 2 * width + height, perimeter]
+    path = []
+    for turn in range(2):
+        for position, corner in zip(positions, corners):
+            if start_position < position + turn * perimeter < end_position:
+                path.append(corner)
+    return path
+
+
+def get_cell_polygon(
+    half_edges: List[HalfEdge],
+    xlim: Limit,
+    ylim: Limit,
+    samples: int = DEFAULT_SAMPLES,
+) -> List[Point]:
+    """Get polygon of the part of a cell inside the box counterclockwise.
+
+    half_edges are the half-edges of the cell in order. The polygon is empty when
+    no edge of the cell is in the box.
+    """
+    pieces = []
+    for half_edge in half_edges:
+        pieces += get_half_edge_pieces(half_edge, xlim, ylim, samples)
+
+    polygon: List[Point] = []
+    for i, piece in enumerate(pieces):
+        if polygon and polygon[-1] == piece[0]:
+            polygon += piece[1:]
+        else:
+            polygon += piece
+        next_piece = pieces[(i + 1) % len(pieces)]
+        if not piece[-1] == next_piece[0]:
+            polygon += get_box_path(piece[-1], next_piece[0], xlim, ylim)
+    if len(polygon) > 1 and polygon[-1] == polygon[0]:
+        polygon.pop()
+    return polygon
+
+
+def get_cell_polygons(
+    voronoi_diagram: Any, xlim: Limit, ylim: Limit, samples: int = DEFAULT_SAMPLES,
+) -> List[List[Point]]:
+    """Get polygons of the cells of all the sites clipped to the box.
+
+    The polygons are in the order of the sites of the diagram.
+    """
+    polygons = [
+        get_cell_polygon(voronoi_diagram.get_cell_half_edges(site), xlim, ylim, samples)
+        for site in voronoi_diagram.sites
+    ]
+    if voronoi_diagram.sites and not any(polygons):
+        # No edge crosses the box, so the box is inside only one cell.
+        x = (xlim[0] + xlim[1]) / 2
+        y = (ylim[0] + ylim[1]) / 2
+        distances = [site.get_weighted_distance(x, y) for site in voronoi_diagram.sites]
+        polygons[distances.index(min(distances))] = get_box_corners(xlim, ylim)
+    return polygons
+
+
+def get_polygon_area(polygon: List[Point]) -> Any:
+    """Get area of a counterclockwise polygon."""
+    double_area = sum(
+        polygon[i - 1].x * polygon[i].y - polygon[i].x * polygon[i - 1].y
+        for i in range(len(polygon))
+    )
+    return double_area / 2
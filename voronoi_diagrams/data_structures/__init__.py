@@ -1,4 +1,5 @@
 """Data Structures init."""
 from .avl_tree import AVLTree, IntNode, AVLNode
 from .l import LStructure
-from .q import QStructure
+from .q import QStructure, HeapQStructure
+from .list_index import ListIndex
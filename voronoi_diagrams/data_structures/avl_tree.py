@@ -1,8 +1,11 @@
 """AVL Tree."""
 # Standard Library
-from typing import Any, Optional, Iterable, List
+from typing import Any, Optional, Iterable, List, TYPE_CHECKING
 from abc import ABCMeta, abstractmethod
 
+if TYPE_CHECKING:
+    from voronoi_diagrams.profiling import Profile
+
 
 class AVLNode:
     """AVL Node.
@@ -11,14 +14,15 @@ class AVLNode:
     """
 
     __metaclass__ = ABCMeta
+    __slots__ = ("factor", "value", "length", "level", "left", "right", "parent")
 
-    factor: int = 0
-    value: Any = None
-    length: int = 1
-    level: int = 1
-    left: Optional["AVLNode"] = None
-    right: Optional["AVLNode"] = None
-    parent: Optional["AVLNode"] = None
+    factor: int
+    value: Any
+    length: int
+    level: int
+    left: Optional["AVLNode"]
+    right: Optional["AVLNode"]
+    parent: Optional["AVLNode"]
 
     def __init__(
         self,
@@ -28,9 +32,13 @@ class AVLNode:
         parent: Optional["AVLNode"] = None,
     ) -> None:
         """AVL Node constructor."""
+        self.factor = 0
         self.value = value
+        self.length = 1
+        self.level = 1
         self.left = left
         self.right = right
+        self.parent = parent
 
         if left is not None:
             self.length += left.length
@@ -72,6 +80,8 @@ class AVLNode:
 class IntNode(AVLNode):
     """Integer AVLNode."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: int,
@@ -99,6 +109,8 @@ class AVLTree:
 
     length: int = 0
     root: Optional[AVLNode] = None
+    # Profile where the rotations are counted, None if they are not.
+    profile: Optional["Profile"] = None
 
     def __init__(self, node_class=AVLNode):
         """Create AVLTree."""
@@ -150,6 +162,8 @@ class AVLTree:
         right = node.right
         if right is None:
             return
+        if self.profile is not None:
+            self.profile.counters["avl_rotations"] += 1
 
         right_left = right.left
         node.right = right_left
@@ -179,6 +193,8 @@ class AVLTree:
         left = node.left
         if left is None:
             return
+        if self.profile is not None:
+            self.profile.counters["avl_rotations"] += 1
 
         left_right = left.right
         node.left = left_right
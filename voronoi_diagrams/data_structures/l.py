@@ -1,13 +1,25 @@
 """L Structure implementation."""
 
 # Standard Library
-from typing import Any, Optional, Tuple, List
+from typing import Any, Optional, Tuple, List, Dict, TYPE_CHECKING
+from decimal import Decimal
 
 # AVL
 from .avl_tree import AVLTree, AVLNode
 
 # Models
-from voronoi_diagrams.models import Region, Event, Bisector, Site, Point, Boundary
+from voronoi_diagrams.models import (
+    Region,
+    Event,
+    Bisector,
+    Site,
+    Point,
+    Boundary,
+    CacheCounter,
+)
+
+if TYPE_CHECKING:
+    from voronoi_diagrams.profiling import Profile
 
 
 class RegionNotFoundException(Exception):
@@ -21,15 +33,55 @@ class RegionNotFoundException(Exception):
         )
 
 
+class BoundaryComparisons:
+    """Comparisons between boundaries and points in the current sweep position.
+
+    The comparisons are cleared when the sweep advances to another y.
+    """
+
+    __slots__ = ("y", "comparisons", "counter")
+
+    y: Optional[Decimal]
+    # The boundary is kept with its comparison so its id cannot be reused.
+    comparisons: Dict[Tuple[int, Decimal], Tuple[Boundary, Decimal]]
+    counter: CacheCounter
+
+    def __init__(self, counter: Optional[CacheCounter] = None) -> None:
+        """Construct empty comparisons counted in the counter, if it is given."""
+        self.y = None
+        self.comparisons = {}
+        self.counter = CacheCounter() if counter is None else counter
+
+    def compare_point(self, boundary: Boundary, point: Point) -> Decimal:
+        """Get the comparison of the point with the boundary.
+
+        The comparison is computed once for each boundary and point in the same y.
+        """
+        if point.y != self.y:
+            self.y = point.y
+            self.comparisons = {}
+        key = (id(boundary), point.x)
+        cached = self.comparisons.get(key)
+        if cached is not None and cached[0] is boundary:
+            self.counter.hits += 1
+            return cached[1]
+        self.counter.misses += 1
+        comparison = boundary.compare_point(point)
+        self.comparisons[key] = (boundary, comparison)
+        return comparison
+
+
 class LNode(AVLNode):
     """L Structure AVLNode that contains Region in their values."""
 
+    __slots__ = ("left_neighbor", "right_neighbor")
+
     left: Optional["LNode"]
     right: Optional["LNode"]
     value: Region
-    parent: Optional["LNode"] = None
-    left_neighbor: Optional["LNode"] = None
-    right_neighbor: Optional["LNode"] = None
+    parent: Optional["LNode"]
+    left_neighbor: Optional["LNode"]
+    right_neighbor: Optional["LNode"]
 
     def __init__(
         self,
@@ -39,6 +91,8 @@ class LNode(AVLNode):
     ) -> None:
         """L structure AVL Node constructor."""
         super(LNode, self).__init__(value, left, right)
+        self.left_neighbor = None
+        self.right_neighbor = None
 
     def is_contained(self, site: Site, *args: Any, **kwargs: Any) -> bool:
         """Site is contained in the Node."""
@@ -52,21 +106,39 @@ class LNode(AVLNode):
         """Site is to the right of Node."""
         return self.value.is_right(site.get_event_point())
 
+    def get_containment(
+        self, site: Site, comparisons: BoundaryComparisons
+    ) -> Tuple[bool, bool]:
+        """Get if the site is contained to the left and to the right of the Node."""
+        return self.value.get_containment(
+            site.get_event_point(), comparisons.compare_point
+        )
+
 
 class LStructure:
     """L Structure used in the Fortune's Algorithm."""
 
     t: AVLTree
     head: Optional[LNode]
+    comparisons: BoundaryComparisons
+    profile: Optional["Profile"]
 
-    def __init__(self, root: Region):
+    def __init__(self, root: Region, profile: Optional["Profile"] = None):
         """Construct Tree t.
 
         The list must have a root region. If there is one region, this region must not have any
         boundaries.
+        The searches, their comparisons and the rotations are counted in the profile, if
+        it is given.
         """
         self.t = AVLTree(node_class=LNode)
+        self.t.profile = profile
         self.head = self.t.insert(root)  # type: ignore
+        self.profile = profile
+        if profile is None:
+            self.comparisons = BoundaryComparisons()
+        else:
+            self.comparisons = BoundaryComparisons(profile.point_comparisons)
 
     def __str__(self):
         """Get string representation."""
@@ -107,11 +179,33 @@ class LStructure:
         return self.__str__()
 
     def search_region_node(self, site: Site) -> LNode:
-        """Search the node of the region where the site is located."""
-        node = self.t.search(site)
-        if node is None:
-            raise RegionNotFoundException()
-        return node  # type: ignore
+        """Search the node of the region where the site is located.
+
+        Each boundary is compared once with the site in each visited node and the
+        comparisons are reused while the sweep does not advance.
+        """
+        node = self.t.root
+        while node is not None:
+            is_left_contained, is_right_contained = node.get_containment(
+                site, self.comparisons
+            )
+            if is_left_contained and is_right_contained:
+                if self.profile is not None:
+                    self.profile.add_region_search(self._get_node_depth(node))
+                return node  # type: ignore
+            if is_right_contained:
+                node = node.left
+            else:
+                node = node.right
+        raise RegionNotFoundException()
+
+    def _get_node_depth(self, node: LNode) -> int:
+        """Get the nodes from the root to the node, the node included."""
+        depth = 1
+        while node.parent is not None:
+            node = node.parent  # type: ignore
+            depth += 1
+        return depth
 
     def search_region_contained(self, site: Site) -> Region:
         """Search the region where the site is located."""
@@ -0,0 +1,52 @@
+"""Index of the positions of the items in lists."""
+
+# Standard Library
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class ListIndex:
+    """Positions of the items of parallel lists by their keys.
+
+    The key of an item of the first list is given by get_key. An item is removed
+    in constant time moving the last items to its position, so the lists do not
+    keep the order of their items.
+    """
+
+    __slots__ = ("lists", "get_key", "positions")
+
+    lists: List[List[Any]]
+    get_key: Callable[[Any], Hashable]
+    positions: Dict[Hashable, int]
+
+    def __init__(self, lists: List[List[Any]], get_key: Callable[[Any], Hashable]):
+        """Construct index of the items already in the lists."""
+        self.lists = lists
+        self.get_key = get_key
+        self.positions = {get_key(item): i for i, item in enumerate(lists[0])}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if there is an item with the key."""
+        return key in self.positions
+
+    def get_position(self, key: Hashable) -> Optional[int]:
+        """Get position of the item with the key, None if there is not one."""
+        return self.positions.get(key)
+
+    def append(self, *items: Any) -> None:
+        """Append an item to each list."""
+        self.positions[self.get_key(items[0])] = len(self.lists[0])
+        for items_list, item in zip(self.lists, items):
+            items_list.append(item)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the items with the key if there are."""
+        position = self.positions.pop(key, None)
+        if position is None:
+            return
+        last_position = len(self.lists[0]) - 1
+        if position != last_position:
+            for items_list in self.lists:
+                items_list[position] = items_list[last_position]
+            self.positions[self.get_key(self.lists[0][position])] = position
+        for items_list in self.lists:
+            items_list.pop()
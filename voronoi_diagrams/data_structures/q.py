@@ -1,7 +1,10 @@
 """Q Structure implementation."""
 
 # Standard Library
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Dict, Iterable
+from itertools import count
+from functools import cmp_to_key
+import heapq
 
 # AVL
 from .avl_tree import AVLTree, AVLNode
@@ -13,6 +16,8 @@ from voronoi_diagrams.models import Event
 class QNode(AVLNode):
     """Q structure AVLNode that contains an event in their values."""
 
+    __slots__ = ()
+
     def __init__(self, value: Event, left=None, right=None) -> None:
         """List L AVL Node constructor."""
         super(QNode, self).__init__(value, left, right)
@@ -42,10 +47,17 @@ class QStructure:
 
     t: AVLTree
     head: Optional[QNode]
+    sites: List[Event]
+    _site_index: int
+    # Events in the tree, the lengths of its nodes are not updated when removing.
+    _tree_length: int
 
     def __init__(self):
         """Construct Tree t."""
         self.t = AVLTree(node_class=QNode)
+        self.sites = []
+        self._site_index = 0
+        self._tree_length = 0
 
     def __str__(self) -> str:
         """Get string representation."""
@@ -55,13 +67,33 @@ class QStructure:
         """Get representation."""
         return self.__str__()
 
+    def __len__(self) -> int:
+        """Get number of events."""
+        return self._tree_length + len(self.sites) - self._site_index
+
     def enqueue(self, event: Event):
         """Enqueue an event."""
         self.t.insert(event)
+        self._tree_length += 1
+
+    def enqueue_sites(self, sites: Iterable[Event]):
+        """Enqueue many sites at once.
+
+        The sites are sorted once and kept in a list that is merged with the tree
+        when dequeuing, so the tree only holds the events enqueued one by one.
+        Sites enqueued this way cannot be deleted.
+        """
+        pending_sites = self.sites[self._site_index :] + list(sites)
+        # As in the tree, the last enqueued of equal events is dequeued first.
+        self.sites = sorted(
+            reversed(pending_sites), key=lambda site: site.get_queue_key()
+        )
+        self._site_index = 0
 
     def delete(self, event: Event):
         """Delete an event."""
-        self.t.remove(event)
+        if self.t.remove(event):
+            self._tree_length -= 1
 
     def dequeue(self) -> Optional[Event]:
         """Get the next event.
@@ -69,16 +101,134 @@ class QStructure:
         Get the minimun in y axis event and delete it.
         """
         node = self.t.get_min_node()
+        if self._site_index < len(self.sites):
+            site = self.sites[self._site_index]
+            if node is None or site.get_comparison(node.value) < 0:
+                self._site_index += 1
+                return site
         if node is None:
             return None
         event = node.value
         self.t.remove_node(node)
+        self._tree_length -= 1
+        return event
+
+    def is_empty(self) -> bool:
+        """Return True if the structure is Empty."""
+        return self.t.is_empty() and self._site_index == len(self.sites)
+
+    def get_all_events(self) -> List[Event]:
+        """Get all events sorted."""
+        return list(
+            heapq.merge(
+                self.sites[self._site_index :],
+                self.t.dfs_inorder(),
+                key=cmp_to_key(lambda event1, event2: event1.get_comparison(event2)),
+            )
+        )
+
+
+class HeapQStructure:
+    """Q Structure used in the Fortune's Algorithm implemented with a binary heap.
+
+    Events are sorted by their queue key. Deleted events are just marked as invalid
+    and are skipped when they reach the top of the heap.
+    """
+
+    heap: List[List[Any]]
+    sites: List[List[Any]]
+    _site_index: int
+    _entries: Dict[int, List[Any]]
+
+    # Positions in a heap entry.
+    KEY = 0
+    EVENT = 2
+    VALID = 3
+
+    def __init__(self):
+        """Construct empty heap."""
+        self.heap = []
+        self.sites = []
+        self._site_index = 0
+        self._entries = {}
+        self._counter = count()
+
+    def __str__(self) -> str:
+        """Get string representation."""
+        return f"Q: {str(self.get_all_events())}"
+
+    def __repr__(self):
+        """Get representation."""
+        return self.__str__()
+
+    def __len__(self) -> int:
+        """Get number of valid events."""
+        return len(self._entries)
+
+    def enqueue(self, event: Event):
+        """Enqueue an event."""
+        entry = self._create_entry(event)
+        heapq.heappush(self.heap, entry)
+
+    def _create_entry(self, event: Event) -> List[Any]:
+        """Create and save heap entry of event.
+
+        As in the AVL Q Structure, the last enqueued of equal events is dequeued first.
+        """
+        entry = [event.get_queue_key(), -next(self._counter), event, True]
+        self._entries[id(event)] = entry
+        return entry
+
+    def enqueue_sites(self, sites: Iterable[Event]):
+        """Enqueue many sites at once.
+
+        The sites are sorted once and kept in a list that is merged with the heap
+        when dequeuing, so the heap only holds the events enqueued one by one.
+        """
+        pending_sites = self.sites[self._site_index :]
+        pending_sites += [self._create_entry(site) for site in sites]
+        pending_sites.sort()
+        self.sites = pending_sites
+        self._site_index = 0
+
+    def delete(self, event: Event):
+        """Mark an event as invalid if it is in the queue."""
+        entry = self._entries.pop(id(event), None)
+        if entry is not None:
+            entry[self.VALID] = False
+
+    def _remove_invalid_top(self) -> None:
+        """Pop the invalid entries on top of the heap and the sites list."""
+        while self.heap and not self.heap[0][self.VALID]:
+            heapq.heappop(self.heap)
+        while (
+            self._site_index < len(self.sites)
+            and not self.sites[self._site_index][self.VALID]
+        ):
+            self._site_index += 1
+
+    def dequeue(self) -> Optional[Event]:
+        """Get the next event.
+
+        Get the minimun in y axis event and delete it.
+        """
+        self._remove_invalid_top()
+        if self._site_index < len(self.sites) and (
+            not self.heap or self.sites[self._site_index] < self.heap[0]
+        ):
+            event = self.sites[self._site_index][self.EVENT]
+            self._site_index += 1
+        elif self.heap:
+            event = heapq.heappop(self.heap)[self.EVENT]
+        else:
+            return None
+        del self._entries[id(event)]
         return event
 
     def is_empty(self) -> bool:
         """Return True if the structure is Empty."""
-        return self.t.is_empty()
+        return len(self._entries) == 0
 
     def get_all_events(self) -> List[Event]:
         """Get all events sorted."""
-        return self.t.dfs_inorder()
+        return [entry[self.EVENT] for entry in sorted(self._entries.values())]
@@ -3,10 +3,23 @@
 General Solution.
 """
 # Standard Library
-from typing import Iterable, List, Any, Optional, Tuple, Dict, Type
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Any,
+    Optional,
+    Tuple,
+    Dict,
+    Type,
+    FrozenSet,
+    Set,
+    Callable,
+)
+from collections import Counter
 
 # Data structures
-from .data_structures import LStructure, QStructure
+from .data_structures import LStructure, QStructure, HeapQStructure, ListIndex
 from .data_structures.l import LNode
 
 # Models
@@ -27,29 +40,52 @@ from .models import (
     PointBisectorEdge,
     WeightedPointBisectorEdge,
     Vertex,
+    HalfEdge,
+    DiagramArrays,
+    NO_VERTEX,
 )
 
+# Clipping
+from .clipping import get_cell_polygons, get_polygon_area, DEFAULT_SAMPLES
+
+# Point location
+from .point_location import PointLocator
+
 # Math
 from decimal import Decimal
-
-# Plot
-from plotly import graph_objects as go
-from plots.plot_utils.models.events import (
-    plot_sweep_line,
-    get_site_traces,
-    plot_events_traces,
+import numpy as np
+
+# Utils
+from general_utils.numbers import (
+    to_numeric,
+    DECIMAL_NUMERIC,
+    FLOAT_NUMERIC,
+    NUMERICS,
 )
-from plots.plot_utils.models.boundaries import get_plot_scatter_boundary
-from plots.plot_utils.models.bisectors import plot_edge
-from plots.plot_utils.models.vertices import plot_vertex
+
+# Observers
+from .observers import FortunesAlgorithmObserver
+
+# Profiling
+from .profiling import Profile
 
 # Types
 Limit = Tuple[Decimal, Decimal]
+HalfEdgeKey = Tuple[int, Optional[FrozenSet[int]], Optional[FrozenSet[int]]]
 
 # Modes
 AUTOMATIC_MODE = 0
 MANUAL_MODE = 1
 
+# Queues
+AVL_QUEUE = 0
+HEAP_QUEUE = 1
+QUEUE_CLASSES = {AVL_QUEUE: QStructure, HEAP_QUEUE: HeapQStructure}
+
+# Sites in all the local diagrams calculated to change some sites, relative to the
+# sites of the diagram, before calculating all the cells left at once.
+MAX_LOCAL_SITES_RATIO = 1
+
 
 class FortunesAlgorithm:
     """Fortune's Algorithm implementation."""
@@ -62,15 +98,33 @@ class FortunesAlgorithm:
         ylim: Limit = (-100, 100),
         mode: int = AUTOMATIC_MODE,
         names: Optional[List[str]] = None,
+        numeric: str = DECIMAL_NUMERIC,
+        queue: int = AVL_QUEUE,
+        profile: Optional[Profile] = None,
     ) -> "FortunesAlgorithm":
-        """Calculate Voronoi Diagram."""
+        """Calculate Voronoi Diagram.
+
+        numeric is the number type used in the sweep: DECIMAL_NUMERIC or FLOAT_NUMERIC.
+        """
         if names is None or len(points) != len(names):
             names = [str(i + 1) for i in range(len(points))]
         sites = [
-            Site(points[i].x, points[i].y, name=names[i]) for i in range(len(points))
+            Site(
+                to_numeric(points[i].x, numeric),
+                to_numeric(points[i].y, numeric),
+                name=names[i],
+            )
+            for i in range(len(points))
         ]
         voronoi_diagram = FortunesAlgorithm(
-            sites, plot_steps=plot_steps, xlim=xlim, ylim=ylim, mode=mode,
+            sites,
+            plot_steps=plot_steps,
+            xlim=xlim,
+            ylim=ylim,
+            mode=mode,
+            numeric=numeric,
+            queue=queue,
+            profile=profile,
         )
 
         return voronoi_diagram
@@ -83,18 +137,36 @@ class FortunesAlgorithm:
         ylim: Limit = (-100, 100),
         mode: int = AUTOMATIC_MODE,
         names: Optional[List[str]] = None,
+        numeric: str = DECIMAL_NUMERIC,
+        queue: int = AVL_QUEUE,
+        profile: Optional[Profile] = None,
     ) -> "FortunesAlgorithm":
-        """Calculate AW Voronoi Diagram."""
+        """Calculate AW Voronoi Diagram.
+
+        numeric is the number type used in the sweep: DECIMAL_NUMERIC or FLOAT_NUMERIC.
+        """
         sites = []
         if names is None or len(points_and_weights) != len(names):
             names = [str(i + 1) for i in range(len(points_and_weights))]
         for i in range(len(points_and_weights)):
             point, weight = points_and_weights[i]
-            site = WeightedSite(point.x, point.y, weight, name=names[i])
+            site = WeightedSite(
+                to_numeric(point.x, numeric),
+                to_numeric(point.y, numeric),
+                to_numeric(weight, numeric),
+                name=names[i],
+            )
             sites.append(site)
 
         voronoi_diagram = FortunesAlgorithm(
-            sites, plot_steps=plot_steps, xlim=xlim, ylim=ylim, mode=mode,
+            sites,
+            plot_steps=plot_steps,
+            xlim=xlim,
+            ylim=ylim,
+            mode=mode,
+            numeric=numeric,
+            queue=queue,
+            profile=profile,
         )
         return voronoi_diagram
 
@@ -103,17 +175,35 @@ class FortunesAlgorithm:
     edges: List[Edge]
     bisectors_list: List[Bisector]
     mode: int
+    numeric: str
+    queue: int
     event: Event  # Current Event
 
-    _vertices_dict: Dict[Tuple[Decimal, Decimal], Vertex]
-    _bisectors: Dict[Any, Bisector]
-    _active_bisectors: Dict[Any, Edge]
+    # Vertices by their points.
+    _vertices: Dict[Point, Vertex]
+    # A bisector of each pair of sites, by itself as bisectors of the same sites are
+    # equal.
+    _bisectors: Dict[Bisector, Bisector]
+    # Edges being traced in the sweep by the id of their bisector, the one of their
+    # boundaries.
+    _active_edges: Dict[int, Edge]
     sites: List[Site]
-    _plot_steps: bool
-    _figure: Optional[go.Figure]
-    _figure_traces: int
-    _boundary_plot_dict: Dict[str, int]
-    _bisector_plot_dict: Dict[Tuple[str, bool], int]
+    # Outer half-edge of the cell of each site by the id of the site.
+    _site_half_edges: Dict[int, HalfEdge]
+    # Positions in their lists of the sites, edges, bisectors and vertices by their
+    # ids, to remove them in constant time. They are indexed when the diagram first
+    # changes.
+    _site_index: Optional[ListIndex]
+    _edge_index: Optional[ListIndex]
+    _bisector_index: Optional[ListIndex]
+    _vertex_index: Optional[ListIndex]
+    # Sites with empty cells by the id of the site whose cell has their point, and
+    # that site by the id of each of them. Also indexed when the diagram first
+    # changes.
+    _hidden_sites: Dict[int, Dict[int, Site]]
+    _hidden_site_owners: Dict[int, Site]
+    observer: Optional[FortunesAlgorithmObserver]
+    profile: Optional[Profile]
     _begin_event: bool
     _updated_regions: List[Region]
     _updated_boundaries: List[Boundary]
@@ -125,8 +215,36 @@ class FortunesAlgorithm:
         xlim: Optional[Limit] = (-100, 100),
         ylim: Optional[Limit] = (-100, 100),
         mode: Optional[int] = AUTOMATIC_MODE,
+        numeric: str = DECIMAL_NUMERIC,
+        observer: Optional[FortunesAlgorithmObserver] = None,
+        queue: int = AVL_QUEUE,
+        profile: Optional[Profile] = None,
     ) -> None:
-        """Construct and calculate Voronoi Diagram."""
+        """Construct and calculate Voronoi Diagram.
+
+        With FLOAT_NUMERIC the sites are expected to have float coordinates, the
+        sweep runs on floats and only the ambiguous point comparisons are recomputed
+        with Decimal.
+        The observer is notified of every step. If plot_steps is given and there is
+        no observer, the plotly steps observer is imported and used.
+        The queue is the Q structure used: AVL_QUEUE or HEAP_QUEUE.
+        If a profile is given, the phases and hot paths of this diagram are counted and
+        timed in it.
+        """
+        if numeric not in NUMERICS:
+            raise ValueError(f"Numeric must be one of {NUMERICS}, not {numeric!r}.")
+        if numeric == FLOAT_NUMERIC and plot_steps:
+            raise ValueError("Steps can only be plotted with Decimal numeric.")
+        self.numeric = numeric
+        if queue not in QUEUE_CLASSES:
+            raise ValueError(
+                f"Queue must be one of {list(QUEUE_CLASSES)}, not {queue!r}."
+            )
+        self.queue = queue
+        if numeric == FLOAT_NUMERIC:
+            xlim = (float(xlim[0]), float(xlim[1]))
+            ylim = (float(ylim[0]), float(ylim[1]))
+
         self.vertices = []
         self.vertices_list = []
         self._vertices = dict()
@@ -134,7 +252,13 @@ class FortunesAlgorithm:
         self.edges = []
         self.bisectors_list = []
         self._bisectors = dict()
-        self._active_bisectors = dict()
+        self._active_edges = dict()
+        self._site_half_edges = dict()
+        self._site_index = None
+        self._edge_index = None
+        self._bisector_index = None
+        self._vertex_index = None
+        self.profile = profile
 
         # Type of Voronoi diagram.
         self.sites = list(sites)
@@ -158,26 +282,13 @@ class FortunesAlgorithm:
         self._xlim = xlim
         self._ylim = ylim
 
-        # Plot.
-        self._plot_steps = plot_steps
-        if self._plot_steps:
-            self._figure = go.Figure()
-            layout = go.Layout(
-                height=745,
-                width=815,
-                hovermode="closest",
-                legend={"itemclick": "toggleothers", "itemdoubleclick": "toggle"},
-            )
-            template = dict(layout=layout)
-            self._figure.update_layout(title="VD", template=template)
-            self._figure.update_xaxes(range=list(xlim))
-            self._figure.update_yaxes(range=list(ylim), scaleanchor="x", scaleratio=1)
-            self._figure_traces = 0
-            self._traces = []
-            self._boundary_plot_dict = {}
-            self._bisector_plot_dict = {}
-        else:
-            self._figure = None
+        # Observer.
+        if observer is None and plot_steps:
+            # Imported here so the algorithm does not depend on plotly.
+            from plots.plot_utils.steps import PlotStepsObserver
+
+            observer = PlotStepsObserver()
+        self.observer = observer
 
         self._updated_regions = []
         self._updated_boundaries = []
@@ -185,18 +296,23 @@ class FortunesAlgorithm:
         # Mode.
         self.mode = mode
         self._begin_event = True
-        self._init_structures()
+        self._run_phase("init", self._init_structures)
         if self.mode == AUTOMATIC_MODE:
             self._calculate_diagram()
 
     def _init_structures(self):
         """Init data structures used."""
+        if self.observer is not None:
+            self.observer.start(self)
+
         # Step 1.
-        self.q_structure = QStructure()
-        for site in self.sites:
-            self.q_structure.enqueue(site)
-            if self._plot_steps:
-                self._set_site_trace(site)
+        self.q_structure = QUEUE_CLASSES[self.queue]()
+        if self.queue == AVL_QUEUE:
+            self.q_structure.t.profile = self.profile
+        self.q_structure.enqueue_sites(self.sites)
+        if self.observer is not None:
+            for site in self.sites:
+                self.observer.add_site(site)
 
         # Step 2.
         self.event = self.q_structure.dequeue()
@@ -205,15 +321,8 @@ class FortunesAlgorithm:
         r_p = self.REGION_CLASS(self.event, None, None)
         self._updated_regions = [r_p]
         r_p.active = True
-        self.l_structure = LStructure(r_p)
-        self._plot_step()
-
-    def _set_site_trace(self, site):
-        """Set site trace in traces."""
-        if self._plot_steps:
-            site_traces = get_site_traces(site, self.SITE_CLASS)
-            self._traces += site_traces
-            self._figure_traces += len(site_traces)
+        self.l_structure = LStructure(r_p, profile=self.profile)
+        self._notify_step()
 
     def _calculate_diagram(self):
         """Calculate point diagram."""
@@ -242,7 +351,7 @@ class FortunesAlgorithm:
 
         # Step 5.
         self.event = self.q_structure.dequeue()
-        self._plot_step()
+        self._notify_step()
         self._begin_event = False
         if not self.event.is_site:
             self.event.region_node.value.is_to_be_deleted = True
@@ -253,24 +362,29 @@ class FortunesAlgorithm:
         """Calculate actual event."""
         # Step 6 and 7.
         if self.event.is_site:
-            self._handle_site(self.event)
+            self._run_phase("site_events", self._handle_site, self.event)
         # Step 13: p is an intersection.
         else:
-            self._handle_intersection(self.event)
-        self._plot_step()
+            self._run_phase(
+                "intersection_events", self._handle_intersection, self.event
+            )
+        if self.q_structure.is_empty():
+            self._run_phase("close_cells", self._close_cells)
+        self._notify_step()
         self._begin_event = True
 
-    def _plot_step(self):
-        """Plot step."""
-        if self._plot_steps:
-            # keep the sites and clean all other traces.
-            self._figure.data = []
-            for trace in self._traces:
-                if trace is not None:
-                    self._figure.add_trace(trace)
-            plot_sweep_line(self._figure, self._xlim, self._ylim, self.event)
-            plot_events_traces(self._figure, self.q_structure)
-            # self._figure.show()
+    def _run_phase(self, phase: str, method: Callable, *args: Any) -> None:
+        """Run method of the phase, measured if the diagram is profiled."""
+        if self.profile is None:
+            method(*args)
+            return
+        with self.profile.measure(phase):
+            method(*args)
+
+    def _notify_step(self):
+        """Notify step to the observer."""
+        if self.observer is not None:
+            self.observer.step()
 
     def next_step(self):
         """Calculate next step."""
@@ -300,8 +414,8 @@ class FortunesAlgorithm:
         # Step 9.
         # Create Bisector B*pq.
         # Actually we are creating Bpq.
-        bisector_p_q = self.BISECTOR_CLASS(sites=(p, r_q.site))
-        self.add_edge(bisector_p_q, sign=None)
+        bisector_p_q = self._create_bisector(p, r_q.site)
+        self.add_edge(bisector_p_q)
 
         # Step 10.
         # Update L so that it contains ...,R*q,C-pq,R*p,C+pq,R*q,... in place of R*q.
@@ -344,8 +458,14 @@ class FortunesAlgorithm:
 
         self.add_endpoint_to_new_edge_in_site(boundary_p_q_plus, boundary_p_q_minus, p)
 
-        if self._plot_steps:
-            self._update_plot_site_event(boundary_p_q_minus, boundary_p_q_plus)
+        if self.observer is not None:
+            self.observer.site_event(boundary_p_q_minus, boundary_p_q_plus)
+
+    def _create_bisector(self, p: Site, q: Site) -> Bisector:
+        """Create bisector of p and q."""
+        if self.profile is not None:
+            self.profile.counters["bisectors"] += 1
+        return self.BISECTOR_CLASS(sites=(p, q))
 
     def _handle_intersection(self, p: Intersection):
         """Handle when event is an intersection."""
@@ -360,7 +480,7 @@ class FortunesAlgorithm:
 
         # Step 15.
         # Create bisector B*qs.
-        bisector_q_s = self.BISECTOR_CLASS(sites=(r_q.site, r_s.site))
+        bisector_q_s = self._create_bisector(r_q.site, r_s.site)
 
         # Step 16.
         # Update L so it contains Cqs instead of Cqr, Rr*, Crs
@@ -368,7 +488,10 @@ class FortunesAlgorithm:
             p.point, r_q.site, r_s.site
         )
         boundary_q_s = self.BOUNDARY_CLASS(bisector_q_s, boundary_q_s_sign)
-        self.add_edge(bisector_q_s, sign=boundary_q_s_sign)
+        vertex_sign = boundary_q_s.get_vertex_sign(p.vertex)
+        if vertex_sign != boundary_q_s_sign:
+            boundary_q_s = self.BOUNDARY_CLASS(bisector_q_s, vertex_sign)
+        self.add_edge(bisector_q_s)
         region_q_node = region_r_node.left_neighbor
         region_s_node = region_r_node.right_neighbor
 
@@ -392,6 +515,10 @@ class FortunesAlgorithm:
             self._delete_intersection_from_boundary(
                 region_s_node.value.right, is_left_intersection=True
             )
+        # The boundaries of p left L, so they stop referencing it to be freed
+        # without waiting for the garbage collector.
+        boundary_q_r.right_intersection = None
+        boundary_r_s.left_intersection = None
 
         # Step 18.
         # Insert any intersections between Cqs and its neighbors to the left or right
@@ -410,10 +537,20 @@ class FortunesAlgorithm:
         # Add that this vertex is an endpoint of B*qr, B*rs and B*qs.
         self.add_vertex(p, boundary_q_s, boundary_q_r, boundary_r_s)
 
-        if self._plot_steps:
-            self._update_plot_intersection_event(
-                boundary_q_s, boundary_q_r, boundary_r_s
-            )
+        if self.observer is not None:
+            self.observer.intersection_event(boundary_q_s, boundary_q_r, boundary_r_s)
+        self._remove_complete_edges([boundary_q_r, boundary_r_s])
+
+    def _remove_complete_edges(self, boundaries: List[Boundary]) -> None:
+        """Remove the edges of the boundaries with both vertices from the sweep.
+
+        Their boundaries left L, so the quantities of their bisectors are freed too.
+        """
+        for boundary in boundaries:
+            bisector_id = id(boundary.bisector)
+            if not self._active_edges[bisector_id].is_to_the_infinity():
+                del self._active_edges[bisector_id]
+                boundary.bisector.free_cached_quantities()
 
     def add_vertex(
         self,
@@ -433,39 +570,57 @@ class FortunesAlgorithm:
                 (boundary_q_s.bisector, boundary_q_s.sign),
             ]
         )
-        point_tuple = p.vertex.get_tuple()
-        if point_tuple not in self._vertices:
+        vertex = self._vertices.get(p.vertex)
+        if vertex is None:
             vertex = Vertex(p.vertex)
-            self._vertices[point_tuple] = vertex
-            self.vertices.append(vertex)
-            self.vertices_list.append(p.vertex)
-        else:
-            vertex = self._vertices[point_tuple]
+            self._add_vertex_to_lists(vertex)
 
         for edge in edges:
             vertex.add_edge(edge)
-            edge.add_vertex(vertex)
+        self._link_half_edges(vertex, boundary_q_r, boundary_r_s, *edges)
+
+        if self.observer is not None:
+            self.observer.add_vertex(vertex)
 
-        if self._plot_steps:
-            self._add_vertex_trace(vertex)
+    def _link_half_edges(
+        self,
+        vertex: Vertex,
+        boundary_q_r: Boundary,
+        boundary_r_s: Boundary,
+        edge_q_r: Edge,
+        edge_r_s: Edge,
+        edge_q_s: Edge,
+    ) -> None:
+        """Link the half-edges of the cells of q, r and s around the vertex.
 
-    def add_edge(self, bisector: Bisector, sign: Optional[bool] = True) -> None:
+        Counterclockwise around the vertex there are B*qs, R*q, B*qr, R*r, B*rs and
+        R*s, so every cell goes from one edge to the next one in the vertex.
+        """
+        q, r = boundary_q_r.bisector.sites
+        if q is boundary_r_s.bisector.sites[0] or q is boundary_r_s.bisector.sites[1]:
+            q, r = r, q
+        s = boundary_r_s.bisector.sites[0]
+        if s is r:
+            s = boundary_r_s.bisector.sites[1]
+
+        half_edge_q_s = edge_q_s.get_half_edge(q)
+        edge_q_r.get_half_edge(q).set_next(half_edge_q_s)
+        half_edge_q_s.origin = vertex
+        half_edge_r_q = edge_q_r.get_half_edge(r)
+        edge_r_s.get_half_edge(r).set_next(half_edge_r_q)
+        half_edge_r_q.origin = vertex
+        half_edge_s_r = edge_r_s.get_half_edge(s)
+        edge_q_s.get_half_edge(s).set_next(half_edge_s_r)
+        half_edge_s_r.origin = vertex
+
+    def add_edge(self, bisector: Bisector) -> None:
         """Add point in the edges list."""
-        hasheable_of_bisector = bisector.get_object_to_hash()
-        if hasheable_of_bisector not in self._bisectors:
-            self._bisectors[hasheable_of_bisector] = bisector
-            self.bisectors_list.append(bisector)
-        edge = self.EDGE_CLASS(
-            bisector,
-            self.BOUNDARY_CLASS(bisector, True),
-            self.BOUNDARY_CLASS(bisector, False),
-        )
-        self.edges.append(edge)
-        if sign is None:
-            self._active_bisectors[(hasheable_of_bisector, False)] = edge
-            self._active_bisectors[(hasheable_of_bisector, True)] = edge
-        else:
-            self._active_bisectors[(hasheable_of_bisector, sign)] = edge
+        edge = self.EDGE_CLASS(bisector)
+        self._add_edge_to_lists(edge)
+        for half_edge in edge.half_edges:
+            self._site_half_edges.setdefault(id(half_edge.site), half_edge)
+        if self.has_next_step():
+            self._active_edges[id(bisector)] = edge
 
     def _find_region_containing_p(self, p: Site) -> Tuple[Region, Region, LNode]:
         """Find an occurrence of a region R*q on L containing p."""
@@ -514,6 +669,10 @@ class FortunesAlgorithm:
         elif not is_left_intersection and boundary.right_intersection is not None:
             self.q_structure.delete(boundary.right_intersection)
             boundary.right_intersection = None
+        else:
+            return
+        if self.profile is not None:
+            self.profile.counters["deleted_events"] += 1
 
     def _insert_posible_intersections(
         self,
@@ -595,13 +754,11 @@ class FortunesAlgorithm:
             self.add_end_edge(boundary, p.point)
 
     def get_edges(self, bisectors: List[Tuple[Bisector, bool]]) -> List[Edge]:
-        """Get voronoi diagram bisectors based on the current state."""
-        edges = []
-        for bisector, sign in bisectors:
-            hasheable_of_bisector = bisector.get_object_to_hash()
-            edge = self._active_bisectors[(hasheable_of_bisector, sign)]
-            edges.append(edge)
-        return edges
+        """Get voronoi diagram bisectors based on the current state.
+
+        Each bisector of the sweep has its own edge, for both of its boundaries.
+        """
+        return [self._active_edges[id(bisector)] for bisector, _ in bisectors]
 
     def add_begin_vertical_edge(
         self, bisector: Bisector, y: Optional[Decimal] = None, sign: bool = True
@@ -627,133 +784,925 @@ class FortunesAlgorithm:
         side = boundary.get_side_where_point_belongs(point)
         edge.add_end_range(point.x, boundary.sign, side)
 
-    def _update_plot_site_event(
-        self, boundary_plus: Boundary, boundary_minus: Boundary
-    ):
-        self._add_boundaries_to_plot([boundary_minus, boundary_plus])
-        self._add_bisector_to_plot(boundary_plus.bisector, None)
+    def _close_cells(self) -> None:
+        """Link the half-edges that go to the infinity with the ones that come from it.
 
-    def _update_plot_intersection_event(
-        self, boundary_q_s: Boundary, boundary_q_r: Boundary, boundary_r_s: Boundary
-    ):
-        self._remove_boundaries_from_figure_traces(
-            boundary_q_r, boundary_r_s,
+        The outer half-edge of an unbounded cell is one that comes from the infinity.
+        Cells of collinear sites have two chains of half-edges.
+        """
+        chains: Dict[int, List[HalfEdge]] = dict()
+        for edge in self.edges:
+            for half_edge in edge.half_edges:
+                if half_edge.prev is None:
+                    chains.setdefault(id(half_edge.site), []).append(half_edge)
+        for chain_starts in chains.values():
+            starts, ends = [], []
+            for start in chain_starts:
+                end = start
+                visited = {id(start)}
+                while end.next is not None and id(end.next) not in visited:
+                    end = end.next
+                    visited.add(id(end))
+                # A chain that loops does not reach the infinity, it is left as it is.
+                if end.next is None:
+                    starts.append(start)
+                    ends.append(end)
+            for i in range(len(ends)):
+                ends[i].set_next(starts[(i + 1) % len(starts)])
+            if starts:
+                self._site_half_edges[id(starts[0].site)] = starts[0]
+        # The sweep ended, so no more edges are traced.
+        self._active_edges = dict()
+
+    def get_outer_half_edge(self, site: Site) -> Optional[HalfEdge]:
+        """Get the outer half-edge of the cell of the site, None if it is empty.
+
+        It is the one that comes from the infinity when the cell is not bounded.
+        """
+        return self._site_half_edges.get(id(site))
+
+    def get_cell_half_edges(self, site: Site) -> List[HalfEdge]:
+        """Get the half-edges of the cell of the site counterclockwise.
+
+        The cell is complete when the sweep ends.
+        """
+        half_edges = []
+        visited = set()
+        half_edge = self.get_outer_half_edge(site)
+        while half_edge is not None and id(half_edge) not in visited:
+            half_edges.append(half_edge)
+            visited.add(id(half_edge))
+            half_edge = half_edge.next
+        return half_edges
+
+    def get_cell_neighbors(self, site: Site) -> List[Site]:
+        """Get the sites whose cells share an edge with the cell of the site."""
+        return [half_edge.twin.site for half_edge in self.get_cell_half_edges(site)]
+
+    def get_cell_vertices(self, site: Site) -> List[Vertex]:
+        """Get the vertices of the cell of the site counterclockwise."""
+        return [
+            half_edge.origin
+            for half_edge in self.get_cell_half_edges(site)
+            if half_edge.origin is not None
+        ]
+
+    def get_cell_area(self, site: Site) -> Optional[Decimal]:
+        """Get area of the polygon of the vertices of the cell of the site.
+
+        It is the area of the cell in point diagrams. It is None when the cell is
+        not bounded.
+        """
+        half_edges = self.get_cell_half_edges(site)
+        if len(half_edges) == 0 or any(
+            half_edge.origin is None for half_edge in half_edges
+        ):
+            return None
+        return get_polygon_area([half_edge.origin.point for half_edge in half_edges])
+
+    def get_cell_polygons(
+        self,
+        xlim: Optional[Limit] = None,
+        ylim: Optional[Limit] = None,
+        samples: int = DEFAULT_SAMPLES,
+    ) -> List[List[Point]]:
+        """Get the cells of the sites clipped to a box as counterclockwise polygons.
+
+        The box defaults to the limits of the diagram. Edges of hyperbola have
+        samples points between their ends.
+        """
+        if len(self.sites) == 0:
+            return []
+        if xlim is None:
+            xlim = self._xlim
+        if ylim is None:
+            ylim = self._ylim
+        xlim = (to_numeric(xlim[0], self.numeric), to_numeric(xlim[1], self.numeric))
+        ylim = (to_numeric(ylim[0], self.numeric), to_numeric(ylim[1], self.numeric))
+        return get_cell_polygons(self, xlim, ylim, samples)
+
+    def get_point_locator(
+        self, xlim: Optional[Limit] = None, ylim: Optional[Limit] = None
+    ) -> PointLocator:
+        """Get index to locate the cells of many points in a box.
+
+        The box defaults to the limits of the diagram.
+        """
+        return PointLocator(self, xlim, ylim)
+
+    def insert_site(self, point: Point, name: Optional[str] = None) -> Site:
+        """Insert a site in the finished diagram repairing only the affected cells.
+
+        The new cell is traced through the cells it takes area from, and the edges
+        and vertices it covers are removed from their lists in constant time, so the
+        cost is proportional to the edges of the cells it takes area from plus the
+        walk to locate it. The first change also indexes the lists of the diagram.
+        Only point sites in general position are supported, so a site in the circle
+        of the sites of a vertex it would share is rejected.
+        """
+        if len(self.sites) == 0 or self.has_next_step():
+            raise ValueError("Sites can only be inserted in a finished diagram.")
+        if self.SITE_CLASS != Site:
+            raise ValueError("Only point sites can be inserted.")
+        self._index_lists()
+        if name is None:
+            name = str(len(self.sites) + 1)
+        p = Site(
+            to_numeric(point.x, self.numeric),
+            to_numeric(point.y, self.numeric),
+            name=name,
         )
-        self._update_boundaries_bisectors_figure_traces([boundary_q_r, boundary_r_s])
-        self._add_boundary_to_plot(boundary_q_s)
-        self._add_bisector_to_plot(boundary_q_s.bisector, boundary_q_s.sign)
-
-    def _add_boundaries_to_plot(self, boundaries: List[Boundary]):
-        """Add boundaries to plot."""
-        if self._plot_steps:
-            for boundary in boundaries:
-                self._add_boundary_to_plot(boundary)
-
-    def _add_boundary_to_plot(self, boundary: Boundary):
-        """Add boundary to plot."""
-        if self._plot_steps:
-            trace = get_plot_scatter_boundary(
-                boundary, self._xlim, self._ylim, self.BISECTOR_CLASS,
+        nearest_site = self._get_nearest_site(p.point)
+        if nearest_site.point == p.point:
+            raise ValueError(f"There is already a site in ({p.get_point_str()}).")
+
+        cells = self._trace_new_cell(p, nearest_site)
+        if self._is_cocircular_with_cells(p, cells):
+            raise ValueError(
+                f"The site ({p.get_point_str()}) is cocircular with the sites of a "
+                "vertex."
             )
-            self._traces.append(trace)
-            self._figure_traces += 1
-            # TODO: Change to use complete_string()
-            self._boundary_plot_dict[str(boundary)] = self._figure_traces - 1
-
-    def _add_bisector_to_plot(self, bisector: Bisector, sign: Optional[bool]):
-        """Add boundary to plot."""
-        if self._plot_steps:
-            if sign is None:
-                vd_bisector = self.get_edges([(bisector, True)])[0]
+        self._site_index.append(p)
+        self._repair_cells(p, cells)
+        return p
+
+    def _get_nearest_site(self, point: Point, site: Optional[Site] = None) -> Site:
+        """Get nearest site to the point walking through neighbor cells.
+
+        The walk starts in the site, which needs a cell, or in the last site.
+        """
+        if site is None:
+            site = self.sites[-1]
+        distance = site.get_weighted_distance(point.x, point.y)
+        is_nearest = False
+        while not is_nearest:
+            is_nearest = True
+            for neighbor in self.get_cell_neighbors(site):
+                neighbor_distance = neighbor.get_weighted_distance(point.x, point.y)
+                if neighbor_distance < distance:
+                    site, distance = neighbor, neighbor_distance
+                    is_nearest = False
+                    break
+        return site
+
+    def _get_bisector_crossings(
+        self, p: Site, site: Site
+    ) -> Tuple[Optional[HalfEdge], Optional[HalfEdge]]:
+        """Get half-edges where the bisector of p and site enters and exits the cell.
+
+        The bisector goes with p at its left. The cell is the intersection of the
+        half-planes given by its neighbors, so the bisector enters in the last one it
+        gets into and exits in the first one it leaves. None is the infinity.
+        """
+        middle_x = (p.point.x + site.point.x) / 2
+        middle_y = (p.point.y + site.point.y) / 2
+        dx = p.point.y - site.point.y
+        dy = site.point.x - p.point.x
+        t_in = t_out = None
+        half_edge_in = half_edge_out = None
+        for half_edge in self.get_cell_half_edges(site):
+            neighbor = half_edge.twin.site.point
+            nx = neighbor.x - site.point.x
+            ny = neighbor.y - site.point.y
+            direction = dx * nx + dy * ny
+            if direction == 0:
+                continue
+            t = (
+                neighbor.x ** 2
+                + neighbor.y ** 2
+                - site.point.x ** 2
+                - site.point.y ** 2
+                - 2 * (middle_x * nx + middle_y * ny)
+            ) / (2 * direction)
+            if direction > 0 and (t_out is None or t < t_out):
+                t_out, half_edge_out = t, half_edge
+            elif direction < 0 and (t_in is None or t > t_in):
+                t_in, half_edge_in = t, half_edge
+        return half_edge_in, half_edge_out
+
+    def _trace_new_cell(
+        self, p: Site, nearest_site: Site
+    ) -> List[Tuple[Site, Optional[HalfEdge]]]:
+        """Get cells that give area to the cell of p, counterclockwise around p.
+
+        Each cell has its half-edge where the new cell leaves it. It is None in the
+        last cell when the new cell is not bounded.
+        """
+        half_edge_in, half_edge_out = self._get_bisector_crossings(p, nearest_site)
+        cells = [(nearest_site, half_edge_out)]
+        if half_edge_in is None and half_edge_out is None:
+            return cells + self._get_strip_cells(p, nearest_site)
+        while half_edge_out is not None:
+            site = half_edge_out.twin.site
+            if site is nearest_site:
+                return cells
+            half_edge_out = self._get_bisector_crossings(p, site)[1]
+            cells.append((site, half_edge_out))
+            if len(cells) > len(self.sites):
+                raise RuntimeError("The cell of the new site could not be traced.")
+
+        # The new cell is not bounded, so it is traced back to the infinity too.
+        previous_cells = []
+        while half_edge_in is not None:
+            half_edge_out = half_edge_in.twin
+            previous_cells.append((half_edge_out.site, half_edge_out))
+            half_edge_in = self._get_bisector_crossings(p, half_edge_out.site)[0]
+            if len(previous_cells) + len(cells) > len(self.sites):
+                raise RuntimeError("The cell of the new site could not be traced.")
+        return previous_cells[::-1] + cells
+
+    def _is_cocircular_with_cells(
+        self, p: Site, cells: List[Tuple[Site, Optional[HalfEdge]]]
+    ) -> bool:
+        """Check if p is in the circle of the sites of a vertex of the cells.
+
+        The vertices of the cells p takes area from are the only ones that can be in
+        the boundary of the new cell, and they would be a vertex of 4 sites. The
+        circles are tested with the sites, so it is exact when the sites are.
+        """
+        for site, _ in cells:
+            for half_edge in self.get_cell_half_edges(site):
+                vertex = half_edge.origin
+                if vertex is None:
+                    continue
+                vertex_sites = {
+                    id(vertex_site): vertex_site.point
+                    for edge in vertex.edges
+                    for vertex_site in edge.bisector.sites
+                }
+                a, b, c = list(vertex_sites.values())[:3]
+                adx, ady = a.x - p.point.x, a.y - p.point.y
+                bdx, bdy = b.x - p.point.x, b.y - p.point.y
+                cdx, cdy = c.x - p.point.x, c.y - p.point.y
+                in_circle = (
+                    (adx ** 2 + ady ** 2) * (bdx * cdy - cdx * bdy)
+                    - (bdx ** 2 + bdy ** 2) * (adx * cdy - cdx * ady)
+                    + (cdx ** 2 + cdy ** 2) * (adx * bdy - bdx * ady)
+                )
+                if in_circle == 0:
+                    return True
+        return False
+
+    def _get_strip_cells(
+        self, p: Site, site: Site
+    ) -> List[Tuple[Site, Optional[HalfEdge]]]:
+        """Get the other cell when the cell of p is a strip between parallel lines.
+
+        It happens when p is between two neighbor sites and all of them are in a line.
+        """
+        for neighbor in self.get_cell_neighbors(site):
+            nx = neighbor.point.x - site.point.x
+            ny = neighbor.point.y - site.point.y
+            px = p.point.x - site.point.x
+            py = p.point.y - site.point.y
+            if px * ny - py * nx == 0 and px * nx + py * ny > 0:
+                return [(neighbor, None)]
+        return []
+
+    def _get_removed_half_edges(
+        self,
+        site: Site,
+        half_edge_in: Optional[HalfEdge],
+        half_edge_out: Optional[HalfEdge],
+        strip_site: Optional[Site] = None,
+    ) -> Tuple[List[HalfEdge], Optional[HalfEdge], Optional[HalfEdge]]:
+        """Get half-edges of the cell between where the new cell leaves and enters it.
+
+        Also get the half-edges that will be before and after the new half-edge.
+        """
+        removed = []
+        if half_edge_out is not None and half_edge_in is not None:
+            half_edge = half_edge_out.next
+            while half_edge is not half_edge_in:
+                removed.append(half_edge)
+                half_edge = half_edge.next
+            return removed, half_edge_out, half_edge_in
+        if half_edge_out is not None:
+            half_edge = half_edge_out
+            while half_edge.twin.origin is not None:
+                half_edge = half_edge.next
+                removed.append(half_edge)
+            return removed, half_edge_out, half_edge.next
+        if half_edge_in is not None:
+            half_edge = half_edge_in
+            while half_edge.origin is not None:
+                half_edge = half_edge.prev
+                removed.append(half_edge)
+            return removed, half_edge.prev, half_edge_in
+        # The new cell only shares one edge with this cell, the edge with the site in
+        # the other side of the new cell is removed when the new cell is a strip.
+        half_edge = self.get_outer_half_edge(site)
+        if half_edge is None:
+            return removed, None, None
+        for cell_half_edge in self.get_cell_half_edges(site):
+            if cell_half_edge.twin.site is strip_site:
+                removed.append(cell_half_edge)
+                if cell_half_edge.next is cell_half_edge:
+                    return removed, None, None
+                return removed, cell_half_edge.prev, cell_half_edge.next
+        while half_edge.twin.origin is not None:
+            half_edge = half_edge.next
+        return removed, half_edge, half_edge.next
+
+    def _repair_cells(
+        self, p: Site, cells: List[Tuple[Site, Optional[HalfEdge]]]
+    ) -> None:
+        """Replace the parts of the cells closer to p by the cell of p."""
+        n_cells = len(cells)
+        entries = [
+            None if cells[k - 1][1] is None else cells[k - 1][1].twin
+            for k in range(n_cells)
+        ]
+        is_strip = n_cells == 2 and entries == [None, None]
+
+        # Half-edges and vertices closer to p.
+        removed_half_edges: List[HalfEdge] = []
+        removed_vertices: Dict[int, Vertex] = dict()
+        links = []
+        for k, ((site, half_edge_out), half_edge_in) in enumerate(zip(cells, entries)):
+            strip_site = cells[1 - k][0] if is_strip else None
+            removed, previous_half_edge, next_half_edge = self._get_removed_half_edges(
+                site, half_edge_in, half_edge_out, strip_site
+            )
+            links.append((previous_half_edge, next_half_edge))
+            removed_half_edges += removed
+            if half_edge_out is not None and half_edge_out.twin.origin is not None:
+                destination = half_edge_out.twin.origin
+                removed_vertices[id(destination)] = destination
+            for half_edge in removed:
+                if half_edge.origin is not None:
+                    removed_vertices[id(half_edge.origin)] = half_edge.origin
+        self._remove_edges_and_vertices(removed_half_edges, removed_vertices)
+
+        # New edges between p and each cell.
+        new_edges = []
+        for site, _ in cells:
+            self.add_edge(self._create_bisector(p, site))
+            new_edges.append(self.edges[-1])
+
+        # New vertices where the new cell leaves each cell.
+        for k in range(n_cells):
+            site, half_edge_out = cells[k]
+            if half_edge_out is None:
+                continue
+            edge, next_edge = new_edges[k], new_edges[(k + 1) % n_cells]
+            point = edge.bisector.get_intersections(next_edge.bisector)[0]
+            vertex = Vertex(point)
+            self._add_vertex_to_lists(vertex)
+
+            old_edge = half_edge_out.edge
+            half_edge_out.twin.origin = vertex
+            edge.get_half_edge(site).origin = vertex
+            next_edge.get_half_edge(p).origin = vertex
+            for vertex_edge in (old_edge, edge, next_edge):
+                vertex.add_edge(vertex_edge)
+            old_edge.set_ranges_from_half_edges()
+
+        # The half-edges of p go from one cell to the next one.
+        for k in range(n_cells):
+            site = cells[k][0]
+            half_edge = new_edges[k].get_half_edge(site)
+            previous_half_edge, next_half_edge = links[k]
+            if previous_half_edge is None:
+                half_edge.set_next(half_edge)
             else:
-                vd_bisector = self.get_edges([(bisector, sign)])[0]
-            traces = plot_edge(vd_bisector, self._xlim, self._ylim, self.BISECTOR_CLASS)
-            self._traces += traces
-            traces_numbers = list(
-                range(self._figure_traces, self._figure_traces + len(traces))
+                previous_half_edge.set_next(half_edge)
+                half_edge.set_next(next_half_edge)
+            new_edges[k].get_half_edge(p).set_next(
+                new_edges[(k + 1) % n_cells].get_half_edge(p)
             )
-            if sign is None:
-                self._bisector_plot_dict[
-                    (str(bisector.get_object_to_hash()), True)
-                ] = traces_numbers
-                self._bisector_plot_dict[
-                    (str(bisector.get_object_to_hash()), False)
-                ] = traces_numbers
+            new_edges[k].set_ranges_from_half_edges()
+            self._set_outer_half_edge(site, half_edge)
+        self._set_outer_half_edge(p, new_edges[0].get_half_edge(p))
+
+    def _remove_edges_and_vertices(
+        self, half_edges: List[HalfEdge], vertices: Dict[int, Vertex]
+    ) -> None:
+        """Remove edges of the half-edges and the vertices from the diagram."""
+        edges = {id(half_edge.edge): half_edge.edge for half_edge in half_edges}
+        for edge in edges.values():
+            self._remove_edge_from_lists(edge)
+        for vertex in vertices.values():
+            self._remove_vertex_from_lists(vertex)
+
+    def _index_lists(self) -> None:
+        """Index the lists of the diagram and the sites with empty cells."""
+        if self._site_index is not None:
+            return
+        self._site_index = ListIndex([self.sites], id)
+        self._edge_index = ListIndex([self.edges], id)
+        self._bisector_index = ListIndex([self.bisectors_list], id)
+        self._vertex_index = ListIndex([self.vertices, self.vertices_list], id)
+        self._hidden_sites = dict()
+        self._hidden_site_owners = dict()
+        self._update_hidden_sites(
+            [site for site in self.sites if id(site) not in self._site_half_edges]
+        )
+
+    def _add_edge_to_lists(self, edge: Edge) -> None:
+        """Add edge to the lists of the diagram, and its bisector if it is new."""
+        if edge.bisector not in self._bisectors:
+            self._bisectors[edge.bisector] = edge.bisector
+            if self._bisector_index is None:
+                self.bisectors_list.append(edge.bisector)
             else:
-                self._bisector_plot_dict[
-                    (str(bisector.get_object_to_hash()), sign)
-                ] = traces_numbers
-            self._figure_traces += len(traces)
+                self._bisector_index.append(edge.bisector)
+        if self._edge_index is None:
+            self.edges.append(edge)
+        else:
+            self._edge_index.append(edge)
 
-    def _update_boundaries_bisectors_figure_traces(
-        self, boundaries: List[Optional[Boundary]]
-    ):
-        """Update boundaries bisectors' figure traces."""
-        for boundary in boundaries:
-            if boundary is None:
+    def _add_vertex_to_lists(self, vertex: Vertex) -> None:
+        """Add vertex to the lists of the diagram."""
+        self._vertices[vertex.point] = vertex
+        if self._vertex_index is None:
+            self.vertices.append(vertex)
+            self.vertices_list.append(vertex.point)
+        else:
+            self._vertex_index.append(vertex, vertex.point)
+
+    def _remove_vertex_from_lists(self, vertex: Vertex) -> None:
+        """Remove vertex from the indexed lists of the diagram."""
+        self._vertex_index.remove(id(vertex))
+        if self._vertices.get(vertex.point) is vertex:
+            del self._vertices[vertex.point]
+
+    def _remove_edge_from_lists(self, edge: Edge) -> None:
+        """Remove edge and its bisector from the indexed lists of the diagram.
+
+        The bisector is only removed if it is the one saved with its sites.
+        """
+        self._edge_index.remove(id(edge))
+        self._remove_bisector_from_lists(edge.bisector)
+
+    def _remove_bisector_from_lists(self, bisector: Bisector) -> None:
+        """Remove bisector from the indexed lists if it is the one of its sites."""
+        if self._bisectors.get(bisector) is bisector:
+            del self._bisectors[bisector]
+            self._bisector_index.remove(id(bisector))
+
+    def _get_visible_site(self) -> Site:
+        """Get a site with a cell."""
+        for half_edge in self._site_half_edges.values():
+            return half_edge.site
+        # There are no edges, so one site has the whole plane.
+        x, y = self.sites[0].point.x, self.sites[0].point.y
+        return min(self.sites, key=lambda site: site.get_weighted_distance(x, y))
+
+    def _update_hidden_sites(
+        self, sites: Iterable[Site], start_site: Optional[Site] = None
+    ) -> None:
+        """Update the sites whose cells have the points of the sites with empty cells.
+
+        They are located walking through the cells from the start site, which needs
+        a cell.
+        """
+        for site in sites:
+            self._remove_hidden_site(site)
+            if id(site) in self._site_half_edges:
+                continue
+            if start_site is None:
+                start_site = self._get_visible_site()
+            owner_site = self._get_nearest_site(site.point, start_site)
+            if owner_site is site:
                 continue
-            self._update_bisector_figure_traces(boundary.bisector, boundary.sign)
+            self._hidden_site_owners[id(site)] = owner_site
+            self._hidden_sites.setdefault(id(owner_site), dict())[id(site)] = site
 
-    def _update_bisector_figure_traces(self, bisector: Bisector, sign: bool):
-        """Update bisector's figure traces."""
-        bisector_traces = self._bisector_plot_dict[
-            (str(bisector.get_object_to_hash()), sign)
-        ]
-        bisector_other_sign_traces = self._bisector_plot_dict.get(
-            (str(bisector.get_object_to_hash()), not sign), []
-        )
-        if bisector_traces == bisector_other_sign_traces:
-            sign = None
-        for bisector_trace_i in bisector_traces:
-            self._traces[bisector_trace_i] = None
-        self._add_bisector_to_plot(bisector, sign)
-
-    def _add_vertex_trace(self, vertex: Vertex):
-        """Add vertex to vd trace."""
-        trace = plot_vertex(vertex)
-        self._traces.append(trace)
-        self._figure_traces += 1
-
-    def _remove_boundaries_from_figure_traces(
-        self, boundary1: Optional[Boundary], boundary2: Optional[Boundary]
-    ):
-        """Remove boundary from figure traces."""
-        if boundary1 is None and boundary2 is None:
+    def _remove_hidden_site(self, site: Site) -> None:
+        """Remove site from the sites with empty cells if it is there."""
+        owner_site = self._hidden_site_owners.pop(id(site), None)
+        if owner_site is None:
             return
-        if boundary1 is None:
-            self._remove_boundary_from_figure_traces(boundary2)
-        elif boundary2 is None:
-            self._remove_boundary_from_figure_traces(boundary1)
-        else:
-            position1 = self._boundary_plot_dict[str(boundary1)]
-            position2 = self._boundary_plot_dict[str(boundary2)]
-            if position1 > position2:
-                self._remove_boundary_from_figure_traces(boundary1)
-                self._remove_boundary_from_figure_traces(boundary2)
+        owned_sites = self._hidden_sites[id(owner_site)]
+        del owned_sites[id(site)]
+        if not owned_sites:
+            del self._hidden_sites[id(owner_site)]
+
+    def _get_hidden_sites(self, *site_groups: Dict[int, Site]) -> List[Site]:
+        """Get the sites with empty cells in the cells of the sites."""
+        hidden_sites = []
+        for sites in site_groups:
+            for site_id in sites:
+                hidden_sites += self._hidden_sites.get(site_id, dict()).values()
+        return hidden_sites
+
+    def _set_outer_half_edge(self, site: Site, half_edge: HalfEdge) -> None:
+        """Set outer half-edge of the cell with one of its half-edges.
+
+        It is the one that comes from the infinity when the cell is not bounded.
+        """
+        self._site_half_edges[id(site)] = half_edge
+        for cell_half_edge in self.get_cell_half_edges(site):
+            if cell_half_edge.origin is None:
+                self._site_half_edges[id(site)] = cell_half_edge
+                return
+
+    def remove_site(self, site: Site) -> None:
+        """Remove a site from the finished diagram recomputing only the cells near.
+
+        The last site of the sites takes the position of the removed one.
+        """
+        self.remove_sites([site])
+
+    def remove_sites(self, sites: Iterable[Site]) -> None:
+        """Remove many sites from the finished diagram recomputing the cells once.
+
+        The cells near each site are recomputed together with the cells of the other
+        sites near it, and all the cells are recomputed at most once.
+        """
+        sites = list(sites)
+        self._check_sites_to_update(sites)
+        self._update_cells(sites, removed_sites={id(site) for site in sites})
+
+    def update_weight(self, site: WeightedSite, weight: Decimal) -> None:
+        """Change the weight of a site recomputing only the cells that change."""
+        self.update_weights([(site, weight)])
+
+    def update_weights(self, changes: Iterable[Tuple[WeightedSite, Decimal]]) -> None:
+        """Change the weights of many sites recomputing the cells that change once.
+
+        The cells near each site are recomputed together with the cells of the other
+        sites near it, and all the cells are recomputed at most once.
+        """
+        if self.SITE_CLASS != WeightedSite:
+            raise ValueError("Only weighted sites have weights to update.")
+        changes = list(changes)
+        sites = [site for site, _ in changes]
+        self._check_sites_to_update(sites)
+        for site, weight in changes:
+            site.weight = to_numeric(weight, self.numeric)
+        self._update_cells(sites)
+
+    def _check_sites_to_update(self, sites: List[Site]) -> None:
+        """Check the sites can be changed in this diagram."""
+        if len(self.sites) == 0 or self.has_next_step():
+            raise ValueError("Sites can only be changed in a finished diagram.")
+        self._index_lists()
+        for site in sites:
+            if id(site) not in self._site_index:
+                raise ValueError(f"{site} is not a site of the diagram.")
+
+    def _update_cells(
+        self, sites: List[Site], removed_sites: Optional[Set[int]] = None
+    ) -> None:
+        """Replace the cells near the changed sites by the ones of local diagrams.
+
+        The sites near each other are changed together. The local diagram has the
+        changed cells and the cells around them. The changed cells start as the cells
+        of the sites and their neighbors, and grow while the cells around them do not
+        match the ones in the local diagram. When the local diagrams of the changes
+        have more sites than MAX_LOCAL_SITES_RATIO of the sites, the cells of all the
+        sites left are calculated in one diagram.
+        Sites with empty cells inside the changed cells are changed too, as they can
+        appear in weighted diagrams. Only the ones in the changed cells and the cells
+        around them are checked.
+        """
+        if removed_sites is None:
+            removed_sites = set()
+        pending_sites = {id(site): site for site in sites}
+        max_local_sites = MAX_LOCAL_SITES_RATIO * len(self.sites)
+        while pending_sites:
+            site = next(iter(pending_sites.values()))
+            if (
+                id(site) in removed_sites
+                and id(site) not in self._site_half_edges
+                and len(self.edges) > 0
+            ):
+                # The site had an empty cell, so no cell changes.
+                self._remove_hidden_site(site)
+                self._site_index.remove(id(site))
+                del pending_sites[id(site)]
+                continue
+            if max_local_sites < 0:
+                changed_sites = self._get_all_sites()
             else:
-                self._remove_boundary_from_figure_traces(boundary2)
-                self._remove_boundary_from_figure_traces(boundary1)
+                changed_sites = self._get_changed_sites(site)
+            max_local_sites -= self._update_changed_cells(
+                changed_sites, pending_sites, removed_sites, max_local_sites
+            )
 
-    def _remove_boundary_from_figure_traces(self, boundary: Optional[Boundary]):
-        """Remove boundary from figure traces."""
-        if boundary is None:
-            return
-        self._traces[self._boundary_plot_dict[str(boundary)]] = None
+    def _get_all_sites(self) -> Dict[int, Site]:
+        """Get the sites of the diagram by their ids."""
+        return {id(site): site for site in self.sites}
+
+    def _get_changed_sites(self, site: Site) -> Dict[int, Site]:
+        """Get the sites whose cells can change when the site changes."""
+        if len(self.edges) == 0:
+            # Only one cell has the whole plane, so every cell can change.
+            return self._get_all_sites()
+        if id(site) not in self._site_half_edges:
+            # The site had an empty cell, so it starts in the cell that has its point.
+            owner_site = self._hidden_site_owners[id(site)]
+            return {id(site): site, id(owner_site): owner_site}
+        changed_sites = {id(site): site}
+        for neighbor in self.get_cell_neighbors(site):
+            changed_sites[id(neighbor)] = neighbor
+        return changed_sites
+
+    def _update_changed_cells(
+        self,
+        changed_sites: Dict[int, Site],
+        pending_sites: Dict[int, Site],
+        removed_sites: Set[int],
+        max_local_sites: float,
+    ) -> int:
+        """Replace the changed cells by the ones of a local diagram.
+
+        The changed sites grow until the cells around them are kept, and the sites
+        still to change that are found near them are changed with them. When the
+        local diagrams have more than max_local_sites, all the cells are changed.
+        Return the sites in all the local diagrams calculated.
+        """
+        n_local_sites = 0
+        expanded_sites: Set[int] = set()
+        while True:
+            ring_sites = dict()
+            for changed_site in changed_sites.values():
+                for neighbor in self.get_cell_neighbors(changed_site):
+                    if id(neighbor) not in changed_sites:
+                        ring_sites[id(neighbor)] = neighbor
+            for hidden_site in self._get_hidden_sites(changed_sites, ring_sites):
+                if id(hidden_site) in pending_sites or self._is_in_changed_cells(
+                    hidden_site, changed_sites, ring_sites
+                ):
+                    changed_sites[id(hidden_site)] = hidden_site
+            # The sites near that also change are changed with these ones.
+            n_changed_sites = len(changed_sites)
+            for site_id in list(changed_sites) + list(ring_sites):
+                if site_id in pending_sites and site_id not in expanded_sites:
+                    expanded_sites.add(site_id)
+                    changed_sites.update(
+                        self._get_changed_sites(pending_sites[site_id])
+                    )
+            if len(changed_sites) > n_changed_sites:
+                continue
+
+            local_sites = [
+                local_site
+                for local_site in list(changed_sites.values())
+                + list(ring_sites.values())
+                if id(local_site) not in removed_sites
+            ]
+            local_diagram, outer_half_edges = self._get_local_diagram(local_sites)
+            n_local_sites += len(local_sites)
+            ring_half_edges = self._get_ring_half_edges(local_diagram, changed_sites)
+            mismatched_sites = {
+                site_id: ring_site
+                for site_id, ring_site in ring_sites.items()
+                if not self._is_cell_kept(
+                    ring_site, changed_sites, ring_half_edges.get(site_id, [])
+                )
+            }
+            if not mismatched_sites:
+                break
+            changed_sites.update(mismatched_sites)
+            if n_local_sites > max_local_sites:
+                changed_sites = self._get_all_sites()
+
+        # The sites with empty cells in the changed cells can be in other cells now.
+        moved_sites = [
+            moved_site
+            for moved_site in self._get_hidden_sites(changed_sites)
+            + list(changed_sites.values())
+            if id(moved_site) not in removed_sites
+        ]
+        changed_removed_sites = [
+            changed_site
+            for site_id, changed_site in changed_sites.items()
+            if site_id in removed_sites
+        ]
+        for removed_site in changed_removed_sites:
+            self._site_index.remove(id(removed_site))
+        self._replace_cells(
+            local_diagram, changed_sites, ring_sites, outer_half_edges, ring_half_edges
+        )
+        for removed_site in changed_removed_sites:
+            self._site_half_edges.pop(id(removed_site), None)
+            self._remove_hidden_site(removed_site)
+        for site_id in changed_sites:
+            pending_sites.pop(site_id, None)
+        self._update_hidden_sites(moved_sites, next(iter(ring_sites.values()), None))
+        return n_local_sites
+
+    def _is_in_changed_cells(
+        self, site: Site, changed_sites: Dict[int, Site], ring_sites: Dict[int, Site]
+    ) -> bool:
+        """Check if the point of the site is nearer to a changed site."""
+        x, y = site.point.x, site.point.y
+        nearest_site = min(
+            list(changed_sites.values()) + list(ring_sites.values()),
+            key=lambda near_site: near_site.get_weighted_distance(x, y),
+        )
+        return id(nearest_site) in changed_sites
+
+    def _get_local_diagram(
+        self, sites: List[Site]
+    ) -> Tuple["FortunesAlgorithm", Dict[int, Optional[HalfEdge]]]:
+        """Calculate diagram of some of the sites.
+
+        Also get the outer half-edges of the sites in the local diagram.
+        """
+        local_diagram = FortunesAlgorithm(
+            sites,
+            xlim=self._xlim,
+            ylim=self._ylim,
+            numeric=self.numeric,
+            queue=self.queue,
+            profile=self.profile,
+        )
+        return local_diagram, local_diagram._site_half_edges
+
+    def _get_ring_half_edges(
+        self, local_diagram: "FortunesAlgorithm", changed_sites: Dict[int, Site]
+    ) -> Dict[int, List[HalfEdge]]:
+        """Get half-edges in the local diagram of the sites not changed.
+
+        Only the half-edges shared with changed cells are taken.
+        """
+        ring_half_edges: Dict[int, List[HalfEdge]] = dict()
+        for edge in local_diagram.edges:
+            for half_edge in edge.half_edges:
+                if (
+                    id(half_edge.site) not in changed_sites
+                    and id(half_edge.twin.site) in changed_sites
+                ):
+                    ring_half_edges.setdefault(id(half_edge.site), []).append(half_edge)
+        return ring_half_edges
+
+    def _get_vertex_key(self, vertex: Optional[Vertex]) -> Optional[FrozenSet[int]]:
+        """Get the sites of a vertex to compare vertices of different diagrams."""
+        if vertex is None:
+            return None
+        return frozenset(
+            id(half_edge.site) for edge in vertex.edges for half_edge in edge.half_edges
+        )
+
+    def _get_half_edge_key(self, half_edge: HalfEdge) -> HalfEdgeKey:
+        """Get the twin site and the vertices of a half-edge to compare it."""
+        return (
+            id(half_edge.twin.site),
+            self._get_vertex_key(half_edge.origin),
+            self._get_vertex_key(half_edge.get_destination()),
+        )
+
+    def _is_cell_kept(
+        self,
+        site: Site,
+        changed_sites: Dict[int, Site],
+        local_half_edges: List[HalfEdge],
+    ) -> bool:
+        """Check if the cell has the same edges with the changed cells locally."""
+        old_half_edges = [
+            half_edge
+            for half_edge in self.get_cell_half_edges(site)
+            if id(half_edge.twin.site) in changed_sites
+        ]
+        old_keys = Counter(map(self._get_half_edge_key, old_half_edges))
+        return old_keys == Counter(map(self._get_half_edge_key, local_half_edges))
+
+    def _replace_cells(
+        self,
+        local_diagram: "FortunesAlgorithm",
+        changed_sites: Dict[int, Site],
+        ring_sites: Dict[int, Site],
+        outer_half_edges: Dict[int, Optional[HalfEdge]],
+        ring_half_edges: Dict[int, List[HalfEdge]],
+    ) -> None:
+        """Replace the changed cells by their cells in the local diagram.
+
+        The cells around keep their vertices, so the local half-edges shared with
+        them get the old vertices.
+        """
+        # Cells around with their half-edges shared with changed cells replaced.
+        vertices: Dict[int, Vertex] = dict()
+        ring_cells = []
+        for site_id, site in ring_sites.items():
+            replacements = {
+                self._get_half_edge_key(half_edge): half_edge
+                for half_edge in ring_half_edges.get(site_id, [])
+            }
+            half_edges = []
+            for half_edge in self.get_cell_half_edges(site):
+                if id(half_edge.twin.site) in changed_sites:
+                    local_half_edge = replacements[self._get_half_edge_key(half_edge)]
+                    if local_half_edge.origin is not None:
+                        vertices[id(local_half_edge.origin)] = half_edge.origin
+                    destination = local_half_edge.get_destination()
+                    if destination is not None:
+                        vertices[id(destination)] = half_edge.get_destination()
+                    half_edge = local_half_edge
+                half_edges.append(half_edge)
+            ring_cells.append((site, half_edges))
+
+        # Old edges and vertices of the changed cells.
+        removed_edges: Dict[int, Edge] = dict()
+        removed_vertices: Dict[int, Vertex] = dict()
+        kept_vertex_ids = {id(vertex) for vertex in vertices.values()}
+        for site in changed_sites.values():
+            for half_edge in self.get_cell_half_edges(site):
+                removed_edges[id(half_edge.edge)] = half_edge.edge
+                vertex = half_edge.origin
+                if vertex is not None and id(vertex) not in kept_vertex_ids:
+                    removed_vertices[id(vertex)] = vertex
+
+        # New edges and vertices of the changed cells.
+        new_edges = [
+            edge
+            for edge in local_diagram.edges
+            if any(id(half_edge.site) in changed_sites for half_edge in edge.half_edges)
+        ]
+        new_edge_ids = {id(edge) for edge in new_edges}
+        new_vertices: Dict[int, Vertex] = dict()
+        for edge in new_edges:
+            for vertex in edge.vertices:
+                if id(vertex) not in vertices:
+                    vertices[id(vertex)] = vertex
+                    new_vertices[id(vertex)] = vertex
+        for vertex in new_vertices.values():
+            vertex.edges = tuple(
+                edge for edge in vertex.edges if id(edge) in new_edge_ids
+            )
+        for vertex in vertices.values():
+            if id(vertex) not in new_vertices:
+                vertex.edges = tuple(
+                    edge for edge in vertex.edges if id(edge) not in removed_edges
+                )
+        for edge in new_edges:
+            for half_edge in edge.half_edges:
+                if half_edge.origin is not None:
+                    half_edge.origin = vertices[id(half_edge.origin)]
+            for vertex in edge.vertices:
+                if id(vertex) not in new_vertices:
+                    vertex.add_edge(edge)
+
+        # Links of the cells.
+        for site, half_edges in ring_cells:
+            for i in range(len(half_edges)):
+                half_edges[i - 1].set_next(half_edges[i])
+            self._set_outer_half_edge(site, half_edges[0])
+        for site_id, site in changed_sites.items():
+            half_edge = outer_half_edges.get(site_id)
+            if half_edge is None:
+                self._site_half_edges.pop(site_id, None)
+            else:
+                self._set_outer_half_edge(site, half_edge)
+
+        # Lists of the diagram.
+        for edge in removed_edges.values():
+            self._remove_edge_from_lists(edge)
+        for vertex in removed_vertices.values():
+            self._remove_vertex_from_lists(vertex)
+        for edge in new_edges:
+            self._add_edge_to_lists(edge)
+        for vertex in new_vertices.values():
+            self._add_vertex_to_lists(vertex)
+
+    def to_arrays(self, exact: bool = False) -> DiagramArrays:
+        """Get the diagram as NumPy arrays.
+
+        Sites and vertices are referenced by their position in sites and vertices.
+        With exact the vertex coordinates are also given as strings of the numbers
+        used in the sweep.
+        """
+        site_indices = {id(site): i for i, site in enumerate(self.sites)}
+        vertex_indices = {id(vertex): i for i, vertex in enumerate(self.vertices)}
+        points = [vertex.point for vertex in self.vertices]
+        vertices = np.array(
+            [(float(point.x), float(point.y)) for point in points], dtype=float
+        ).reshape(-1, 2)
+        exact_vertices = None
+        if exact:
+            exact_vertices = np.array(
+                [(str(point.x), str(point.y)) for point in points], dtype=str
+            ).reshape(-1, 2)
+
+        edges = np.full((len(self.edges), 4), NO_VERTEX, dtype=np.int32)
+        for i, edge in enumerate(self.edges):
+            site_a, site_b = edge.bisector.sites
+            edges[i, 0] = site_indices[id(site_a)]
+            edges[i, 1] = site_indices[id(site_b)]
+            for j, vertex in enumerate(edge.vertices):
+                edges[i, 2 + j] = vertex_indices[id(vertex)]
+        return DiagramArrays(vertices, edges, len(self.sites), exact_vertices)
 
     def get_xml(self) -> str:
         """Get xml representation."""
-        all_xml = self.get_base_xml() + "\n"
+        return "".join(self.iter_xml())
+
+    def iter_xml(self) -> Iterator[str]:
+        """Get xml representation in parts, one for each site, edge and vertex."""
+        yield self.get_base_xml() + "\n"
         for site in self.sites:
-            all_xml += site.get_xml()
+            yield site.get_xml()
         for i in range(len(self.edges)):
-            all_xml += self.edges[i].get_xml(i, self._ylim)
+            yield self.edges[i].get_xml(i, self._ylim)
         for i in range(len(self.vertices)):
-            all_xml += self.vertices[i].get_xml(i)
-        all_xml += """\n
+            yield self.vertices[i].get_xml(i)
+        yield """\n
         </construction>
         </geogebra>
         """
-        return all_xml
 
     def get_base_xml(self) -> str:
         """Get base xml."""
@@ -15,3 +15,6 @@ from .edges import (
     WeightedPointBisectorEdge,
 )
 from .vertices import Vertex
+from .half_edges import HalfEdge
+from .counters import CacheCounter
+from .arrays import DiagramArrays, NO_VERTEX
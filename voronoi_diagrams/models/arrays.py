@@ -0,0 +1,89 @@
+"""Arrays representation of the Voronoi Diagram."""
+
+# Standard Library
+from typing import Optional
+
+# Math
+import numpy as np
+
+# Value used in the edges table when the edge goes to the infinity.
+NO_VERTEX = -1
+
+
+class DiagramArrays:
+    """Voronoi Diagram as NumPy arrays.
+
+    vertices has one (x, y) row per vertex and exact_vertices, when given, has the
+    same coordinates as strings of the numbers used in the sweep.
+    edges has one (site_a, site_b, v0, v1) row per edge, where site_a and site_b
+    are indices of the sites and v0 and v1 are indices of vertices. Edges that go
+    to the infinity have NO_VERTEX instead of a vertex index.
+    The cells adjacency is in CSR form: the neighbors of the site i are
+    cell_neighbors[cell_offsets[i]:cell_offsets[i + 1]] and cell_edges has the
+    edges shared with them in the same positions.
+    index is the position of the site set when the diagram is computed in a batch.
+    """
+
+    __slots__ = (
+        "vertices",
+        "edges",
+        "cell_offsets",
+        "cell_neighbors",
+        "cell_edges",
+        "exact_vertices",
+        "index",
+    )
+
+    vertices: np.ndarray
+    edges: np.ndarray
+    cell_offsets: np.ndarray
+    cell_neighbors: np.ndarray
+    cell_edges: np.ndarray
+    exact_vertices: Optional[np.ndarray]
+    index: int
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        edges: np.ndarray,
+        n_sites: int,
+        exact_vertices: Optional[np.ndarray] = None,
+        index: int = 0,
+    ) -> None:
+        """Construct arrays and the cells adjacency of the edges."""
+        self.vertices = vertices
+        self.edges = edges
+        self.exact_vertices = exact_vertices
+        self.index = index
+
+        sites = np.concatenate([edges[:, 0], edges[:, 1]])
+        order = np.argsort(sites, kind="stable")
+        self.cell_neighbors = np.concatenate([edges[:, 1], edges[:, 0]])[order]
+        self.cell_edges = np.tile(np.arange(len(edges), dtype=np.int32), 2)[order]
+        self.cell_offsets = np.zeros(n_sites + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sites, minlength=n_sites), out=self.cell_offsets[1:])
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return (
+            f"DiagramArrays({self.index}, {len(self.vertices)} vertices, "
+            f"{len(self.edges)} edges)"
+        )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return self.__str__()
+
+    def get_n_sites(self) -> int:
+        """Get number of sites."""
+        return len(self.cell_offsets) - 1
+
+    def get_cell_neighbors(self, site: int) -> np.ndarray:
+        """Get indices of the sites adjacent to the cell of the site."""
+        start, end = self.cell_offsets[site], self.cell_offsets[site + 1]
+        return self.cell_neighbors[start:end]
+
+    def get_cell_edges(self, site: int) -> np.ndarray:
+        """Get indices of the edges of the cell of the site."""
+        start, end = self.cell_offsets[site], self.cell_offsets[site + 1]
+        return self.cell_edges[start:end]
@@ -1,27 +1,38 @@
 """Bisector representation."""
 
 # Standard Library
-from typing import Tuple, Optional, Any, List
+from typing import Tuple, Optional, Any, List, Dict
 from abc import ABC, abstractmethod
 
 # Models
 from .events import Site, WeightedSite, Coordinates
 from .points import Point
+from .counters import CacheCounter
 
 # Conic Sections
 from conic_sections.models import ConicSection
 
 # Math
 from decimal import Decimal
+import numpy as np
 
 # Utils
-from general_utils.numbers import are_close
+from general_utils.numbers import (
+    are_close,
+    to_number_like,
+    to_float_array,
+    sort_rows,
+    FLOAT_RELATIVE_ERROR,
+)
 
 
 class Bisector(ABC):
     """Bisector representation."""
 
+    __slots__ = ("sites", "_decimal_bisector")
+
     sites: Tuple[Site, Site]
+    _decimal_bisector: Optional["Bisector"]
 
     def __init__(self, sites: Tuple[Site, Site]) -> None:
         """Construct bisector."""
@@ -31,11 +42,36 @@ class Bisector(ABC):
         ):
             sites = (sites[1], sites[0])
         self.sites = sites
+        self._decimal_bisector = None
 
     def __eq__(self, bisector: "Bisector") -> bool:
         """Equality between bisectors."""
         return self.sites == bisector.sites
 
+    def __hash__(self) -> int:
+        """Get hash of the bisector, the same of the bisectors equal to it."""
+        return hash((self.sites[0].point, self.sites[1].point))
+
+    def get_decimal_bisector(self) -> "Bisector":
+        """Get this bisector defined by the Decimal version of its sites.
+
+        The Decimal bisector is created once and then reused.
+        """
+        if self._decimal_bisector is None:
+            decimal_sites = (
+                self.sites[0].get_decimal_site(),
+                self.sites[1].get_decimal_site(),
+            )
+            if decimal_sites[0] is self.sites[0] and decimal_sites[1] is self.sites[1]:
+                self._decimal_bisector = self
+            else:
+                self._decimal_bisector = type(self)(sites=decimal_sites)
+        return self._decimal_bisector
+
+    def free_cached_quantities(self) -> None:
+        """Free the quantities that are computed again when they are needed."""
+        self._decimal_bisector = None
+
     @abstractmethod
     def formula_x(self, y: Decimal) -> List[Decimal]:
         """Get x coordinate given a y coordinate."""
@@ -46,6 +82,20 @@ class Bisector(ABC):
         """Get y coordinate given a x coordinate."""
         raise NotImplementedError
 
+    @abstractmethod
+    def formula_y_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Get y coordinates given many x coordinates in one vectorized pass.
+
+        Each row has one of the y coordinates of formula_y, sorted from the highest to
+        the lowest. The missing values are masked.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_y_error_bound(self, x: float, y: float) -> float:
+        """Get a bound of the error of the y in x given by float formula_y."""
+        raise NotImplementedError
+
     def __str__(self) -> str:
         """Get bisector string representation."""
         return f"B({self.sites[0]}, {self.sites[1]})"
@@ -115,15 +165,31 @@ class Bisector(ABC):
         A point is in the bisector if the point is to the same distance to both sites.
         """
         site1, site2 = self.sites
-        epsilon = Decimal("0.001")
         return are_close(
-            site1.get_site_distance(x, y), site2.get_site_distance(x, y), epsilon,
+            site1.get_site_distance(x, y),
+            site2.get_site_distance(x, y),
+            self.get_distance_epsilon(),
         )
 
+    def are_points_in_bisector(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Get if each point is part of the bisector in one vectorized pass."""
+        site1, site2 = self.sites
+        distances = site1.get_site_distance_many(xs, ys) - site2.get_site_distance_many(
+            xs, ys
+        )
+        epsilon = float(self.get_distance_epsilon())
+        return np.ma.filled(abs(distances) <= epsilon, False)
+
+    def get_distance_epsilon(self) -> Decimal:
+        """Get the difference allowed between the distances to the sites of a point."""
+        return Decimal("0.001")
+
 
 class PointBisector(Bisector):
     """Bisector defined by point sites."""
 
+    __slots__ = ()
+
     def __init__(self, sites: Tuple[Site, Site]):
         """Construct bisector of Point sites Bisector."""
         super(PointBisector, self).__init__(sites)
@@ -164,10 +230,48 @@ class PointBisector(Bisector):
         if q.y == p.y:
             return []
 
-        a = Decimal(-((q.x - p.x) / (q.y - p.y)))
-        b = Decimal((q.x ** 2 - p.x ** 2 + q.y ** 2 - p.y ** 2) / (2 * (q.y - p.y)))
+        a = -((q.x - p.x) / (q.y - p.y))
+        b = (q.x ** 2 - p.x ** 2 + q.y ** 2 - p.y ** 2) / (2 * (q.y - p.y))
         return [a * x + b]
 
+    def formula_y_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Get y coordinates given many x coordinates in one vectorized pass.
+
+        In this case is a line, so there is just one row.
+        """
+        xs = to_float_array(xs)
+        p_site = self.sites[0]
+        p = p_site.point
+        q_site = self.sites[1]
+        q = q_site.point
+
+        if q.x == p.x:
+            return np.ma.masked_array(
+                np.full((1,) + xs.shape, float(self.formula_y(p.x)[0]))
+            )
+        if q.y == p.y:
+            return np.ma.masked_all((1,) + xs.shape)
+
+        a = -float((q.x - p.x) / (q.y - p.y))
+        b = float((q.x ** 2 - p.x ** 2 + q.y ** 2 - p.y ** 2) / (2 * (q.y - p.y)))
+        return np.ma.masked_array([a * xs + b])
+
+    def get_y_error_bound(self, x: float, y: float) -> float:
+        """Get a bound of the error of the y in x given by float formula_y.
+
+        In this case the error comes from the coefficients of the line.
+        """
+        p_x, p_y = float(self.sites[0].point.x), float(self.sites[0].point.y)
+        q_x, q_y = float(self.sites[1].point.x), float(self.sites[1].point.y)
+        if q_x == p_x:
+            return FLOAT_RELATIVE_ERROR * (abs(p_y) + abs(q_y))
+        if q_y == p_y:
+            return 0.0
+        magnitude = abs(((q_x - p_x) / (q_y - p_y)) * float(x)) + (
+            (q_x ** 2 + p_x ** 2 + q_y ** 2 + p_y ** 2) / abs(2 * (q_y - p_y))
+        )
+        return FLOAT_RELATIVE_ERROR * magnitude
+
     def is_vertical(self) -> bool:
         """Get if the bisector is vertical."""
         p, q = self.sites
@@ -284,18 +388,36 @@ class PointBisector(Bisector):
             return (site2, site1)
 
 
+# Value of the cached quantities that are not computed yet.
+NOT_COMPUTED = object()
+
+
 class WeightedPointBisector(Bisector):
     """Bisector defined by weighted sites."""
 
+    __slots__ = (
+        "point_bisector",
+        "_conic_section",
+        "_vertical_tangents",
+        "_not_x_monotone_sign",
+        "_vertical_asymptote_sign",
+    )
+
     sites: Tuple[WeightedSite, WeightedSite]
-    a: Decimal
-    b: Decimal
-    c: Decimal
-    d: Decimal
-    e: Decimal
-    conic_section: ConicSection
     # In case that the sites have the same weights.
     point_bisector: Optional[PointBisector]
+    # Quantities that only depend on the sites. They are computed once when needed.
+    _conic_section: Any
+    _vertical_tangents: Any
+    _not_x_monotone_sign: Any
+    _vertical_asymptote_sign: Any
+    # Hits and misses of the cached quantities of all the bisectors.
+    cache_counters: Dict[str, CacheCounter] = {
+        "conic_section": CacheCounter(),
+        "vertical_tangents": CacheCounter(),
+        "not_x_monotone_sign": CacheCounter(),
+        "vertical_asymptote_sign": CacheCounter(),
+    }
 
     def __init__(self, sites: Tuple[WeightedSite, WeightedSite]):
         """Construct bisector of weighted sites.
@@ -311,18 +433,51 @@ class WeightedPointBisector(Bisector):
             new_q = Site(q.point.x, q.point.y, q.name,)
             # We use the PointBisector of the points without weights.
             self.point_bisector = PointBisector(sites=(new_p, new_q))
-        self._set_polynomial_parameters()
-        self.conic_section = ConicSection(
-            self.a, self.b, self.c, self.d, self.e, self.f
-        )
+        self._conic_section = NOT_COMPUTED
+        self._vertical_tangents = NOT_COMPUTED
+        self._not_x_monotone_sign = NOT_COMPUTED
+        self._vertical_asymptote_sign = NOT_COMPUTED
 
     def is_vertical(self) -> bool:
         """Get if the bisector is vertical."""
         p_site, q_site = self.sites
         return q_site.point.y == p_site.point.y and q_site.weight == p_site.weight
 
-    def _set_polynomial_parameters(self) -> None:
-        """Set parameters of general conic formula.
+    def get_distance_epsilon(self) -> Decimal:
+        """Get the difference allowed between the distances to the sites of a point.
+
+        The points of the other branch of the hyperbola of the conic section have
+        distances that differ in twice the difference of the weights, so the epsilon
+        is never bigger than that difference.
+        """
+        epsilon = super(WeightedPointBisector, self).get_distance_epsilon()
+        p, q = self.sites
+        weights_difference = abs(abs(p.weight) - abs(q.weight))
+        if weights_difference == 0 or weights_difference >= epsilon:
+            return epsilon
+        return Decimal(weights_difference)
+
+    @property
+    def conic_section(self) -> ConicSection:
+        """Get the conic section of the bisector.
+
+        The conic section is computed once and then reused, until it is freed.
+        """
+        counter = self.cache_counters["conic_section"]
+        if self._conic_section is NOT_COMPUTED:
+            counter.misses += 1
+            self._conic_section = self._get_conic_section()
+        else:
+            counter.hits += 1
+        return self._conic_section
+
+    def free_cached_quantities(self) -> None:
+        """Free the conic section, as its coefficients take most of the memory."""
+        super(WeightedPointBisector, self).free_cached_quantities()
+        self._conic_section = NOT_COMPUTED
+
+    def _get_conic_section(self) -> ConicSection:
+        """Get conic section with the parameters of general conic formula.
 
         Ax^2 + Bxy + Cy^2 + Dx + Ey + F = 0
         """
@@ -336,21 +491,25 @@ class WeightedPointBisector(Bisector):
         qw = q.weight
         if self.point_bisector:
             # The bisector is a line.
-            self.a = Decimal(0)
-            self.b = Decimal(0)
-            self.c = Decimal(0)
-            self.d = Decimal(2 * qx - 2 * px)
-            self.e = Decimal(2 * qy - 2 * py)
-            self.f = Decimal((px ** 2) + (py ** 2) - (qx ** 2) - (qy ** 2))
-        else:
-            r = (qx ** 2) + (qy ** 2) - (px ** 2) - (py ** 2) - ((pw - qw) ** 2)
-            s = 4 * ((pw - qw) ** 2)
-            self.a = Decimal(s - (((2 * px) - (2 * qx)) ** 2))
-            self.b = Decimal((-2) * ((2 * px) - (2 * qx)) * ((2 * py) - (2 * qy)))
-            self.c = Decimal(s - (((2 * py) - (2 * qy)) ** 2))
-            self.d = Decimal((-2 * px * s) - (2 * ((2 * px) - (2 * qx)) * r))
-            self.e = Decimal((-2 * py * s) - (2 * ((2 * py) - (2 * qy)) * r))
-            self.f = Decimal((s * (px ** 2)) + (s * (py ** 2)) - (r ** 2))
+            zero = to_number_like(0, px)
+            return ConicSection(
+                zero,
+                zero,
+                zero,
+                2 * qx - 2 * px,
+                2 * qy - 2 * py,
+                (px ** 2) + (py ** 2) - (qx ** 2) - (qy ** 2),
+            )
+        r = (qx ** 2) + (qy ** 2) - (px ** 2) - (py ** 2) - ((pw - qw) ** 2)
+        s = 4 * ((pw - qw) ** 2)
+        return ConicSection(
+            s - (((2 * px) - (2 * qx)) ** 2),
+            (-2) * ((2 * px) - (2 * qx)) * ((2 * py) - (2 * qy)),
+            s - (((2 * py) - (2 * qy)) ** 2),
+            (-2 * px * s) - (2 * ((2 * px) - (2 * qx)) * r),
+            (-2 * py * s) - (2 * ((2 * py) - (2 * qy)) * r),
+            (s * (px ** 2)) + (s * (py ** 2)) - (r ** 2),
+        )
 
     def formula_x(self, y: Decimal) -> List[Decimal]:
         """Get x coordinate given the y coordinate.
@@ -384,6 +543,56 @@ class WeightedPointBisector(Bisector):
 
         return return_values
 
+    def formula_y_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Get y coordinates given many x coordinates in one vectorized pass.
+
+        In this case is an hyperbola, so there are at most 2 rows with values.
+        """
+        xs = to_float_array(xs)
+        if self.point_bisector:
+            ys = self.point_bisector.formula_y_many(xs)
+            return np.ma.concatenate([ys, np.ma.masked_all(ys.shape)])
+
+        ys = self.conic_section.y_formula_many(xs).filled(np.nan)
+        ys = np.where(self.are_points_in_bisector(xs, ys), ys, np.nan)
+        # Repeated solutions are only given once.
+        ys[1] = np.where(ys[1] == ys[0], np.nan, ys[1])
+        return np.ma.masked_invalid(sort_rows(ys))
+
+    def get_y_error_bound(self, x: float, y: float) -> float:
+        """Get a bound of the error of the y in x given by float formula_y.
+
+        In this case the error of the conic section equation is divided by its
+        derivative in y, so the bound grows near the vertical tangents.
+        """
+        if self.point_bisector:
+            return self.point_bisector.get_y_error_bound(x, y)
+        x, y = float(x), float(y)
+        conic_section = self.conic_section
+        a, b, c, d, e, f = (
+            float(coefficient)
+            for coefficient in (
+                conic_section.a,
+                conic_section.b,
+                conic_section.c,
+                conic_section.d,
+                conic_section.e,
+                conic_section.f,
+            )
+        )
+        derivative = abs(b * x + 2 * c * y + e)
+        if derivative == 0:
+            return float("inf")
+        magnitude = (
+            abs(a) * (x ** 2)
+            + abs(b * x * y)
+            + abs(c) * (y ** 2)
+            + abs(d * x)
+            + abs(e * y)
+            + abs(f)
+        )
+        return FLOAT_RELATIVE_ERROR * magnitude / derivative
+
     def get_intersections(self, bisector: "WeightedPointBisector") -> List[Point]:
         """Get the point of intersection between two Weighted Point Bisectors."""
         all_intersections = self.conic_section.get_intersections(bisector.conic_section)
@@ -405,32 +614,87 @@ class WeightedPointBisector(Bisector):
         return False
 
     def get_vertical_tangents(self) -> List[Decimal]:
-        """Get vertical tangents in the bisector."""
+        """Get vertical tangents in the bisector.
+
+        The vertical tangents are computed once and then reused.
+        """
+        counter = self.cache_counters["vertical_tangents"]
+        if self._vertical_tangents is NOT_COMPUTED:
+            counter.misses += 1
+            self._vertical_tangents = self._get_vertical_tangents()
+        else:
+            counter.hits += 1
+        return list(self._vertical_tangents)
+
+    def _get_vertical_tangents(self) -> List[Decimal]:
+        """Compute vertical tangents in the bisector."""
         if self.point_bisector:
             return []
 
         xs = self.conic_section.get_vertical_tangents()
         valid_xs = []
         for x in xs:
-            decimals = Decimal("4")
-            multiplier = Decimal("10") ** decimals
-            truncated_x = Decimal(int(x * multiplier) / multiplier)
+            multiplier = to_number_like(10 ** 4, x)
+            step = to_number_like("0.0001", x)
+            truncated_x = int(x * multiplier) / multiplier
             ys = self.formula_y(truncated_x)
             if len(ys) >= 1:
                 valid_xs.append(x)
             else:
                 # Second chance.
-                ys = self.formula_y(truncated_x + Decimal("0.0001"))
+                ys = self.formula_y(truncated_x + step)
                 if len(ys) >= 1:
                     valid_xs.append(x)
                 else:
                     # Third Chance
-                    ys = self.formula_y(truncated_x - Decimal("0.0001"))
+                    ys = self.formula_y(truncated_x - step)
                     if len(ys) >= 1:
                         valid_xs.append(x)
 
         return valid_xs
 
+    def get_not_x_monotone_sign(self) -> Optional[bool]:
+        """Get the sign of the boundary of this bisector that is not x monotone.
+
+        None is returned if both boundaries are x monotone.
+        """
+        counter = self.cache_counters["not_x_monotone_sign"]
+        if self._not_x_monotone_sign is NOT_COMPUTED:
+            counter.misses += 1
+            max_site, min_site = self.get_sites_tuple()
+            if max_site.get_lowest_site_point().y < min_site.get_lowest_site_point().y:
+                self._not_x_monotone_sign = max_site.point.x < min_site.point.x
+            else:
+                self._not_x_monotone_sign = None
+        else:
+            counter.hits += 1
+        return self._not_x_monotone_sign
+
+    def get_vertical_asymptote_sign(self) -> Optional[bool]:
+        """Get the sign of the boundary of this bisector with a vertical asymptote.
+
+        None is returned if no boundary has a vertical asymptote.
+        """
+        counter = self.cache_counters["vertical_asymptote_sign"]
+        if self._vertical_asymptote_sign is NOT_COMPUTED:
+            counter.misses += 1
+            p, q = self.sites
+            if p.weight > q.weight:
+                biggest_site = p
+                smallest_site = q
+            else:
+                biggest_site = q
+                smallest_site = p
+            if p.get_lowest_site_point().y == q.get_lowest_site_point().y:
+                self._vertical_asymptote_sign = (
+                    biggest_site.point.x < smallest_site.point.x
+                )
+            else:
+                self._vertical_asymptote_sign = None
+        else:
+            counter.hits += 1
+        return self._vertical_asymptote_sign
+
     def get_sites_tuple(self) -> Tuple[WeightedSite, WeightedSite]:
         """Get site tuple sorted.
 
@@ -11,14 +11,36 @@ from .events import Intersection, Site, WeightedSite
 
 # Math
 from decimal import Decimal
+import numpy as np
 
 # Generaal utils
-from general_utils.numbers import are_close
+from general_utils.numbers import (
+    are_close,
+    sqrt,
+    to_float_array,
+    to_number_like,
+    sort_rows,
+    FLOAT_RELATIVE_ERROR,
+)
+
+# Conic Sections
+from conic_sections.utils.polynomials import get_roots
 
 
 class Boundary(ABC):
     """Bisector that is * mapped."""
 
+    __slots__ = (
+        "bisector",
+        "sign",
+        "left_intersection",
+        "right_intersection",
+        "active",
+        "is_to_be_deleted",
+        "_decimal_boundary",
+        "_last_ys_without_sign",
+    )
+
     bisector: Bisector
     sign: bool
     left_intersection: Optional[Intersection]
@@ -26,6 +48,9 @@ class Boundary(ABC):
     # active says if this boundary is the current added to the LList.
     active: bool
     is_to_be_deleted: bool
+    _decimal_boundary: Optional["Boundary"]
+    # x, ys of the bisector and ys of the boundary of the last formula_y_without_sign.
+    _last_ys_without_sign: Optional[Tuple[Decimal, List[Decimal], List[Decimal]]]
 
     def __init__(self, bisector: Bisector, sign: bool, active: bool = False) -> None:
         """Construct Boundary."""
@@ -35,6 +60,8 @@ class Boundary(ABC):
         self.right_intersection = None
         self.active = active
         self.is_to_be_deleted = False
+        self._decimal_boundary = None
+        self._last_ys_without_sign = None
 
     def get_site(self) -> Site:
         """Get the site that is highest or more to the right.
@@ -58,6 +85,64 @@ class Boundary(ABC):
         """
         raise NotImplementedError
 
+    def compare_point(self, point: Point) -> Optional[Decimal]:
+        """Get the point comparison of get_point_comparison without float ambiguities.
+
+        When the boundary works with floats and the point is too close to the boundary
+        the comparison is recomputed with the Decimal versions of both.
+        """
+        if not isinstance(point.x, float) or not self.is_point_near(point):
+            return self.get_point_comparison(point)
+        return self.get_decimal_boundary().get_point_comparison(
+            point.get_decimal_point()
+        )
+
+    def is_point_near(self, point: Point) -> bool:
+        """Check if the point is close to the boundary without taking care of the sign.
+
+        The point is close when its distance to the boundary is within the error bound
+        of the float formulas, so its comparison depends on the rounding.
+        """
+        if self.bisector.is_vertical():
+            middle_x = self.bisector.get_middle_between_sites().x
+            error = FLOAT_RELATIVE_ERROR * (abs(point.x) + abs(middle_x))
+            return abs(point.x - middle_x) <= error
+        _, ys_bisector, ys = self._get_ys_without_sign(point.x)
+        for y_bisector, y in zip(ys_bisector, ys):
+            if self._is_y_near(point, y_bisector, y):
+                return True
+        return False
+
+    def is_point_at_boundary(self, point: Point) -> bool:
+        """Check if the point is in this boundary up to the error bound of its formula.
+
+        Unlike is_point_in_boundary, a point slightly away from the boundary is not in
+        it, so a site near a boundary is placed in the region that has it.
+        """
+        ys = self.formula_y(point.x)
+        _, ys_bisector, ys_without_sign = self._get_ys_without_sign(point.x)
+        for y_bisector, y in zip(ys_bisector, ys_without_sign):
+            if y in ys and self._is_y_near(point, y_bisector, y):
+                return True
+        return False
+
+    def _is_y_near(self, point: Point, y_bisector: Decimal, y: Decimal) -> bool:
+        """Check if the y of the boundary in the x of the point is within its error."""
+        # The star map adds at most the error of y to the distance to the site.
+        error = 2 * self.bisector.get_y_error_bound(point.x, y_bisector)
+        error += FLOAT_RELATIVE_ERROR * (abs(float(y)) + abs(float(point.y)))
+        return float(abs(y - point.y)) <= error
+
+    def get_decimal_boundary(self) -> "Boundary":
+        """Get this boundary with its bisector using Decimal sites."""
+        if self._decimal_boundary is None:
+            decimal_bisector = self.bisector.get_decimal_bisector()
+            if decimal_bisector is self.bisector:
+                self._decimal_boundary = self
+            else:
+                self._decimal_boundary = type(self)(decimal_bisector, self.sign)
+        return self._decimal_boundary
+
     def formula_y_without_sign(self, x: Decimal) -> List[Decimal]:
         """Return the y coordinates in all the boundary given the x coordinate.
 
@@ -65,11 +150,32 @@ class Boundary(ABC):
         This can also be viewed as the projection of x in all the boundary without
         taking care of the sign.
         """
-        ys = [
-            self.star(Point(x, y_bisector)).y
-            for y_bisector in self.bisector.formula_y(x)
-        ]
-        return ys
+        return list(self._get_ys_without_sign(x)[2])
+
+    def _get_ys_without_sign(
+        self, x: Decimal
+    ) -> Tuple[Decimal, List[Decimal], List[Decimal]]:
+        """Get x with the ys of the bisector and their star map in the boundary.
+
+        The ys of the last x are kept, as comparing a point evaluates them several
+        times in the same x.
+        """
+        if self._last_ys_without_sign is None or self._last_ys_without_sign[0] != x:
+            ys_bisector = self.bisector.formula_y(x)
+            ys = [self.star(Point(x, y_bisector)).y for y_bisector in ys_bisector]
+            self._last_ys_without_sign = (x, ys_bisector, ys)
+        return self._last_ys_without_sign
+
+    def formula_y_without_sign_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Return the y coordinates in all the boundary given many x coordinates.
+
+        This is formula_y_without_sign in one vectorized pass. Each row has one of the
+        y coordinates sorted from the highest to the lowest and the missing values are
+        masked.
+        """
+        xs = to_float_array(xs)
+        ys = self.bisector.formula_y_many(xs).filled(np.nan)
+        return np.ma.masked_invalid(ys + self.get_site().get_site_distance_many(xs, ys))
 
     @abstractmethod
     def formula_y(self, x: Decimal) -> List[Decimal]:
@@ -81,6 +187,15 @@ class Boundary(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def formula_y_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Return the y coordinates given many x coordinates taking care of the sign.
+
+        This is formula_y in one vectorized pass. Each row has one of the y coordinates
+        sorted from the highest to the lowest and the missing values are masked.
+        """
+        raise NotImplementedError
+
     def __str__(self):
         """Get boundary string representation."""
         if self.sign:
@@ -116,12 +231,23 @@ class Boundary(ABC):
         # Now we need to look that each mapped intersection point is in the boundary.
         for intersection_point in intersection_points:
             intersection_point_star = self.star(intersection_point)
-            if self.is_point_in_boundary(
-                intersection_point_star
-            ) and boundary.is_point_in_boundary(intersection_point_star):
+            if self.is_bisector_point_in_boundary(
+                intersection_point
+            ) and boundary.is_bisector_point_in_boundary(intersection_point):
                 all_intersections.append((intersection_point, intersection_point_star))
         return all_intersections
 
+    def is_bisector_point_in_boundary(self, point: Point) -> bool:
+        """Check if the star map of a point of the bisector is in this boundary."""
+        return self.is_point_in_boundary(self.star(point))
+
+    def get_vertex_sign(self, vertex: Point) -> bool:
+        """Get the sign of the boundary of the bisector that has the vertex.
+
+        The vertex is a point of the bisector in the side of this boundary.
+        """
+        return self.sign
+
     @abstractmethod
     def get_side_where_point_belongs(self, point: Point) -> int:
         """Get side of the boundary where the point belongs."""
@@ -139,6 +265,8 @@ class Boundary(ABC):
 class PointBoundary(Boundary):
     """Boundary of a site point."""
 
+    __slots__ = ()
+
     bisector: PointBisector
 
     def __init__(self, bisector: PointBisector, sign: bool):
@@ -166,7 +294,7 @@ class PointBoundary(Boundary):
 
         if self.is_left_to_boundary(point):
             return Decimal(-1)
-        if self.is_point_in_boundary(point):
+        if self.is_point_at_boundary(point):
             return Decimal(0)
         return Decimal(1)
 
@@ -197,18 +325,18 @@ class PointBoundary(Boundary):
                 sign_value = 1
             else:
                 sign_value = -1
-            solution = (-b + (-sign_value) * Decimal(b ** 2 - 4 * a * c).sqrt()) / 2 * a
+            solution = (-b + (-sign_value) * sqrt(b ** 2 - 4 * a * c)) / 2 * a
             return solution
 
         p = self.bisector.sites[0].point
         q = self.bisector.sites[1].point
-        a = Decimal(-((q.x - p.x) / (q.y - p.y)))
-        b = Decimal((q.x ** 2 - p.x ** 2 + q.y ** 2 - p.y ** 2) / (2 * (q.y - p.y)))
-        c = Decimal(-b + y)
-        d = Decimal(b - p.y)
-        e = Decimal(c ** 2 - d ** 2 - p.x ** 2)
-        f = Decimal(-1)
-        g = Decimal(2 * (-a * (c + d) + p.x))
+        a = -((q.x - p.x) / (q.y - p.y))
+        b = (q.x ** 2 - p.x ** 2 + q.y ** 2 - p.y ** 2) / (2 * (q.y - p.y))
+        c = -b + y
+        d = b - p.y
+        e = c ** 2 - d ** 2 - p.x ** 2
+        f = -1
+        g = 2 * (-a * (c + d) + p.x)
         x = quadratic_solution_with_sign(f, g, e)
         return [x]
 
@@ -225,12 +353,26 @@ class PointBoundary(Boundary):
             return self.formula_y_without_sign(x)
         return []
 
+    def formula_y_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Return the y coordinates given many x coordinates, taking care of the sign.
+
+        This is formula_y in one vectorized pass.
+        """
+        xs = to_float_array(xs)
+        site_x = float(self.get_site().point.x)
+        if self.sign:
+            is_in_boundary = xs >= site_x
+        else:
+            is_in_boundary = xs < site_x
+        ys = self.formula_y_without_sign_many(xs)
+        return np.ma.masked_where(np.broadcast_to(~is_in_boundary, ys.shape), ys)
+
     def is_point_in_boundary(self, point: Point) -> bool:
         """Check if the point is in this boundary."""
         p, q = self.bisector.sites
         if p.point.y == q.point.y:
             distance = abs(p.point.x - q.point.x)
-            mid_x = min(p.point.x, q.point.x) + (distance / Decimal(2))
+            mid_x = min(p.point.x, q.point.x) + (distance / 2)
             return are_close(point.x, mid_x, Decimal("0.0001"),) and self.sign
 
         ys_in_boundary = self.formula_y(point.x)
@@ -243,6 +385,46 @@ class PointBoundary(Boundary):
         """Get side where point belongs."""
         return 0
 
+    def get_intersections(self, boundary: "Boundary") -> List[Tuple[Point, Point]]:
+        """Get intersections between two boundaries of point sites.
+
+        When the bisectors share a site, their intersection is the circumcenter of the
+        three sites and the boundaries intersection is the highest point of the
+        circumcircle, so both are computed directly from the sites.
+        """
+        sites = {}
+        for site in self.bisector.sites + boundary.bisector.sites:
+            sites[site.get_object_to_hash()] = site.point
+        if len(sites) != 3:
+            return super(PointBoundary, self).get_intersections(boundary)
+
+        a, b, c = sites.values()
+        bx, by = b.x - a.x, b.y - a.y
+        cx, cy = c.x - a.x, c.y - a.y
+        # Orientation of the sites, it is 0 when they are collinear.
+        determinant = 2 * (bx * cy - by * cx)
+        if determinant == 0:
+            return []
+        b_norm = bx ** 2 + by ** 2
+        c_norm = cx ** 2 + cy ** 2
+        center_x = (cy * b_norm - by * c_norm) / determinant
+        center_y = (bx * c_norm - cx * b_norm) / determinant
+        radius = sqrt(center_x ** 2 + center_y ** 2)
+        x = a.x + center_x
+        y = a.y + center_y
+        if not self.is_x_in_boundary(x) or not boundary.is_x_in_boundary(x):
+            return []
+        return [(Point(x, y), Point(x, y + radius))]
+
+    def is_x_in_boundary(self, x: Decimal) -> bool:
+        """Check if the star map of the bisector point in x is in the boundary."""
+        p, q = self.bisector.sites
+        if p.point.y == q.point.y:
+            return self.sign
+        if self.sign:
+            return x >= self.get_site().point.x
+        return x < self.get_site().point.x
+
     @staticmethod
     def get_boundary_sign(p: Point, q: Site, s: Site) -> bool:
         """Get Boundary sign given two sites and a point to compare."""
@@ -260,6 +442,8 @@ class PointBoundary(Boundary):
 class WeightedPointBoundary(Boundary):
     """Boundary of a weighted site point."""
 
+    __slots__ = ()
+
     bisector: WeightedPointBisector
 
     def __init__(self, bisector: WeightedPointBisector, sign: bool):
@@ -268,37 +452,11 @@ class WeightedPointBoundary(Boundary):
 
     def is_boundary_not_x_monotone(self) -> bool:
         """Check if the boundary is concave to y."""
-        sites = self.bisector.sites
-        if sites[0] == self.get_site():
-            max_site = sites[0]
-            min_site = sites[1]
-        else:
-            max_site = sites[1]
-            min_site = sites[0]
-        if max_site.get_lowest_site_point().y < min_site.get_lowest_site_point().y:
-            if max_site.point.x < min_site.point.x:
-                return self.sign
-            else:
-                return not self.sign
-        else:
-            return False
+        return self.bisector.get_not_x_monotone_sign() == self.sign
 
     def has_vertical_asymptote(self) -> bool:
         """Check if the boundary has a vertical asymptote."""
-        p, q = self.bisector.sites
-        if p.weight > q.weight:
-            biggest_site = p
-            smallest_site = q
-        else:
-            biggest_site = q
-            smallest_site = p
-        if p.get_lowest_site_point().y == q.get_lowest_site_point().y:
-            if biggest_site.point.x < smallest_site.point.x:
-                return self.sign
-            else:
-                return not self.sign
-        else:
-            return False
+        return self.bisector.get_vertical_asymptote_sign() == self.sign
 
     def formula_y(self, x: Decimal) -> List[Decimal]:
         """Return the y coordinate given the x coordinate taking care of the sign.
@@ -334,12 +492,48 @@ class WeightedPointBoundary(Boundary):
 
         return to_return
 
+    def formula_y_many(self, xs: np.ndarray) -> np.ma.MaskedArray:
+        """Return the y coordinates given many x coordinates taking care of the sign.
+
+        This is formula_y in one vectorized pass.
+        """
+        xs = to_float_array(xs)
+        ys_without_sign = self.formula_y_without_sign_many(xs)
+
+        # Check when events are in the same y.
+        p, q = self.bisector.sites
+        p_event, q_event = p.get_event_point(), q.get_event_point()
+        if p_event.y == q_event.y:
+            if p.weight > q.weight:
+                bigger, smaller = p, q
+            else:
+                bigger, smaller = q, p
+            if (bigger.point.x > smaller.point.x and not self.sign) or (
+                bigger.point.x < smaller.point.x and self.sign
+            ):
+                return ys_without_sign
+            return np.ma.masked_all(ys_without_sign.shape)
+
+        ys_without_sign = ys_without_sign.filled(np.nan)
+        ys = np.full(ys_without_sign.shape, np.nan)
+        if self.is_boundary_not_x_monotone():
+            ys[0] = np.fmax(ys_without_sign[0], ys_without_sign[1])
+        site_x = float(self.get_site().point.x)
+        if self.sign:
+            is_in_side = site_x <= xs
+        else:
+            is_in_side = xs < site_x
+        ys[1] = np.where(
+            is_in_side, np.fmin(ys_without_sign[0], ys_without_sign[1]), np.nan
+        )
+        return np.ma.masked_invalid(sort_rows(ys))
+
     def is_point_in_boundary(self, point: Point) -> bool:
         """Check if the point is in this boundary."""
         p, q = self.bisector.sites
         if p.point.y == q.point.y and p.weight == q.weight:
             distance = abs(p.point.x - q.point.x)
-            mid_x = min(p.point.x, q.point.x) + (distance / Decimal(2))
+            mid_x = min(p.point.x, q.point.x) + (distance / 2)
             return are_close(point.x, mid_x, Decimal("0.001"),) and self.sign
 
         ys_in_boundary = self.formula_y(point.x)
@@ -348,6 +542,122 @@ class WeightedPointBoundary(Boundary):
                 return True
         return False
 
+    def get_intersections(self, boundary: "Boundary") -> List[Tuple[Point, Point]]:
+        """Get intersections between two boundaries of weighted point sites.
+
+        When the bisectors share a site, their intersections are the centers of the
+        circles tangent to the three weighted sites. They are computed from a quadratic
+        in the radius of the circle instead of the quartic of the conic sections, as
+        the coefficients of the quartic lose most of their digits in floats.
+        """
+        sites = {}
+        for site in self.bisector.sites + boundary.bisector.sites:
+            sites[site.get_object_to_hash()] = site
+        if len(sites) != 3:
+            return super(WeightedPointBoundary, self).get_intersections(boundary)
+
+        a, b, c = sites.values()
+        a_weight = abs(a.weight)
+        bx, by = b.point.x - a.point.x, b.point.y - a.point.y
+        cx, cy = c.point.x - a.point.x, c.point.y - a.point.y
+        b_weight, c_weight = abs(b.weight) - a_weight, abs(c.weight) - a_weight
+        determinant = bx * cy - by * cx
+        if determinant == 0:
+            return super(WeightedPointBoundary, self).get_intersections(boundary)
+        # The center is (x0 + x1 * r, y0 + y1 * r) where r is its distance to a.
+        b_k = (bx ** 2 + by ** 2 - b_weight ** 2) / 2
+        c_k = (cx ** 2 + cy ** 2 - c_weight ** 2) / 2
+        x0 = (cy * b_k - by * c_k) / determinant
+        x1 = (cy * b_weight - by * c_weight) / determinant
+        y0 = (bx * c_k - cx * b_k) / determinant
+        y1 = (bx * c_weight - cx * b_weight) / determinant
+        radiuses = get_roots(
+            [x1 ** 2 + y1 ** 2 - 1, 2 * (x0 * x1 + y0 * y1), x0 ** 2 + y0 ** 2]
+        )
+
+        all_intersections = []
+        for radius in radiuses:
+            if not are_close(radius.imag, 0.0, 0.001):
+                continue
+            radius = to_number_like(radius.real, x0)
+            if radius < max(0, b_weight, c_weight):
+                continue
+            intersection_point = Point(
+                a.point.x + x0 + x1 * radius, a.point.y + y0 + y1 * radius
+            )
+            if any(
+                are_close(intersection_point.x, point.x, Decimal("0.001"))
+                and are_close(intersection_point.y, point.y, Decimal("0.001"))
+                for point, _ in all_intersections
+            ):
+                continue
+            if self.is_bisector_point_in_boundary(
+                intersection_point
+            ) and boundary.is_bisector_point_in_boundary(intersection_point):
+                intersection_point_star = Point(
+                    intersection_point.x, intersection_point.y + radius + a_weight
+                )
+                all_intersections.append((intersection_point, intersection_point_star))
+        return all_intersections
+
+    def is_bisector_point_in_boundary(self, point: Point) -> bool:
+        """Check if the star map of a point of the bisector is in this boundary.
+
+        The star map keeps the order of the ys of the bisector in the same x, so the
+        part of the boundary of the point is known from the other y of the conic
+        section in that x. The ys are not recomputed from x, as they are unstable near
+        the vertical tangents.
+        """
+        bisector_parts = self._get_bisector_parts(point)
+        if bisector_parts is None:
+            return super(WeightedPointBoundary, self).is_bisector_point_in_boundary(
+                point
+            )
+
+        is_max, is_min = bisector_parts
+        if is_max and self.is_boundary_not_x_monotone():
+            return True
+        site_x = self.get_site().point.x
+        return is_min and (
+            (not self.sign and point.x < site_x) or (self.sign and site_x <= point.x)
+        )
+
+    def _get_bisector_parts(self, point: Point) -> Optional[Tuple[bool, bool]]:
+        """Get if a point of the bisector is its max and min y in the x of the point.
+
+        None is returned when the other y of the bisector is not known.
+        """
+        p, q = self.bisector.sites
+        conic_section = self.bisector.conic_section
+        if (
+            p.get_event_point().y == q.get_event_point().y
+            or self.bisector.point_bisector
+            or conic_section.c == 0
+        ):
+            return None
+
+        # Both ys of the conic section in x add up to -(bx + e) / c.
+        other_y = -(conic_section.b * point.x + conic_section.e) / conic_section.c
+        other_y -= point.y
+        if self.bisector.is_point_in_bisector(point.x, other_y):
+            return point.y >= other_y, point.y <= other_y
+        return True, True
+
+    def get_vertex_sign(self, vertex: Point) -> bool:
+        """Get the sign of the boundary of the bisector that has the vertex.
+
+        The max y of a bisector that is not x monotone is in the same boundary in any
+        x, so the side of the vertex is not enough to know its sign.
+        """
+        bisector_parts = self._get_bisector_parts(vertex)
+        not_x_monotone_sign = self.bisector.get_not_x_monotone_sign()
+        if bisector_parts is None or not_x_monotone_sign is None:
+            return self.sign
+        is_max, is_min = bisector_parts
+        if is_max and not is_min:
+            return not_x_monotone_sign
+        return self.sign
+
     def get_point_comparison(self, point: Point) -> Optional[Decimal]:
         """Get the y comparison of a point based on the y coordinate of the point.
 
@@ -364,9 +674,7 @@ class WeightedPointBoundary(Boundary):
         if same_y and same_weight:
             if self.sign:
                 distance = abs(p.point.x - q.point.x)
-                comparison = point.x - (
-                    min(p.point.x, q.point.x) + (distance / Decimal(2))
-                )
+                comparison = point.x - (min(p.point.x, q.point.x) + (distance / 2))
                 return comparison
             else:
                 # Negative Boundary of a vertical bisector is always to the left of any point.
@@ -374,7 +682,7 @@ class WeightedPointBoundary(Boundary):
 
         if self.is_left_to_boundary(point):
             return Decimal(-1)
-        if self.is_point_in_boundary(point):
+        if self.is_point_at_boundary(point):
             return Decimal(0)
         return Decimal(1)
 
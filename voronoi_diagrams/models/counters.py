@@ -0,0 +1,35 @@
+"""Counters of cached values."""
+
+
+class CacheCounter:
+    """Hits and misses of a cached value."""
+
+    __slots__ = ("hits", "misses")
+
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        """Construct counter."""
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self) -> None:
+        """Set hits and misses to 0."""
+        self.hits = 0
+        self.misses = 0
+
+    def get_hit_rate(self) -> float:
+        """Get the fraction of the lookups that were hits."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def __str__(self) -> str:
+        """Get counter string representation."""
+        return f"hits: {self.hits}, misses: {self.misses}"
+
+    def __repr__(self) -> str:
+        """Get counter representation."""
+        return self.__str__()
@@ -6,51 +6,117 @@ from decimal import Decimal
 import numpy as np
 from xml.etree import ElementTree as ET
 
+# Utils
+from general_utils.numbers import to_number_like
+from general_utils.xml_elements import element_to_string
+
 # Models
 from .bisectors import Bisector, PointBisector, WeightedPointBisector
 from .boundaries import Boundary, PointBoundary, WeightedPointBoundary
+from .half_edges import HalfEdge
 
 # Ranges
 # Bisector side is set to be an int if there is other sides when using other type of sites.
 BisectorSide = int
 # Each range must have the same Bisector Side.
 Range = Tuple[Optional[Decimal], Optional[Decimal], BisectorSide]
+Ranges = Tuple[Range, ...]
+VerticalRanges = Tuple[Tuple[Optional[Decimal], Optional[Decimal]], ...]
+# Ranges saved one after another in a tuple, as most edges have only one range.
+FlatRanges = Tuple[Any, ...]
 
 
 Vertex = "vertices.Vertex"
 
 
+def get_flat_ranges(ranges: Iterable[Range]) -> FlatRanges:
+    """Get the ranges one after another in a tuple."""
+    return tuple(value for x_range in ranges for value in x_range)
+
+
+def get_ranges_from_flat_ranges(flat_ranges: FlatRanges) -> Ranges:
+    """Get the ranges saved one after another in a tuple."""
+    return tuple(zip(flat_ranges[0::3], flat_ranges[1::3], flat_ranges[2::3]))
+
+
 class Edge:
     """Edge representation in the Voronoi diagram."""
 
+    __slots__ = (
+        "bisector",
+        "flat_ranges_b_plus",
+        "flat_ranges_b_minus",
+        "ranges_vertical",
+        "half_edge",
+    )
+
+    BOUNDARY_CLASS = Boundary
+
     bisector: Bisector
-    vertices: List[Vertex]
-    ranges_b_plus: List[Range]
-    ranges_b_minus: List[Range]
-    boundary_plus: Boundary
-    boundary_minus: Boundary
-    ranges_vertical: List[Tuple[Optional[Decimal], Optional[Decimal]]]
-
-    def __init__(
-        self,
-        bisector: Any,
-        boundary_plus: Boundary,
-        boundary_minus: Boundary,
-        vertex1: Vertex = None,
-        vertex2: Vertex = None,
-    ) -> None:
-        """Constructor."""
+    flat_ranges_b_plus: FlatRanges
+    flat_ranges_b_minus: FlatRanges
+    ranges_vertical: VerticalRanges
+    half_edge: HalfEdge
+
+    def __init__(self, bisector: Any) -> None:
+        """Constructor.
+
+        The boundaries, the vertices and the other half-edge are not saved, as they
+        are known from the bisector and the half-edges.
+        """
         self.bisector = bisector
-        self.vertices = []
-        if vertex1 is not None:
-            self.vertices.append(vertex1)
-        if vertex2 is not None:
-            self.vertices.append(vertex2)
-        self.ranges_b_plus = []
-        self.ranges_b_minus = []
-        self.ranges_vertical = []
-        self.boundary_plus = boundary_plus
-        self.boundary_minus = boundary_minus
+        self.flat_ranges_b_plus = ()
+        self.flat_ranges_b_minus = ()
+        self.ranges_vertical = ()
+        half_edge_a = HalfEdge(self)
+        half_edge_b = HalfEdge(self)
+        half_edge_a.twin = half_edge_b
+        half_edge_b.twin = half_edge_a
+        self.half_edge = half_edge_a
+
+    @property
+    def half_edges(self) -> Tuple[HalfEdge, HalfEdge]:
+        """Get the half-edges of the edge, the one of the first site first."""
+        return (self.half_edge, self.half_edge.twin)
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """Get the vertices of the edge, the origins of its half-edges."""
+        return [
+            half_edge.origin
+            for half_edge in (self.half_edge, self.half_edge.twin)
+            if half_edge.origin is not None
+        ]
+
+    @property
+    def ranges_b_plus(self) -> Ranges:
+        """Get the ranges of the positive boundary."""
+        return get_ranges_from_flat_ranges(self.flat_ranges_b_plus)
+
+    @ranges_b_plus.setter
+    def ranges_b_plus(self, ranges: Ranges) -> None:
+        """Set the ranges of the positive boundary."""
+        self.flat_ranges_b_plus = get_flat_ranges(ranges)
+
+    @property
+    def ranges_b_minus(self) -> Ranges:
+        """Get the ranges of the negative boundary."""
+        return get_ranges_from_flat_ranges(self.flat_ranges_b_minus)
+
+    @ranges_b_minus.setter
+    def ranges_b_minus(self, ranges: Ranges) -> None:
+        """Set the ranges of the negative boundary."""
+        self.flat_ranges_b_minus = get_flat_ranges(ranges)
+
+    @property
+    def boundary_plus(self) -> Boundary:
+        """Get the positive boundary of the bisector."""
+        return self.BOUNDARY_CLASS(self.bisector, True)
+
+    @property
+    def boundary_minus(self) -> Boundary:
+        """Get the negative boundary of the bisector."""
+        return self.BOUNDARY_CLASS(self.bisector, False)
 
     def __eq__(self, other: "Edge") -> bool:
         """Equallity between VoronoiDiagramBisectors."""
@@ -88,11 +154,11 @@ class Edge:
 
         return (vertex1, vertex2)
 
-    def add_vertex(self, vertex: Vertex):
-        """Add vertex."""
-        if len(self.vertices) >= 2:
-            return
-        self.vertices.append(vertex)
+    def get_half_edge(self, site: Any) -> HalfEdge:
+        """Get half-edge in the boundary of the cell of the site."""
+        if self.half_edge.site is site:
+            return self.half_edge
+        return self.half_edge.twin
 
     def get_x(self, y: Decimal) -> Optional[Decimal]:
         """Get x given y of the bisector.
@@ -110,7 +176,7 @@ class Edge:
         """Get Ranges to plot."""
         x_ranges = []
         y_ranges = []
-        num_steps = Decimal("50")
+        num_steps = to_number_like(50, self.bisector.sites[0].point.x)
 
         self.complete_ranges()
         if self.bisector.is_vertical():
@@ -191,12 +257,10 @@ class Edge:
         step = abs(x0 - x1) / num_steps
         if step > 0:
             if side == 1:
-                x_range = np.arange(x0, x1 - Decimal(step), -step)
+                x_range = np.arange(x0, x1 - step, -step)
             else:
-                x_range = np.arange(x0, x1 + Decimal(step), step)
-            y_range = []
-            for x in x_range:
-                y_range.append(self.get_y_by_side(x, side))
+                x_range = np.arange(x0, x1 + step, step)
+            y_range = self.get_ys_by_side(x_range, side).tolist()
             x_ranges.append(x_range)
             y_ranges.append(y_range)
         else:
@@ -208,18 +272,23 @@ class Edge:
         """Get y by BisectorSide."""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_ys_by_side(self, xs: np.ndarray, side: BisectorSide) -> np.ma.MaskedArray:
+        """Get ys by BisectorSide of many xs in one vectorized pass."""
+        raise NotImplementedError
+
     def add_begin_range(
         self, x: Decimal, boundary_sign: bool, side: BisectorSide
     ) -> None:
         """Add new of the the bisector to be graphed."""
         if boundary_sign:
-            self.ranges_b_plus.append((x, None, side))
+            self.flat_ranges_b_plus += (x, None, side)
         else:
-            self.ranges_b_minus.append((x, None, side))
+            self.flat_ranges_b_minus += (x, None, side)
 
     def add_begin_range_vertical(self, y: Optional[Decimal]):
         """Add new vertical range."""
-        self.ranges_vertical.append((y, None))
+        self.ranges_vertical += ((y, None),)
 
     @abstractmethod
     def add_end_range(
@@ -230,7 +299,23 @@ class Edge:
 
     def add_end_range_vertical(self, y: Decimal):
         """Add end of the vertical range."""
-        self.ranges_vertical[-1] = (self.ranges_vertical[-1][0], y)
+        self.ranges_vertical = self.ranges_vertical[:-1] + (
+            (self.ranges_vertical[-1][0], y),
+        )
+
+    def get_last_range(self, boundary_sign: bool) -> Range:
+        """Get the last range of the boundary."""
+        if boundary_sign:
+            return self.flat_ranges_b_plus[-3:]
+        return self.flat_ranges_b_minus[-3:]
+
+    def set_last_range(self, boundary_sign: bool, *ranges: Range) -> None:
+        """Replace the last range of the boundary by the ranges."""
+        flat_ranges = get_flat_ranges(ranges)
+        if boundary_sign:
+            self.flat_ranges_b_plus = self.flat_ranges_b_plus[:-3] + flat_ranges
+        else:
+            self.flat_ranges_b_minus = self.flat_ranges_b_minus[:-3] + flat_ranges
 
     @abstractmethod
     def complete_ranges(self):
@@ -292,9 +377,7 @@ class Edge:
         edge_line_style.set("opacity", "204")
 
         expression_xml = (
-            ET.tostring(edge_expression, encoding="unicode", method="xml")
-            + "\n"
-            + ET.tostring(edge_element, encoding="unicode", method="xml")
+            element_to_string(edge_expression) + "\n" + element_to_string(edge_element)
         )
         return expression_xml
 
@@ -340,9 +423,7 @@ class Edge:
         edge_line_style.set("opacity", "204")
 
         expression_xml = (
-            ET.tostring(edge_command, encoding="unicode", method="xml")
-            + "\n"
-            + ET.tostring(edge_element, encoding="unicode", method="xml")
+            element_to_string(edge_command) + "\n" + element_to_string(edge_element)
         )
         return expression_xml
 
@@ -350,31 +431,24 @@ class Edge:
 class PointBisectorEdge(Edge):
     """Point Bisector Edge representation in Voronoi Diagram."""
 
+    __slots__ = ()
+
+    BOUNDARY_CLASS = PointBoundary
+
     bisector: PointBisector
     boundary_plus: PointBoundary
     boundary_minus: PointBoundary
 
-    def __init__(
-        self,
-        bisector: PointBisector,
-        boundary_plus: PointBoundary,
-        boundary_minus: PointBoundary,
-        vertex1: Any = None,
-        vertex2: Any = None,
-    ) -> None:
+    def __init__(self, bisector: PointBisector) -> None:
         """Create Voronoi Diagram Weighted Bisector."""
-        super().__init__(bisector, boundary_plus, boundary_minus, vertex1, vertex2)
+        super().__init__(bisector)
 
     def add_end_range(
         self, x: Decimal, boundary_sign: bool, side: BisectorSide
     ) -> None:
         """Add new of the the bisector to be graphed."""
-        if boundary_sign:
-            ranges = self.ranges_b_plus
-        else:
-            ranges = self.ranges_b_minus
-
-        ranges[-1] = (ranges[-1][0], x, side)
+        x0 = self.get_last_range(boundary_sign)[0]
+        self.set_last_range(boundary_sign, (x0, x, side))
 
     def get_y_by_side(self, x: Decimal, side: BisectorSide) -> Optional[Decimal]:
         """Get y by BisectorSide."""
@@ -383,10 +457,48 @@ class PointBisectorEdge(Edge):
             return None
         return ys[0]
 
+    def get_ys_by_side(self, xs: np.ndarray, side: BisectorSide) -> np.ma.MaskedArray:
+        """Get ys by BisectorSide of many xs in one vectorized pass."""
+        return self.bisector.formula_y_many(xs)[0]
+
     def complete_ranges(self):
         """Add a new range if neccessary."""
         pass
 
+    def set_ranges_from_half_edges(self) -> None:
+        """Set the ranges to plot from the ends of the half-edges.
+
+        Used when the edge is changed after the sweep, where there are no boundaries.
+        """
+        half_edge = self.half_edge
+        site, twin_site = half_edge.site.point, half_edge.twin.site.point
+        # Direction of the half-edge, it has its site at the left.
+        dx = site.y - twin_site.y
+        dy = twin_site.x - site.x
+        start, end = half_edge.origin, half_edge.twin.origin
+        if dx < 0 or (dx == 0 and dy < 0):
+            start, end = end, start
+        self.ranges_b_plus = ()
+        self.ranges_b_minus = ()
+        self.ranges_vertical = ()
+        if self.bisector.is_vertical():
+            self.ranges_vertical = (
+                (
+                    None if start is None else start.point.y,
+                    None if end is None else end.point.y,
+                ),
+            )
+        elif start is not None:
+            self.ranges_b_plus = (
+                (start.point.x, None if end is None else end.point.x, 0),
+            )
+        elif end is not None:
+            self.ranges_b_minus = ((end.point.x, None, 0),)
+        else:
+            x = (site.x + twin_site.x) / 2
+            self.ranges_b_plus = ((x, None, 0),)
+            self.ranges_b_minus = ((x, None, 0),)
+
     def get_xml(self, i: int, ylim: Tuple[Decimal, Decimal] = (-100, 100)) -> str:
         """Get xml representation of the edge.
 
@@ -497,42 +609,33 @@ class PointBisectorEdge(Edge):
 class WeightedPointBisectorEdge(Edge):
     """Weighted Point Bisector representation in Voronoi Diagram."""
 
+    __slots__ = ()
+
+    BOUNDARY_CLASS = WeightedPointBoundary
+
     bisector: WeightedPointBisector
     boundary_plus: WeightedPointBoundary
     boundary_minus: WeightedPointBoundary
 
-    def __init__(
-        self,
-        bisector: WeightedPointBisector,
-        boundary_plus: WeightedPointBoundary,
-        boundary_minus: WeightedPointBoundary,
-        vertex1: Any = None,
-        vertex2: Any = None,
-    ) -> None:
+    def __init__(self, bisector: WeightedPointBisector) -> None:
         """Create Voronoi Diagram Weighted Bisector."""
-        super().__init__(bisector, boundary_plus, boundary_minus, vertex1, vertex2)
+        super().__init__(bisector)
 
     def add_end_range(
         self, x: Optional[Decimal], boundary_sign: bool, side: BisectorSide
     ) -> None:
         """Add new of the the bisector to be graphed."""
-        if boundary_sign:
-            ranges = self.ranges_b_plus
-        else:
-            ranges = self.ranges_b_minus
-
-        last_side = ranges[-1][2]
+        x0, _, last_side = self.get_last_range(boundary_sign)
         if last_side != side:
             vertical_tangents = self.bisector.get_vertical_tangents()
             if len(vertical_tangents) >= 1:
-                ranges[-1] = (
-                    ranges[-1][0],
-                    vertical_tangents[0],
-                    last_side,
+                self.set_last_range(
+                    boundary_sign,
+                    (x0, vertical_tangents[0], last_side),
+                    (vertical_tangents[0], x, side),
                 )
-                ranges.append((vertical_tangents[0], x, side))
         else:
-            ranges[-1] = (ranges[-1][0], x, side)
+            self.set_last_range(boundary_sign, (x0, x, side))
 
     def get_y_by_side(self, x: Decimal, side: BisectorSide) -> Optional[Decimal]:
         """Get y by BisectorSide."""
@@ -546,43 +649,47 @@ class WeightedPointBisectorEdge(Edge):
                 return max(ys)
             return min(ys)
 
+    def get_ys_by_side(self, xs: np.ndarray, side: BisectorSide) -> np.ma.MaskedArray:
+        """Get ys by BisectorSide of many xs in one vectorized pass."""
+        ys = self.bisector.formula_y_many(xs)
+        if side == 1:
+            return ys.max(axis=0)
+        return ys.min(axis=0)
+
     def complete_ranges(self) -> None:
         """Add a new range if neccessary."""
         # No blank lines
-        def complete_range_in_boundary_if_neccessary(x, side, boundary):
-            if x is None and side == 0 and boundary.is_boundary_not_x_monotone():
-                self.add_end_range(None, boundary.sign, 1)
+        def complete_range_in_boundary_if_neccessary(x, side, sign):
+            not_x_monotone_sign = self.bisector.get_not_x_monotone_sign()
+            if x is None and side == 0 and not_x_monotone_sign == sign:
+                self.add_end_range(None, sign, 1)
 
         def delete_first_with_side_0(b_range):
             for i, (_, _, side) in enumerate(b_range):
                 if side == 0:
-                    del b_range[i]
-                    break
+                    return b_range[:i] + b_range[i + 1 :]
+            return b_range
 
         if len(self.ranges_b_minus) > 0 and len(self.ranges_b_plus) > 0:
             x0, x1, side = self.ranges_b_plus[-1]
-            complete_range_in_boundary_if_neccessary(x1, side, self.boundary_plus)
+            complete_range_in_boundary_if_neccessary(x1, side, True)
             x1, x0, side = self.ranges_b_minus[-1]
-            complete_range_in_boundary_if_neccessary(x0, side, self.boundary_minus)
+            complete_range_in_boundary_if_neccessary(x0, side, False)
             return
         if len(self.ranges_b_minus) > 0:
             x1, x0, side = self.ranges_b_minus[-1]
-            return complete_range_in_boundary_if_neccessary(
-                x0, side, self.boundary_minus
-            )
+            return complete_range_in_boundary_if_neccessary(x0, side, False)
         if len(self.ranges_b_plus) > 0:
             x0, x1, side = self.ranges_b_plus[-1]
-            return complete_range_in_boundary_if_neccessary(
-                x1, side, self.boundary_plus
-            )
+            return complete_range_in_boundary_if_neccessary(x1, side, True)
 
         sites = self.bisector.get_sites_tuple()
         are_sites_in_same_y = (
             sites[0].get_event_point().y == sites[1].get_event_point().y
         )
         if not self.bisector.is_vertical() and are_sites_in_same_y:
-            delete_first_with_side_0(self.ranges_b_plus)
-            delete_first_with_side_0(self.ranges_b_minus)
+            self.ranges_b_plus = delete_first_with_side_0(self.ranges_b_plus)
+            self.ranges_b_minus = delete_first_with_side_0(self.ranges_b_minus)
 
     def get_xml(self, i: int, ylim: Tuple[Decimal, Decimal] = (-100, 100)) -> str:
         """Get xml representation of the edge.
@@ -14,10 +14,15 @@ from ..data_structures.avl_tree import AVLNode
 # Math
 from math import tan, atan, sin, cos
 from decimal import Decimal
+import numpy as np
 
 # Conic Sections
 from conic_sections.utils.circle import get_circle_formula_x, get_circle_formula_y
 
+# Utils
+from general_utils.numbers import to_number, to_number_like, sqrt
+from general_utils.xml_elements import element_to_string
+
 # Types
 Coordinates = Tuple[Decimal, Decimal]
 
@@ -26,6 +31,7 @@ class Event:
     """Event Representation. It can be either a Site or an Interception."""
 
     __metaclass__ = ABCMeta
+    __slots__ = ("point", "is_site", "name")
 
     is_site: bool
     point: Point
@@ -33,7 +39,7 @@ class Event:
 
     def __init__(self, x: Decimal, y: Decimal, is_site: bool, name: str = ""):
         """Construct Event."""
-        self.point = Point(x, y)
+        self.point = Point(to_number(x), to_number(y))
         self.is_site = is_site
         self.name = name
 
@@ -77,6 +83,14 @@ class Event:
             return other_event_point.x - event_point.x
         return event_point.y - other_event_point.y
 
+    def get_queue_key(self) -> Tuple[Decimal, Decimal, Decimal]:
+        """Get key to sort this event in a queue.
+
+        Events are sorted by y, then by weight and then by x in descending order.
+        """
+        event_point = self.get_event_point()
+        return (event_point.y, 0, -event_point.x)
+
     def get_xml_element_value(self, label: str, value: str) -> str:
         """Get xml element with value."""
         numeric_element = ET.Element("element")
@@ -101,9 +115,7 @@ class Event:
         numeric_line_style.set("type", "0")
         numeric_line_style.set("typeHidden", "1")
 
-        numeric_xml = (
-            ET.tostring(numeric_element, encoding="unicode", method="xml") + "\n"
-        )
+        numeric_xml = element_to_string(numeric_element) + "\n"
         return numeric_xml
 
 
@@ -113,6 +125,8 @@ class Site(Event):
     By itself it is just a point.
     """
 
+    __slots__ = ()
+
     def __init__(self, x: Decimal, y: Decimal, name: str = "") -> None:
         """Construct point."""
         super(Site, self).__init__(x, y, True, name=name)
@@ -154,15 +168,17 @@ class Site(Event):
 
         In this case the site distance is the distance to the site point.
         """
-        return (
-            ((self.point.x - x) ** Decimal(2)) + ((self.point.y - y) ** Decimal(2))
-        ).sqrt()
+        return sqrt(((self.point.x - x) ** 2) + ((self.point.y - y) ** 2))
+
+    def get_site_distance_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Get distances to site from many points in one vectorized pass."""
+        return np.sqrt(
+            ((float(self.point.x) - xs) ** 2) + ((float(self.point.y) - ys) ** 2)
+        )
 
     def get_distance_to_site_point_from_point(self, x: Decimal, y: Decimal) -> Decimal:
         """Get distance to site point from another point."""
-        return (
-            ((self.point.x - x) ** Decimal(2)) + ((self.point.y - y) ** Decimal(2))
-        ).sqrt()
+        return sqrt(((self.point.x - x) ** 2) + ((self.point.y - y) ** 2))
 
     def get_distance_to_site_frontier_from_point(
         self, x: Decimal, y: Decimal
@@ -197,6 +213,15 @@ class Site(Event):
         """Get object to hash this site."""
         return (self.point.x, self.point.y)
 
+    def get_decimal_site(self) -> "Site":
+        """Get this site with Decimal coordinates.
+
+        Used to recompute with Decimal the comparisons that are ambiguous in floats.
+        """
+        if isinstance(self.point.x, Decimal) and isinstance(self.point.y, Decimal):
+            return self
+        return Site(Decimal(self.point.x), Decimal(self.point.y), name=self.name)
+
     def get_xml(self) -> str:
         """Get XML representation."""
         xml_str = ""
@@ -216,6 +241,8 @@ class Site(Event):
 class Intersection(Event):
     """Intersection to handle in Fortune's Algorithm."""
 
+    __slots__ = ("vertex", "region_node")
+
     vertex: Point
     region_node: AVLNode
 
@@ -244,12 +271,14 @@ class WeightedSite(Site):
     Is a point with weight.
     """
 
+    __slots__ = ("weight",)
+
     weight: Decimal
 
     def __init__(self, x: Decimal, y: Decimal, weight: Decimal, name: str = "") -> None:
         """Construct point."""
         super(WeightedSite, self).__init__(x, y, name=name)
-        self.weight = weight
+        self.weight = to_number(weight)
 
     def __eq__(self, site: "WeightedSite") -> bool:
         """Get equality between weighted sites."""
@@ -264,9 +293,17 @@ class WeightedSite(Site):
 
         In this case the site distance is the distance to the site point plus the weight.
         """
-        return (
-            ((self.point.x - x) ** Decimal(2)) + ((self.point.y - y) ** Decimal(2))
-        ).sqrt() + abs(self.weight)
+        return sqrt(((self.point.x - x) ** 2) + ((self.point.y - y) ** 2)) + abs(
+            self.weight
+        )
+
+    def get_site_distance_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Get distances to site from many points in one vectorized pass.
+
+        In this case it is the distance to the site point plus the weight.
+        """
+        distances = super(WeightedSite, self).get_site_distance_many(xs, ys)
+        return distances + abs(float(self.weight))
 
     def compare_weights(self, site: "WeightedSite") -> int:
         """Compare weight between sites."""
@@ -278,57 +315,57 @@ class WeightedSite(Site):
     def get_x_frontier_pointing_to_point(self, point: Point) -> Decimal:
         """Get the last point of the site pointing to given point."""
         if point.x >= self.point.x:
-            sign = Decimal(1)
+            sign = 1
         else:
-            sign = Decimal(-1)
+            sign = -1
 
         if point.x == self.point.x:
             return self.point.x
 
         angle = abs(atan((point.y - self.point.y) / (point.x - self.point.x)))
-        x = abs(self.weight) * Decimal(cos(angle))
+        x = abs(self.weight) * to_number_like(cos(angle), self.weight)
         return self.point.x + sign * x
 
     def get_x_farthest_frontier_pointing_to_point(self, point: Point) -> Decimal:
         """Get the farthest point of the site pointing to given point."""
         if point.x >= self.point.x:
-            sign = Decimal(-1)
+            sign = -1
         else:
-            sign = Decimal(1)
+            sign = 1
 
         if point.x == self.point.x:
             return self.point.x
 
         angle = abs(atan((point.y - self.point.y) / (point.x - self.point.x)))
-        x = abs(self.weight) * Decimal(cos(angle))
+        x = abs(self.weight) * to_number_like(cos(angle), self.weight)
         return self.point.x + sign * x
 
     def get_y_frontier_pointing_to_point(self, point: Point) -> Decimal:
         """Get the last point of the site pointing to given point."""
         if point.y >= self.point.y:
-            sign = Decimal(1)
+            sign = 1
         else:
-            sign = Decimal(-1)
+            sign = -1
 
         if point.x == self.point.x:
             return self.point.y + sign * self.weight
 
         angle = abs(atan((point.y - self.point.y) / (point.x - self.point.x)))
-        y = abs(self.weight) * Decimal(sin(angle))
+        y = abs(self.weight) * to_number_like(sin(angle), self.weight)
         return self.point.y + sign * y
 
     def get_y_farthest_frontier_pointing_to_point(self, point: Point) -> Decimal:
         """Get the farthest point of the site pointing to given point."""
         if point.y >= self.point.y:
-            sign = Decimal(-1)
+            sign = -1
         else:
-            sign = Decimal(1)
+            sign = 1
 
         if point.x == self.point.x:
             return self.point.y + sign * self.weight
 
         angle = abs(atan((point.y - self.point.y) / (point.x - self.point.x)))
-        y = abs(self.weight) * Decimal(sin(angle))
+        y = abs(self.weight) * to_number_like(sin(angle), self.weight)
         return self.point.y + sign * y
 
     def get_y_frontier_formula(self, x: Decimal) -> Optional[Tuple[Decimal, Decimal]]:
@@ -384,6 +421,29 @@ class WeightedSite(Site):
         """Get object to hash this site."""
         return (self.point.x, self.point.y, self.weight)
 
+    def get_decimal_site(self) -> "WeightedSite":
+        """Get this weighted site with Decimal coordinates and weight."""
+        if (
+            isinstance(self.point.x, Decimal)
+            and isinstance(self.point.y, Decimal)
+            and isinstance(self.weight, Decimal)
+        ):
+            return self
+        return WeightedSite(
+            Decimal(self.point.x),
+            Decimal(self.point.y),
+            Decimal(self.weight),
+            name=self.name,
+        )
+
+    def get_queue_key(self) -> Tuple[Decimal, Decimal, Decimal]:
+        """Get key to sort this event in a queue.
+
+        The smallest site will be first between sites with the same y.
+        """
+        event_point = self.get_event_point()
+        return (event_point.y, self.weight, -event_point.x)
+
     def get_comparison(self, event: Event) -> Decimal:
         """Get comparison between 2 events."""
         if not event.is_site:
@@ -467,8 +527,8 @@ class WeightedSite(Site):
         weight_line_style.set("opacity", "204")
 
         expression_xml = (
-            ET.tostring(weight_expression, encoding="unicode", method="xml")
+            element_to_string(weight_expression)
             + "\n"
-            + ET.tostring(weight_element, encoding="unicode", method="xml")
+            + element_to_string(weight_element)
         )
         return expression_xml
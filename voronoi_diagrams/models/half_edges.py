@@ -0,0 +1,60 @@
+"""Half-edges of the doubly connected edge list of the Voronoi Diagram."""
+
+# Standard Library
+from typing import Any, Optional
+
+Edge = "edges.Edge"
+Vertex = "vertices.Vertex"
+
+
+class HalfEdge:
+    """Half of an edge in the boundary of the cell of its site.
+
+    The half-edges of a cell go counterclockwise around its site, so the cell is at
+    the left of each one. origin is None when the half-edge comes from the infinity.
+    When the sweep ends, in unbounded cells the half-edge that goes to the infinity
+    is followed by the one that comes from the infinity, so every cell is a cycle.
+    """
+
+    __slots__ = ("edge", "origin", "twin", "next", "prev")
+
+    edge: Edge
+    origin: Optional[Vertex]
+    twin: Optional["HalfEdge"]
+    next: Optional["HalfEdge"]
+    prev: Optional["HalfEdge"]
+
+    def __init__(self, edge: Edge) -> None:
+        """Constructor.
+
+        The site is not saved, as it is known from the bisector of the edge.
+        """
+        self.edge = edge
+        self.origin = None
+        self.twin = None
+        self.next = None
+        self.prev = None
+
+    @property
+    def site(self) -> Any:
+        """Get the site of the cell, given by the bisector of the edge."""
+        if self is self.edge.half_edge:
+            return self.edge.bisector.sites[0]
+        return self.edge.bisector.sites[1]
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"H({self.site.name}, {self.origin}, {self.get_destination()})"
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return self.__str__()
+
+    def get_destination(self) -> Optional[Vertex]:
+        """Get vertex where this half-edge ends, None if it goes to the infinity."""
+        return self.twin.origin
+
+    def set_next(self, half_edge: "HalfEdge") -> None:
+        """Set the half-edge that follows this one in the cell."""
+        self.next = half_edge
+        half_edge.prev = self
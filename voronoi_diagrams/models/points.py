@@ -6,12 +6,17 @@ from xml.etree import ElementTree as ET
 # Math
 from decimal import Decimal
 
+# Utils
+from general_utils.xml_elements import element_to_string
+
 Coordinates = Tuple[Decimal, Decimal]
 
 
 class Point:
     """Point representation."""
 
+    __slots__ = ("x", "y")
+
     x: Decimal
     y: Decimal
 
@@ -32,10 +37,18 @@ class Point:
         """Get equality between points."""
         return self.x == point.x and self.y == point.y
 
+    def __hash__(self) -> int:
+        """Get hash of the point, the same of the points equal to it."""
+        return hash((self.x, self.y))
+
     def get_tuple(self) -> Coordinates:
         """Get tuple of coordinates (x, y)."""
         return (self.x, self.y)
 
+    def get_decimal_point(self) -> "Point":
+        """Get this point with Decimal coordinates."""
+        return Point(Decimal(self.x), Decimal(self.y))
+
     def get_xml(self, label, exp) -> str:
         """Get xml representation."""
         point_expression = ET.Element("expression")
@@ -77,9 +90,9 @@ class Point:
         point_style.set("val", "0")
 
         expression_xml = (
-            ET.tostring(point_expression, encoding="unicode", method="xml")
+            element_to_string(point_expression)
             + "\n"
-            + ET.tostring(point_element, encoding="unicode", method="xml")
+            + element_to_string(point_element)
             + "\n"
         )
         return expression_xml
@@ -1,7 +1,8 @@
 """Region representation."""
 
 # Standard Library
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Tuple
+from decimal import Decimal
 
 # Models
 from .boundaries import Boundary
@@ -12,6 +13,8 @@ from .events import Site
 class Region:
     """Voronoi Cell that is * mapped."""
 
+    __slots__ = ("left", "right", "site", "active", "is_to_be_deleted")
+
     left: Optional[Boundary]
     right: Optional[Boundary]
     site: Site
@@ -54,7 +57,7 @@ class Region:
         if self.left is None:
             return True
 
-        comparison = self.left.get_point_comparison(point)
+        comparison = self.left.compare_point(point)
         return comparison > 0
 
     def is_right_contained(self, point: Point) -> bool:
@@ -64,9 +67,27 @@ class Region:
         if self.right is None:
             return True
 
-        comparison = self.right.get_point_comparison(point)
+        comparison = self.right.compare_point(point)
         return comparison <= 0
 
+    def get_containment(
+        self,
+        point: Point,
+        compare_point: Optional[Callable[[Boundary, Point], Decimal]] = None,
+    ) -> Tuple[bool, bool]:
+        """Return if a point is contained to the left and to the right.
+
+        Each boundary is compared once with the point using compare_point, that is
+        Boundary.compare_point by default.
+        """
+        if point.y < self.site.get_highest_site_point().y:
+            return (False, False)
+        if compare_point is None:
+            compare_point = Boundary.compare_point
+        is_left_contained = self.left is None or compare_point(self.left, point) > 0
+        is_right_contained = self.right is None or compare_point(self.right, point) <= 0
+        return (is_left_contained, is_right_contained)
+
     def __str__(self) -> str:
         """Get Region string representation."""
         return f"Region({self.site}, {self.left}, {self.right})"
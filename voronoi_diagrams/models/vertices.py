@@ -1,9 +1,12 @@
 """Vertices in Voronoi Diagram."""
 
 # Standard Library
-from typing import List, Any, Optional
+from typing import Tuple, Any
 from xml.etree import ElementTree as ET
 
+# Utils
+from general_utils.xml_elements import element_to_string
+
 # Models
 from .points import Point
 from .edges import Edge
@@ -12,14 +15,17 @@ from .edges import Edge
 class Vertex:
     """Vertex representation in the Voronoi diagram."""
 
+    __slots__ = ("point", "edges")
+
     point: Point
-    edges: List[Edge]
+    edges: Tuple[Edge, ...]
+
+    def __init__(self, point: Point, edges: Tuple[Edge, ...] = ()) -> None:
+        """Constructor.
 
-    def __init__(self, point: Point, edges: Optional[List[Edge]] = None) -> None:
-        """Constructor."""
+        The edges are in a tuple, as a vertex has only a few of them.
+        """
         self.point = point
-        if edges is None:
-            edges = []
         self.edges = edges
 
     def __eq__(self, other: "Vertex") -> bool:
@@ -34,9 +40,9 @@ class Vertex:
         """Return string representation."""
         return self.__str__()
 
-    def add_edge(self, edge: Edge) -> List[Edge]:
+    def add_edge(self, edge: Edge) -> Tuple[Edge, ...]:
         """Add bisector adjacent to this vertex."""
-        self.edges.append(edge)
+        self.edges += (edge,)
         return self.edges
 
     def get_xml(self, i: int) -> str:
@@ -78,7 +84,5 @@ class Vertex:
         numeric_line_style.set("type", "0")
         numeric_line_style.set("typeHidden", "1")
 
-        numeric_xml = (
-            ET.tostring(numeric_element, encoding="unicode", method="xml") + "\n"
-        )
+        numeric_xml = element_to_string(numeric_element) + "\n"
         return numeric_xml
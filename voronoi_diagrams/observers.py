@@ -0,0 +1,44 @@
+"""Observers of Fortune's Algorithm.
+
+Observers are notified of every step of the algorithm. They are used to visualize
+the steps without making the algorithm depend on any plotting library.
+"""
+
+# Standard Library
+from typing import Optional, TYPE_CHECKING
+
+# Models
+from .models import Boundary, Site, Vertex
+
+if TYPE_CHECKING:
+    from .fortunes_algorithm import FortunesAlgorithm
+
+
+class FortunesAlgorithmObserver:
+    """Fortune's Algorithm observer.
+
+    Every method is a no-op, subclasses only override the ones they need.
+    """
+
+    voronoi_diagram: Optional["FortunesAlgorithm"] = None
+
+    def start(self, voronoi_diagram: "FortunesAlgorithm") -> None:
+        """Start observing voronoi diagram before the structures are initialized."""
+        self.voronoi_diagram = voronoi_diagram
+
+    def add_site(self, site: Site) -> None:
+        """Notify that site was enqueued."""
+
+    def step(self) -> None:
+        """Notify that a step was calculated."""
+
+    def site_event(self, boundary_minus: Boundary, boundary_plus: Boundary) -> None:
+        """Notify that a site event created boundary_minus and boundary_plus."""
+
+    def intersection_event(
+        self, boundary_q_s: Boundary, boundary_q_r: Boundary, boundary_r_s: Boundary,
+    ) -> None:
+        """Notify that an intersection event replaced boundary_q_r and boundary_r_s."""
+
+    def add_vertex(self, vertex: Vertex) -> None:
+        """Notify that vertex was added."""
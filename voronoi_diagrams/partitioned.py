@@ -0,0 +1,495 @@
+"""Divide and conquer computation of a single Voronoi Diagram.
+
+The sites are split in vertical strips with the same number of sites. Each strip is
+calculated with a halo of the sites around it and only the cells that are the same
+as in the whole diagram are kept.
+
+The local cell of a site always contains its real cell, and a site can only cut the
+local cell if it is inside the flower of the cell: the union of the empty circles of
+its vertices and the half planes beyond its unbounded edges. So the cell is final
+when the empty circles only have sites of the window and the unbounded edges are
+between consecutive sites of the convex hull. The cells that are not final are
+calculated again with all the sites in their flower, that is enough to get them.
+"""
+# Standard Library
+from typing import Dict, List, Optional, Sequence, Tuple
+import os
+
+# Batch
+from .batch import compute_many, compute_one, to_site_array
+
+# Models
+from .models import DiagramArrays, NO_VERTEX
+
+# Math
+from math import inf, sqrt
+import numpy as np
+
+# Utils
+from general_utils.numbers import DECIMAL_NUMERIC
+
+# Strips per worker when the number of strips is not given.
+STRIPS_PER_WORKER = 2
+# Initial halo measured in the mean distance between sites.
+HALO_SPACINGS = 4
+# Relative tolerance used to decide if an empty circle is inside a window.
+WINDOW_TOLERANCE = 1e-9
+
+# (xmin, xmax, ymin, ymax)
+Box = Tuple[float, float, float, float]
+VertexKey = Tuple[int, ...]
+
+ALL_PLANE = (-inf, inf, -inf, inf)
+EMPTY_BOX = (inf, -inf, inf, -inf)
+
+
+class Tile:
+    """Sites whose cells are calculated with the sites in a window around them."""
+
+    __slots__ = ("owned", "window", "is_flower_window")
+
+    owned: np.ndarray
+    window: Box
+    is_flower_window: bool
+
+    def __init__(
+        self, owned: np.ndarray, window: Box, is_flower_window: bool = False
+    ) -> None:
+        """Constructor."""
+        self.owned = owned
+        self.window = window
+        self.is_flower_window = is_flower_window
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"Tile({len(self.owned)} sites, {self.window})"
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return self.__str__()
+
+
+class PartitionedDiagram:
+    """Voronoi Diagram built from the final cells of the tiles."""
+
+    __slots__ = (
+        "sites",
+        "order",
+        "sorted_xs",
+        "box",
+        "edges",
+        "vertices",
+        "_vertex_indices",
+    )
+
+    sites: np.ndarray
+    order: np.ndarray
+    sorted_xs: np.ndarray
+    box: Box
+    edges: Dict[Tuple[int, int], Tuple[int, int]]
+    vertices: List[Tuple[float, float]]
+    _vertex_indices: Dict[VertexKey, int]
+
+    def __init__(self, sites: np.ndarray) -> None:
+        """Constructor."""
+        self.sites = sites
+        self.order = np.argsort(sites[:, 0], kind="stable")
+        self.sorted_xs = sites[self.order, 0]
+        self.box = get_box(sites)
+        self.edges = {}
+        self.vertices = []
+        self._vertex_indices = {}
+
+    def get_sites_in_box(self, box: Box) -> np.ndarray:
+        """Get the indices of the sites inside the box."""
+        xmin, xmax, ymin, ymax = box
+        start = np.searchsorted(self.sorted_xs, xmin, side="left")
+        end = np.searchsorted(self.sorted_xs, xmax, side="right")
+        indices = self.order[start:end]
+        ys = self.sites[indices, 1]
+        return indices[(ys >= ymin) & (ys <= ymax)]
+
+    def get_window_limits(self, window: Box) -> Box:
+        """Get the window with infinite limits in the sides without more sites."""
+        xmin, xmax, ymin, ymax = window
+        return (
+            -inf if xmin <= self.box[0] else xmin,
+            inf if xmax >= self.box[1] else xmax,
+            -inf if ymin <= self.box[2] else ymin,
+            inf if ymax >= self.box[3] else ymax,
+        )
+
+    def add_final_cells(
+        self, tile: Tile, window: np.ndarray, local_diagram: DiagramArrays
+    ) -> List[Tile]:
+        """Add the final cells of the tile and get the tiles of the ones not final."""
+        window_limits = self.get_window_limits(tile.window)
+        local_edges = local_diagram.edges
+        sites_a = window[local_edges[:, 0]]
+        sites_b = window[local_edges[:, 1]]
+
+        are_cells_final = np.zeros(len(self.sites), dtype=bool)
+        are_cells_final[sites_a] = True
+        are_cells_final[sites_b] = True
+        if window_limits == ALL_PLANE:
+            if len(window) == 1:
+                # Only one site, its cell is the whole plane.
+                are_cells_final[window] = True
+        else:
+            are_edges_final = self.are_edges_final(
+                local_diagram, sites_a, sites_b, window_limits
+            )
+            are_cells_final[sites_a[~are_edges_final]] = False
+            are_cells_final[sites_b[~are_edges_final]] = False
+
+        are_owned_final = np.zeros(len(self.sites), dtype=bool)
+        are_owned_final[tile.owned[are_cells_final[tile.owned]]] = True
+        vertex_keys = self.get_vertex_keys(local_edges, sites_a, sites_b)
+        for i in np.flatnonzero(are_owned_final[sites_a] | are_owned_final[sites_b]):
+            site_pair = (int(sites_a[i]), int(sites_b[i]))
+            if site_pair not in self.edges:
+                self.edges[site_pair] = (
+                    self.get_vertex_index(
+                        vertex_keys, local_diagram.vertices, local_edges[i, 2]
+                    ),
+                    self.get_vertex_index(
+                        vertex_keys, local_diagram.vertices, local_edges[i, 3]
+                    ),
+                )
+
+        not_final = tile.owned[~are_owned_final[tile.owned]]
+        if len(not_final) == 0:
+            return []
+        if tile.is_flower_window:
+            # The flower was not enough only because of the tolerance.
+            return [Tile(not_final, ALL_PLANE)]
+        flower_boxes = self.get_flower_boxes(
+            not_final, window, local_diagram, sites_a, sites_b
+        )
+        return [
+            Tile(owned, box, is_flower_window=True)
+            for owned, box in merge_boxes(not_final, flower_boxes)
+        ]
+
+    def are_edges_final(
+        self,
+        local_diagram: DiagramArrays,
+        sites_a: np.ndarray,
+        sites_b: np.ndarray,
+        window_limits: Box,
+    ) -> np.ndarray:
+        """Check which local edges are edges of the whole diagram."""
+        local_edges = local_diagram.edges
+        are_vertices_final = self.are_vertices_final(
+            local_diagram.vertices, local_edges, sites_a, window_limits
+        )
+        are_edges_final = local_edges[:, 2] != NO_VERTEX
+        for column in (2, 3):
+            vertex_indices = local_edges[:, column]
+            has_vertex = vertex_indices != NO_VERTEX
+            are_edges_final &= ~has_vertex | are_vertices_final[vertex_indices]
+        for i in np.flatnonzero(are_edges_final & (local_edges[:, 3] == NO_VERTEX)):
+            are_edges_final[i] = self.is_hull_edge(sites_a[i], sites_b[i])
+        return are_edges_final
+
+    def get_circle_boxes(
+        self, vertices: np.ndarray, local_edges: np.ndarray, sites_a: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get radii of the empty circles and the boxes of their part with sites.
+
+        The boxes contain the part of the circles inside the box of all the sites,
+        they are empty when the circle does not touch it. Radii and boxes are
+        widened by the tolerance.
+        """
+        radii = np.zeros(len(vertices))
+        for column in (2, 3):
+            has_vertex = local_edges[:, column] != NO_VERTEX
+            vertex_indices = local_edges[has_vertex, column]
+            distances = vertices[vertex_indices] - self.sites[sites_a[has_vertex]]
+            radii[vertex_indices] = np.hypot(distances[:, 0], distances[:, 1])
+
+        xs, ys = vertices[:, 0], vertices[:, 1]
+        xmin, xmax, ymin, ymax = self.box
+        x_gaps = np.maximum(np.maximum(xs - xmax, xmin - xs), 0)
+        y_gaps = np.maximum(np.maximum(ys - ymax, ymin - ys), 0)
+        tolerances = WINDOW_TOLERANCE * (1 + np.abs(xs) + np.abs(ys) + radii)
+        half_widths = np.sqrt(np.maximum(radii ** 2 - y_gaps ** 2, 0)) + tolerances
+        half_heights = np.sqrt(np.maximum(radii ** 2 - x_gaps ** 2, 0)) + tolerances
+        boxes = np.stack(
+            [
+                np.maximum(xs - half_widths, xmin),
+                np.minimum(xs + half_widths, xmax),
+                np.maximum(ys - half_heights, ymin),
+                np.minimum(ys + half_heights, ymax),
+            ],
+            axis=1,
+        )
+        return radii + tolerances, boxes
+
+    def are_vertices_final(
+        self,
+        vertices: np.ndarray,
+        local_edges: np.ndarray,
+        sites_a: np.ndarray,
+        window_limits: Box,
+    ) -> np.ndarray:
+        """Check which empty circles of the vertices only have sites of the window."""
+        radii, boxes = self.get_circle_boxes(vertices, local_edges, sites_a)
+        xmin, xmax, ymin, ymax = window_limits
+        are_vertices_final = (
+            (boxes[:, 0] >= xmin)
+            & (boxes[:, 1] <= xmax)
+            & (boxes[:, 2] >= ymin)
+            & (boxes[:, 3] <= ymax)
+        )
+        for i in np.flatnonzero(~are_vertices_final):
+            are_vertices_final[i] = self.is_circle_empty(
+                vertices[i], radii[i], window_limits
+            )
+        return are_vertices_final
+
+    def is_circle_empty(
+        self, center: np.ndarray, radius: float, window_limits: Box
+    ) -> bool:
+        """Check if there are no sites outside the window inside the circle.
+
+        Sites on the circle are counted as inside, so a vertex of more than 3 sites
+        is only final when all of them are in the window.
+        """
+        x, y = center
+        candidates = self.sites[
+            self.get_sites_in_box((x - radius, x + radius, y - radius, y + radius))
+        ]
+        xs, ys = candidates[:, 0], candidates[:, 1]
+        xmin, xmax, ymin, ymax = window_limits
+        are_outside = (xs < xmin) | (xs > xmax) | (ys < ymin) | (ys > ymax)
+        distances = (xs[are_outside] - x) ** 2 + (ys[are_outside] - y) ** 2
+        return bool(np.all(distances > radius ** 2))
+
+    def get_line_distances(self, site_a: int, site_b: int) -> np.ndarray:
+        """Get signed distances of the sites to the line ab, scaled by |ab|."""
+        direction = self.sites[site_b] - self.sites[site_a]
+        normal = np.array([-direction[1], direction[0]])
+        distances = (self.sites - self.sites[site_a]) @ normal
+        # Avoid the rounding errors of the sites of the line.
+        distances[[site_a, site_b]] = 0
+        return distances
+
+    def is_hull_edge(self, site_a: int, site_b: int) -> bool:
+        """Check if there are no sites in one of the sides of the line ab."""
+        distances = self.get_line_distances(site_a, site_b)
+        return bool(distances.max() <= 0 or distances.min() >= 0)
+
+    def get_half_plane_box(self, site_a: int, site_b: int, window: np.ndarray) -> Box:
+        """Get the box of the sites beyond the line ab.
+
+        ab is in the convex hull of the window, the sites beyond are the ones in the
+        side without sites of the window.
+        """
+        distances = self.get_line_distances(site_a, site_b)
+        window_distances = distances[window]
+        if window_distances.min() < 0:
+            beyond = self.sites[distances > 0]
+        elif window_distances.max() > 0:
+            beyond = self.sites[distances < 0]
+        else:
+            return self.box
+        return get_box(beyond)
+
+    def get_flower_boxes(
+        self,
+        owned: np.ndarray,
+        window: np.ndarray,
+        local_diagram: DiagramArrays,
+        sites_a: np.ndarray,
+        sites_b: np.ndarray,
+    ) -> np.ndarray:
+        """Get the boxes of the sites in the flowers of the owned local cells.
+
+        Cells without edges or with an edge without vertices get the box of all
+        the sites.
+        """
+        local_edges = local_diagram.edges
+        _, circle_boxes = self.get_circle_boxes(
+            local_diagram.vertices, local_edges, sites_a
+        )
+        boxes = np.tile(EMPTY_BOX, (len(window), 1))
+        for column in (0, 1):
+            for vertex_column in (2, 3):
+                vertex_indices = local_edges[:, vertex_column]
+                has_vertex = vertex_indices != NO_VERTEX
+                cells = local_edges[has_vertex, column]
+                vertex_boxes = circle_boxes[vertex_indices[has_vertex]]
+                np.minimum.at(boxes[:, 0], cells, vertex_boxes[:, 0])
+                np.maximum.at(boxes[:, 1], cells, vertex_boxes[:, 1])
+                np.minimum.at(boxes[:, 2], cells, vertex_boxes[:, 2])
+                np.maximum.at(boxes[:, 3], cells, vertex_boxes[:, 3])
+
+        is_owned = np.zeros(len(self.sites), dtype=bool)
+        is_owned[owned] = True
+        for i in np.flatnonzero(
+            (is_owned[sites_a] | is_owned[sites_b]) & (local_edges[:, 3] == NO_VERTEX)
+        ):
+            if local_edges[i, 2] == NO_VERTEX:
+                half_plane_box = self.box
+            else:
+                half_plane_box = self.get_half_plane_box(sites_a[i], sites_b[i], window)
+            for cell in local_edges[i, :2]:
+                boxes[cell] = get_union_box(boxes[cell], half_plane_box)
+
+        local_indices = np.full(len(self.sites), -1)
+        local_indices[window] = np.arange(len(window))
+        flower_boxes = boxes[local_indices[owned]]
+        flower_boxes[flower_boxes[:, 0] > flower_boxes[:, 1]] = self.box
+        return flower_boxes
+
+    def get_vertex_keys(
+        self, local_edges: np.ndarray, sites_a: np.ndarray, sites_b: np.ndarray
+    ) -> Dict[int, VertexKey]:
+        """Get the sites around each local vertex, used to identify it."""
+        vertex_sites: Dict[int, set] = {}
+        for column in (2, 3):
+            for vertex_index, site_a, site_b in zip(
+                local_edges[:, column].tolist(), sites_a.tolist(), sites_b.tolist()
+            ):
+                if vertex_index != NO_VERTEX:
+                    vertex_sites.setdefault(vertex_index, set()).update(
+                        (site_a, site_b)
+                    )
+        return {
+            vertex_index: tuple(sorted(sites))
+            for vertex_index, sites in vertex_sites.items()
+        }
+
+    def get_vertex_index(
+        self,
+        vertex_keys: Dict[int, VertexKey],
+        local_vertices: np.ndarray,
+        local_vertex_index: int,
+    ) -> int:
+        """Get the index in the whole diagram of a local vertex."""
+        if local_vertex_index == NO_VERTEX:
+            return NO_VERTEX
+        key = vertex_keys[int(local_vertex_index)]
+        if key not in self._vertex_indices:
+            self._vertex_indices[key] = len(self.vertices)
+            x, y = local_vertices[local_vertex_index]
+            self.vertices.append((float(x), float(y)))
+        return self._vertex_indices[key]
+
+    def get_diagram_arrays(self) -> DiagramArrays:
+        """Get the arrays representation of the diagram."""
+        vertices = np.array(self.vertices, dtype=float).reshape(-1, 2)
+        edges = np.array(
+            [
+                (site_a, site_b, v0, v1)
+                for (site_a, site_b), (v0, v1) in self.edges.items()
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 4)
+        return DiagramArrays(vertices, edges, len(self.sites))
+
+
+def get_box(points: np.ndarray) -> Box:
+    """Get the smallest box containing the points."""
+    if len(points) == 0:
+        return EMPTY_BOX
+    return (
+        float(points[:, 0].min()),
+        float(points[:, 0].max()),
+        float(points[:, 1].min()),
+        float(points[:, 1].max()),
+    )
+
+
+def get_union_box(box_1: Sequence[float], box_2: Sequence[float]) -> Box:
+    """Get the smallest box containing both boxes."""
+    return (
+        min(box_1[0], box_2[0]),
+        max(box_1[1], box_2[1]),
+        min(box_1[2], box_2[2]),
+        max(box_1[3], box_2[3]),
+    )
+
+
+def merge_boxes(owned: np.ndarray, boxes: np.ndarray) -> List[Tuple[np.ndarray, Box]]:
+    """Group the sites whose boxes overlap, with the box of each group."""
+    groups: List[Tuple[List[int], Box]] = []
+    for i in np.argsort(boxes[:, 0], kind="stable"):
+        box = tuple(boxes[i])
+        if groups:
+            group_owned, group_box = groups[-1]
+            if (
+                box[0] <= group_box[1]
+                and box[2] <= group_box[3]
+                and group_box[2] <= box[3]
+            ):
+                group_owned.append(owned[i])
+                groups[-1] = (group_owned, get_union_box(group_box, box))
+                continue
+        groups.append(([owned[i]], box))
+    return [(np.array(group_owned), box) for group_owned, box in groups]
+
+
+def get_strips(diagram: PartitionedDiagram, n_strips: int) -> List[Tile]:
+    """Split the sites in vertical strips with the same number of sites.
+
+    The window of each strip has a halo proportional to the mean distance between
+    sites.
+    """
+    xmin, xmax, ymin, ymax = diagram.box
+    n = len(diagram.sites)
+    spacing = sqrt((xmax - xmin) * (ymax - ymin) / n)
+    if spacing == 0:
+        spacing = max(xmax - xmin, ymax - ymin) / n
+    halo = HALO_SPACINGS * spacing
+    strips = []
+    for owned in np.array_split(np.arange(n), n_strips):
+        if len(owned) > 0:
+            left = float(diagram.sorted_xs[owned[0]])
+            right = float(diagram.sorted_xs[owned[-1]])
+            window = (left - halo, right + halo, -inf, inf)
+            strips.append(Tile(diagram.order[owned], window))
+    return strips
+
+
+def compute_partitioned(
+    sites: Sequence,
+    workers: Optional[int] = None,
+    strips: Optional[int] = None,
+    numeric: str = DECIMAL_NUMERIC,
+) -> DiagramArrays:
+    """Calculate the Voronoi Diagram of many point sites splitting them in strips.
+
+    The tiles are calculated with compute_many, so they run in worker processes.
+    The result has the same edges and vertices as calculating all the sites at once,
+    only their order in the arrays is different.
+    strips defaults to STRIPS_PER_WORKER strips per worker.
+    """
+    site_array = to_site_array(sites)
+    if site_array.shape[1] != 2:
+        raise ValueError("Only diagrams of point sites can be partitioned.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if strips is None:
+        strips = workers * STRIPS_PER_WORKER
+    if strips <= 1 or len(site_array) <= 1:
+        return compute_one(site_array, numeric=numeric)
+
+    diagram = PartitionedDiagram(site_array)
+    pending = get_strips(diagram, strips)
+    while pending:
+        windows = [diagram.get_sites_in_box(tile.window) for tile in pending]
+        local_diagrams = compute_many(
+            (site_array[window] for window in windows),
+            workers=workers,
+            numeric=numeric,
+            chunksize=1,
+        )
+        next_pending = []
+        for local_diagram in local_diagrams:
+            tile = pending[local_diagram.index]
+            window = windows[local_diagram.index]
+            next_pending += diagram.add_final_cells(tile, window, local_diagram)
+        pending = next_pending
+    return diagram.get_diagram_arrays()
@@ -0,0 +1,220 @@
+"""Point location in a finished Voronoi Diagram.
+
+The box of the diagram is split in a grid and every grid cell keeps the sites
+whose cells intersect it, so a query only compares the distances to a few sites.
+"""
+# Standard Library
+from typing import Any, List, Optional, Tuple
+
+# Models
+from .models import WeightedSite
+
+# Math
+import numpy as np
+
+# Utils
+from general_utils.numbers import to_float_array
+
+Limit = Tuple[Any, Any]
+
+# Grid cells per site.
+DEFAULT_CELLS_PER_SITE = 2
+# Queries located at once, to bound the memory of the candidates.
+LOCATE_CHUNKSIZE = 1 << 16
+# Tolerance relative to the box size added to the bounds of the cells.
+BOUNDS_TOLERANCE = 1e-9
+
+
+class PointLocator:
+    """Index to get the site whose cell contains each point.
+
+    Built from the cells of a finished diagram clipped to a box. The distance is
+    the weighted distance of the sites, so AW diagrams are located too. Points out
+    of the box are compared with all the sites.
+    """
+
+    __slots__ = (
+        "site_xs",
+        "site_ys",
+        "site_weights",
+        "xlim",
+        "ylim",
+        "shape",
+        "cell_sizes",
+        "candidates",
+        "widths",
+    )
+
+    site_xs: np.ndarray
+    site_ys: np.ndarray
+    site_weights: Optional[np.ndarray]
+    xlim: Tuple[float, float]
+    ylim: Tuple[float, float]
+    shape: Tuple[int, int]
+    cell_sizes: Tuple[float, float]
+    # Sites of each grid cell, padded with len(sites) that is never the nearest.
+    candidates: np.ndarray
+    # Columns of candidates used in each grid cell, a power of 2 to group queries.
+    widths: np.ndarray
+
+    def __init__(
+        self,
+        voronoi_diagram: Any,
+        xlim: Optional[Limit] = None,
+        ylim: Optional[Limit] = None,
+        cells_per_site: float = DEFAULT_CELLS_PER_SITE,
+    ) -> None:
+        """Construct index of a finished diagram in the box given.
+
+        The box defaults to the limits of the diagram.
+        """
+        sites = voronoi_diagram.sites
+        if len(sites) == 0:
+            raise ValueError("Points can not be located in a diagram without sites.")
+        if voronoi_diagram.has_next_step():
+            raise ValueError("Points can only be located in a finished diagram.")
+        if xlim is None:
+            xlim = voronoi_diagram._xlim
+        if ylim is None:
+            ylim = voronoi_diagram._ylim
+        polygons = voronoi_diagram.get_cell_polygons(xlim, ylim)
+        self.xlim = (float(xlim[0]), float(xlim[1]))
+        self.ylim = (float(ylim[0]), float(ylim[1]))
+
+        # The sentinel site is far away from every point.
+        self.site_xs = np.append(to_float_array([site.point.x for site in sites]), 0)
+        self.site_ys = np.append(to_float_array([site.point.y for site in sites]), 0)
+        self.site_weights = None
+        if voronoi_diagram.SITE_CLASS == WeightedSite:
+            weights = to_float_array([abs(site.weight) for site in sites])
+            self.site_weights = np.append(weights, np.inf)
+        else:
+            self.site_xs[-1] = np.inf
+
+        width = self.xlim[1] - self.xlim[0]
+        height = self.ylim[1] - self.ylim[0]
+        n_cells = max(1, int(cells_per_site * len(sites)))
+        nx = max(1, int(round((n_cells * width / height) ** 0.5)))
+        ny = max(1, int(round(n_cells / nx)))
+        self.shape = (nx, ny)
+        self.cell_sizes = (width / nx, height / ny)
+        self._set_candidates(polygons, BOUNDS_TOLERANCE * (width + height))
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return (
+            f"PointLocator({len(self.site_xs) - 1} sites, grid {self.shape}, "
+            f"up to {self.candidates.shape[1]} candidates)"
+        )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return self.__str__()
+
+    def _get_grid_indices(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get column and row in the grid of points, clipped to the grid."""
+        columns = np.floor((xs - self.xlim[0]) / self.cell_sizes[0]).astype(np.int64)
+        rows = np.floor((ys - self.ylim[0]) / self.cell_sizes[1]).astype(np.int64)
+        np.clip(columns, 0, self.shape[0] - 1, out=columns)
+        np.clip(rows, 0, self.shape[1] - 1, out=rows)
+        return columns, rows
+
+    def _set_candidates(self, polygons: List[List[Any]], tolerance: float) -> None:
+        """Set sites of each grid cell from the bounds of their clipped cells."""
+        nx, ny = self.shape
+        grid_cells = []
+        grid_sites = []
+        for site_index, polygon in enumerate(polygons):
+            if not polygon:
+                continue
+            points = to_float_array([(point.x, point.y) for point in polygon])
+            lowest = points.min(axis=0) - tolerance
+            highest = points.max(axis=0) + tolerance
+            columns, rows = self._get_grid_indices(
+                np.array([lowest[0], highest[0]]), np.array([lowest[1], highest[1]])
+            )
+            cells = (
+                np.arange(columns[0], columns[1] + 1)[:, None] * ny
+                + np.arange(rows[0], rows[1] + 1)[None, :]
+            ).ravel()
+            grid_cells.append(cells)
+            grid_sites.append(np.full(len(cells), site_index))
+        cells = np.concatenate(grid_cells)
+        sites = np.concatenate(grid_sites)
+
+        order = np.argsort(cells, kind="stable")
+        cells = cells[order]
+        sites = sites[order]
+        counts = np.bincount(cells, minlength=nx * ny)
+        offsets = np.zeros(nx * ny, dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        sentinel = len(self.site_xs) - 1
+        self.widths = 1 << np.ceil(np.log2(np.maximum(counts, 1))).astype(np.int64)
+        self.candidates = np.full((nx * ny, self.widths.max()), sentinel, np.int32)
+        self.candidates[cells, np.arange(len(cells)) - offsets[cells]] = sites
+
+    def _get_distances(
+        self, xs: np.ndarray, ys: np.ndarray, sites: np.ndarray
+    ) -> np.ndarray:
+        """Get distances to compare from points (as columns) to sites.
+
+        Point sites are compared with the squared distance.
+        """
+        squared_distances = (xs - self.site_xs[sites]) ** 2 + (
+            ys - self.site_ys[sites]
+        ) ** 2
+        if self.site_weights is None:
+            return squared_distances
+        return np.sqrt(squared_distances) + self.site_weights[sites]
+
+    def _locate_in_box(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Get nearest sites to points in the box comparing with their candidates."""
+        columns, rows = self._get_grid_indices(xs, ys)
+        grid_cells = columns * self.shape[1] + rows
+        widths = self.widths[grid_cells]
+        located = np.empty(len(xs), dtype=np.int64)
+        # Points are grouped by the number of candidates of their grid cells.
+        for width in np.unique(widths):
+            group = np.flatnonzero(widths == width)
+            sites = self.candidates[grid_cells[group], :width]
+            distances = self._get_distances(xs[group, None], ys[group, None], sites)
+            located[group] = sites[np.arange(len(group)), np.argmin(distances, axis=1)]
+        return located
+
+    def _locate_out_of_box(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Get nearest sites to points comparing with all the sites."""
+        sites = np.arange(len(self.site_xs) - 1)
+        distances = self._get_distances(xs[:, None], ys[:, None], sites[None, :])
+        return np.argmin(distances, axis=1)
+
+    def locate(self, xs: Any, ys: Any) -> np.ndarray:
+        """Get indices in the sites of the diagram of the cells containing points.
+
+        Points at the same distance of many sites get the one with the lowest index.
+        """
+        xs = to_float_array(xs).ravel()
+        ys = to_float_array(ys).ravel()
+        if xs.shape != ys.shape:
+            raise ValueError(
+                f"xs and ys must have the same size, not {xs.size} and {ys.size}."
+            )
+        located = np.empty(len(xs), dtype=np.int64)
+        in_box = (
+            (xs >= self.xlim[0])
+            & (xs <= self.xlim[1])
+            & (ys >= self.ylim[0])
+            & (ys <= self.ylim[1])
+        )
+        in_box_indices = np.flatnonzero(in_box)
+        for start in range(0, len(in_box_indices), LOCATE_CHUNKSIZE):
+            chunk = in_box_indices[start : start + LOCATE_CHUNKSIZE]
+            located[chunk] = self._locate_in_box(xs[chunk], ys[chunk])
+        # Points out of the box are compared with all the sites, so less at once.
+        out_of_box_indices = np.flatnonzero(~in_box)
+        chunksize = max(1, LOCATE_CHUNKSIZE // len(self.site_xs))
+        for start in range(0, len(out_of_box_indices), chunksize):
+            chunk = out_of_box_indices[start : start + chunksize]
+            located[chunk] = self._locate_out_of_box(xs[chunk], ys[chunk])
+        return located
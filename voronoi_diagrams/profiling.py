@@ -0,0 +1,83 @@
+"""Profiling of the phases and hot paths of Fortune's Algorithm.
+
+A profile is given to the diagram that is profiled, and the diagram and its
+structures only count and time when they have one, so other diagrams, also in
+other threads, are not measured and do not pay anything.
+"""
+# Standard Library
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+import time
+
+# Models
+from .models import CacheCounter
+
+# Conic Sections
+from conic_sections.utils.polynomials import roots_counters
+
+
+class Profile:
+    """Counters, seconds of the phases and maxima measured in a diagram.
+
+    The counters are the runs of the init, site events, intersection events and
+    closing of the cells phases, the events deleted from Q, the searches of
+    regions in L and the nodes visited in them, the comparisons of points with
+    boundaries in the searches, the roots of polynomials calculated in the phases,
+    the bisectors constructed and the rotations of the AVL trees. The seconds are
+    of the phases, and the maxima are the depth of the searches in L.
+
+        stats = Profile()
+        FortunesAlgorithm.calculate_voronoi_diagram(points, profile=stats)
+        stats.get_stats()
+    """
+
+    __slots__ = ("counters", "seconds", "maxima", "point_comparisons")
+
+    counters: Counter
+    seconds: Dict[str, float]
+    maxima: Dict[str, int]
+    # Comparisons of points with boundaries computed and reused in the searches.
+    point_comparisons: CacheCounter
+
+    def __init__(self) -> None:
+        """Construct empty profile."""
+        self.counters = Counter()
+        self.seconds = {}
+        self.maxima = {}
+        self.point_comparisons = CacheCounter()
+
+    def update_maximum(self, name: str, value: int) -> None:
+        """Keep value if it is the maximum of the name."""
+        if value > self.maxima.get(name, 0):
+            self.maxima[name] = value
+
+    def add_region_search(self, depth: int) -> None:
+        """Count a search of a region in L that visited depth nodes."""
+        self.counters["region_searches"] += 1
+        self.counters["region_search_nodes"] += depth
+        self.update_maximum("region_search_depth", depth)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Count and time a run of the phase, and the roots calculated in it."""
+        self.counters[phase] += 1
+        self.seconds.setdefault(phase, 0.0)
+        token = roots_counters.set(self.counters)
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[phase] += time.perf_counter() - start_time
+            roots_counters.reset(token)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get counters, seconds and maxima in a dict."""
+        counters = dict(self.counters)
+        counters["point_comparisons"] = self.point_comparisons.misses
+        counters["cached_point_comparisons"] = self.point_comparisons.hits
+        return {
+            "counters": counters,
+            "seconds": dict(self.seconds),
+            "maxima": dict(self.maxima),
+        }